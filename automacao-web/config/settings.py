@@ -4,6 +4,7 @@ Implementa o padrão Singleton para garantir configurações únicas.
 """
 import os
 import logging
+from contextlib import contextmanager
 from dotenv import load_dotenv
 from pathlib import Path
 
@@ -35,22 +36,114 @@ class Config:
         # URLs base do projeto
         self.BASE_URL = os.getenv('BASE_URL', 'http://localhost:3000')
         
+        # Backend remoto (Selenium Grid/standalone): endpoints separados por vírgula
+        self.REMOTE_ENDPOINTS = [url.strip() for url in os.getenv('REMOTE_ENDPOINTS', '').split(',') if url.strip()]
+        self.REMOTE_QUEUE_TIMEOUT = int(os.getenv('REMOTE_QUEUE_TIMEOUT', 300))
+        self.REMOTE_POLL_INTERVAL = float(os.getenv('REMOTE_POLL_INTERVAL', 2))
+        
         # Configurações de teste
         self.MAX_WAIT_ELEMENTS = int(os.getenv('MAX_WAIT_ELEMENTS', 10))
         self.SCREENSHOT_ON_FAILURE = os.getenv('SCREENSHOT_ON_FAILURE', 'true').lower() == 'true'
         
+        # Tempos limite adaptativos por localizador: p99 histórico × fator, entre o mínimo e MAX_WAIT_ELEMENTS
+        self.ADAPTIVE_TIMEOUTS = os.getenv('ADAPTIVE_TIMEOUTS', 'true').lower() == 'true'
+        self.ADAPTIVE_TIMEOUT_FACTOR = float(os.getenv('ADAPTIVE_TIMEOUT_FACTOR', 3))
+        self.ADAPTIVE_TIMEOUT_MIN = float(os.getenv('ADAPTIVE_TIMEOUT_MIN', 2))
+        self.ADAPTIVE_TIMEOUT_MIN_SAMPLES = int(os.getenv('ADAPTIVE_TIMEOUT_MIN_SAMPLES', 5))
+        self.ADAPTIVE_TIMEOUT_SAMPLES = int(os.getenv('ADAPTIVE_TIMEOUT_SAMPLES', 200))
+        
+        # Aquecimento do servidor de desenvolvimento antes dos testes: auto (só sem build de produção), true ou false
+        self.WARMUP = os.getenv('WARMUP', 'auto').lower()
+        self.WARMUP_WORKERS = int(os.getenv('WARMUP_WORKERS', 8))
+        self.WARMUP_MAX_ROUNDS = int(os.getenv('WARMUP_MAX_ROUNDS', 5))
+        self.WARMUP_TIMEOUT = float(os.getenv('WARMUP_TIMEOUT', 120))
+        
+        # Esperas dentro da página (MutationObserver + execute_async_script) em vez do polling do WebDriverWait
+        self.PUSH_WAITS = os.getenv('PUSH_WAITS', 'true').lower() == 'true'
+        
+        # Logs do navegador (console, exceções JS e falhas de rede) anexados aos testes que falham
+        self.BROWSER_LOGS_ENABLED = os.getenv('BROWSER_LOGS_ENABLED', 'true').lower() == 'true'
+        self.BROWSER_LOG_LEVEL = os.getenv('BROWSER_LOG_LEVEL', 'WARNING').upper()
+        self.BROWSER_LOG_BUFFER_SIZE = int(os.getenv('BROWSER_LOG_BUFFER_SIZE', 1000))
+        self.BROWSER_LOG_DRAIN_INTERVAL = float(os.getenv('BROWSER_LOG_DRAIN_INTERVAL', 30))
+        
+        # HAR das cargas de página (log 'performance' do Chrome) e tamanho do resumo no relatório
+        self.HAR_ENABLED = os.getenv('HAR_ENABLED', 'false').lower() == 'true'
+        self.HAR_SUMMARY_TOP = int(os.getenv('HAR_SUMMARY_TOP', 10))
+        
+        # Cache de resultados: reproduz testes aprovados enquanto build do site, código e configuração não mudam
+        self.RESULT_CACHE_ENABLED = os.getenv('RESULT_CACHE_ENABLED', 'false').lower() == 'true'
+        self.RESULT_CACHE_MAX_AGE = int(os.getenv('RESULT_CACHE_MAX_AGE', 86400))
+        
+        # Armazenamento de artefatos por hash de conteúdo, com retenção por idade, quantidade de execuções e tamanho
+        self.ARTIFACT_STORE_ENABLED = os.getenv('ARTIFACT_STORE_ENABLED', 'false').lower() == 'true'
+        self.ARTIFACT_RETENTION_DAYS = float(os.getenv('ARTIFACT_RETENTION_DAYS', 14))
+        self.ARTIFACT_MAX_RUNS = int(os.getenv('ARTIFACT_MAX_RUNS', 100))
+        self.ARTIFACT_MAX_BYTES = int(os.getenv('ARTIFACT_MAX_BYTES', 1024 * 1024 * 1024))
+        
+        # Watchdog: tempo máximo por teste e para a execução completa (0 = ilimitado)
+        self.TEST_TIMEOUT = int(os.getenv('TEST_TIMEOUT', 120))
+        self.RUN_TIMEOUT = int(os.getenv('RUN_TIMEOUT', 1800))
+        
+        # Modo daemon (monitoramento sintético contínuo); o limite em bytes vale
+        # para o arquivo de resultados contínuos e para o arquivo de log
+        self.DAEMON_INTERVAL = int(os.getenv('DAEMON_INTERVAL', 300))
+        self.DAEMON_JITTER = float(os.getenv('DAEMON_JITTER', 0.1))
+        self.DAEMON_HISTORY_SIZE = int(os.getenv('DAEMON_HISTORY_SIZE', 288))
+        self.DAEMON_RECYCLE_CYCLES = int(os.getenv('DAEMON_RECYCLE_CYCLES', 100))
+        self.DAEMON_RESULTS_MAX_BYTES = int(os.getenv('DAEMON_RESULTS_MAX_BYTES', 10 * 1024 * 1024))
+        self.DAEMON_MAX_SCREENSHOTS = int(os.getenv('DAEMON_MAX_SCREENSHOTS', 200))
+        
+        # Métricas Prometheus/OpenMetrics (porta 0 = endpoint desativado)
+        self.METRICS_PORT = int(os.getenv('METRICS_PORT', 0))
+        self.METRICS_TEXTFILE = os.getenv('METRICS_TEXTFILE', '')
+        
+        # Trace da execução (Trace Event / Perfetto); eventos além do limite descartam os mais antigos
+        self.TRACE_ENABLED = os.getenv('TRACE_ENABLED', 'false').lower() == 'true'
+        self.TRACE_MAX_EVENTS = int(os.getenv('TRACE_MAX_EVENTS', 500000))
+        
+        # Teste de escala do acordeão de membros (--scale-members)
+        self.SCALE_SIZES = [int(size) for size in os.getenv('SCALE_SIZES', '100,1000,5000,10000').split(',') if size.strip()]
+        self.SCALE_REPETITIONS = int(os.getenv('SCALE_REPETITIONS', 3))
+        self.SCALE_SEED_WORKERS = int(os.getenv('SCALE_SEED_WORKERS', 8))
+        self.SCALE_SEED = int(os.getenv('SCALE_SEED', 42))
+        
+        # Painel administrativo: orçamento do render e volumes do teste de escala;
+        # ADMIN_SEED_TARGET=site cria os registros no banco do site em vez do stub local
+        self.ADMIN_RENDER_BUDGET_MS = int(os.getenv('ADMIN_RENDER_BUDGET_MS', 3000))
+        self.ADMIN_SCALE_SIZES = sorted(int(size) for size in os.getenv('ADMIN_SCALE_SIZES', '100,1000,5000').split(',') if size.strip())
+        self.ADMIN_SEED_TARGET = os.getenv('ADMIN_SEED_TARGET', 'stub').lower()
+        
+        # Verificação de links (--strategy links): requisições simultâneas no total e por host
+        # e tempo limite por requisição
+        self.LINK_CHECK_WORKERS = int(os.getenv('LINK_CHECK_WORKERS', 16))
+        self.LINK_CHECK_PER_HOST = int(os.getenv('LINK_CHECK_PER_HOST', 4))
+        self.LINK_CHECK_TIMEOUT = float(os.getenv('LINK_CHECK_TIMEOUT', 10))
+        
+        # Perfil do executor (--profile): funções no resumo do relatório/log, intervalo da amostragem e tracemalloc
+        self.PROFILE_TOP = int(os.getenv('PROFILE_TOP', 15))
+        self.PROFILE_LOG_TOP = int(os.getenv('PROFILE_LOG_TOP', 5))
+        self.PROFILE_INTERVAL_MS = float(os.getenv('PROFILE_INTERVAL_MS', 5))
+        self.PROFILE_MEMORY = os.getenv('PROFILE_MEMORY', 'true').lower() == 'true'
+        self.PROFILE_MEMORY_FRAMES = int(os.getenv('PROFILE_MEMORY_FRAMES', 1))
+        
         # Configurações de relatórios
         self.EXPORT_EXCEL = os.getenv('EXPORT_EXCEL', 'true').lower() == 'true'
         self.EXPORT_JSON = os.getenv('EXPORT_JSON', 'true').lower() == 'true'
         
         # Dados de teste
         self.TEST_PIX_KEY = os.getenv('TEST_PIX_KEY', 'blocopraieira@gmail.com')
+        # O site codifica hoje apenas a chave no QR Code; 'true' exige um BR Code (EMV com CRC16)
+        self.PIX_REQUIRE_BRCODE = os.getenv('PIX_REQUIRE_BRCODE', 'false').lower() == 'true'
         self.TEST_EMAIL = os.getenv('TEST_EMAIL', 'teste@blocopraieira.com')
         
         # Configurações de logging
         self.LOG_LEVEL = getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper())
         self.LOG_TO_FILE = os.getenv('LOG_TO_FILE', 'true').lower() == 'true'
         
+        # Buffer circular de debug por teste, emitido só quando o teste falha (0 = desativado)
+        self.DEBUG_BUFFER_SIZE = int(os.getenv('DEBUG_BUFFER_SIZE', 500))
+        
         # Configurações do navegador
         self.HEADLESS_MODE = os.getenv('HEADLESS_MODE', 'false').lower() == 'true'
         self.BROWSER_WIDTH = int(os.getenv('BROWSER_WIDTH', 1920))
@@ -61,26 +154,108 @@ class Config:
         self.LOGS_DIR = self.PROJECT_ROOT / 'logs'
         self.REPORTS_DIR = self.PROJECT_ROOT / 'reports'
         self.SCREENSHOTS_DIR = self.PROJECT_ROOT / 'screenshots'
+        self.ARTIFACTS_DIR = Path(os.getenv('ARTIFACTS_DIR') or self.PROJECT_ROOT / 'artifacts')
         
         # Criar diretórios se não existirem
         self.LOGS_DIR.mkdir(exist_ok=True)
         self.REPORTS_DIR.mkdir(exist_ok=True)
         self.SCREENSHOTS_DIR.mkdir(exist_ok=True)
     
-    def get_log_file_path(self):
-        """Retorna o caminho do arquivo de log."""
+    def _unique_path(self, directory, prefix, extension='', is_dir=False):
+        """
+        Reserva um caminho com carimbo de data/hora ainda não usado.
+        O arquivo (ou diretório) é criado vazio de forma atômica, então execuções
+        paralelas no mesmo segundo recebem sufixos _2, _3... em vez de se sobrescreverem.
+        Grave o arquivo dentro de reserved_file para não deixar o reservado vazio se a gravação falhar.
+        
+        Args:
+            directory (Path): Diretório de destino
+            prefix (str): Início do nome (vazio para usar só o carimbo)
+            extension (str): Extensão com ponto (ex: '.json')
+            is_dir (bool): Reserva um diretório em vez de um arquivo
+        
+        Returns:
+            Path: Caminho reservado
+        """
         from datetime import datetime
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        return self.LOGS_DIR / f'automacao_{timestamp}.log'
+        stem = f'{prefix}_{timestamp}' if prefix else timestamp
+        directory.mkdir(parents=True, exist_ok=True)
+        
+        attempt = 1
+        while True:
+            path = directory / f"{stem}{f'_{attempt}' if attempt > 1 else ''}{extension}"
+            try:
+                if is_dir:
+                    path.mkdir()
+                else:
+                    path.touch(exist_ok=False)
+                return path
+            except FileExistsError:
+                attempt += 1
+    
+    @contextmanager
+    def reserved_file(self, path):
+        """
+        Envolve a gravação de um arquivo reservado por _unique_path. Se a gravação
+        falhar, ou terminar sem gravar nada, o arquivo reservado é removido.
+        
+        Args:
+            path (Path): Caminho reservado
+        
+        Yields:
+            Path: O próprio caminho
+        """
+        path = Path(path)
+        try:
+            yield path
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+        
+        if path.exists() and path.stat().st_size == 0:
+            path.unlink()
+    
+    def get_log_file_path(self):
+        """Retorna o caminho do arquivo de log."""
+        return self._unique_path(self.LOGS_DIR, 'automacao', '.log')
     
     def get_report_file_path(self, extension='xlsx'):
         """Retorna o caminho do arquivo de relatório."""
-        from datetime import datetime
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        return self.REPORTS_DIR / f'relatorio_testes_{timestamp}.{extension}'
+        return self._unique_path(self.REPORTS_DIR, 'relatorio_testes', f'.{extension}')
+    
+    def get_trace_file_path(self):
+        """Retorna o caminho do arquivo de trace da execução."""
+        return self._unique_path(self.REPORTS_DIR, 'trace', '.json')
+    
+    def get_har_dir(self):
+        """Retorna o diretório dos arquivos HAR da execução."""
+        return self._unique_path(self.REPORTS_DIR / 'har', '', is_dir=True)
+    
+    def get_profile_dir(self):
+        """Retorna o diretório dos arquivos de perfil do executor."""
+        return self._unique_path(self.REPORTS_DIR / 'profile', '', is_dir=True)
+    
+    def get_locator_latency_path(self):
+        """Retorna o caminho do histórico de latência dos localizadores (compartilhado entre execuções)."""
+        return self.REPORTS_DIR / 'latencias_localizadores.json'
+    
+    def get_result_cache_dir(self):
+        """Retorna o diretório do cache de resultados (compartilhado entre execuções)."""
+        return self.REPORTS_DIR / 'cache'
+    
+    def get_scale_report_path(self, extension='json'):
+        """Retorna o caminho do relatório do teste de escala."""
+        return self._unique_path(self.REPORTS_DIR, 'escala_membros', f'.{extension}')
+    
+    def get_monitoring_results_path(self):
+        """Retorna o caminho do arquivo de resultados contínuos do modo daemon."""
+        return self.REPORTS_DIR / 'monitoramento.jsonl'
+    
+    def get_monitoring_status_path(self):
+        """Retorna o caminho do arquivo de status do modo daemon."""
+        return self.REPORTS_DIR / 'monitoramento_status.json'
     
     def get_screenshot_path(self, test_name):
         """Retorna o caminho para screenshots."""
-        from datetime import datetime
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        return self.SCREENSHOTS_DIR / f'{test_name}_{timestamp}.png'
\ No newline at end of file
+        return self._unique_path(self.SCREENSHOTS_DIR, test_name, '.png')
\ No newline at end of file
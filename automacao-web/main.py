@@ -10,7 +10,20 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent / 'src'))
 
 from src.test_executor import TestExecutor
+from src.monitoring_daemon import MonitoringDaemon
+from src.members_scale import MembersScaleHarness
+from src.strategies.registry import registry
+from src.utils.matrix import add_emulation, parse_matrix
+from src.utils.emulation import parse_emulation
+from src.utils.scaling import parse_sizes
 from src.utils.logger import logger
+from src.utils.metrics import metrics
+from src.utils.tracing import tracer
+from src.utils.har import har_recorder
+from src.utils.result_cache import result_cache
+from src.utils.artifact_store import artifact_store
+from src.utils.warmup import warmup
+from src.utils.profiling import profiler
 from config.settings import Config
 
 def main():
@@ -26,14 +39,34 @@ Exemplos de uso:
   python main.py --strategy home          # Executa apenas testes da homepage
   python main.py --strategy donations     # Executa apenas testes de doações
   python main.py --strategy members       # Executa apenas testes de membros
+  python main.py --strategy admin         # Desempenho do painel administrativo
   python main.py --browser firefox        # Usa Firefox em vez de Chrome
   python main.py --headless               # Executa em modo headless
+  python main.py --list-tests             # Lista os testes registrados
+  python main.py --tags smoke,pix         # Executa apenas testes com essas tags
+  python main.py --test "QR Code Generation"  # Executa um único teste
+  python main.py --schedule --workers 3   # Escalonamento DAG com 3 navegadores
+  python main.py --order history --fail-fast  # Falhas recentes primeiro, para na 1ª falha
+  python main.py --daemon --interval 300  # Monitoramento contínuo a cada ~5 minutos
+  python main.py --daemon --metrics-port 9108  # Expõe métricas em /metrics
+  python main.py --remote http://localhost:4444 --workers 4  # Sessões em Selenium Grid/standalone
+  python main.py --matrix "chrome,firefox x 1920x1080,390x844"  # Matriz navegador × viewport
+  python main.py --emulate slow-3g,cpu4x  # Compara os tempos sem emulação, em 3G lento e com CPU 4× mais lenta
+  python main.py --workers 3 --trace      # Grava o trace da execução para o Perfetto
+  python main.py --har --headless         # Grava um HAR por carga de página (Chrome)
+  python main.py --cache                  # Reproduz testes aprovados se build, código e config não mudaram
+  python main.py --artifacts              # Guarda screenshots, HARs, DOM e relatórios por hash de conteúdo
+  python main.py --artifacts-gc           # Aplica a retenção ao armazenamento de artefatos e sai
+  python main.py --no-warmup              # Não aquece o servidor de desenvolvimento antes dos testes
+  python main.py --profile                # Perfil do executor (cProfile + tracemalloc) por estratégia
+  python main.py --profile sampling --workers 3  # Perfil por amostragem, com baixo custo
+  python main.py --scale-members 100,1k,10k --headless  # Curva de escala do acordeão de membros
         """
     )
     
     parser.add_argument(
         '--strategy',
-        choices=['home', 'donations', 'members'],
+        choices=registry.strategy_keys(),
         help='Executa apenas uma estratégia específica de testes'
     )
     
@@ -44,6 +77,18 @@ Exemplos de uso:
         help='Escolhe o navegador para os testes (padrão: chrome)'
     )
     
+    parser.add_argument(
+        '--matrix',
+        help=('Executa todas as combinações navegador × viewport, ex: "chrome,firefox x 1920x1080,390x844" '
+              '(navegadores em paralelo; --workers define quantos navegadores de cada tipo)')
+    )
+    
+    parser.add_argument(
+        '--emulate',
+        help=('Repete os testes em perfis de rede e CPU emulados (Chrome), ex: "slow-3g,cpu4x" ou '
+              '"slow-3g+cpu4x" (combinados); redes: slow-3g, fast-3g, slow-4g; CPU: cpuNx')
+    )
+    
     parser.add_argument(
         '--headless',
         action='store_true',
@@ -56,8 +101,212 @@ Exemplos de uso:
         help='URL base do site a ser testado (padrão: http://localhost:3000)'
     )
     
+    parser.add_argument(
+        '--remote',
+        action='append',
+        help=('Endpoint de Selenium Grid/standalone (pode ser repetido ou separado por vírgula); '
+              'as sessões são distribuídas pela capacidade livre de cada nó (padrão: REMOTE_ENDPOINTS)')
+    )
+    
+    parser.add_argument(
+        '--tags',
+        help='Executa apenas testes com alguma das tags informadas (separadas por vírgula)'
+    )
+    
+    parser.add_argument(
+        '--test',
+        action='append',
+        dest='tests',
+        help='Executa apenas o teste informado (pode ser repetido; aceita "estrategia:Nome")'
+    )
+    
+    parser.add_argument(
+        '--schedule',
+        action='store_true',
+        help='Executa os testes individualmente, na ordem calculada pelo escalonador de dependências'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Quantidade de navegadores em paralelo no modo escalonado (padrão: 1)'
+    )
+    
+    parser.add_argument(
+        '--order',
+        choices=['default', 'dag', 'history'],
+        default='default',
+        help=('Ordem de execução: default (estratégias em sequência), dag (escalonador de dependências) '
+              'ou history (falhas recentes e testes baratos primeiro, a partir de relatórios anteriores)')
+    )
+    
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Interrompe a execução na primeira falha, gerando um relatório parcial'
+    )
+    
+    parser.add_argument(
+        '--test-timeout',
+        type=int,
+        help='Tempo máximo por teste em segundos antes de reiniciar o navegador (padrão: TEST_TIMEOUT)'
+    )
+    
+    parser.add_argument(
+        '--run-timeout',
+        type=int,
+        help='Tempo máximo da execução completa em segundos, 0 = ilimitado (padrão: RUN_TIMEOUT)'
+    )
+    
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Monitoramento contínuo: mantém os navegadores abertos e repete os testes periodicamente'
+    )
+    
+    parser.add_argument(
+        '--interval',
+        type=float,
+        help='Intervalo entre ciclos do daemon em segundos (padrão: DAEMON_INTERVAL)'
+    )
+    
+    parser.add_argument(
+        '--jitter',
+        type=float,
+        help='Variação aleatória do intervalo, fração entre 0 e 1 (padrão: DAEMON_JITTER)'
+    )
+    
+    parser.add_argument(
+        '--max-cycles',
+        type=int,
+        help='Encerra o daemon após a quantidade informada de ciclos'
+    )
+    
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        help='Expõe métricas Prometheus/OpenMetrics em http://127.0.0.1:PORTA/metrics (padrão: METRICS_PORT)'
+    )
+    
+    parser.add_argument(
+        '--metrics-textfile',
+        help='Grava as métricas ao fim de cada execução neste arquivo .prom (textfile collector)'
+    )
+    
+    parser.add_argument(
+        '--trace',
+        nargs='?',
+        const='',
+        metavar='ARQUIVO',
+        help=('Grava um trace da execução (Trace Event JSON) para abrir no Perfetto ou em chrome://tracing, '
+              'com uma trilha por navegador (padrão: reports/trace_<timestamp>.json)')
+    )
+    
+    parser.add_argument(
+        '--har',
+        action='store_true',
+        help=('Grava um HAR por carga de página (navegações e rolagens que carregam seções) em reports/har/, '
+              'com resumo dos recursos mais pesados e lentos no relatório (somente Chrome)')
+    )
+    
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help=('Ativa o cache de resultados: testes aprovados com o mesmo build do site, o mesmo código '
+              'de estratégias/Page Objects e a mesma configuração são reproduzidos sem abrir páginas')
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Executa todos os testes normalmente, mesmo com RESULT_CACHE_ENABLED=true'
+    )
+    
+    parser.add_argument(
+        '--artifacts',
+        action='store_true',
+        help=('Guarda screenshots, HARs, snapshots do DOM e relatórios em artifacts/ por hash de conteúdo, '
+              'com manifesto por execução e retenção por idade, quantidade e tamanho')
+    )
+    
+    parser.add_argument(
+        '--artifacts-gc',
+        action='store_true',
+        help='Aplica a política de retenção ao armazenamento de artefatos e encerra'
+    )
+    
+    parser.add_argument(
+        '--warmup',
+        action='store_true',
+        help=('Aquece páginas, rotas de API e chunks antes dos testes mesmo em build de produção '
+              '(por padrão o aquecimento só ocorre no servidor de desenvolvimento)')
+    )
+    
+    parser.add_argument(
+        '--no-warmup',
+        action='store_true',
+        help='Não aquece o site antes dos testes'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='cprofile',
+        choices=['cprofile', 'sampling'],
+        help=('Mede o custo em Python do executor por estratégia (cprofile: determinístico; sampling: '
+              'amostragem de baixo custo, indicada com vários workers), com tracemalloc; grava os arquivos '
+              'em reports/profile/ e resume as funções mais caras no log')
+    )
+    
+    parser.add_argument(
+        '--scale-members',
+        nargs='?',
+        const='',
+        metavar='VOLUMES',
+        help=('Teste de escala do acordeão de membros: cria elencos sintéticos (ex: "100,1k,10k") em um stub '
+              'local da API e mede abertura/fechamento das seções e nós do DOM (padrão: SCALE_SIZES)')
+    )
+    
+    parser.add_argument(
+        '--scale-url',
+        help='Cria os membros na API deste site em vez do stub local (o Members.tsx atual não reflete a API)'
+    )
+    
+    parser.add_argument(
+        '--list-tests',
+        action='store_true',
+        help='Lista as unidades de teste registradas e sai'
+    )
+    
     args = parser.parse_args()
     
+    tags = [tag.strip() for tag in args.tags.split(',') if tag.strip()] if args.tags else None
+    
+    matrix_cells = None
+    if args.matrix or args.emulate:
+        try:
+            matrix_cells = parse_matrix(
+                args.matrix or args.browser,
+                default_browser=args.browser,
+                default_viewport=(Config().BROWSER_WIDTH, Config().BROWSER_HEIGHT)
+            )
+            if args.emulate:
+                matrix_cells = add_emulation(matrix_cells, parse_emulation(args.emulate))
+        except ValueError as e:
+            parser.error(str(e))
+    
+    scale_sizes = None
+    if args.scale_members is not None:
+        try:
+            scale_sizes = parse_sizes(args.scale_members) if args.scale_members else None
+        except ValueError as e:
+            parser.error(str(e))
+    
+    if args.list_tests:
+        list_registered_tests(args.strategy, tags, args.tests)
+        return 0
+    
     # Configurar ambiente
     config = Config()
     
@@ -72,12 +321,42 @@ Exemplos de uso:
         os.environ['BASE_URL'] = args.base_url
         config._load_config()  # Recarregar configurações
     
+    if args.remote:
+        import os
+        os.environ['REMOTE_ENDPOINTS'] = ','.join(args.remote)
+        config._load_config()  # Recarregar configurações
+    
+    if args.har:
+        import os
+        os.environ['HAR_ENABLED'] = 'true'
+        config._load_config()  # Recarregar configurações
+    
+    if args.artifacts:
+        import os
+        os.environ['ARTIFACT_STORE_ENABLED'] = 'true'
+        config._load_config()  # Recarregar configurações
+    
+    if args.cache or args.no_cache:
+        import os
+        os.environ['RESULT_CACHE_ENABLED'] = 'false' if args.no_cache else 'true'
+        config._load_config()  # Recarregar configurações
+    
+    if args.warmup or args.no_warmup:
+        import os
+        os.environ['WARMUP'] = 'false' if args.no_warmup else 'true'
+        config._load_config()  # Recarregar configurações
+    
     # Exibir informações de configuração
     logger.info("🚀 INICIANDO AUTOMAÇÃO DE TESTES - BLOCO PRAIEIRA")
     logger.info("=" * 60)
     logger.info(f"🌐 URL Base: {config.BASE_URL}")
-    logger.info(f"🖥️ Navegador: {args.browser.upper()}")
+    if matrix_cells:
+        logger.info(f"🧮 Matriz: {', '.join(cell.label for cell in matrix_cells)}")
+    else:
+        logger.info(f"🖥️ Navegador: {args.browser.upper()}")
     logger.info(f"👁️ Modo Headless: {'SIM' if config.HEADLESS_MODE else 'NÃO'}")
+    if config.REMOTE_ENDPOINTS:
+        logger.info(f"🛰️ Nós remotos: {', '.join(config.REMOTE_ENDPOINTS)}")
     logger.info(f"📊 Exportar Excel: {'SIM' if config.EXPORT_EXCEL else 'NÃO'}")
     logger.info(f"📄 Exportar JSON: {'SIM' if config.EXPORT_JSON else 'NÃO'}")
     
@@ -86,19 +365,105 @@ Exemplos de uso:
     else:
         logger.info("🧪 Executando TODAS as estratégias")
     
+    if tags:
+        logger.info(f"🏷️ Tags: {', '.join(tags)}")
+    
+    if args.tests:
+        logger.info(f"🔎 Testes selecionados: {', '.join(args.tests)}")
+    
     logger.info("=" * 60)
     
+    # Configurar exportação de métricas
+    metrics.textfile_path = args.metrics_textfile or config.METRICS_TEXTFILE or None
+    metrics_port = args.metrics_port if args.metrics_port is not None else config.METRICS_PORT
+    if metrics_port:
+        metrics.serve(metrics_port)
+    
+    # Configurar o trace da execução
+    if args.trace is not None or config.TRACE_ENABLED:
+        tracer.enable(args.trace or None, config.TRACE_MAX_EVENTS)
+    
+    # Configurar a gravação de HAR
+    if config.HAR_ENABLED:
+        if args.browser != 'chrome' or (matrix_cells and any(cell.browser != 'chrome' for cell in matrix_cells)):
+            logger.warning("⚠️ HAR disponível apenas no Chrome; navegadores sem suporte serão ignorados")
+        har_recorder.enable()
+    
+    # Configurar o armazenamento de artefatos (a retenção é aplicada ao ativar)
+    if args.artifacts_gc:
+        stats = artifact_store.collect_garbage()
+        logger.info(f"🧹 Coleta de artefatos concluída em {stats['seconds']}s: {stats['runs_removed']} execução(ões) removida(s)")
+        return 0
+    
+    if config.ARTIFACT_STORE_ENABLED:
+        artifact_store.enable()
+    
+    # Teste de escala: usa o stub local e não depende do servidor Next.js
+    if args.scale_members is not None:
+        harness = MembersScaleHarness(args.browser, sizes=scale_sizes, base_url=args.scale_url)
+        report = harness.run()
+        return 0 if report['measurements'] else 1
+    
     # Verificar se o site está acessível
-    if not check_site_accessibility(config.BASE_URL):
+    if args.daemon:
+        # No monitoramento, indisponibilidade é um resultado a registrar, não um erro de inicialização
+        if not check_site_accessibility(config.BASE_URL):
+            logger.warning("⚠️ Site inacessível no início do monitoramento; os ciclos registrarão as falhas")
+    elif not check_site_accessibility(config.BASE_URL):
         logger.error(f"❌ Site não acessível em {config.BASE_URL}")
         logger.error("💡 Dica: Certifique-se de que o servidor Next.js esteja rodando com 'npm run dev'")
         return 1
     
+    # Aquecer o servidor: a compilação sob demanda do 'npm run dev' não deve pesar no primeiro teste
+    if config.WARMUP != 'false':
+        warmup.run(config.BASE_URL, force=config.WARMUP == 'true')
+    
+    # Configurar o cache de resultados (o monitoramento precisa sempre exercitar o site)
+    if config.RESULT_CACHE_ENABLED:
+        if args.daemon:
+            logger.warning("⚠️ Cache de resultados ignorado no modo daemon")
+        else:
+            result_cache.enable()
+            result_cache.begin_run(config.BASE_URL)
+    
+    # Perfil do executor (até o fim da execução, incluindo os relatórios)
+    if args.profile:
+        profiler.enable(args.profile)
+    
     # Executar testes
-    executor = TestExecutor(browser_type=args.browser)
+    executor = TestExecutor(
+        browser_type=args.browser,
+        tags=tags,
+        test_names=args.tests,
+        test_timeout=args.test_timeout,
+        run_timeout=args.run_timeout,
+        fail_fast=args.fail_fast
+    )
     
     try:
-        if args.strategy:
+        order = args.order
+        if order == 'default' and (args.schedule or args.workers > 1 or args.daemon or matrix_cells):
+            order = 'dag'
+        
+        if args.daemon:
+            daemon = MonitoringDaemon(
+                executor,
+                interval=args.interval,
+                jitter=args.jitter,
+                strategy_name=args.strategy,
+                workers=args.workers,
+                order=order
+            )
+            cycles = daemon.run_forever(args.max_cycles)
+            return 0 if cycles else 1
+        
+        if matrix_cells:
+            logger.info(f"🧮 Executando matriz com {len(matrix_cells)} combinações")
+            result = executor.run_matrix(matrix_cells, args.strategy, args.workers, order)
+        elif order != 'default':
+            logger.info(f"🗓️ Executando testes escalonados ({order}) com {args.workers} worker(s)")
+            result = executor.run_scheduled_tests(args.strategy, args.workers, order)
+        elif args.strategy:
             logger.info(f"🎯 Executando estratégia: {args.strategy}")
             result = executor.run_specific_strategy(args.strategy)
         else:
@@ -126,6 +491,25 @@ Exemplos de uso:
     except Exception as e:
         logger.error(f"❌ Erro inesperado: {str(e)}")
         return 1
+    finally:
+        profiler.finish()
+
+def list_registered_tests(strategy_key=None, tags=None, names=None):
+    """
+    Exibe as unidades de teste registradas que atendem aos filtros.
+    
+    Args:
+        strategy_key (str): Restringe a uma estratégia
+        tags (list): Tags aceitas
+        names (list): Nomes aceitos
+    """
+    units = registry.get_units(strategy_key, tags=tags, names=names)
+    
+    for unit in units:
+        requires = ', '.join(f"{key}={value}" for key, value in unit.requires.items())
+        print(f"{unit.qualified_name:<45} custo={unit.cost:>4.1f}s  tags={','.join(sorted(unit.tags))}  requer={requires}")
+    
+    print(f"\n{len(units)} teste(s) registrado(s)")
 
 def check_site_accessibility(base_url):
     """
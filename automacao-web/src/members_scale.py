@@ -0,0 +1,299 @@
+"""
+Teste de escala do acordeão de membros.
+Cria elencos sintéticos crescentes via POST /api/members e mede, para cada
+volume, a latência de abrir e fechar cada seção (commit no DOM e primeiro
+quadro pintado), o tempo de renderização do grid de cards e a quantidade de
+nós do DOM, gerando uma curva de escala com o expoente de crescimento de cada
+medida. Por padrão usa o stub local do site, pois o Members.tsx exibe uma
+lista fixa de membros e não reflete os dados da API.
+"""
+import json
+import time
+from selenium.webdriver.common.by import By
+from src.pages.members_page import MembersPage
+from src.utils.logger import logger
+from src.utils.artifact_store import artifact_store
+from src.utils.scaling import fit_power_law, summarize
+from src.utils.seed_data import generate_members, seed_members
+from src.utils.site_stub import SiteStub
+from src.utils.webdriver_factory import WebDriverFactory
+from config.settings import Config
+
+# Medidas da curva de escala: chave na linha do relatório e descrição
+CURVE_METRICS = {
+    'expand_paint_ms': 'Abrir seção (pintura, mediana)',
+    'expand_dom_ms': 'Abrir seção (DOM, mediana)',
+    'collapse_paint_ms': 'Fechar seção (pintura, mediana)',
+    'peak_nodes': 'Nós do DOM com todas as seções abertas'
+}
+
+class MembersScaleHarness:
+    """Mede o acordeão de membros com elencos de tamanhos crescentes."""
+    
+    def __init__(self, browser_type="chrome", sizes=None, repetitions=None, base_url=None):
+        """
+        Inicializa o teste de escala.
+        
+        Args:
+            browser_type (str): Navegador usado nas medições
+            sizes (list): Quantidades de membros (padrão: SCALE_SIZES)
+            repetitions (int): Aberturas e fechamentos por seção em cada volume (padrão: SCALE_REPETITIONS)
+            base_url (str): Site cuja API recebe os membros (padrão: stub local)
+        """
+        self.config = Config()
+        self.browser_type = browser_type
+        self.sizes = sorted(sizes or self.config.SCALE_SIZES)
+        self.repetitions = repetitions or self.config.SCALE_REPETITIONS
+        self.base_url = base_url
+    
+    def run(self):
+        """
+        Executa as medições para todos os volumes e exporta a curva de escala.
+        
+        Returns:
+            dict: Relatório com as medições por volume e o ajuste de cada medida
+        """
+        logger.info(f"📈 Teste de escala do acordeão de membros: {', '.join(map(str, self.sizes))} membros")
+        
+        stub = None
+        base_url = self.base_url
+        if base_url is None:
+            stub = SiteStub()
+            base_url = stub.start()
+        else:
+            logger.warning("⚠️ O Members.tsx não consulta /api/members; sem o stub as seções podem não refletir o elenco criado")
+        
+        # Cada volume é atingido criando apenas a diferença em relação ao anterior
+        roster = generate_members(self.sizes[-1], seed=self.config.SCALE_SEED)
+        seeded = 0
+        rows = []
+        started = time.time()
+        driver = None
+        
+        try:
+            driver = WebDriverFactory.create_driver(self.browser_type)
+            page = MembersPage(driver)
+            
+            for size in self.sizes:
+                seeding = seed_members(base_url, roster[seeded:size], workers=self.config.SCALE_SEED_WORKERS)
+                seeded = size
+                rows.append(self._measure_size(page, base_url, size, seeding))
+        except Exception as e:
+            logger.error(f"❌ Erro no teste de escala: {str(e)}")
+        finally:
+            if driver:
+                driver.quit()
+            if stub:
+                stub.stop()
+        
+        report = {
+            'scale_summary': {
+                'component': 'Members (acordeão de instrumentos)',
+                'target': 'stub' if stub else base_url,
+                'browser_used': self.browser_type,
+                'sizes': self.sizes,
+                'repetitions': self.repetitions,
+                'execution_time_seconds': round(time.time() - started, 1)
+            },
+            'measurements': rows,
+            'curve': self._fit_curve(rows)
+        }
+        
+        self._export_report(report)
+        self._log_summary(report)
+        return report
+    
+    def _measure_size(self, page, base_url, size, seeding):
+        """
+        Mede o acordeão com o elenco atual.
+        
+        Args:
+            page (MembersPage): Page Object da seção de membros
+            base_url (str): URL da página
+            size (int): Quantidade de membros criados
+            seeding (dict): Resultado da carga dos membros
+        
+        Returns:
+            dict: Medições do volume
+        """
+        logger.info(f"📏 Medindo acordeão com {size} membros")
+        
+        started = time.perf_counter()
+        page.navigate_to(base_url)
+        page.wait_for_element((By.XPATH, page.INSTRUMENT_SECTION_TEMPLATE.format(page.INSTRUMENTS[0])))
+        page_ready_ms = (time.perf_counter() - started) * 1000
+        baseline_nodes = page.count_dom_nodes()
+        
+        expand_dom, expand_paint, collapse_paint = [], [], []
+        section_cards = {}
+        failures = 0
+        
+        for instrument in page.INSTRUMENTS:
+            for _ in range(self.repetitions):
+                opened = page.measure_section_toggle(instrument)
+                if opened is None:
+                    failures += 1
+                    break
+                closed = page.measure_section_toggle(instrument)
+                if closed is None:
+                    failures += 1
+                    break
+                
+                expand_dom.append(opened['dom_ms'])
+                expand_paint.append(opened['paint_ms'])
+                collapse_paint.append(closed['paint_ms'])
+                section_cards[instrument] = opened['cards']
+        
+        # Pior caso: todas as seções abertas ao mesmo tempo
+        peak_nodes = baseline_nodes
+        opened_sections = []
+        for instrument in page.INSTRUMENTS:
+            measurement = page.measure_section_toggle(instrument)
+            if measurement and measurement['expanded']:
+                opened_sections.append(instrument)
+                peak_nodes = measurement['nodes']
+        for instrument in opened_sections:
+            page.measure_section_toggle(instrument)
+        
+        return {
+            'members': size,
+            'seeded': seeding['created'],
+            'seed_failed': seeding['failed'],
+            'seed_seconds': seeding['seconds'],
+            'rendered_cards': sum(section_cards.values()),
+            'page_ready_ms': round(page_ready_ms, 1),
+            'expand_dom_ms': summarize(expand_dom),
+            'expand_paint_ms': summarize(expand_paint),
+            'collapse_paint_ms': summarize(collapse_paint),
+            'baseline_nodes': baseline_nodes,
+            'peak_nodes': peak_nodes,
+            'nodes_per_member': round((peak_nodes - baseline_nodes) / size, 2),
+            'failed_measurements': failures
+        }
+    
+    def _fit_curve(self, rows):
+        """
+        Ajusta uma lei de potência a cada medida da curva.
+        
+        Args:
+            rows (list): Medições por volume
+        
+        Returns:
+            dict: Expoente e coeficiente por medida
+        """
+        sizes = [row['members'] for row in rows]
+        curve = {}
+        
+        for key, description in CURVE_METRICS.items():
+            values = [row[key]['median'] if isinstance(row[key], dict) else row[key] for row in rows]
+            fit = fit_power_law(sizes, values)
+            curve[key] = dict(fit or {'exponent': None, 'coefficient': None}, description=description)
+        
+        return curve
+    
+    def _curve_rows(self, report):
+        """Linhas da curva de escala para a planilha e o log."""
+        for row in report['measurements']:
+            yield {
+                'Membros': row['members'],
+                'Cards Renderizados': row['rendered_cards'],
+                'Abrir DOM p50 (ms)': row['expand_dom_ms']['median'],
+                'Abrir Pintura p50 (ms)': row['expand_paint_ms']['median'],
+                'Abrir Pintura p95 (ms)': row['expand_paint_ms']['p95'],
+                'Fechar Pintura p50 (ms)': row['collapse_paint_ms']['median'],
+                'Nós DOM (base)': row['baseline_nodes'],
+                'Nós DOM (tudo aberto)': row['peak_nodes'],
+                'Nós por Membro': row['nodes_per_member'],
+                'Página Pronta (ms)': row['page_ready_ms'],
+                'Carga dos Dados (s)': row['seed_seconds']
+            }
+    
+    def _export_report(self, report):
+        """
+        Exporta a curva de escala em JSON e Excel (com gráfico).
+        
+        Args:
+            report (dict): Relatório do teste de escala
+        """
+        try:
+            if self.config.EXPORT_JSON:
+                json_path = self.config.get_scale_report_path('json')
+                with self.config.reserved_file(json_path), open(json_path, 'w', encoding='utf-8') as f:
+                    json.dump(report, f, indent=2, ensure_ascii=False)
+                json_path = artifact_store.put_file(json_path, 'report')
+                logger.info(f"📄 Curva de escala exportada: {json_path}")
+            
+            if self.config.EXPORT_EXCEL and report['measurements']:
+                self._export_excel_report(report)
+        except Exception as e:
+            logger.error(f"❌ Erro ao exportar a curva de escala: {str(e)}")
+    
+    def _export_excel_report(self, report):
+        """
+        Exporta a curva de escala em Excel, com gráficos de latência e de nós do DOM.
+        
+        Args:
+            report (dict): Relatório do teste de escala
+        """
+        try:
+            import pandas as pd
+            from openpyxl.chart import LineChart, Reference
+            
+            curve_df = pd.DataFrame(list(self._curve_rows(report)))
+            fit_df = pd.DataFrame([
+                {'Medida': fit['description'], 'Expoente': fit['exponent'], 'Coeficiente': fit['coefficient']}
+                for fit in report['curve'].values()
+            ])
+            
+            excel_path = self.config.get_scale_report_path('xlsx')
+            with self.config.reserved_file(excel_path), pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
+                curve_df.to_excel(writer, sheet_name='Curva de Escala', index=False)
+                fit_df.to_excel(writer, sheet_name='Crescimento', index=False)
+                
+                sheet = writer.sheets['Curva de Escala']
+                last_row = len(curve_df) + 1
+                sizes = Reference(sheet, min_col=1, min_row=2, max_row=last_row)
+                
+                # Colunas 3-6: latências; colunas 7-8: nós do DOM
+                for title, y_title, first_col, last_col, anchor in (
+                    ('Latência do acordeão', 'ms', 3, 6, 'M2'),
+                    ('Nós do DOM', 'elementos', 7, 8, 'M20')
+                ):
+                    chart = LineChart()
+                    chart.title = title
+                    chart.x_axis.title = 'Membros'
+                    chart.y_axis.title = y_title
+                    chart.add_data(Reference(sheet, min_col=first_col, max_col=last_col, min_row=1, max_row=last_row),
+                                   titles_from_data=True)
+                    chart.set_categories(sizes)
+                    sheet.add_chart(chart, anchor)
+            
+            excel_path = artifact_store.put_file(excel_path, 'report')
+            logger.info(f"📊 Curva de escala em Excel exportada: {excel_path}")
+            
+        except ImportError:
+            logger.warning("⚠️ Pandas/openpyxl não disponíveis. Curva de escala em Excel não gerada.")
+        except Exception as e:
+            logger.error(f"❌ Erro ao gerar a curva de escala em Excel: {str(e)}")
+    
+    def _log_summary(self, report):
+        """
+        Loga a curva de escala.
+        
+        Args:
+            report (dict): Relatório do teste de escala
+        """
+        logger.info("=" * 60)
+        logger.info("📈 CURVA DE ESCALA - ACORDEÃO DE MEMBROS")
+        logger.info("=" * 60)
+        
+        for row in report['measurements']:
+            logger.info(
+                f"   {row['members']:>6} membros: abrir {row['expand_paint_ms']['median']}ms "
+                f"(p95 {row['expand_paint_ms']['p95']}ms), fechar {row['collapse_paint_ms']['median']}ms, "
+                f"{row['peak_nodes']} nós ({row['nodes_per_member']}/membro)"
+            )
+        
+        for fit in report['curve'].values():
+            if fit['exponent'] is not None:
+                logger.info(f"   📐 {fit['description']}: cresce ~ n^{fit['exponent']}")
\ No newline at end of file
@@ -0,0 +1,288 @@
+"""
+Modo daemon para monitoramento sintético contínuo.
+Mantém o executor e os navegadores residentes entre os ciclos, executa os
+testes em intervalos com jitter e grava resultados contínuos em arquivos de
+tamanho limitado, para que o uso de memória e disco não cresça com o tempo.
+"""
+import gc
+import json
+import os
+import random
+import signal
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from src.utils.webdriver_factory import WebDriverFactory
+from src.utils.logger import logger
+from src.utils.metrics import metrics
+from src.utils.tracing import tracer
+from src.utils.artifact_store import artifact_store
+from src.utils.wait_history import wait_history
+from config.settings import Config
+
+class MonitoringDaemon:
+    """Executa os testes periodicamente reutilizando navegadores já abertos."""
+    
+    def __init__(self, executor, interval=None, jitter=None, strategy_name=None, workers=1, order='dag'):
+        """
+        Inicializa o daemon.
+        
+        Args:
+            executor (TestExecutor): Executor reutilizado em todos os ciclos
+            interval (float): Intervalo entre o início de dois ciclos, em segundos (padrão: DAEMON_INTERVAL)
+            jitter (float): Variação aleatória do intervalo, fração entre 0 e 1 (padrão: DAEMON_JITTER)
+            strategy_name (str): Restringe a uma estratégia
+            workers (int): Quantidade de navegadores residentes
+            order (str): Ordem de execução ('dag' ou 'history')
+        """
+        self.config = Config()
+        self.executor = executor
+        self.interval = interval or self.config.DAEMON_INTERVAL
+        self.jitter = self.config.DAEMON_JITTER if jitter is None else min(max(jitter, 0.0), 1.0)
+        self.strategy_name = strategy_name
+        self.workers = workers
+        self.order = order
+        self.plans = []
+        self.drivers = {}
+        self.cycle = 0
+        self.history = deque(maxlen=self.config.DAEMON_HISTORY_SIZE)
+        self.consecutive_failures = 0
+        self._stop_event = threading.Event()
+    
+    def start(self):
+        """
+        Calcula o plano de execução e abre os navegadores residentes.
+        
+        Returns:
+            bool: True se o daemon estiver pronto para executar
+        """
+        self.plans = self.executor.plan_tests(self.strategy_name, self.workers, self.order)
+        if not self.plans:
+            logger.error("❌ Nenhum teste selecionado para o monitoramento")
+            return False
+        
+        try:
+            for plan in self.plans:
+                self.drivers[plan.worker_id] = WebDriverFactory.create_managed_driver(self.executor.browser_type)
+        except Exception as e:
+            logger.error(f"❌ Erro ao abrir navegadores do daemon: {str(e)}")
+            self.shutdown()
+            return False
+        
+        logger.enable_rotation(self.config.DAEMON_RESULTS_MAX_BYTES)
+        logger.info(f"🛰️ Daemon iniciado: {len(self.drivers)} navegador(es), intervalo de {self.interval}s (±{self.jitter:.0%})")
+        return True
+    
+    def stop(self, *_):
+        """Solicita o encerramento após o ciclo atual (também usado como handler de sinal)."""
+        logger.info("🛑 Encerramento do daemon solicitado")
+        self._stop_event.set()
+    
+    def shutdown(self):
+        """Fecha os navegadores residentes."""
+        for worker_id, driver in self.drivers.items():
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.error(f"❌ Erro ao fechar WebDriver do worker {worker_id}: {str(e)}")
+        self.drivers = {}
+    
+    def run_forever(self, max_cycles=None):
+        """
+        Executa ciclos até receber SIGINT/SIGTERM ou atingir max_cycles.
+        
+        Args:
+            max_cycles (int): Quantidade máxima de ciclos (None = ilimitado)
+        
+        Returns:
+            int: Quantidade de ciclos executados
+        """
+        if not self.start():
+            return 0
+        
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            try:
+                signal.signal(signal_number, self.stop)
+            except ValueError:
+                # Sinais só podem ser tratados na thread principal
+                pass
+        
+        try:
+            # Primeiro ciclo com atraso aleatório para não sincronizar várias instâncias
+            next_start = time.monotonic() + random.uniform(0, self.interval * self.jitter)
+            
+            while not self._stop_event.is_set():
+                if self._stop_event.wait(max(0.0, next_start - time.monotonic())):
+                    break
+                
+                cycle_start = time.monotonic()
+                self.run_cycle()
+                
+                if max_cycles and self.cycle >= max_cycles:
+                    break
+                
+                next_start = cycle_start + self._next_interval()
+                if next_start < time.monotonic():
+                    logger.warning("⚠️ Ciclo mais longo que o intervalo configurado; próximo ciclo inicia imediatamente")
+        finally:
+            self.shutdown()
+            logger.info(f"👋 Daemon encerrado após {self.cycle} ciclo(s)")
+        
+        return self.cycle
+    
+    def _next_interval(self):
+        """Sorteia o intervalo até o próximo ciclo aplicando o jitter."""
+        return self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+    
+    def run_cycle(self):
+        """
+        Executa um ciclo completo de testes nos navegadores residentes.
+        
+        Returns:
+            dict: Relatório do ciclo
+        """
+        self.cycle += 1
+        logger.info(f"🔁 Ciclo de monitoramento #{self.cycle}")
+        
+        # Um manifesto por ciclo: a retenção de artefatos descarta ciclos antigos
+        if self.cycle > 1:
+            artifact_store.begin_run(f"ciclo {self.cycle}")
+        
+        self._check_browsers()
+        
+        self.executor.reset()
+        report = self.executor.execute_plans(self.plans, self.order, self.drivers)
+        report['execution_summary']['cycle'] = self.cycle
+        
+        self._record(report)
+        tracer.save()
+        
+        # Descarta os resultados detalhados do executor; só o resumo do ciclo é mantido
+        self.executor.reset()
+        self._prune_screenshots()
+        if artifact_store.enabled:
+            artifact_store.collect_garbage()
+        gc.collect()
+        
+        return report
+    
+    def _check_browsers(self):
+        """Substitui navegadores que pararam de responder ou atingiram o limite de ciclos."""
+        recycle = self.config.DAEMON_RECYCLE_CYCLES
+        
+        for worker_id, driver in self.drivers.items():
+            try:
+                if recycle and self.cycle > 1 and (self.cycle - 1) % recycle == 0:
+                    logger.info(f"♻️ Reciclando navegador do worker {worker_id} após {recycle} ciclos")
+                    driver.replace()
+                    continue
+                
+                driver.current_url
+            except Exception as e:
+                logger.warning(f"⚠️ Navegador do worker {worker_id} não responde ({str(e)}); substituindo")
+                try:
+                    driver.replace()
+                except Exception as replace_error:
+                    logger.error(f"❌ Falha ao substituir navegador do worker {worker_id}: {str(replace_error)}")
+    
+    def _record(self, report):
+        """
+        Registra o resumo do ciclo nos resultados contínuos e no arquivo de status.
+        
+        Args:
+            report (dict): Relatório do ciclo
+        """
+        summary = report['test_summary']
+        failures = [
+            {'test_name': test['test_name'], 'message': test['message']}
+            for test in report['detailed_breakdown']['failed_tests']
+        ]
+        
+        entry = {
+            'cycle': self.cycle,
+            'timestamp': report['execution_summary']['start_time'],
+            'duration_seconds': report['execution_summary']['execution_time_seconds'],
+            'total_tests': summary['total_tests'],
+            'passed': summary['total_passed'],
+            'failed': summary['total_failed'],
+            'success': summary['overall_success'],
+            'failures': failures
+        }
+        
+        self.history.append(entry)
+        self.consecutive_failures = 0 if entry['success'] else self.consecutive_failures + 1
+        
+        self._append_result(entry)
+        self._write_status(entry)
+        metrics.flush()
+        wait_history.save()
+        
+        status = "✅" if entry['success'] else "❌"
+        logger.info(
+            f"{status} Ciclo #{self.cycle}: {entry['passed']}/{entry['total_tests']} aprovados "
+            f"em {entry['duration_seconds'] or 0:.1f}s"
+        )
+    
+    def _append_result(self, entry):
+        """Acrescenta uma linha ao arquivo de resultados, rotacionando-o ao atingir o limite."""
+        results_path = self.config.get_monitoring_results_path()
+        
+        try:
+            if results_path.exists() and results_path.stat().st_size >= self.config.DAEMON_RESULTS_MAX_BYTES:
+                os.replace(results_path, results_path.with_suffix('.jsonl.1'))
+            
+            with open(results_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        except OSError as e:
+            logger.error(f"❌ Erro ao gravar resultado do ciclo: {str(e)}")
+    
+    def _write_status(self, entry):
+        """Grava atomicamente o status atual e as estatísticas da janela recente."""
+        status_path = self.config.get_monitoring_status_path()
+        
+        window_failures = {}
+        for cycle_entry in self.history:
+            for failure in cycle_entry['failures']:
+                window_failures[failure['test_name']] = window_failures.get(failure['test_name'], 0) + 1
+        
+        successful_cycles = sum(1 for cycle_entry in self.history if cycle_entry['success'])
+        
+        status = {
+            'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'base_url': self.config.BASE_URL,
+            'cycles_run': self.cycle,
+            'consecutive_failures': self.consecutive_failures,
+            'last_cycle': entry,
+            'window': {
+                'cycles': len(self.history),
+                'availability': successful_cycles / len(self.history) * 100,
+                'failures_by_test': window_failures
+            },
+            'browser_generations': {
+                str(worker_id): driver.generation for worker_id, driver in self.drivers.items()
+            }
+        }
+        
+        try:
+            temp_path = status_path.with_suffix('.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(status, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, status_path)
+        except OSError as e:
+            logger.error(f"❌ Erro ao gravar status do monitoramento: {str(e)}")
+    
+    def _prune_screenshots(self):
+        """Mantém apenas as screenshots mais recentes dentro do limite configurado."""
+        limit = self.config.DAEMON_MAX_SCREENSHOTS
+        screenshots = sorted(
+            self.config.SCREENSHOTS_DIR.glob('*.png'),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True
+        )
+        
+        for screenshot in screenshots[limit:]:
+            try:
+                screenshot.unlink()
+            except OSError:
+                pass
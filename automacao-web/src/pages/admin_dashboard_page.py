@@ -0,0 +1,243 @@
+"""
+Page Object para o painel administrativo do Bloco Praieira (/admin).
+"""
+import re
+from selenium.webdriver.common.by import By
+from src.pages.base_page import BasePage
+from src.utils.logger import logger
+
+class AdminDashboardPage(BasePage):
+    """Page Object para o painel administrativo."""
+    
+    # Localizadores do painel
+    HEADER_TITLE = (By.XPATH, "//h1[contains(text(), 'Admin - Bloco Praieira')]")
+    LOADING_TEXT = (By.XPATH, "//p[contains(text(), 'Carregando...')]")
+    MEMBERS_TAB = (By.XPATH, "//button[starts-with(normalize-space(), 'Membros (')]")
+    DONATIONS_TAB = (By.XPATH, "//button[starts-with(normalize-space(), 'Doações (')]")
+    MEMBERS_HEADING = (By.XPATH, "//h2[contains(text(), 'Lista de Membros')]")
+    DONATIONS_HEADING = (By.XPATH, "//h2[contains(text(), 'Histórico de Doações')]")
+    NEW_MEMBER_NAME = (By.XPATH, "//input[@placeholder='Nome']")
+    TABLE_ROWS = (By.CSS_SELECTOR, "tbody tr")
+    
+    # Abas: prefixo do rótulo do botão e título exibido quando a aba está ativa
+    TABS = {
+        'members': ('Membros (', 'Lista de Membros'),
+        'donations': ('Doações (', 'Histórico de Doações')
+    }
+    
+    # Aguarda o fim do carregamento (abas com contadores) e o primeiro quadro pintado
+    # depois dele; o tempo é contado a partir do início da navegação (performance.now)
+    MEASURE_RENDER_SCRIPT = """
+        const timeoutMs = arguments[0], done = arguments[arguments.length - 1];
+        const ready = () => Array.from(document.querySelectorAll('button'))
+            .some(button => button.textContent.trim().startsWith('Membros ('));
+        const apiTime = route => {
+            const entry = performance.getEntriesByType('resource').filter(e => e.name.includes(route)).pop();
+            return entry ? entry.duration : null;
+        };
+        const finish = upperBound => requestAnimationFrame(() => requestAnimationFrame(() => done({
+            render_ms: performance.now(),
+            upper_bound: upperBound,
+            api_members_ms: apiTime('/api/members'),
+            api_donations_ms: apiTime('/api/donations'),
+            rows: document.querySelectorAll('tbody tr').length,
+            nodes: document.getElementsByTagName('*').length
+        })));
+        // Já pronto ao iniciar o script: o instante real do render é anterior ao medido
+        if (ready()) { finish(true); return; }
+        const observer = new MutationObserver(() => {
+            if (ready()) { observer.disconnect(); finish(false); }
+        });
+        observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+        setTimeout(() => { observer.disconnect(); done({error: 'Timeout aguardando o painel'}); }, timeoutMs);
+    """
+    
+    # Clica em um botão e aguarda uma condição no DOM, marcando o commit e o primeiro quadro pintado
+    MEASURE_CLICK_SCRIPT = """
+        const buttonPrefix = arguments[0], condition = arguments[1], expected = arguments[2],
+              timeoutMs = arguments[3], done = arguments[arguments.length - 1];
+        const findButton = prefix => Array.from(document.querySelectorAll('button'))
+            .find(button => button.textContent.trim().startsWith(prefix));
+        const checks = {
+            heading: () => Array.from(document.querySelectorAll('h2')).some(h => h.textContent.includes(expected)),
+            button: () => !!findButton(expected)
+        };
+        const button = findButton(buttonPrefix);
+        if (!button) { done({error: 'Botão não encontrado: ' + buttonPrefix}); return; }
+        let domMs = null;
+        const started = performance.now();
+        const observer = new MutationObserver(() => {
+            if (!checks[condition]()) return;
+            observer.disconnect();
+            domMs = performance.now() - started;
+            requestAnimationFrame(() => requestAnimationFrame(() => done({
+                dom_ms: domMs,
+                paint_ms: performance.now() - started,
+                rows: document.querySelectorAll('tbody tr').length,
+                nodes: document.getElementsByTagName('*').length
+            })));
+        });
+        observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+        button.click();
+        setTimeout(() => {
+            if (domMs === null) { observer.disconnect(); done({error: 'Timeout aguardando: ' + expected}); }
+        }, timeoutMs);
+    """
+    
+    def __init__(self, driver, base_url=None):
+        """
+        Inicializa o painel administrativo.
+        
+        Args:
+            driver: Instância do WebDriver
+            base_url (str): Site que serve o painel (padrão: BASE_URL)
+        """
+        super().__init__(driver)
+        self.page_url = f"{(base_url or self.config.BASE_URL).rstrip('/')}/admin"
+    
+    def open(self):
+        """Abre o painel administrativo."""
+        logger.action("Abrindo painel administrativo")
+        self.navigate_to(self.page_url)
+        return self
+    
+    def _run_measurement(self, label, script, *args, timeout=None):
+        """
+        Executa um script de medição assíncrono.
+        
+        Args:
+            label (str): Nome da ação medida
+            script (str): Script com callback no último argumento
+            *args: Argumentos do script (sem o tempo limite)
+            timeout (float): Tempo limite em segundos (padrão: PAGE_LOAD_TIMEOUT)
+        
+        Returns:
+            dict: Medição retornada pelo script, ou None em caso de erro
+        """
+        timeout = timeout or self.config.PAGE_LOAD_TIMEOUT
+        
+        try:
+            self.driver.set_script_timeout(timeout + 5)
+            with self._measure(label):
+                measurement = self.driver.execute_async_script(script, *args, int(timeout * 1000))
+        except Exception as e:
+            logger.error(f"❌ Erro ao medir {label}: {str(e)}")
+            return None
+        
+        if not measurement or measurement.get('error'):
+            logger.error(f"❌ Medição de {label} falhou: {(measurement or {}).get('error')}")
+            return None
+        return measurement
+    
+    def measure_render(self, timeout=None):
+        """
+        Abre o painel e mede o tempo até os dados serem renderizados.
+        
+        Args:
+            timeout (float): Tempo limite em segundos (padrão: PAGE_LOAD_TIMEOUT)
+        
+        Returns:
+            dict: render_ms (desde o início da navegação), upper_bound, api_members_ms,
+                api_donations_ms, rows e nodes, ou None se a medição falhar
+        """
+        self.open()
+        measurement = self._run_measurement('admin_render', self.MEASURE_RENDER_SCRIPT, timeout=timeout)
+        
+        if measurement:
+            logger.info(
+                f"⏱️ Painel renderizado em {measurement['render_ms']:.0f}ms "
+                f"({measurement['rows']} linhas, {measurement['nodes']} elementos)"
+            )
+        return measurement
+    
+    def measure_tab_switch(self, tab, timeout=None):
+        """
+        Troca de aba medindo a renderização da tabela correspondente.
+        
+        Args:
+            tab (str): 'members' ou 'donations'
+            timeout (float): Tempo limite em segundos
+        
+        Returns:
+            dict: dom_ms, paint_ms, rows e nodes, ou None se a medição falhar
+        """
+        logger.action(f"Trocando para a aba: {tab}")
+        button_prefix, heading = self.TABS[tab]
+        return self._run_measurement('admin_tab_switch', self.MEASURE_CLICK_SCRIPT,
+                                     button_prefix, 'heading', heading, timeout=timeout)
+    
+    def measure_add_member(self, name, timeout=None):
+        """
+        Adiciona um membro pelo formulário e mede até a lista recarregada ser pintada
+        (o painel busca novamente todos os membros e doações após cada inclusão).
+        
+        Args:
+            name (str): Nome do novo membro
+            timeout (float): Tempo limite em segundos
+        
+        Returns:
+            dict: dom_ms, paint_ms, rows e nodes, ou None se a medição falhar
+        """
+        counts = self.get_tab_counts()
+        if counts is None:
+            return None
+        
+        self.type_text(self.NEW_MEMBER_NAME, name)
+        return self._run_measurement('admin_add_member', self.MEASURE_CLICK_SCRIPT,
+                                     'Adicionar', 'button', f"Membros ({counts['members'] + 1})", timeout=timeout)
+    
+    def get_tab_counts(self):
+        """
+        Lê os contadores exibidos nas abas.
+        
+        Returns:
+            dict: members (quantidade) e donations_total (R$), ou None se não encontrados
+        """
+        try:
+            members_label = self.get_text(self.MEMBERS_TAB)
+            donations_label = self.get_text(self.DONATIONS_TAB)
+        except Exception as e:
+            logger.error(f"❌ Abas do painel não encontradas: {str(e)}")
+            return None
+        
+        members = re.search(r'\((\d+)\)', members_label)
+        total = re.search(r'R\$\s*([\d.]+)', donations_label)
+        if not members or not total:
+            logger.error(f"❌ Contadores inesperados nas abas: '{members_label}', '{donations_label}'")
+            return None
+        
+        return {'members': int(members.group(1)), 'donations_total': float(total.group(1))}
+    
+    def count_table_rows(self):
+        """
+        Conta as linhas da tabela da aba ativa.
+        
+        Returns:
+            int: Quantidade de linhas
+        """
+        return len(self.driver.find_elements(*self.TABLE_ROWS))
+    
+    def verify_dashboard_loaded(self):
+        """
+        Verifica se o painel terminou de carregar.
+        
+        Returns:
+            bool: True se cabeçalho e abas estão visíveis
+        """
+        logger.verification("Verificando painel administrativo")
+        
+        elements_to_check = [
+            (self.HEADER_TITLE, "Título do painel"),
+            (self.MEMBERS_TAB, "Aba de membros"),
+            (self.DONATIONS_TAB, "Aba de doações"),
+            (self.MEMBERS_HEADING, "Lista de membros")
+        ]
+        
+        for locator, element_name in elements_to_check:
+            if not self.is_element_visible(locator):
+                logger.error(f"❌ Elemento não visível: {element_name}")
+                return False
+            logger.debug(f"✅ {element_name} está visível")
+        
+        logger.info("✅ Painel administrativo carregado")
+        return True
\ No newline at end of file
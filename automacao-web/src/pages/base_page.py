@@ -6,9 +6,34 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException,
+    ElementNotInteractableException, ElementClickInterceptedException
+)
 from config.settings import Config
 from src.utils.logger import logger
+from src.utils.metrics import metrics
+from src.utils.tracing import tracer
+from src.utils.har import har_recorder
+from src.utils.artifact_store import artifact_store
+from src.utils.wait_history import wait_history
+from src.utils.dom_waits import push_waits
+from src.utils.link_checker import LINK_COLLECTION_SCRIPT
+from contextlib import contextmanager
+from urllib.parse import urlparse
+import time
+import weakref
+
+# Navegações feitas por qualquer Page Object em cada navegador: invalidam os
+# elementos guardados por todos os Page Objects que compartilham o driver
+_navigations = weakref.WeakKeyDictionary()
+
+# Elemento guardado removido do DOM ou re-renderizado: é localizado de novo
+STALE_ELEMENT_ERRORS = (StaleElementReferenceException,)
+
+# Elemento guardado ainda no DOM, mas escondido ou coberto: a espera de localização
+# (ex: até ficar clicável) é feita como sem o cache, com métrica própria
+NOT_INTERACTABLE_ERRORS = (ElementNotInteractableException, ElementClickInterceptedException)
 
 class BasePage:
     """Classe base para todas as páginas do site."""
@@ -23,6 +48,22 @@ class BasePage:
         self.driver = driver
         self.config = Config()
         self.wait = WebDriverWait(driver, self.config.MAX_WAIT_ELEMENTS)
+        self._elements = {}
+        self._history_context = None
+    
+    @contextmanager
+    def _measure(self, action, category='page', **args):
+        """
+        Mede uma ação do Page Object na métrica de ações e no trace da execução.
+        
+        Args:
+            action (str): Nome da ação
+            category (str): Categoria do span no trace
+            **args: Dados extras do span
+        """
+        with metrics.page_action_duration.time(action=action):
+            with tracer.span(action, category, self.driver, **args):
+                yield
     
     def navigate_to(self, url):
         """
@@ -32,27 +73,152 @@ class BasePage:
             url (str): URL de destino
         """
         logger.action(f"Navegando para: {url}")
-        self.driver.get(url)
+        path = urlparse(url).path or '/'
+        with har_recorder.capture(self.driver, f"navegação {path}"):
+            with metrics.navigation_duration.time(path=path):
+                with tracer.span('navigate', 'page', self.driver, url=url):
+                    self.driver.get(url)
+        _navigations[self.driver] = _navigations.get(self.driver, 0) + 1
+        self._elements.clear()
         logger.info(f"✅ Página carregada: {self.driver.title}")
     
+    def _dom_generation(self):
+        """Geração do documento: muda ao substituir o navegador ou navegar por qualquer Page Object."""
+        return getattr(self.driver, 'generation', 0), _navigations.get(self.driver, 0)
+    
+    def invalidate_elements(self):
+        """Descarta os elementos guardados (ex: após recarregar a página por fora do Page Object)."""
+        self._elements.clear()
+    
+    def _remember(self, locator, element):
+        """Guarda o elemento localizado para as próximas interações com o mesmo localizador."""
+        self._elements[locator] = (self._dom_generation(), element)
+    
+    def _cached_element(self, locator):
+        """
+        Elemento guardado para o localizador, se ainda for da geração atual do documento.
+        
+        Args:
+            locator (tuple): Localizador do elemento
+            
+        Returns:
+            WebElement: Elemento guardado, ou None
+        """
+        entry = self._elements.get(locator)
+        if entry is None:
+            return None
+        if entry[0] != self._dom_generation():
+            del self._elements[locator]
+            return None
+        return entry[1]
+    
+    def _with_element(self, locator, find, action, accept=None):
+        """
+        Executa uma ação sobre o elemento guardado, evitando uma nova busca. Se o
+        elemento ficou obsoleto (ou o resultado não é aceito), localiza de novo
+        com a espera informada e repete a ação. Um elemento guardado escondido ou
+        coberto também passa pela espera, contado à parte ('not_interactable').
+        
+        Args:
+            locator (tuple): Localizador do elemento
+            find (callable): Espera usada para localizar o elemento
+            action (callable): Ação que recebe o elemento
+            accept (callable): Valida o resultado obtido com o elemento guardado
+            
+        Returns:
+            Resultado da ação
+        """
+        element = self._cached_element(locator)
+        if element is not None:
+            outcome = 'stale'
+            try:
+                result = action(element)
+                if accept is None or accept(result):
+                    metrics.element_cache.inc(result='hit')
+                    return result
+            except STALE_ELEMENT_ERRORS:
+                pass
+            except NOT_INTERACTABLE_ERRORS:
+                outcome = 'not_interactable'
+            metrics.element_cache.inc(result=outcome)
+            if outcome == 'stale':
+                logger.debug(f"♻️ Elemento guardado obsoleto, localizando novamente: {locator}")
+            else:
+                logger.debug(f"⏳ Elemento guardado escondido ou coberto, aguardando novamente: {locator}")
+            self._elements.pop(locator, None)
+        else:
+            metrics.element_cache.inc(result='miss')
+        
+        return action(find(locator))
+    
+    def _history_key(self, locator):
+        """Chave do localizador no histórico de latência; o contexto é lido uma vez por documento."""
+        generation = self._dom_generation()
+        if self._history_context is None or self._history_context[0] != generation:
+            self._history_context = (generation, wait_history.context(self.driver))
+        return wait_history.key(self._history_context[1], type(self).__name__, locator)
+    
+    def _wait_until(self, action, condition, locator, timeout, push=None, **options):
+        """
+        Aguarda uma condição sobre um elemento, registrando a latência observada.
+        Sem tempo limite explícito, usa o derivado do histórico do localizador.
+        Com uma condição equivalente na página, a espera é feita pelo observador
+        de mutações (uma única chamada); sem suporte do driver, pelo WebDriverWait.
+        
+        Args:
+            action (str): Nome da espera nas métricas
+            condition (callable): Condição do WebDriverWait
+            locator (tuple): Localizador do elemento
+            timeout (float): Tempo limite em segundos (padrão: adaptativo)
+            push (str): Condição equivalente nas esperas na página
+            **options: Parâmetros da condição na página
+            
+        Returns:
+            WebElement: Elemento que atendeu à condição
+        """
+        key = self._history_key(locator)
+        p99 = None
+        adaptive = timeout is None and key is not None
+        if timeout is None:
+            timeout, p99 = wait_history.timeout_for(key) if key else (self.config.MAX_WAIT_ELEMENTS, None)
+        
+        started = time.perf_counter()
+        try:
+            with self._measure(action):
+                element = None
+                if push and push_waits.available(self.driver):
+                    element = push_waits.wait(self.driver, locator, push, timeout, self._dom_generation(), **options)
+                if element is None:
+                    remaining = max(timeout - (time.perf_counter() - started), 0)
+                    wait = WebDriverWait(self.driver, remaining, ignored_exceptions=(StaleElementReferenceException,))
+                    element = wait.until(condition)
+        except TimeoutException:
+            if p99 is not None:
+                logger.warning(f"⏱️ Tempo limite adaptativo de {timeout:.1f}s esgotado (p99 histórico {p99:.0f}ms)")
+            if adaptive:
+                # Amostra censurada: o elemento levou pelo menos o tempo esperado, e o limite seguinte sobe
+                wait_history.record(key, time.perf_counter() - started)
+            raise
+        
+        if key:
+            wait_history.record(key, time.perf_counter() - started)
+        self._remember(locator, element)
+        return element
+    
     def wait_for_element(self, locator, timeout=None):
         """
         Aguarda um elemento ficar visível.
         
         Args:
             locator (tuple): Localizador do elemento (By.ID, "element_id")
-            timeout (int): Tempo limite em segundos
+            timeout (int): Tempo limite em segundos (padrão: adaptativo, até MAX_WAIT_ELEMENTS)
             
         Returns:
             WebElement: Elemento encontrado
         """
-        if timeout is None:
-            timeout = self.config.MAX_WAIT_ELEMENTS
-        
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            element = self._wait_until('wait_visible', EC.visibility_of_element_located(locator), locator, timeout,
+                                       push='visible')
             logger.debug(f"✅ Elemento encontrado: {locator}")
             return element
         except TimeoutException:
@@ -65,24 +231,90 @@ class BasePage:
         
         Args:
             locator (tuple): Localizador do elemento
-            timeout (int): Tempo limite em segundos
+            timeout (int): Tempo limite em segundos (padrão: adaptativo, até MAX_WAIT_ELEMENTS)
             
         Returns:
             WebElement: Elemento clicável
         """
-        if timeout is None:
-            timeout = self.config.MAX_WAIT_ELEMENTS
-        
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(locator)
-            )
+            element = self._wait_until('wait_clickable', EC.element_to_be_clickable(locator), locator, timeout,
+                                       push='clickable')
             logger.debug(f"✅ Elemento clicável: {locator}")
             return element
         except TimeoutException:
             logger.error(f"❌ Timeout ao aguardar elemento clicável: {locator}")
             raise
     
+    def wait_for_text_change(self, locator, previous_text, timeout=None):
+        """
+        Aguarda o texto de um elemento ficar diferente do informado.
+        
+        Args:
+            locator (tuple): Localizador do elemento
+            previous_text (str): Texto anterior
+            timeout (int): Tempo limite em segundos (padrão: adaptativo, até MAX_WAIT_ELEMENTS)
+            
+        Returns:
+            WebElement: Elemento com o novo texto
+        """
+        def changed(driver):
+            element = driver.find_element(*locator)
+            return element if element.text != previous_text else False
+        
+        try:
+            return self._wait_until('wait_text_change', changed, locator, timeout,
+                                    push='text_changed', previous=previous_text)
+        except TimeoutException:
+            logger.error(f"❌ Timeout ao aguardar mudança de texto: {locator}")
+            raise
+    
+    def wait_for_class(self, locator, class_name, present=True, timeout=None):
+        """
+        Aguarda uma classe CSS ser adicionada (ou removida) de um elemento.
+        
+        Args:
+            locator (tuple): Localizador do elemento
+            class_name (str): Classe CSS
+            present (bool): True para aguardar a classe, False para aguardar a remoção
+            timeout (int): Tempo limite em segundos (padrão: adaptativo, até MAX_WAIT_ELEMENTS)
+            
+        Returns:
+            WebElement: Elemento no estado esperado
+        """
+        def toggled(driver):
+            element = driver.find_element(*locator)
+            classes = (element.get_attribute('class') or '').split()
+            return element if (class_name in classes) == present else False
+        
+        try:
+            return self._wait_until('wait_class', toggled, locator, timeout,
+                                    push='class_toggled', class_name=class_name, present=present)
+        except TimeoutException:
+            logger.error(f"❌ Timeout ao aguardar classe '{class_name}': {locator}")
+            raise
+    
+    def wait_for_image_loaded(self, locator, timeout=None):
+        """
+        Aguarda uma imagem terminar de carregar.
+        
+        Args:
+            locator (tuple): Localizador da imagem
+            timeout (int): Tempo limite em segundos (padrão: adaptativo, até MAX_WAIT_ELEMENTS)
+            
+        Returns:
+            WebElement: Imagem carregada
+        """
+        def loaded(driver):
+            element = driver.find_element(*locator)
+            complete = driver.execute_script("return arguments[0].complete && arguments[0].naturalWidth > 0;", element)
+            return element if complete else False
+        
+        try:
+            return self._wait_until('wait_image', loaded, locator, timeout, push='image_loaded')
+        except TimeoutException:
+            logger.error(f"❌ Timeout ao aguardar carregamento da imagem: {locator}")
+            raise
+    
     def click_element(self, locator):
         """
         Clica em um elemento.
@@ -90,8 +322,11 @@ class BasePage:
         Args:
             locator (tuple): Localizador do elemento
         """
-        element = self.wait_for_element_clickable(locator)
-        element.click()
+        def click(element):
+            with self._measure('click'):
+                element.click()
+        
+        self._with_element(locator, self.wait_for_element_clickable, click)
         logger.action(f"Clicou no elemento: {locator}")
     
     def type_text(self, locator, text):
@@ -102,9 +337,12 @@ class BasePage:
             locator (tuple): Localizador do campo
             text (str): Texto a ser digitado
         """
-        element = self.wait_for_element(locator)
-        element.clear()
-        element.send_keys(text)
+        def type_into(element):
+            with self._measure('type'):
+                element.clear()
+                element.send_keys(text)
+        
+        self._with_element(locator, self.wait_for_element, type_into)
         logger.action(f"Digitou '{text}' no campo: {locator}")
     
     def get_text(self, locator):
@@ -117,8 +355,8 @@ class BasePage:
         Returns:
             str: Texto do elemento
         """
-        element = self.wait_for_element(locator)
-        text = element.text
+        # Texto vazio no elemento guardado pode ser um elemento escondido: aguarda a visibilidade de novo
+        text = self._with_element(locator, self.wait_for_element, lambda element: element.text, accept=bool)
         logger.debug(f"Texto obtido: '{text}' do elemento: {locator}")
         return text
     
@@ -148,10 +386,15 @@ class BasePage:
         Returns:
             bool: True se o elemento estiver visível
         """
-        try:
+        def find(locator):
             element = self.driver.find_element(*locator)
-            return element.is_displayed()
-        except NoSuchElementException:
+            self._remember(locator, element)
+            return element
+        
+        try:
+            with self._measure('is_visible'):
+                return self._with_element(locator, find, lambda element: element.is_displayed())
+        except (NoSuchElementException, StaleElementReferenceException):
             return False
     
     def scroll_to_element(self, locator):
@@ -161,8 +404,11 @@ class BasePage:
         Args:
             locator (tuple): Localizador do elemento
         """
-        element = self.wait_for_element(locator)
-        self.driver.execute_script("arguments[0].scrollIntoView();", element)
+        def scroll(element):
+            with self._measure('scroll'):
+                self.driver.execute_script("arguments[0].scrollIntoView();", element)
+        
+        self._with_element(locator, self.wait_for_element, scroll)
         logger.action(f"Rolou até o elemento: {locator}")
     
     def take_screenshot(self, filename):
@@ -172,11 +418,99 @@ class BasePage:
         Args:
             filename (str): Nome do arquivo
         """
-        screenshot_path = self.config.get_screenshot_path(filename)
-        self.driver.save_screenshot(str(screenshot_path))
+        if artifact_store.enabled:
+            with self._measure('screenshot', category='screenshot'):
+                png = self.driver.get_screenshot_as_png()
+            screenshot_path = artifact_store.put_bytes(png, 'screenshot', filename, '.png')
+        else:
+            screenshot_path = self.config.get_screenshot_path(filename)
+            with self.config.reserved_file(screenshot_path), \
+                    self._measure('screenshot', category='screenshot', path=str(screenshot_path)):
+                self.driver.save_screenshot(str(screenshot_path))
         logger.screenshot(screenshot_path)
         return screenshot_path
     
+    def save_dom_snapshot(self, filename):
+        """
+        Guarda o HTML atual da página no armazenamento de artefatos.
+        
+        Args:
+            filename (str): Nome lógico do snapshot
+        
+        Returns:
+            Path: Objeto gravado, ou None com o armazenamento desativado
+        """
+        if not artifact_store.enabled:
+            return None
+        
+        with self._measure('dom_snapshot'):
+            html = self.driver.page_source
+        snapshot_path = artifact_store.put_bytes(html, 'dom', filename, '.html', url=self.driver.current_url)
+        logger.debug(f"🧾 Snapshot do DOM salvo: {snapshot_path}")
+        return snapshot_path
+    
+    def count_dom_nodes(self):
+        """
+        Conta os elementos do DOM da página atual.
+        
+        Returns:
+            int: Quantidade de elementos
+        """
+        with self._measure('count_dom_nodes'):
+            return self.driver.execute_script("return document.getElementsByTagName('*').length;")
+    
+    def collect_links(self):
+        """
+        Coleta todos os endereços (href, src e srcset) do DOM renderizado em uma única chamada.
+        
+        Returns:
+            list: Endereços com url absoluta, tag, atributo e texto do elemento
+        """
+        with self._measure('collect_links'):
+            return self.driver.execute_script(LINK_COLLECTION_SCRIPT) or []
+    
+    def get_memory_usage(self):
+        """
+        Obtém o uso de memória da página (heap JavaScript e nós do DOM).
+        No Chrome usa as métricas do DevTools após uma coleta de lixo; nos demais,
+        a API não padronizada performance.memory, quando existir.
+        
+        Returns:
+            dict: js_heap_used_mb, js_heap_total_mb e dom_nodes, ou None se indisponível
+        """
+        with self._measure('memory_usage'):
+            try:
+                self.driver.execute_cdp_cmd('HeapProfiler.collectGarbage', {})
+                self.driver.execute_cdp_cmd('Performance.enable', {})
+                values = {
+                    metric['name']: metric['value']
+                    for metric in self.driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+                }
+                return {
+                    'js_heap_used_mb': round(values['JSHeapUsedSize'] / 1024 ** 2, 2),
+                    'js_heap_total_mb': round(values['JSHeapTotalSize'] / 1024 ** 2, 2),
+                    'dom_nodes': int(values['Nodes'])
+                }
+            except Exception as e:
+                logger.debug(f"Métricas do DevTools indisponíveis: {str(e)}")
+            
+            try:
+                memory = self.driver.execute_script(
+                    "return performance.memory ? {used: performance.memory.usedJSHeapSize, "
+                    "total: performance.memory.totalJSHeapSize, nodes: document.getElementsByTagName('*').length} : null;"
+                )
+            except Exception as e:
+                logger.debug(f"performance.memory indisponível: {str(e)}")
+                return None
+        
+        if not memory:
+            return None
+        return {
+            'js_heap_used_mb': round(memory['used'] / 1024 ** 2, 2),
+            'js_heap_total_mb': round(memory['total'] / 1024 ** 2, 2),
+            'dom_nodes': memory['nodes']
+        }
+    
     def get_page_title(self):
         """
         Obtém o título da página.
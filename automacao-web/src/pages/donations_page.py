@@ -1,9 +1,29 @@
 """
 Page Object para a seção de doações do Bloco Praieira.
 """
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from src.pages.base_page import BasePage
 from src.utils.logger import logger
+from src.utils.har import har_recorder
+from src.utils.pix import decode_qr_image, image_from_data_url
+
+# Conteúdo da imagem do QR Code em uma única chamada: o src em data URL
+# (QRCode.toDataURL) ou, para imagens externas e canvas, o desenho exportado
+QR_CODE_SOURCE_SCRIPT = """
+const element = arguments[0];
+if (element.tagName === 'IMG' && element.src.startsWith('data:')) return element.src;
+try {
+  if (element.tagName === 'CANVAS') return element.toDataURL('image/png');
+  const canvas = document.createElement('canvas');
+  canvas.width = element.naturalWidth;
+  canvas.height = element.naturalHeight;
+  canvas.getContext('2d').drawImage(element, 0, 0);
+  return canvas.toDataURL('image/png');
+} catch (error) {
+  return null;
+}
+"""
 
 class DonationsPage(BasePage):
     """Page Object para a seção de doações."""
@@ -117,22 +137,48 @@ class DonationsPage(BasePage):
             # Clicar no botão
             self.click_element(self.QR_CODE_GENERATE_BUTTON)
             
-            # Aguardar um momento para o QR Code ser gerado
-            import time
-            time.sleep(3)
-            
-            # Verificar se o QR Code foi gerado
-            if self.is_element_visible(self.QR_CODE_IMAGE):
-                logger.info("✅ QR Code gerado com sucesso")
-                return True
-            else:
+            # Aguardar a imagem do QR Code terminar de carregar
+            try:
+                self.wait_for_image_loaded(self.QR_CODE_IMAGE)
+            except TimeoutException:
                 logger.error("❌ QR Code não foi gerado")
                 return False
+            
+            logger.info("✅ QR Code gerado com sucesso")
+            return True
                 
         except Exception as e:
             logger.error(f"❌ Erro ao gerar QR Code: {str(e)}")
             return False
     
+    def read_qr_code_payload(self):
+        """
+        Lê o conteúdo do QR Code gerado, decodificando a imagem no próprio processo.
+        
+        Returns:
+            str: Texto do QR Code
+        
+        Raises:
+            ValueError: Se a imagem não puder ser lida ou decodificada (com o motivo)
+        """
+        try:
+            source = self._with_element(
+                self.QR_CODE_IMAGE, self.wait_for_element,
+                lambda element: self.driver.execute_script(QR_CODE_SOURCE_SCRIPT, element)
+            )
+        except Exception as e:
+            raise ValueError(f"Imagem do QR Code não pôde ser lida: {str(e)}")
+        
+        if not source:
+            # Ex: imagem de outra origem sem CORS, que não pode ser exportada pelo canvas
+            raise ValueError("Imagem do QR Code não pôde ser exportada da página")
+        
+        image = image_from_data_url(source)
+        if image is None:
+            raise ValueError(f"Imagem do QR Code não está em base64: {source[:40]}")
+        
+        return decode_qr_image(image)
+    
     def copy_pix_key(self):
         """
         Testa a funcionalidade de copiar chave PIX.
@@ -202,7 +248,8 @@ class DonationsPage(BasePage):
         """
         logger.action("Rolando para seção de doações")
         try:
-            self.scroll_to_element(self.DONATIONS_SECTION)
+            with har_recorder.capture(self.driver, "rolagem doações"):
+                self.scroll_to_element(self.DONATIONS_SECTION)
             return True
         except Exception as e:
             logger.error(f"❌ Erro ao rolar para doações: {str(e)}")
@@ -4,6 +4,7 @@ Page Object para a seção de membros do Bloco Praieira.
 from selenium.webdriver.common.by import By
 from src.pages.base_page import BasePage
 from src.utils.logger import logger
+from src.utils.har import har_recorder
 
 class MembersPage(BasePage):
     """Page Object para a seção de membros."""
@@ -28,6 +29,36 @@ class MembersPage(BasePage):
         "Tamborim"
     ]
     
+    # Mede um clique no acordeão dentro do navegador: o MutationObserver marca o
+    # commit do React no DOM e o rAF duplo marca o primeiro quadro pintado depois dele
+    MEASURE_TOGGLE_SCRIPT = """
+        const title = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+        const heading = Array.from(document.querySelectorAll('h3')).find(h => h.textContent.includes(title));
+        if (!heading) { done({error: 'Seção não encontrada'}); return; }
+        const section = heading.closest('.glassmorphism');
+        const isOpen = () => !!section.querySelector(':scope > .border-t');
+        const wasOpen = isOpen();
+        let domMs = null;
+        const started = performance.now();
+        const observer = new MutationObserver(() => {
+            if (isOpen() === wasOpen) return;
+            observer.disconnect();
+            domMs = performance.now() - started;
+            requestAnimationFrame(() => requestAnimationFrame(() => done({
+                expanded: !wasOpen,
+                dom_ms: domMs,
+                paint_ms: performance.now() - started,
+                cards: section.querySelectorAll('.grid > div').length,
+                nodes: document.getElementsByTagName('*').length
+            })));
+        });
+        observer.observe(section, {childList: true, subtree: true});
+        heading.closest('button').click();
+        setTimeout(() => {
+            if (domMs === null) { observer.disconnect(); done({error: 'Timeout aguardando o acordeão'}); }
+        }, timeoutMs);
+    """
+    
     # Call to action
     JOIN_CTA_TITLE = (By.XPATH, "//h3[contains(text(), 'Quer fazer parte do Bloco')]")
     JOIN_CTA_BUTTON = (By.XPATH, "//a[contains(text(), 'Entrar em Contato')]")
@@ -222,6 +253,42 @@ class MembersPage(BasePage):
         logger.info("✅ Funcionalidade do acordeão testada com sucesso")
         return True
     
+    def measure_section_toggle(self, instrument_name, timeout=None):
+        """
+        Abre ou fecha uma seção do acordeão medindo a latência dentro do navegador,
+        sem as esperas fixas de expand/collapse_instrument_section.
+        
+        Args:
+            instrument_name (str): Nome do instrumento
+            timeout (float): Tempo limite em segundos (padrão: MAX_WAIT_ELEMENTS)
+            
+        Returns:
+            dict: expanded, dom_ms (commit no DOM), paint_ms (primeiro quadro
+                pintado), cards e nodes, ou None se a medição falhar
+        """
+        timeout = timeout or self.config.MAX_WAIT_ELEMENTS
+        
+        try:
+            self.driver.set_script_timeout(timeout + 5)
+            with self._measure('accordion_toggle', instrument=instrument_name):
+                measurement = self.driver.execute_async_script(
+                    self.MEASURE_TOGGLE_SCRIPT, instrument_name, int(timeout * 1000)
+                )
+        except Exception as e:
+            logger.error(f"❌ Erro ao medir o acordeão de {instrument_name}: {str(e)}")
+            return None
+        
+        if not measurement or measurement.get('error'):
+            logger.error(f"❌ Medição do acordeão de {instrument_name} falhou: {(measurement or {}).get('error')}")
+            return None
+        
+        logger.debug(
+            f"{'Abriu' if measurement['expanded'] else 'Fechou'} {instrument_name}: "
+            f"DOM {measurement['dom_ms']:.1f}ms, pintura {measurement['paint_ms']:.1f}ms, "
+            f"{measurement['cards']} cards"
+        )
+        return measurement
+    
     def click_join_cta(self):
         """
         Clica no botão "Entrar em Contato" do CTA.
@@ -255,7 +322,8 @@ class MembersPage(BasePage):
         """
         logger.action("Rolando para seção de membros")
         try:
-            self.scroll_to_element(self.MEMBERS_TITLE)
+            with har_recorder.capture(self.driver, "rolagem membros"):
+                self.scroll_to_element(self.MEMBERS_TITLE)
             return True
         except Exception as e:
             logger.error(f"❌ Erro ao rolar para membros: {str(e)}")
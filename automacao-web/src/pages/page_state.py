@@ -0,0 +1,160 @@
+"""
+Gerenciador do estado da página para execução de unidades de teste isoladas.
+Conhece o estado atual do navegador (página aberta, seção rolada, acordeão)
+e sabe planejar e aplicar as transições exigidas pelas precondições dos testes.
+"""
+from src.pages.home_page import HomePage
+from src.pages.donations_page import DonationsPage
+from src.pages.members_page import MembersPage
+from src.pages.admin_dashboard_page import AdminDashboardPage
+from src.utils.logger import logger
+
+class PageStateManager:
+    """Rastreia e estabelece o estado de página de um WebDriver."""
+    
+    # Estado logo após abrir uma página
+    FRESH_STATE = {'section': 'top', 'accordion': 'collapsed'}
+    
+    # Custos estimados (segundos) de cada ação de preparação
+    ACTION_COSTS = {
+        'navigate': 3.0,
+        'scroll': 0.5
+    }
+    
+    # Chaves cujo valor só volta ao padrão com uma nova navegação
+    RESET_BY_NAVIGATION = ('accordion',)
+    
+    PAGE_OPENERS = {
+        'home': lambda driver: HomePage(driver).open(),
+        'admin': lambda driver: AdminDashboardPage(driver).open()
+    }
+    
+    SECTION_SCROLLERS = {
+        'top': lambda driver: driver.execute_script("window.scrollTo(0, 0);"),
+        'donations': lambda driver: DonationsPage(driver).scroll_to_donations_section(),
+        'members': lambda driver: MembersPage(driver).scroll_to_members_section()
+    }
+    
+    def __init__(self, driver):
+        """
+        Inicializa o gerenciador de estado.
+        
+        Args:
+            driver: Instância do WebDriver
+        """
+        self.driver = driver
+        self.state = {'page': None}
+        self.actions_performed = {action: 0 for action in self.ACTION_COSTS}
+    
+    @classmethod
+    def fresh_state(cls, page):
+        """
+        Retorna o estado de uma página recém-aberta.
+        
+        Args:
+            page (str): Página aberta
+        
+        Returns:
+            dict: Estado inicial da página
+        """
+        state = dict(cls.FRESH_STATE)
+        state['page'] = page
+        return state
+    
+    @classmethod
+    def plan_transition(cls, current, required):
+        """
+        Planeja as ações necessárias para sair de um estado e atender às precondições.
+        
+        Args:
+            current (dict): Estado atual
+            required (dict): Precondições do teste
+        
+        Returns:
+            tuple: (lista de ações (ação, valor), custo estimado, estado resultante)
+        """
+        state = dict(current)
+        steps = []
+        
+        page = required.get('page', state.get('page'))
+        needs_navigation = page is not None and state.get('page') != page
+        
+        for key in cls.RESET_BY_NAVIGATION:
+            if key in required and state.get(key) != required[key]:
+                if required[key] != cls.FRESH_STATE.get(key):
+                    raise ValueError(f"Estado '{key}={required[key]}' não pode ser estabelecido automaticamente")
+                needs_navigation = True
+        
+        if needs_navigation:
+            steps.append(('navigate', page))
+            state = cls.fresh_state(page)
+        
+        section = required.get('section')
+        if section is not None and state.get('section') != section:
+            steps.append(('scroll', section))
+            state['section'] = section
+        
+        cost = sum(cls.ACTION_COSTS[action] for action, _ in steps)
+        return steps, cost, state
+    
+    @classmethod
+    def apply_effects(cls, state, effects):
+        """
+        Retorna o estado resultante após os efeitos colaterais de um teste.
+        
+        Args:
+            state (dict): Estado antes do teste
+            effects (dict): Efeitos declarados pelo teste
+        
+        Returns:
+            dict: Novo estado
+        """
+        new_state = dict(state)
+        new_state.update(effects)
+        return new_state
+    
+    def establish(self, required):
+        """
+        Executa as ações necessárias para atender às precondições.
+        
+        Args:
+            required (dict): Precondições do teste
+        """
+        steps, _, _ = self.plan_transition(self.state, required)
+        
+        for action, value in steps:
+            self.perform(action, value)
+    
+    def perform(self, action, value):
+        """
+        Executa uma ação de preparação e atualiza o estado rastreado.
+        
+        Args:
+            action (str): 'navigate' ou 'scroll'
+            value (str): Página ou seção de destino
+        """
+        logger.debug(f"Preparando estado: {action} -> {value}")
+        
+        if action == 'navigate':
+            self.PAGE_OPENERS[value](self.driver)
+            self.state = self.fresh_state(value)
+        elif action == 'scroll':
+            self.SECTION_SCROLLERS[value](self.driver)
+            self.state['section'] = value
+        else:
+            raise ValueError(f"Ação de estado desconhecida: {action}")
+        
+        self.actions_performed[action] += 1
+    
+    def record_effects(self, effects):
+        """
+        Registra os efeitos colaterais de um teste executado.
+        
+        Args:
+            effects (dict): Efeitos declarados pelo teste
+        """
+        self.state = self.apply_effects(self.state, effects)
+    
+    def invalidate(self):
+        """Marca o estado como desconhecido, forçando nova navegação."""
+        self.state = {'page': None}
@@ -0,0 +1,257 @@
+"""
+Estratégia de teste para o painel administrativo (/admin).
+Mede o tempo até os dados serem renderizados, a troca de abas, a recarga da
+lista após incluir um membro e o uso de memória do painel, inclusive com
+volumes crescentes de membros e doações criados pelas rotas da API.
+"""
+from src.strategies.base_strategy import TestStrategy
+from src.strategies.registry import test_unit
+from src.pages.admin_dashboard_page import AdminDashboardPage
+from src.pages.page_state import PageStateManager
+from src.utils.logger import logger
+from src.utils.scaling import fit_power_law
+from src.utils.seed_data import generate_donations, generate_members, seed_donations, seed_members
+from src.utils.site_stub import SiteStub
+from config.settings import Config
+
+# Medidas da curva de escala do painel: chave na linha da medição e descrição
+CURVE_METRICS = {
+    'render_ms': 'Renderização inicial',
+    'tab_switch_members_ms': 'Troca para a aba de membros',
+    'add_member_refresh_ms': 'Recarga após incluir membro',
+    'js_heap_used_mb': 'Heap JavaScript',
+    'dom_nodes': 'Nós do DOM'
+}
+
+def _format_ms(value):
+    """Formata uma duração opcional em milissegundos para as mensagens."""
+    return f"{value:.0f}ms" if value is not None else "n/d"
+
+class AdminDashboardTestStrategy(TestStrategy):
+    """Estratégia de testes de desempenho do painel administrativo."""
+    
+    STRATEGY_KEY = 'admin'
+    
+    def __init__(self, driver):
+        """Inicializa a estratégia de teste do painel administrativo."""
+        super().__init__(driver)
+        self.admin_page = AdminDashboardPage(driver)
+        self.config = Config()
+    
+    def prepare(self):
+        """Abre o painel administrativo."""
+        self.admin_page.open()
+    
+    def execute(self, units=None):
+        """
+        Executa todos os testes do painel administrativo.
+        
+        Args:
+            units (list): Unidades a executar (padrão: todas as declaradas)
+        
+        Returns:
+            StrategyResult: Resultado consolidado dos testes
+        """
+        logger.test_start("Admin Dashboard Tests")
+        
+        try:
+            # Abrir o painel
+            self.run_prepare(units)
+            
+            # Executar os testes selecionados
+            self.run_units(units)
+            
+        except Exception as e:
+            logger.error(f"❌ Erro crítico nos testes do painel: {str(e)}")
+            self.add_result("Admin Dashboard Execution", False, f"Erro crítico: {str(e)}")
+            self.take_screenshot_on_failure("admin_critical_error")
+            
+        finally:
+            logger.test_end("Admin Dashboard Tests", self.success)
+        
+        return self.get_summary()
+    
+    @test_unit("Admin Dashboard Render", tags={'admin', 'performance', 'smoke'}, cost=4.0,
+               effects=PageStateManager.fresh_state('admin'))
+    def _test_dashboard_render(self):
+        """Testa se o painel carrega os dados dentro do orçamento de tempo."""
+        test_name = "Admin Dashboard Render"
+        logger.verification(f"Executando teste: {test_name}")
+        
+        try:
+            measurement = self.admin_page.measure_render()
+            if measurement is None or not self.admin_page.verify_dashboard_loaded():
+                self.add_result(test_name, False, "Painel não terminou de carregar")
+                self.take_screenshot_on_failure("admin_render")
+                return
+            
+            memory = self.admin_page.get_memory_usage()
+            budget = self.config.ADMIN_RENDER_BUDGET_MS
+            result = measurement['render_ms'] <= budget
+            
+            message = (f"Renderizado em {measurement['render_ms']:.0f}ms (orçamento {budget}ms), "
+                       f"{measurement['rows']} membros listados")
+            if memory:
+                message += f", heap {memory['js_heap_used_mb']}MB"
+            
+            self.add_result(test_name, result, message, performance=dict(measurement, memory=memory))
+            
+            if not result:
+                self.take_screenshot_on_failure("admin_render_budget")
+                
+        except Exception as e:
+            self.add_result(test_name, False, f"Exceção: {str(e)}")
+            self.take_screenshot_on_failure("admin_render_exception")
+    
+    @test_unit("Admin Tab Switch", requires={'page': 'admin'}, tags={'admin', 'performance', 'interaction'}, cost=1.5)
+    def _test_tab_switch(self):
+        """Testa a troca entre as abas de membros e doações."""
+        test_name = "Admin Tab Switch"
+        logger.verification(f"Executando teste: {test_name}")
+        
+        try:
+            donations = self.admin_page.measure_tab_switch('donations')
+            members = self.admin_page.measure_tab_switch('members') if donations else None
+            result = donations is not None and members is not None
+            
+            if result:
+                message = (f"Doações em {donations['paint_ms']:.0f}ms ({donations['rows']} linhas), "
+                           f"membros em {members['paint_ms']:.0f}ms ({members['rows']} linhas)")
+            else:
+                message = "Troca de abas não concluída"
+            
+            self.add_result(test_name, result, message, performance={'donations': donations, 'members': members})
+            
+            if not result:
+                self.take_screenshot_on_failure("admin_tab_switch")
+                
+        except Exception as e:
+            self.add_result(test_name, False, f"Exceção: {str(e)}")
+            self.take_screenshot_on_failure("admin_tab_switch_exception")
+    
+    # Cria milhares de registros e leva cerca de um minuto: só roda com --tags scale ou pelo nome
+    @test_unit("Admin Dashboard Scale", tags={'admin', 'performance', 'scale'}, cost=60.0, effects={'page': None})
+    def _test_dashboard_scale(self):
+        """Testa o painel com volumes crescentes de membros e doações."""
+        test_name = "Admin Dashboard Scale"
+        logger.verification(f"Executando teste: {test_name}")
+        
+        sizes = self.config.ADMIN_SCALE_SIZES
+        stub = None
+        base_url = self.config.BASE_URL
+        target = self.config.ADMIN_SEED_TARGET
+        # No stub, o painel medido é a réplica em JavaScript puro, não o AdminDashboard.tsx do site
+        label = "[site] " if target == 'site' else "[stub, não é o AdminDashboard.tsx] "
+        
+        try:
+            if target == 'site':
+                logger.warning(f"⚠️ Criando até {sizes[-1]} membros e doações no banco de {base_url}")
+            else:
+                stub = SiteStub()
+                base_url = stub.start()
+                logger.warning("⚠️ Medindo o painel do stub local: os números não são do AdminDashboard.tsx")
+            
+            page = AdminDashboardPage(self.driver, base_url)
+            members = generate_members(sizes[-1], seed=self.config.SCALE_SEED)
+            donations = generate_donations(sizes[-1], seed=self.config.SCALE_SEED)
+            seeded = 0
+            rows = []
+            
+            # Cada volume é atingido criando apenas a diferença em relação ao anterior
+            for size in sizes:
+                workers = self.config.SCALE_SEED_WORKERS
+                seed_seconds = seed_members(base_url, members[seeded:size], workers)['seconds']
+                seed_seconds += seed_donations(base_url, donations[seeded:size], workers)['seconds']
+                seeded = size
+                
+                row = self._measure_dashboard(page, size)
+                size_name = f"{test_name} - {size}"
+                
+                if row is None:
+                    self.add_result(size_name, False, f"{label}Medição do painel com {size} registros falhou", target=target)
+                    self.take_screenshot_on_failure(f"admin_scale_{size}")
+                    continue
+                
+                row['seed_seconds'] = round(seed_seconds, 3)
+                row['target'] = target
+                rows.append(row)
+                
+                # O painel lista todos os membros, mas a API devolve só as últimas 50 doações
+                result = (row['members_rows'] >= size and row['donations_rows'] == min(size, 50)
+                          and row['add_member_refresh_ms'] is not None)
+                message = (f"{label}Render {_format_ms(row['render_ms'])}, aba membros {_format_ms(row['tab_switch_members_ms'])}, "
+                           f"inclusão {_format_ms(row['add_member_refresh_ms'])}, {row['dom_nodes']} nós")
+                if row['js_heap_used_mb'] is not None:
+                    message += f", heap {row['js_heap_used_mb']}MB"
+                
+                self.add_result(size_name, result, message, scale=row, target=target)
+            
+            curve = self._fit_curve(rows)
+            growth = ', '.join(
+                f"{fit['description']} ~n^{fit['exponent']}" for fit in curve.values() if fit['exponent'] is not None
+            )
+            result = len(rows) == len(sizes)
+            message = f"{label}Crescimento com {', '.join(map(str, sizes))} registros: {growth or 'pontos insuficientes'}"
+            self.add_result(test_name, result, message, curve=curve, target=target)
+            
+        except Exception as e:
+            self.add_result(test_name, False, f"Exceção: {str(e)}")
+            self.take_screenshot_on_failure("admin_scale_exception")
+            
+        finally:
+            if stub:
+                stub.stop()
+    
+    def _measure_dashboard(self, page, size):
+        """
+        Mede o painel com os dados atuais.
+        
+        Args:
+            page (AdminDashboardPage): Painel apontado para o site ou stub com os dados
+            size (int): Quantidade de membros e doações criados
+        
+        Returns:
+            dict: Medições do volume, ou None se o painel não carregar
+        """
+        logger.info(f"📏 Medindo painel com {size} membros e {size} doações")
+        
+        render = page.measure_render()
+        if render is None:
+            return None
+        
+        memory = page.get_memory_usage() or {}
+        donations = page.measure_tab_switch('donations')
+        members = page.measure_tab_switch('members') if donations else None
+        added = page.measure_add_member(f"Membro de Escala {size:05d}") if members else None
+        
+        return {
+            'size': size,
+            'render_ms': round(render['render_ms'], 1),
+            'render_upper_bound': render['upper_bound'],
+            'api_members_ms': render['api_members_ms'] and round(render['api_members_ms'], 1),
+            'api_donations_ms': render['api_donations_ms'] and round(render['api_donations_ms'], 1),
+            'members_rows': render['rows'],
+            'donations_rows': donations['rows'] if donations else 0,
+            'tab_switch_donations_ms': donations and round(donations['paint_ms'], 1),
+            'tab_switch_members_ms': members and round(members['paint_ms'], 1),
+            'add_member_refresh_ms': added and round(added['paint_ms'], 1),
+            'js_heap_used_mb': memory.get('js_heap_used_mb'),
+            'dom_nodes': memory.get('dom_nodes', render['nodes'])
+        }
+    
+    def _fit_curve(self, rows):
+        """
+        Ajusta uma lei de potência a cada medida do painel.
+        
+        Args:
+            rows (list): Medições por volume
+        
+        Returns:
+            dict: Expoente, coeficiente e descrição por medida
+        """
+        sizes = [row['size'] for row in rows]
+        return {
+            key: dict(fit_power_law(sizes, [row[key] for row in rows]) or {'exponent': None, 'coefficient': None},
+                      description=description)
+            for key, description in CURVE_METRICS.items()
+        }
\ No newline at end of file
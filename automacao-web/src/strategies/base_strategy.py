@@ -3,11 +3,41 @@ Interface base para estratégias de teste.
 Implementa o padrão Strategy para diferentes tipos de testes.
 """
 from abc import ABC, abstractmethod
+import time
 from src.utils.logger import logger
+from src.utils.metrics import metrics
+from src.utils.tracing import tracer
+from src.utils.browser_logs import get_log_buffer
+from src.utils.result_cache import result_cache
+from src.utils.profiling import profiler
+from src.strategies.registry import TestUnit, registry
+from src.strategies.results import TestResult, StrategyResult
+from src.pages.page_state import PageStateManager
 
 class TestStrategy(ABC):
     """Interface base para todas as estratégias de teste."""
     
+    # Chave usada pelo registro e pela linha de comando ('home', 'donations', ...)
+    STRATEGY_KEY = None
+    
+    # Unidades de teste declaradas com @test_unit, na ordem de definição
+    TEST_UNITS = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        """Coleta as unidades declaradas e registra a estratégia."""
+        super().__init_subclass__(**kwargs)
+        
+        units = {}
+        for klass in reversed(cls.__mro__):
+            for attr in vars(klass).values():
+                unit = getattr(attr, '_test_unit', None)
+                if isinstance(unit, TestUnit):
+                    units[unit.method_name] = unit.bind(cls.STRATEGY_KEY)
+        cls.TEST_UNITS = tuple(units.values())
+        
+        if cls.STRATEGY_KEY:
+            registry.register_strategy(cls)
+    
     def __init__(self, driver):
         """
         Inicializa a estratégia de teste.
@@ -18,18 +48,279 @@ class TestStrategy(ABC):
         self.driver = driver
         self.test_results = []
         self.success = True
+        
+        # Supervisão de tempo (atribuída pelo executor) e estado da página
+        self.watchdog = None
+        self.state_manager = None
+        self._needs_recovery = False
+        
+        # Interromper na primeira falha e unidades que deixaram de rodar por isso
+        self.fail_fast = False
+        self.units_not_run = []
+        self._unit_started_at = None
+        
+        # Início (epoch) do teste atual: janela dos logs do navegador anexados às falhas
+        self._unit_window_start = None
     
     @abstractmethod
-    def execute(self):
+    def execute(self, units=None):
         """
         Executa a estratégia de teste.
         
+        Args:
+            units (list): Unidades a executar (padrão: todas as declaradas)
+            
         Returns:
             dict: Resultado do teste
         """
         pass
     
-    def add_result(self, test_name, passed, message=""):
+    def prepare(self):
+        """
+        Leva a página ao estado exigido pelas unidades da estratégia.
+        Subclasses sobrescrevem para navegar ou rolar até sua seção.
+        """
+        pass
+    
+    def run_prepare(self, units=None):
+        """
+        Executa prepare() sob a supervisão do watchdog, se houver.
+        
+        Args:
+            units (list): Unidades que serão executadas; se todas estiverem no cache
+                de resultados, a preparação é dispensada
+        """
+        if self.watchdog and self.watchdog.run_expired:
+            logger.warning("⚠️ Preparação não executada: tempo total da execução esgotado")
+            return
+        
+        units = self.get_test_units() if units is None else units
+        if units and all(result_cache.contains(self, unit) for unit in units):
+            logger.info(f"💾 {self.STRATEGY_KEY}: todos os testes no cache, preparação dispensada")
+            return
+        
+        with tracer.span(f"{self.STRATEGY_KEY}: preparação", 'strategy', self.driver):
+            timed_out = self.run_guarded("prepare", self.prepare)
+        
+        if timed_out:
+            logger.warning("⚠️ Preparação interrompida pelo watchdog; o estado será restaurado por teste")
+    
+    @classmethod
+    def get_test_units(cls, tags=None, names=None):
+        """
+        Lista as unidades de teste da estratégia que atendem aos filtros.
+        
+        Args:
+            tags (iterable): Tags aceitas
+            names (iterable): Nomes aceitos
+            
+        Returns:
+            list: Unidades de teste na ordem declarada
+        """
+        return [unit for unit in cls.TEST_UNITS if unit.matches(tags=tags, names=names)]
+    
+    def run_unit(self, unit):
+        """
+        Executa uma única unidade de teste.
+        
+        Args:
+            unit (TestUnit | str): Unidade ou nome do teste
+        """
+        if isinstance(unit, str):
+            matching = self.get_test_units(names=[unit])
+            if not matching:
+                raise ValueError(f"Teste desconhecido em {self.STRATEGY_KEY}: {unit}")
+            unit = matching[0]
+        
+        if self.watchdog and self.watchdog.run_expired:
+            self.add_result(unit.name, False, "Não executado: tempo total da execução esgotado",
+                            timed_out=True, unit=unit.qualified_name)
+            return
+        
+        if self.replay_cached(unit):
+            return
+        
+        if self._needs_recovery:
+            self._recover_state(unit)
+        
+        results_before = len(self.test_results)
+        self._unit_window_start = time.time()
+        
+        # Logs de debug do teste ficam em memória e só são emitidos se ele falhar
+        logger.begin_capture()
+        try:
+            with tracer.span(unit.name, 'test', self.driver, unit=unit.qualified_name) as span:
+                started = self._unit_started_at = time.monotonic()
+                
+                try:
+                    timeout_reason = self.run_guarded(unit.qualified_name, lambda: unit.run(self))
+                finally:
+                    self._unit_started_at = None
+                
+                if timeout_reason:
+                    # Descartar resultados parciais produzidos pelo navegador encerrado
+                    del self.test_results[results_before:]
+                    
+                    if timeout_reason == 'run':
+                        message = "Timeout: tempo total da execução esgotado durante o teste"
+                    else:
+                        message = f"Timeout: teste excedeu {self.watchdog.test_timeout}s e o navegador foi reiniciado"
+                    
+                    self.add_result(unit.name, False, message, timed_out=True,
+                                    duration_seconds=round(time.monotonic() - started, 3))
+                
+                # Resultados com outros nomes (ex: um por volume de dados) continuam ligados à unidade
+                for result in self.test_results[results_before:]:
+                    result.details = dict(result.details or {}, unit=unit.qualified_name)
+                
+                span['passed'] = all(result.passed for result in self.test_results[results_before:])
+        finally:
+            logger.end_capture()
+        
+        self._unit_window_start = None
+        
+        if not timeout_reason:
+            result_cache.store(self, unit, self.test_results[results_before:])
+        
+        # Esvaziamento periódico do log do navegador (sem custo na maioria dos testes)
+        log_buffer = get_log_buffer(self.driver)
+        if log_buffer:
+            try:
+                log_buffer.maybe_drain()
+            except Exception as e:
+                logger.debug(f"Erro ao esvaziar logs do navegador: {str(e)}")
+    
+    def replay_cached(self, unit):
+        """
+        Reproduz os resultados de uma unidade a partir do cache de resultados.
+        
+        Args:
+            unit (TestUnit): Unidade de teste
+            
+        Returns:
+            bool: True se a unidade foi reproduzida (e não precisa ser executada)
+        """
+        entry = result_cache.lookup(self, unit)
+        if entry is None:
+            return False
+        
+        logger.info(f"💾 {unit.qualified_name}: reproduzido do cache (build {entry['build_id']})")
+        for cached in entry['results']:
+            details = dict(cached['details'] or {}, cached=True, cached_at=entry['cached_at'], unit=unit.qualified_name)
+            self.add_result(cached['test_name'], True, cached['message'],
+                            duration_seconds=cached['duration_seconds'], **details)
+        
+        # Os efeitos da unidade não foram aplicados à página: o próximo teste restaura o estado
+        if unit.effects:
+            self._needs_recovery = True
+        return True
+    
+    def get_state_manager(self):
+        """
+        Obtém o gerenciador de estado da página associado ao driver.
+        
+        Returns:
+            PageStateManager: Gerenciador de estado
+        """
+        if self.state_manager is None:
+            self.state_manager = PageStateManager(self.driver)
+        return self.state_manager
+    
+    def _recover_state(self, unit):
+        """Restaura as precondições de um teste após a troca do navegador."""
+        logger.action(f"Restaurando estado da página para: {unit.qualified_name}")
+        
+        try:
+            self.get_state_manager().establish(unit.requires)
+            self._needs_recovery = False
+        except Exception as e:
+            logger.error(f"❌ Erro ao restaurar estado da página: {str(e)}")
+    
+    def run_guarded(self, label, action):
+        """
+        Executa uma ação sob o watchdog; no estouro, mata e substitui o navegador.
+        
+        Args:
+            label (str): Descrição da ação
+            action (callable): Ação a executar
+            
+        Returns:
+            str: Motivo do estouro ('test' ou 'run') ou None se a ação terminou no prazo
+        """
+        if self.watchdog is None:
+            with profiler.section(self.STRATEGY_KEY):
+                action()
+            return None
+        
+        with self.watchdog.guard(label, on_timeout=self._kill_driver) as guard:
+            # Execução esgotada entre a verificação e o registro do prazo: a ação não roda sem supervisão
+            if guard.fired:
+                return guard.reason
+            
+            try:
+                with profiler.section(self.STRATEGY_KEY):
+                    action()
+            except Exception:
+                if not guard.fired:
+                    raise
+        
+        if guard.fired:
+            self._replace_driver()
+        
+        return guard.reason
+    
+    def _kill_driver(self):
+        """Encerra à força o navegador travado (chamado pela thread do watchdog)."""
+        from src.utils.webdriver_factory import WebDriverFactory
+        
+        if hasattr(self.driver, 'kill'):
+            self.driver.kill()
+        else:
+            WebDriverFactory.kill_driver(self.driver)
+    
+    def _replace_driver(self):
+        """Substitui o navegador encerrado e marca o estado da página para restauração."""
+        if self.watchdog.run_expired or not hasattr(self.driver, 'replace'):
+            return
+        
+        try:
+            self.driver.replace()
+        except Exception as e:
+            logger.error(f"❌ Erro ao substituir o WebDriver: {str(e)}")
+            return
+        
+        self.get_state_manager().invalidate()
+        self._needs_recovery = True
+    
+    def skip_units(self, units, message):
+        """
+        Registra unidades como não executadas.
+        
+        Args:
+            units (list): Unidades não executadas
+            message (str): Motivo
+        """
+        for unit in units:
+            self.add_result(unit.name, False, message, timed_out=True, unit=unit.qualified_name)
+    
+    def run_units(self, units=None):
+        """
+        Executa uma sequência de unidades de teste.
+        
+        Args:
+            units (list): Unidades a executar (padrão: todas, na ordem declarada)
+        """
+        if units is None:
+            units = self.get_test_units()
+        
+        for position, unit in enumerate(units):
+            if self.fail_fast and not self.success:
+                self.units_not_run.extend(units[position:])
+                logger.warning(f"⏹️ Fail-fast: {len(units) - position} teste(s) de {self.STRATEGY_KEY} não executado(s)")
+                break
+            self.run_unit(unit)
+    
+    def add_result(self, test_name, passed, message="", **details):
         """
         Adiciona um resultado de teste.
         
@@ -37,15 +328,26 @@ class TestStrategy(ABC):
             test_name (str): Nome do teste
             passed (bool): Se o teste passou
             message (str): Mensagem adicional
+            **details: Campos extras anexados ao resultado (ex: timed_out=True)
         """
-        result = {
-            'test_name': test_name,
-            'passed': passed,
-            'message': message,
-            'timestamp': self._get_timestamp()
-        }
+        duration = details.pop('duration_seconds', None)
+        if duration is None and self._unit_started_at is not None:
+            duration = round(time.monotonic() - self._unit_started_at, 3)
+        
+        if not passed and 'browser_logs' not in details:
+            browser_logs = self._collect_browser_logs()
+            if browser_logs:
+                details['browser_logs'] = browser_logs
+        
+        if not passed:
+            debug_log = logger.flush_capture()
+            if debug_log:
+                details['debug_log'] = debug_log
+        
+        result = TestResult(test_name, passed, message, duration_seconds=duration, details=details)
         
         self.test_results.append(result)
+        metrics.record_test(self.STRATEGY_KEY or type(self).__name__, passed, duration)
         
         if not passed:
             self.success = False
@@ -53,6 +355,37 @@ class TestStrategy(ABC):
         else:
             logger.info(f"✅ TESTE PASSOU: {test_name} - {message}")
     
+    def _collect_browser_logs(self):
+        """
+        Recorta os logs do navegador para a janela do teste atual.
+        Fora de um teste, usa os últimos BROWSER_LOG_DRAIN_INTERVAL segundos.
+        
+        Returns:
+            list: Entradas de console, exceções JS e falhas de rede da janela
+        """
+        log_buffer = get_log_buffer(self.driver)
+        if log_buffer is None:
+            return None
+        
+        started_at = self._unit_window_start or time.time() - log_buffer.drain_interval
+        
+        try:
+            entries = log_buffer.slice(started_at)
+        except Exception as e:
+            logger.debug(f"Não foi possível obter os logs do navegador: {str(e)}")
+            return None
+        
+        if entries:
+            counts = {}
+            for entry in entries:
+                counts[entry['type']] = counts.get(entry['type'], 0) + 1
+            summary = ', '.join(f"{count} {kind}" for kind, count in counts.items())
+            logger.warning(f"🧾 Logs do navegador anexados à falha: {summary}")
+            for entry in entries[-5:]:
+                logger.debug(f"   [{entry['level']}] {entry['type']}: {entry['message']}")
+        
+        return entries
+    
     def take_screenshot_on_failure(self, test_name):
         """
         Tira screenshot em caso de falha.
@@ -67,6 +400,12 @@ class TestStrategy(ABC):
             from src.pages.base_page import BasePage
             base_page = BasePage(self.driver)
             screenshot_path = base_page.take_screenshot(f"failure_{test_name}")
+            
+            # Com o armazenamento de artefatos, o HTML da falha acompanha a screenshot
+            try:
+                base_page.save_dom_snapshot(f"failure_{test_name}")
+            except Exception as e:
+                logger.debug(f"Erro ao salvar snapshot do DOM: {str(e)}")
             return screenshot_path
         return None
     
@@ -85,18 +424,20 @@ class TestStrategy(ABC):
         Obtém um resumo dos resultados dos testes.
         
         Returns:
-            dict: Resumo dos testes
-        """
-        total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results if result['passed'])
-        failed_tests = total_tests - passed_tests
-        
-        return {
-            'strategy_name': self.__class__.__name__,
-            'total_tests': total_tests,
-            'passed_tests': passed_tests,
-            'failed_tests': failed_tests,
-            'success_rate': (passed_tests / total_tests * 100) if total_tests > 0 else 0,
-            'overall_success': self.success,
-            'detailed_results': self.test_results
-        }
\ No newline at end of file
+            StrategyResult: Resumo dos testes
+        """
+        return self.build_summary(self.test_results)
+    
+    @classmethod
+    def build_summary(cls, test_results):
+        """
+        Monta o resumo da estratégia a partir de uma lista de resultados.
+        Usado também para consolidar resultados vindos de vários workers.
+        
+        Args:
+            test_results (list): Resultados individuais dos testes (TestResult)
+            
+        Returns:
+            StrategyResult: Resumo dos testes
+        """
+        return StrategyResult(cls.__name__, test_results)
\ No newline at end of file
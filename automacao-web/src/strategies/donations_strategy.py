@@ -2,39 +2,47 @@
 Estratégia de teste para a seção de doações.
 Implementa testes específicos para funcionalidades de PIX e doações.
 """
+import time
 from src.strategies.base_strategy import TestStrategy
+from src.strategies.registry import test_unit
 from src.pages.donations_page import DonationsPage
 from src.utils.logger import logger
+from src.utils.pix import validate_pix_payload
 from config.settings import Config
 
 class DonationsTestStrategy(TestStrategy):
     """Estratégia de testes para a seção de doações."""
     
+    STRATEGY_KEY = 'donations'
+    
     def __init__(self, driver):
         """Inicializa a estratégia de teste de doações."""
         super().__init__(driver)
         self.donations_page = DonationsPage(driver)
         self.config = Config()
     
-    def execute(self):
+    def prepare(self):
+        """Rola até a seção de doações."""
+        self.donations_page.scroll_to_donations_section()
+    
+    def execute(self, units=None):
         """
         Executa todos os testes da seção de doações.
         
+        Args:
+            units (list): Unidades a executar (padrão: todas as declaradas)
+            
         Returns:
-            dict: Resultado consolidado dos testes
+            StrategyResult: Resultado consolidado dos testes
         """
         logger.test_start("Donations Section Tests")
         
         try:
             # Navegar para a seção de doações
-            self.donations_page.scroll_to_donations_section()
+            self.run_prepare(units)
             
-            # Executar todos os testes
-            self._test_donations_section_visibility()
-            self._test_pix_key_display()
-            self._test_qr_code_generation()
-            self._test_copy_pix_functionality()
-            self._test_instructions_presence()
+            # Executar os testes selecionados
+            self.run_units(units)
             
         except Exception as e:
             logger.error(f"❌ Erro crítico nos testes de doações: {str(e)}")
@@ -46,6 +54,7 @@ class DonationsTestStrategy(TestStrategy):
         
         return self.get_summary()
     
+    @test_unit("Donations Section Visibility", requires={'page': 'home', 'section': 'donations'}, tags={'donations', 'smoke'}, cost=0.5)
     def _test_donations_section_visibility(self):
         """Testa se todos os elementos da seção de doações estão visíveis."""
         test_name = "Donations Section Visibility"
@@ -62,6 +71,7 @@ class DonationsTestStrategy(TestStrategy):
             self.add_result(test_name, False, f"Exceção: {str(e)}")
             self.take_screenshot_on_failure("donations_visibility_exception")
     
+    @test_unit("PIX Key Display", requires={'page': 'home', 'section': 'donations'}, tags={'donations', 'pix', 'smoke'}, cost=0.5)
     def _test_pix_key_display(self):
         """Testa se a chave PIX está sendo exibida corretamente."""
         test_name = "PIX Key Display"
@@ -79,14 +89,32 @@ class DonationsTestStrategy(TestStrategy):
             self.add_result(test_name, False, f"Exceção: {str(e)}")
             self.take_screenshot_on_failure("pix_key_display_exception")
     
+    @test_unit("QR Code Generation", requires={'page': 'home', 'section': 'donations'}, tags={'donations', 'pix', 'interaction'}, cost=3.5)
     def _test_qr_code_generation(self):
         """Testa a geração do QR Code PIX."""
         test_name = "QR Code Generation"
         logger.verification(f"Executando teste: {test_name}")
         
         try:
-            result = self.donations_page.generate_qr_code()
-            self.add_result(test_name, result, "QR Code gerado com sucesso" if result else "Falha na geração do QR Code")
+            if not self.donations_page.generate_qr_code():
+                self.add_result(test_name, False, "Falha na geração do QR Code")
+                self.take_screenshot_on_failure("qr_code_generation")
+                return
+            
+            # Valida o conteúdo do QR Code, não apenas a presença da imagem
+            started = time.perf_counter()
+            try:
+                payload = self.donations_page.read_qr_code_payload()
+            except ValueError as e:
+                self.add_result(test_name, False, f"Conteúdo do QR Code não verificado: {str(e)}")
+                self.take_screenshot_on_failure("qr_code_payload")
+                return
+            
+            pix = validate_pix_payload(payload, self.config.TEST_PIX_KEY, self.config.PIX_REQUIRE_BRCODE)
+            pix['validation_ms'] = round((time.perf_counter() - started) * 1000, 1)
+            result = pix['valid']
+            message = f"QR Code válido ({pix['format']}): {pix['key']}" if result else '; '.join(pix['errors'])
+            self.add_result(test_name, result, message, pix=pix)
             
             if not result:
                 self.take_screenshot_on_failure("qr_code_generation")
@@ -95,6 +123,7 @@ class DonationsTestStrategy(TestStrategy):
             self.add_result(test_name, False, f"Exceção: {str(e)}")
             self.take_screenshot_on_failure("qr_code_generation_exception")
     
+    @test_unit("Copy PIX Functionality", requires={'page': 'home', 'section': 'donations'}, tags={'donations', 'pix', 'interaction'}, cost=2.5)
     def _test_copy_pix_functionality(self):
         """Testa a funcionalidade de copiar chave PIX."""
         test_name = "Copy PIX Functionality"
@@ -111,6 +140,7 @@ class DonationsTestStrategy(TestStrategy):
             self.add_result(test_name, False, f"Exceção: {str(e)}")
             self.take_screenshot_on_failure("copy_pix_exception")
     
+    @test_unit("Instructions Presence", requires={'page': 'home', 'section': 'donations'}, tags={'donations', 'content'}, cost=0.5)
     def _test_instructions_presence(self):
         """Testa se as instruções de como contribuir estão presentes e corretas."""
         test_name = "Instructions Presence"
@@ -3,37 +3,42 @@ Estratégia de teste para a página inicial.
 Implementa testes específicos para a homepage do Bloco Praieira.
 """
 from src.strategies.base_strategy import TestStrategy
+from src.strategies.registry import test_unit
 from src.pages.home_page import HomePage
 from src.utils.logger import logger
 
 class HomePageTestStrategy(TestStrategy):
     """Estratégia de testes para a página inicial."""
     
+    STRATEGY_KEY = 'home'
+    
     def __init__(self, driver):
         """Inicializa a estratégia de teste da homepage."""
         super().__init__(driver)
         self.home_page = HomePage(driver)
     
-    def execute(self):
+    def prepare(self):
+        """Abre a página inicial."""
+        self.home_page.open()
+    
+    def execute(self, units=None):
         """
         Executa todos os testes da página inicial.
         
+        Args:
+            units (list): Unidades a executar (padrão: todas as declaradas)
+            
         Returns:
-            dict: Resultado consolidado dos testes
+            StrategyResult: Resultado consolidado dos testes
         """
         logger.test_start("HomePage Tests")
         
         try:
             # Abrir a página inicial
-            self.home_page.open()
+            self.run_prepare(units)
             
-            # Executar todos os testes
-            self._test_page_loading()
-            self._test_title_and_subtitle()
-            self._test_history_card()
-            self._test_mission_card()
-            self._test_support_button()
-            self._test_navigation_to_donations()
+            # Executar os testes selecionados
+            self.run_units(units)
             
         except Exception as e:
             logger.error(f"❌ Erro crítico nos testes da homepage: {str(e)}")
@@ -45,6 +50,7 @@ class HomePageTestStrategy(TestStrategy):
         
         return self.get_summary()
     
+    @test_unit("Page Loading", requires={'page': 'home'}, tags={'home', 'smoke'}, cost=0.5)
     def _test_page_loading(self):
         """Testa se a página carrega corretamente."""
         test_name = "Page Loading"
@@ -61,6 +67,7 @@ class HomePageTestStrategy(TestStrategy):
             self.add_result(test_name, False, f"Exceção: {str(e)}")
             self.take_screenshot_on_failure("page_loading_exception")
     
+    @test_unit("Title and Subtitle", requires={'page': 'home'}, tags={'home', 'smoke'}, cost=0.5)
     def _test_title_and_subtitle(self):
         """Testa se o título e subtítulo estão corretos."""
         test_name = "Title and Subtitle"
@@ -87,6 +94,7 @@ class HomePageTestStrategy(TestStrategy):
             self.add_result(test_name, False, f"Exceção: {str(e)}")
             self.take_screenshot_on_failure("title_subtitle_exception")
     
+    @test_unit("History Card", requires={'page': 'home'}, tags={'home', 'content'}, cost=0.5)
     def _test_history_card(self):
         """Testa o card de história."""
         test_name = "History Card"
@@ -103,6 +111,7 @@ class HomePageTestStrategy(TestStrategy):
             self.add_result(test_name, False, f"Exceção: {str(e)}")
             self.take_screenshot_on_failure("history_card_exception")
     
+    @test_unit("Mission Card", requires={'page': 'home'}, tags={'home', 'content'}, cost=0.5)
     def _test_mission_card(self):
         """Testa o card de missão."""
         test_name = "Mission Card"
@@ -119,6 +128,7 @@ class HomePageTestStrategy(TestStrategy):
             self.add_result(test_name, False, f"Exceção: {str(e)}")
             self.take_screenshot_on_failure("mission_card_exception")
     
+    @test_unit("Support Button Presence", requires={'page': 'home'}, tags={'home', 'smoke'}, cost=0.5)
     def _test_support_button(self):
         """Testa a presença e funcionalidade do botão de apoio."""
         test_name = "Support Button Presence"
@@ -137,6 +147,8 @@ class HomePageTestStrategy(TestStrategy):
             self.add_result(test_name, False, f"Exceção: {str(e)}")
             self.take_screenshot_on_failure("support_button_exception")
     
+    @test_unit("Navigation to Donations", requires={'page': 'home'}, tags={'home', 'navigation', 'interaction'}, cost=2.5,
+               effects={'section': 'donations'})
     def _test_navigation_to_donations(self):
         """Testa a navegação para a seção de doações."""
         test_name = "Navigation to Donations"
@@ -0,0 +1,154 @@
+"""
+Estratégia de verificação de links.
+Coleta os endereços da página renderizada (links internos, assets, redes
+sociais e contato) e verifica todos em paralelo, sem navegar até cada um.
+"""
+from src.strategies.base_strategy import TestStrategy
+from src.strategies.registry import test_unit
+from src.pages.home_page import HomePage
+from src.utils.link_checker import LinkChecker, classify_link
+from src.utils.logger import logger
+from config.settings import Config
+
+# Descrição de cada categoria de endereço nas mensagens
+CATEGORY_NAMES = {
+    'internal': 'link(s) interno(s)',
+    'asset': 'asset(s)',
+    'external': 'link(s) externo(s)',
+    'contact': 'link(s) de contato'
+}
+
+class LinkCheckTestStrategy(TestStrategy):
+    """Estratégia de verificação dos links e assets da página."""
+    
+    STRATEGY_KEY = 'links'
+    
+    def __init__(self, driver):
+        """Inicializa a estratégia de verificação de links."""
+        super().__init__(driver)
+        self.home_page = HomePage(driver)
+        self.config = Config()
+        # Compartilhado pelos testes: uma URL presente em mais de uma categoria é verificada uma vez
+        self.checker = LinkChecker()
+    
+    def prepare(self):
+        """Abre a página inicial."""
+        self.home_page.open()
+    
+    def execute(self, units=None):
+        """
+        Executa todos os testes de links.
+        
+        Args:
+            units (list): Unidades a executar (padrão: todas as declaradas)
+        
+        Returns:
+            StrategyResult: Resultado consolidado dos testes
+        """
+        logger.test_start("Link Check Tests")
+        
+        try:
+            # Abrir a página inicial
+            self.run_prepare(units)
+            
+            # Executar os testes selecionados
+            self.run_units(units)
+            
+        except Exception as e:
+            logger.error(f"❌ Erro crítico na verificação de links: {str(e)}")
+            self.add_result("Link Check Execution", False, f"Erro crítico: {str(e)}")
+            self.take_screenshot_on_failure("links_critical_error")
+            
+        finally:
+            logger.test_end("Link Check Tests", self.success)
+        
+        return self.get_summary()
+    
+    def _check_category(self, test_name, category, accepted=('ok',)):
+        """
+        Verifica os endereços de uma categoria coletados da página atual.
+        
+        Args:
+            test_name (str): Nome do teste
+            category (str): 'internal', 'asset', 'external' ou 'contact'
+            accepted (tuple): Estados considerados aprovados
+        """
+        links = [link for link in self.home_page.collect_links()
+                 if classify_link(link, self.config.BASE_URL) == category]
+        results = self.checker.check(link['url'] for link in links)
+        
+        # Onde cada URL aparece na página, para localizar o link quebrado
+        sources = {}
+        for link in links:
+            source = f"<{link['tag']} {link['attribute']}> {link['text']}".strip()
+            sources.setdefault(self.checker.normalize(link['url']), source)
+        
+        failed = {url: result for url, result in results.items() if result['state'] not in accepted}
+        details = [dict(result, url=url, source=sources.get(url)) for url, result in results.items()]
+        
+        if failed:
+            for url, result in failed.items():
+                logger.error(f"❌ {url} ({sources.get(url)}): {result['status'] or result['error']}")
+            message = f"{len(failed)} de {len(results)} {CATEGORY_NAMES[category]} com problema: " + ', '.join(
+                f"{url} ({result['status'] or result['error']})" for url, result in list(failed.items())[:5]
+            )
+        else:
+            blocked = sum(1 for result in results.values() if result['state'] == 'blocked')
+            message = f"{len(results)} {CATEGORY_NAMES[category]} verificado(s)"
+            if blocked:
+                message += f", {blocked} bloqueado(s) para robôs"
+        
+        self.add_result(test_name, not failed, message, links=details)
+        
+        if failed:
+            self.take_screenshot_on_failure(f"links_{category}")
+    
+    @test_unit("Internal Links", requires={'page': 'home'}, tags={'links', 'smoke'}, cost=1.0)
+    def _test_internal_links(self):
+        """Testa se os links para o próprio site respondem."""
+        test_name = "Internal Links"
+        logger.verification(f"Executando teste: {test_name}")
+        
+        try:
+            self._check_category(test_name, 'internal')
+        except Exception as e:
+            self.add_result(test_name, False, f"Exceção: {str(e)}")
+            self.take_screenshot_on_failure("links_internal_exception")
+    
+    @test_unit("Asset URLs", requires={'page': 'home'}, tags={'links'}, cost=1.0)
+    def _test_asset_urls(self):
+        """Testa se imagens, scripts, folhas de estilo e ícones carregam."""
+        test_name = "Asset URLs"
+        logger.verification(f"Executando teste: {test_name}")
+        
+        try:
+            self._check_category(test_name, 'asset')
+        except Exception as e:
+            self.add_result(test_name, False, f"Exceção: {str(e)}")
+            self.take_screenshot_on_failure("links_asset_exception")
+    
+    @test_unit("Contact Links", requires={'page': 'home'}, tags={'links', 'smoke'}, cost=0.5)
+    def _test_contact_links(self):
+        """Testa se os links de e-mail e telefone (SocialLinks, CTA dos membros) são válidos."""
+        test_name = "Contact Links"
+        logger.verification(f"Executando teste: {test_name}")
+        
+        try:
+            self._check_category(test_name, 'contact')
+        except Exception as e:
+            self.add_result(test_name, False, f"Exceção: {str(e)}")
+            self.take_screenshot_on_failure("links_contact_exception")
+    
+    # Requisita sites de terceiros: só roda quando pedido com --tags external ou pelo nome
+    @test_unit("External Links", requires={'page': 'home'}, tags={'links', 'external'}, cost=3.0)
+    def _test_external_links(self):
+        """Testa se os links para outros sites (redes sociais) respondem."""
+        test_name = "External Links"
+        logger.verification(f"Executando teste: {test_name}")
+        
+        try:
+            # Redes sociais costumam recusar robôs (403/429): não indica link quebrado
+            self._check_category(test_name, 'external', accepted=('ok', 'blocked'))
+        except Exception as e:
+            self.add_result(test_name, False, f"Exceção: {str(e)}")
+            self.take_screenshot_on_failure("links_external_exception")
\ No newline at end of file
@@ -3,36 +3,42 @@ Estratégia de teste para a seção de membros.
 Implementa testes específicos para o acordeão de membros por instrumento.
 """
 from src.strategies.base_strategy import TestStrategy
+from src.strategies.registry import test_unit
 from src.pages.members_page import MembersPage
 from src.utils.logger import logger
 
 class MembersTestStrategy(TestStrategy):
     """Estratégia de testes para a seção de membros."""
     
+    STRATEGY_KEY = 'members'
+    
     def __init__(self, driver):
         """Inicializa a estratégia de teste de membros."""
         super().__init__(driver)
         self.members_page = MembersPage(driver)
     
-    def execute(self):
+    def prepare(self):
+        """Rola até a seção de membros."""
+        self.members_page.scroll_to_members_section()
+    
+    def execute(self, units=None):
         """
         Executa todos os testes da seção de membros.
         
+        Args:
+            units (list): Unidades a executar (padrão: todas as declaradas)
+            
         Returns:
-            dict: Resultado consolidado dos testes
+            StrategyResult: Resultado consolidado dos testes
         """
         logger.test_start("Members Section Tests")
         
         try:
             # Navegar para a seção de membros
-            self.members_page.scroll_to_members_section()
+            self.run_prepare(units)
             
-            # Executar todos os testes
-            self._test_members_section_visibility()
-            self._test_all_instruments_present()
-            self._test_accordion_functionality()
-            self._test_members_count_consistency()
-            self._test_join_cta()
+            # Executar os testes selecionados
+            self.run_units(units)
             
         except Exception as e:
             logger.error(f"❌ Erro crítico nos testes de membros: {str(e)}")
@@ -44,6 +50,7 @@ class MembersTestStrategy(TestStrategy):
         
         return self.get_summary()
     
+    @test_unit("Members Section Visibility", requires={'page': 'home', 'section': 'members'}, tags={'members', 'smoke'}, cost=0.5)
     def _test_members_section_visibility(self):
         """Testa se a seção de membros está visível e correta."""
         test_name = "Members Section Visibility"
@@ -60,6 +67,7 @@ class MembersTestStrategy(TestStrategy):
             self.add_result(test_name, False, f"Exceção: {str(e)}")
             self.take_screenshot_on_failure("members_visibility_exception")
     
+    @test_unit("All Instruments Present", requires={'page': 'home', 'section': 'members'}, tags={'members', 'smoke'}, cost=1.0)
     def _test_all_instruments_present(self):
         """Testa se todos os instrumentos estão presentes no acordeão."""
         test_name = "All Instruments Present"
@@ -77,6 +85,8 @@ class MembersTestStrategy(TestStrategy):
             self.add_result(test_name, False, f"Exceção: {str(e)}")
             self.take_screenshot_on_failure("instruments_exception")
     
+    @test_unit("Accordion Functionality", requires={'page': 'home', 'section': 'members', 'accordion': 'collapsed'},
+               tags={'members', 'accordion', 'interaction'}, cost=6.5)
     def _test_accordion_functionality(self):
         """Testa a funcionalidade do acordeão (expandir/colapsar)."""
         test_name = "Accordion Functionality"
@@ -93,6 +103,8 @@ class MembersTestStrategy(TestStrategy):
             self.add_result(test_name, False, f"Exceção: {str(e)}")
             self.take_screenshot_on_failure("accordion_functionality_exception")
     
+    @test_unit("Members Count Consistency", requires={'page': 'home', 'section': 'members'}, tags={'members', 'accordion'}, cost=7.5,
+               effects={'accordion': 'expanded'})
     def _test_members_count_consistency(self):
         """Testa se a contagem de membros por instrumento é consistente."""
         test_name = "Members Count Consistency"
@@ -130,6 +142,7 @@ class MembersTestStrategy(TestStrategy):
             self.add_result(test_name, False, f"Exceção: {str(e)}")
             self.take_screenshot_on_failure("members_count_exception")
     
+    @test_unit("Join CTA Functionality", requires={'page': 'home', 'section': 'members'}, tags={'members', 'interaction'}, cost=1.5)
     def _test_join_cta(self):
         """Testa o call-to-action para entrar no bloco."""
         test_name = "Join CTA Functionality"
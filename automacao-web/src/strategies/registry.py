@@ -0,0 +1,176 @@
+"""
+Registro declarativo de unidades de teste.
+Expõe cada verificação das estratégias como uma unidade individual, permitindo
+que executores filtrem, reordenem, paralelizem e reexecutem checagens isoladas.
+"""
+
+# Tags de unidades que ficam fora da seleção padrão (execução completa, daemon)
+# e só rodam quando pedidas explicitamente, pela tag ou pelo nome do teste
+OPT_IN_TAGS = frozenset({'external', 'scale'})
+
+class TestUnit:
+    """Metadados de uma verificação individual de uma estratégia."""
+    
+    def __init__(self, name, method_name, requires=None, tags=(), cost=1.0, strategy_key=None,
+                 effects=None, after=()):
+        """
+        Inicializa a unidade de teste.
+        
+        Args:
+            name (str): Nome do teste (o mesmo usado em add_result)
+            method_name (str): Nome do método da estratégia que executa o teste
+            requires (dict): Estado de página exigido, ex: {'page': 'home', 'section': 'donations'}
+            tags (iterable): Conjunto de tags para filtragem
+            cost (float): Custo estimado de execução em segundos
+            strategy_key (str): Chave da estratégia dona da unidade
+            effects (dict): Efeitos colaterais no estado da página, ex: {'accordion': 'expanded'}
+            after (iterable): Nomes de testes que precisam executar antes deste
+        """
+        self.name = name
+        self.method_name = method_name
+        self.requires = dict(requires or {})
+        self.tags = frozenset(tags)
+        self.cost = float(cost)
+        self.strategy_key = strategy_key
+        self.effects = dict(effects or {})
+        self.after = tuple(after)
+    
+    def bind(self, strategy_key):
+        """
+        Retorna uma cópia da unidade associada a uma estratégia.
+        
+        Args:
+            strategy_key (str): Chave da estratégia
+        
+        Returns:
+            TestUnit: Unidade associada
+        """
+        return TestUnit(self.name, self.method_name, self.requires, self.tags, self.cost, strategy_key,
+                        self.effects, self.after)
+    
+    @property
+    def qualified_name(self):
+        """Nome qualificado no formato 'estrategia:Nome do Teste'."""
+        return f"{self.strategy_key}:{self.name}"
+    
+    def matches(self, tags=None, names=None):
+        """
+        Verifica se a unidade atende aos filtros informados.
+        
+        Args:
+            tags (iterable): Tags aceitas (basta uma em comum)
+            names (iterable): Nomes simples ou qualificados aceitos
+        
+        Returns:
+            bool: True se a unidade passa nos filtros
+        """
+        opt_in = self.tags & OPT_IN_TAGS
+        named = bool(names) and (self.name in names or self.qualified_name in names)
+        if opt_in and not named and not opt_in.intersection(tags or ()):
+            return False
+        if tags and not self.tags.intersection(tags):
+            return False
+        if names and self.name not in names and self.qualified_name not in names:
+            return False
+        return True
+    
+    def run(self, strategy):
+        """
+        Executa a unidade na instância da estratégia.
+        
+        Args:
+            strategy (TestStrategy): Estratégia que contém o método do teste
+        """
+        getattr(strategy, self.method_name)()
+    
+    def __repr__(self):
+        return f"TestUnit({self.qualified_name!r}, cost={self.cost}, tags={sorted(self.tags)})"
+
+def test_unit(name, requires=None, tags=(), cost=1.0, effects=None, after=()):
+    """
+    Decorator que registra um método de estratégia como unidade de teste.
+    
+    Args:
+        name (str): Nome do teste
+        requires (dict): Estado de página exigido
+        tags (iterable): Tags da unidade
+        cost (float): Custo estimado em segundos
+        effects (dict): Efeitos colaterais no estado da página
+        after (iterable): Testes que precisam executar antes
+    
+    Returns:
+        callable: Decorator que anota o método
+    """
+    def decorator(func):
+        func._test_unit = TestUnit(name, func.__name__, requires, tags, cost, effects=effects, after=after)
+        return func
+    return decorator
+
+class TestRegistry:
+    """Classe singleton que mantém as estratégias e suas unidades de teste."""
+    
+    _instance = None
+    _initialized = False
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(TestRegistry, cls).__new__(cls)
+        return cls._instance
+    
+    def __init__(self):
+        if not self._initialized:
+            self._strategies = {}
+            self._initialized = True
+    
+    def register_strategy(self, strategy_class):
+        """
+        Registra uma classe de estratégia pela sua STRATEGY_KEY.
+        
+        Args:
+            strategy_class (type): Subclasse de TestStrategy
+        """
+        self._strategies[strategy_class.STRATEGY_KEY] = strategy_class
+    
+    def strategy_keys(self):
+        """
+        Retorna as chaves das estratégias registradas, na ordem de registro.
+        
+        Returns:
+            list: Chaves das estratégias
+        """
+        return list(self._strategies)
+    
+    def get_strategy_class(self, strategy_key):
+        """
+        Obtém a classe de uma estratégia registrada.
+        
+        Args:
+            strategy_key (str): Chave da estratégia
+        
+        Returns:
+            type: Classe da estratégia
+        """
+        if strategy_key not in self._strategies:
+            raise ValueError(f"Estratégia desconhecida: {strategy_key}")
+        return self._strategies[strategy_key]
+    
+    def get_units(self, strategy_key=None, tags=None, names=None):
+        """
+        Lista as unidades de teste registradas que atendem aos filtros.
+        
+        Args:
+            strategy_key (str): Restringe a uma estratégia
+            tags (iterable): Tags aceitas
+            names (iterable): Nomes aceitos
+        
+        Returns:
+            list: Unidades de teste na ordem declarada
+        """
+        keys = [strategy_key] if strategy_key else self.strategy_keys()
+        units = []
+        for key in keys:
+            units.extend(self.get_strategy_class(key).get_test_units(tags=tags, names=names))
+        return units
+
+# Instância global do registro
+registry = TestRegistry()
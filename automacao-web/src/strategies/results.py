@@ -0,0 +1,189 @@
+"""
+Modelo compacto de resultados de teste.
+Resultados individuais e resumos por estratégia usam __slots__ e nomes
+internados, e são convertidos em dicionários apenas no momento da exportação,
+para que execuções longas (daemon, matriz) não multipliquem cópias em memória.
+"""
+import sys
+import time
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+def format_timestamp(epoch):
+    """
+    Formata um instante (epoch) no padrão dos relatórios.
+    
+    Args:
+        epoch (float): Instante em segundos desde a época
+    
+    Returns:
+        str: Timestamp formatado
+    """
+    return time.strftime(TIMESTAMP_FORMAT, time.localtime(epoch))
+
+class TestResult:
+    """Resultado de um teste individual."""
+    
+    __slots__ = ('test_name', 'passed', 'message', 'created_at', 'duration_seconds', 'details')
+    
+    def __init__(self, test_name, passed, message="", created_at=None, duration_seconds=None, details=None):
+        """
+        Inicializa o resultado.
+        
+        Args:
+            test_name (str): Nome do teste (internado)
+            passed (bool): Se o teste passou
+            message (str): Mensagem adicional
+            created_at (float): Instante do resultado (padrão: agora)
+            duration_seconds (float): Duração do teste, se medida
+            details (dict): Campos extras (ex: timed_out=True)
+        """
+        self.test_name = sys.intern(test_name)
+        self.passed = bool(passed)
+        self.message = message
+        self.created_at = time.time() if created_at is None else created_at
+        self.duration_seconds = duration_seconds
+        self.details = details or None
+    
+    @property
+    def timestamp(self):
+        """Timestamp formatado do resultado."""
+        return format_timestamp(self.created_at)
+    
+    def to_dict(self):
+        """
+        Serializa o resultado no formato dos relatórios.
+        
+        Returns:
+            dict: Resultado serializado
+        """
+        result = {
+            'test_name': self.test_name,
+            'passed': self.passed,
+            'message': self.message,
+            'timestamp': self.timestamp
+        }
+        if self.duration_seconds is not None:
+            result['duration_seconds'] = self.duration_seconds
+        if self.details:
+            result.update(self.details)
+        return result
+    
+    def __repr__(self):
+        return f"TestResult({self.test_name!r}, passed={self.passed})"
+
+class StrategyResult:
+    """Resumo dos resultados de uma estratégia, calculado em uma única passada."""
+    
+    __slots__ = ('strategy_name', 'results', 'total_tests', 'passed_tests', 'failed_tests', 'error', 'dimensions')
+    
+    def __init__(self, strategy_name, results=(), error=None, dimensions=None):
+        """
+        Inicializa o resumo.
+        
+        Args:
+            strategy_name (str): Nome da estratégia (internado)
+            results (iterable): Resultados individuais (TestResult)
+            error (str): Erro crítico que interrompeu a estratégia
+            dimensions (dict): Dimensões extras da execução (ex: navegador e viewport da matriz)
+        """
+        self.strategy_name = sys.intern(strategy_name)
+        self.results = results if isinstance(results, list) else list(results)
+        self.error = error
+        self.dimensions = dimensions or None
+        
+        passed = 0
+        for result in self.results:
+            passed += result.passed
+        
+        self.total_tests = len(self.results)
+        self.passed_tests = passed
+        self.failed_tests = self.total_tests - passed
+    
+    @classmethod
+    def from_error(cls, strategy_name, error):
+        """
+        Cria o resumo de uma estratégia interrompida por erro crítico.
+        
+        Args:
+            strategy_name (str): Nome da estratégia
+            error (str): Descrição do erro
+        
+        Returns:
+            StrategyResult: Resumo com um único teste falho
+        """
+        failure = TestResult(f"{strategy_name}_execution", False, f"Erro crítico: {error}")
+        return cls(strategy_name, [failure], error=error)
+    
+    @property
+    def success_rate(self):
+        """Taxa de sucesso em porcentagem."""
+        return (self.passed_tests / self.total_tests * 100) if self.total_tests > 0 else 0
+    
+    @property
+    def overall_success(self):
+        """Indica se nenhum teste falhou."""
+        return self.failed_tests == 0
+    
+    def with_dimensions(self, label, **dimensions):
+        """
+        Retorna uma cópia rotulada do resumo, compartilhando a lista de resultados.
+        
+        Args:
+            label (str): Sufixo do nome da estratégia, ex: 'chrome@390x844'
+            **dimensions: Dimensões da execução
+        
+        Returns:
+            StrategyResult: Resumo rotulado
+        """
+        labeled = StrategyResult.__new__(StrategyResult)
+        labeled.strategy_name = sys.intern(f"{self.strategy_name} [{label}]")
+        labeled.results = self.results
+        labeled.total_tests = self.total_tests
+        labeled.passed_tests = self.passed_tests
+        labeled.failed_tests = self.failed_tests
+        labeled.error = self.error
+        labeled.dimensions = dict(self.dimensions or {}, **dimensions)
+        return labeled
+    
+    def to_dict(self):
+        """
+        Serializa o resumo no formato dos relatórios.
+        Os resultados detalhados permanecem objetos e são convertidos sob demanda
+        pelo encoder JSON (ver to_json_default).
+        
+        Returns:
+            dict: Resumo serializado
+        """
+        summary = {
+            'strategy_name': self.strategy_name,
+            'total_tests': self.total_tests,
+            'passed_tests': self.passed_tests,
+            'failed_tests': self.failed_tests,
+            'success_rate': self.success_rate,
+            'overall_success': self.overall_success
+        }
+        if self.error:
+            summary['error'] = self.error
+        if self.dimensions:
+            summary.update(self.dimensions)
+        summary['detailed_results'] = self.results
+        return summary
+    
+    def __repr__(self):
+        return f"StrategyResult({self.strategy_name!r}, {self.passed_tests}/{self.total_tests})"
+
+def to_json_default(value):
+    """
+    Função 'default' para json.dump: serializa os objetos de resultado à medida
+    que o encoder os encontra, sem montar uma cópia completa do relatório.
+    
+    Args:
+        value: Objeto não serializável nativamente
+    
+    Returns:
+        dict: Representação serializável
+    """
+    if isinstance(value, (TestResult, StrategyResult)):
+        return value.to_dict()
+    raise TypeError(f"Objeto não serializável: {type(value).__name__}")
\ No newline at end of file
@@ -0,0 +1,236 @@
+"""
+Escalonador de unidades de teste orientado a dependências.
+Monta um DAG a partir das precondições, efeitos colaterais e dependências
+declaradas em @test_unit, distribui os componentes independentes entre
+workers e ordena cada worker minimizando navegações, rolagens e resets do acordeão.
+"""
+from src.pages.page_state import PageStateManager
+
+class WorkerPlan:
+    """Plano de execução de um worker: ações de preparação intercaladas com testes."""
+    
+    def __init__(self, worker_id):
+        """
+        Inicializa o plano do worker.
+        
+        Args:
+            worker_id (int): Identificador do worker
+        """
+        self.worker_id = worker_id
+        self.steps = []
+        self.estimated_cost = 0.0
+    
+    @property
+    def units(self):
+        """Unidades de teste do plano, na ordem de execução."""
+        return [value for kind, value in self.steps if kind == 'test']
+    
+    def count_actions(self, action):
+        """
+        Conta quantas ações de preparação de um tipo o plano contém.
+        
+        Args:
+            action (str): Tipo da ação ('navigate', 'scroll')
+        
+        Returns:
+            int: Quantidade de ações
+        """
+        return sum(1 for kind, value in self.steps if kind == 'setup' and value[0] == action)
+    
+    def to_dict(self):
+        """
+        Serializa o plano para o relatório.
+        
+        Returns:
+            dict: Plano serializado
+        """
+        return {
+            'worker_id': self.worker_id,
+            'estimated_cost_seconds': round(self.estimated_cost, 2),
+            'navigations': self.count_actions('navigate'),
+            'scrolls': self.count_actions('scroll'),
+            'tests': [unit.qualified_name for unit in self.units]
+        }
+
+class TestScheduler:
+    """Calcula a ordem de execução e a atribuição de unidades de teste a workers."""
+    
+    def __init__(self, units, workers=1, state_manager_class=PageStateManager, priority=None):
+        """
+        Inicializa o escalonador.
+        
+        Args:
+            units (list): Unidades de teste a escalonar
+            workers (int): Quantidade de workers (navegadores) disponíveis
+            state_manager_class (type): Classe que modela as transições de estado
+            priority (callable): Chave de prioridade por unidade (menor executa antes);
+                quando informada, prevalece sobre o custo de preparação
+        """
+        self.units = list(units)
+        self.workers = max(1, int(workers))
+        self.state_model = state_manager_class
+        self.priority = priority
+        self._index = {unit.qualified_name: position for position, unit in enumerate(self.units)}
+        self._dependencies = self._build_dependencies()
+    
+    def _resolve(self, unit, name):
+        """Resolve o nome de uma dependência para o nome qualificado da unidade."""
+        if ':' not in name:
+            name = f"{unit.strategy_key}:{name}"
+        return name if name in self._index else None
+    
+    def _build_dependencies(self):
+        """
+        Monta as arestas do DAG a partir das dependências declaradas.
+        
+        Returns:
+            dict: Nome qualificado -> conjunto de dependências diretas
+        """
+        dependencies = {}
+        
+        for unit in self.units:
+            # Dependências fora da seleção atual são ignoradas
+            resolved = (self._resolve(unit, name) for name in unit.after)
+            dependencies[unit.qualified_name] = {name for name in resolved if name}
+        
+        self._check_acyclic(dependencies)
+        return dependencies
+    
+    def _check_acyclic(self, dependencies):
+        """Garante que o grafo de dependências não contém ciclos."""
+        visiting, done = set(), set()
+        
+        def visit(name, path):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Ciclo de dependências entre testes: {' -> '.join(path + [name])}")
+            visiting.add(name)
+            for dependency in dependencies[name]:
+                visit(dependency, path + [name])
+            visiting.discard(name)
+            done.add(name)
+        
+        for name in dependencies:
+            visit(name, [])
+    
+    def _components(self):
+        """
+        Agrupa as unidades em componentes conexos do grafo de dependências.
+        
+        Returns:
+            list: Listas de unidades que precisam rodar no mesmo worker
+        """
+        parent = {name: name for name in self._index}
+        
+        def find(name):
+            while parent[name] != name:
+                parent[name] = parent[parent[name]]
+                name = parent[name]
+            return name
+        
+        for name, dependencies in self._dependencies.items():
+            for dependency in dependencies:
+                parent[find(name)] = find(dependency)
+        
+        groups = {}
+        for unit in self.units:
+            groups.setdefault(find(unit.qualified_name), []).append(unit)
+        return list(groups.values())
+    
+    def _setup_estimate(self, assigned_requirements, unit):
+        """Estima o custo de preparação de uma unidade em um worker."""
+        fresh = {'page': None}
+        best = self.state_model.plan_transition(fresh, unit.requires)[1]
+        
+        for requirements in assigned_requirements:
+            state = self.state_model.plan_transition(fresh, requirements)[2]
+            best = min(best, self.state_model.plan_transition(state, unit.requires)[1])
+        
+        return best
+    
+    def assign_workers(self):
+        """
+        Distribui os componentes entre os workers (maior custo primeiro).
+        
+        Returns:
+            list: Listas de unidades por worker
+        """
+        components = self._components()
+        components.sort(key=lambda group: (-sum(unit.cost for unit in group), self._index[group[0].qualified_name]))
+        
+        assignments = [[] for _ in range(self.workers)]
+        loads = [0.0] * self.workers
+        
+        for group in components:
+            def projected_load(worker):
+                requirements = [unit.requires for unit in assignments[worker]]
+                setup = sum(self._setup_estimate(requirements, unit) for unit in group)
+                return loads[worker] + setup + sum(unit.cost for unit in group)
+            
+            worker = min(range(self.workers), key=lambda candidate: (projected_load(candidate), candidate))
+            loads[worker] = projected_load(worker)
+            assignments[worker].extend(group)
+        
+        return assignments
+    
+    def order_units(self, units, worker_id=0):
+        """
+        Ordena as unidades de um worker respeitando o DAG e minimizando preparações.
+        
+        Args:
+            units (list): Unidades atribuídas ao worker
+            worker_id (int): Identificador do worker
+        
+        Returns:
+            WorkerPlan: Plano de execução do worker
+        """
+        plan = WorkerPlan(worker_id)
+        pending = {unit.qualified_name: unit for unit in units}
+        done = set()
+        state = {'page': None}
+        
+        while pending:
+            ready = [unit for name, unit in pending.items() if self._dependencies[name] <= done]
+            
+            def transition_cost(unit):
+                steps, cost, _ = self.state_model.plan_transition(state, unit.requires)
+                # Prefere não desfazer o estado que outros testes pendentes ainda usam
+                penalty = sum(
+                    1 for other in pending.values()
+                    if other is not unit and self._invalidates(unit.effects, other.requires)
+                )
+                if self.priority:
+                    return (self.priority(unit), cost, penalty, self._index[unit.qualified_name])
+                return (cost, penalty, self._index[unit.qualified_name])
+            
+            unit = min(ready, key=transition_cost)
+            steps, cost, state = self.state_model.plan_transition(state, unit.requires)
+            
+            plan.steps.extend(('setup', step) for step in steps)
+            plan.steps.append(('test', unit))
+            plan.estimated_cost += cost + unit.cost
+            
+            state = self.state_model.apply_effects(state, unit.effects)
+            done.add(unit.qualified_name)
+            del pending[unit.qualified_name]
+        
+        return plan
+    
+    @staticmethod
+    def _invalidates(effects, requires):
+        """Indica se os efeitos de um teste quebram as precondições de outro."""
+        return any(key in requires and requires[key] != value for key, value in effects.items())
+    
+    def plan(self):
+        """
+        Calcula o plano completo de execução.
+        
+        Returns:
+            list: Um WorkerPlan por worker com unidades atribuídas
+        """
+        plans = []
+        for worker_id, units in enumerate(self.assign_workers()):
+            if units:
+                plans.append(self.order_units(units, worker_id))
+        return plans
@@ -4,38 +4,92 @@ Implementa o padrão Context para coordenar diferentes estratégias de teste.
 """
 from src.utils.webdriver_factory import WebDriverFactory
 from src.utils.logger import logger
+from src.utils.watchdog import Watchdog
+from src.utils.history import TestHistory
+from src.utils.metrics import metrics
+from src.utils.tracing import tracer
+from src.utils.har import har_recorder
+from src.utils.result_cache import result_cache
+from src.utils.artifact_store import artifact_store
+from src.utils.wait_history import wait_history
+from src.utils.warmup import warmup
+from src.utils.profiling import profiler
+from src.utils.matrix import plan_lanes
+from src.utils.emulation import BASELINE_NAME
 from src.strategies.home_page_strategy import HomePageTestStrategy
 from src.strategies.donations_strategy import DonationsTestStrategy
 from src.strategies.members_strategy import MembersTestStrategy
+from src.strategies.admin_dashboard_strategy import AdminDashboardTestStrategy
+from src.strategies.link_check_strategy import LinkCheckTestStrategy
+from src.strategies.registry import registry
+from src.strategies.results import TestResult, StrategyResult, to_json_default
+from src.strategies.scheduler import TestScheduler
+from src.pages.page_state import PageStateManager
 from config.settings import Config
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 import json
+import threading
 from datetime import datetime
 
 class TestExecutor:
     """Executor principal que coordena todos os testes."""
     
-    def __init__(self, browser_type="chrome"):
+    def __init__(self, browser_type="chrome", tags=None, test_names=None, test_timeout=None, run_timeout=None,
+                 fail_fast=False):
         """
         Inicializa o executor de testes.
         
         Args:
             browser_type (str): Tipo do navegador a ser usado
+            tags (iterable): Executa apenas testes com alguma dessas tags
+            test_names (iterable): Executa apenas os testes com esses nomes
+            test_timeout (int): Tempo máximo por teste em segundos (padrão: TEST_TIMEOUT)
+            run_timeout (int): Tempo máximo da execução em segundos (padrão: RUN_TIMEOUT)
+            fail_fast (bool): Interrompe a execução na primeira falha
         """
         self.browser_type = browser_type
+        self.tags = set(tags) if tags else None
+        self.test_names = set(test_names) if test_names else None
         self.config = Config()
         self.driver = None
         self.test_results = []
         self.start_time = None
         self.end_time = None
+        self.schedule_summary = None
+        self.matrix_summary = None
+        self.fail_fast = fail_fast
+        self.not_run = []
+        self.sessions = []
+        self._stop_event = threading.Event()
+        self.watchdog = Watchdog(
+            test_timeout or self.config.TEST_TIMEOUT,
+            run_timeout if run_timeout is not None else self.config.RUN_TIMEOUT
+        )
+    
+    def reset(self):
+        """Descarta os resultados da execução anterior, mantendo a configuração do executor."""
+        self.test_results = []
+        self.start_time = None
+        self.end_time = None
+        self.schedule_summary = None
+        self.matrix_summary = None
+        self.not_run = []
+        self.sessions = []
+        self._stop_event.clear()
+        har_recorder.reset()
+        result_cache.reset()
     
     def setup(self):
         """Configura o ambiente de teste."""
         logger.info("🚀 Iniciando configuração dos testes")
         
         try:
-            # Criar WebDriver
-            self.driver = WebDriverFactory.create_driver(self.browser_type)
+            # Criar WebDriver (substituível pelo watchdog em caso de travamento)
+            self.driver = WebDriverFactory.create_managed_driver(self.browser_type)
+            self._record_session(self.driver, 0)
             self.start_time = datetime.now()
+            self.watchdog.start()
             
             logger.info(f"✅ WebDriver {self.browser_type} configurado com sucesso")
             return True
@@ -48,6 +102,8 @@ class TestExecutor:
         """Limpa o ambiente de teste."""
         logger.info("🧹 Limpando ambiente de teste")
         
+        self.watchdog.stop()
+        
         if self.driver:
             try:
                 self.driver.quit()
@@ -74,39 +130,51 @@ class TestExecutor:
             strategies = [
                 ("HomePage", HomePageTestStrategy(self.driver)),
                 ("Donations", DonationsTestStrategy(self.driver)),
-                ("Members", MembersTestStrategy(self.driver))
+                ("Members", MembersTestStrategy(self.driver)),
+                ("AdminDashboard", AdminDashboardTestStrategy(self.driver)),
+                ("LinkCheck", LinkCheckTestStrategy(self.driver))
             ]
             
             for strategy_name, strategy in strategies:
+                units = strategy.get_test_units(tags=self.tags, names=self.test_names)
+                if not units:
+                    logger.info(f"⏭️ Estratégia {strategy_name} sem testes selecionados")
+                    continue
+                
+                if self._stop_event.is_set():
+                    self.not_run.extend(unit.qualified_name for unit in units)
+                    continue
+                
+                strategy.watchdog = self.watchdog
+                strategy.fail_fast = self.fail_fast
+                
+                if self.watchdog.run_expired:
+                    logger.warning(f"⏰ Estratégia {strategy_name} não executada: tempo total esgotado")
+                    strategy.skip_units(units, "Não executado: tempo total da execução esgotado")
+                    self.test_results.append(strategy.get_summary())
+                    continue
+                
                 logger.info(f"🔄 Executando estratégia: {strategy_name}")
                 
                 try:
-                    result = strategy.execute()
+                    with tracer.span(strategy_name, 'strategy', self.driver):
+                        result = strategy.execute(units)
                     self.test_results.append(result)
+                    self.not_run.extend(unit.qualified_name for unit in strategy.units_not_run)
                     
                     logger.info(f"✅ Estratégia {strategy_name} concluída")
                     
+                    if self.fail_fast and not result.overall_success:
+                        logger.warning("⏹️ Fail-fast: interrompendo execução na primeira falha")
+                        self._stop_event.set()
+                    
                 except Exception as e:
                     logger.error(f"❌ Erro na estratégia {strategy_name}: {str(e)}")
                     
-                    error_result = {
-                        'strategy_name': strategy_name,
-                        'total_tests': 0,
-                        'passed_tests': 0,
-                        'failed_tests': 1,
-                        'success_rate': 0,
-                        'overall_success': False,
-                        'error': str(e),
-                        'detailed_results': [
-                            {
-                                'test_name': f'{strategy_name}_execution',
-                                'passed': False,
-                                'message': f'Erro crítico: {str(e)}',
-                                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                            }
-                        ]
-                    }
-                    self.test_results.append(error_result)
+                    self.test_results.append(StrategyResult.from_error(strategy_name, str(e)))
+                    
+                    if self.fail_fast:
+                        self._stop_event.set()
             
             # Gerar relatório final
             final_report = self._generate_final_report()
@@ -135,20 +203,16 @@ class TestExecutor:
             return {"error": "Falha na configuração inicial"}
         
         try:
-            strategy_mapping = {
-                'home': HomePageTestStrategy,
-                'donations': DonationsTestStrategy,
-                'members': MembersTestStrategy
-            }
-            
-            if strategy_name not in strategy_mapping:
-                raise ValueError(f"Estratégia desconhecida: {strategy_name}")
-            
-            strategy_class = strategy_mapping[strategy_name]
+            strategy_class = registry.get_strategy_class(strategy_name)
             strategy = strategy_class(self.driver)
+            strategy.watchdog = self.watchdog
+            strategy.fail_fast = self.fail_fast
             
-            result = strategy.execute()
+            units = strategy.get_test_units(tags=self.tags, names=self.test_names)
+            with tracer.span(strategy_name, 'strategy', self.driver):
+                result = strategy.execute(units)
             self.test_results.append(result)
+            self.not_run.extend(unit.qualified_name for unit in strategy.units_not_run)
             
             # Gerar relatório específico
             final_report = self._generate_final_report()
@@ -159,6 +223,409 @@ class TestExecutor:
         finally:
             self.teardown()
     
+    def run_scheduled_tests(self, strategy_name=None, workers=1, order='dag'):
+        """
+        Executa as unidades de teste selecionadas seguindo o plano do escalonador.
+        Cada worker usa seu próprio navegador; as precondições declaradas em
+        @test_unit são estabelecidas sob demanda pelo PageStateManager.
+        
+        Args:
+            strategy_name (str): Restringe a uma estratégia ('home', 'donations', 'members')
+            workers (int): Quantidade de navegadores executando em paralelo
+            order (str): 'dag' minimiza preparações; 'history' executa primeiro os testes
+                que falharam recentemente e os mais baratos (relatórios em REPORTS_DIR)
+            
+        Returns:
+            dict: Relatório final consolidado
+        """
+        plans = self.plan_tests(strategy_name, workers, order)
+        if not plans:
+            return {"error": "Nenhum teste selecionado"}
+        
+        final_report = self.execute_plans(plans, order)
+        self._export_reports(final_report)
+        
+        return final_report
+    
+    def plan_tests(self, strategy_name=None, workers=1, order='dag'):
+        """
+        Calcula o plano de execução das unidades de teste selecionadas.
+        
+        Args:
+            strategy_name (str): Restringe a uma estratégia
+            workers (int): Quantidade de navegadores executando em paralelo
+            order (str): 'dag' ou 'history' (ver run_scheduled_tests)
+            
+        Returns:
+            list: Um WorkerPlan por worker (vazia se nenhum teste for selecionado)
+        """
+        units = registry.get_units(strategy_name, tags=self.tags, names=self.test_names)
+        if not units:
+            return []
+        
+        priority = None
+        if order == 'history':
+            priority = TestHistory.load(self.config.REPORTS_DIR, browser=self.browser_type).priority_key
+        
+        plans = TestScheduler(units, workers, priority=priority).plan()
+        
+        logger.info(f"🗓️ Plano de execução: {len(units)} testes em {len(plans)} worker(s)")
+        for plan in plans:
+            summary = plan.to_dict()
+            logger.info(
+                f"👷 Worker {plan.worker_id}: {len(summary['tests'])} testes, "
+                f"{summary['navigations']} navegações, {summary['scrolls']} rolagens, "
+                f"~{summary['estimated_cost_seconds']:.1f}s"
+            )
+        
+        return plans
+    
+    def execute_plans(self, plans, order='dag', drivers=None):
+        """
+        Executa planos já calculados e consolida o relatório (sem exportá-lo).
+        
+        Args:
+            plans (list): Planos retornados por plan_tests
+            order (str): Ordem usada no planejamento (registrada no relatório)
+            drivers (dict): WebDrivers já abertos por worker_id; quando informados,
+                são reutilizados e permanecem abertos ao final
+            
+        Returns:
+            dict: Relatório final consolidado
+        """
+        drivers = drivers or {}
+        self.start_time = datetime.now()
+        self.watchdog.start()
+        
+        try:
+            with ThreadPoolExecutor(max_workers=len(plans), thread_name_prefix="worker") as pool:
+                worker_results = list(pool.map(
+                    lambda plan: self._run_worker_plan(plan, drivers.get(plan.worker_id)),
+                    plans
+                ))
+        finally:
+            self.watchdog.stop()
+        
+        self.end_time = datetime.now()
+        
+        # Consolidar resultados por estratégia, na ordem do registro
+        merged = {}
+        for results in worker_results:
+            for strategy_key, test_results in results.items():
+                merged.setdefault(strategy_key, []).extend(test_results)
+        
+        self.test_results = [
+            registry.get_strategy_class(strategy_key).build_summary(merged[strategy_key])
+            for strategy_key in registry.strategy_keys() if strategy_key in merged
+        ]
+        
+        self.schedule_summary = {
+            'order': order,
+            'workers': len(plans),
+            'plans': [plan.to_dict() for plan in plans]
+        }
+        
+        return self._generate_final_report()
+    
+    def run_matrix(self, cells, strategy_name=None, drivers_per_browser=1, order='dag'):
+        """
+        Executa os testes em todas as combinações navegador × viewport (× emulação).
+        Navegadores diferentes rodam em paralelo; cada WebDriver percorre suas
+        viewports e perfis de emulação apenas sendo reconfigurado, sem relançar o navegador.
+        
+        Args:
+            cells (list): Combinações da matriz (MatrixCell)
+            strategy_name (str): Restringe a uma estratégia
+            drivers_per_browser (int): Máximo de WebDrivers simultâneos por navegador
+            order (str): Ordem de execução dentro de cada combinação ('dag' ou 'history')
+            
+        Returns:
+            dict: Relatório único com a dimensão da matriz
+        """
+        plans = self.plan_tests(strategy_name, 1, order)
+        if not plans:
+            return {"error": "Nenhum teste selecionado"}
+        
+        lanes = plan_lanes(cells, drivers_per_browser)
+        logger.info(f"🧮 Matriz: {len(cells)} combinações em {len(lanes)} navegador(es) simultâneo(s)")
+        
+        self.start_time = datetime.now()
+        
+        with ThreadPoolExecutor(max_workers=len(lanes), thread_name_prefix="matrix") as pool:
+            lane_results = list(pool.map(
+                lambda indexed_lane: self._run_matrix_lane(indexed_lane[0], indexed_lane[1], plans, order),
+                enumerate(lanes)
+            ))
+        
+        self.end_time = datetime.now()
+        
+        # Consolidar na ordem da matriz (navegador, viewport)
+        cell_reports = {}
+        for results in lane_results:
+            cell_reports.update(results)
+        
+        self.test_results = []
+        self.matrix_summary = {
+            'browsers': list(dict.fromkeys(cell.browser for cell in cells)),
+            'viewports': list(dict.fromkeys(cell.viewport for cell in cells)),
+            'cells': []
+        }
+        
+        # Duração de cada teste por perfil de emulação, lado a lado
+        emulated = any(cell.emulation for cell in cells)
+        timings = {}
+        
+        for cell in cells:
+            report = cell_reports[cell.label]
+            summary = report.get('test_summary', {})
+            
+            if 'error' in report:
+                report['strategy_results'] = [StrategyResult.from_error('Matrix', report['error'])]
+            
+            emulation = cell.emulation.name if cell.emulation else BASELINE_NAME
+            dimensions = {'browser': cell.browser, 'viewport': cell.viewport}
+            if emulated:
+                dimensions['emulation'] = emulation
+            
+            for strategy_result in report['strategy_results']:
+                self.test_results.append(strategy_result.with_dimensions(cell.label, **dimensions))
+                
+                if emulated:
+                    for test in strategy_result.results:
+                        key = (cell.browser, cell.viewport, strategy_result.strategy_name, test.test_name)
+                        timings.setdefault(key, {})[emulation] = test.duration_seconds
+            
+            self.matrix_summary['cells'].append({
+                'browser': cell.browser,
+                'viewport': cell.viewport,
+                'emulation': emulation if emulated else None,
+                'total_tests': summary.get('total_tests', 0),
+                'passed': summary.get('total_passed', 0),
+                'failed': summary.get('total_failed', 0),
+                'success_rate': summary.get('success_rate', 0),
+                'overall_success': summary.get('overall_success', False),
+                'execution_time_seconds': report.get('execution_summary', {}).get('execution_time_seconds'),
+                'error': report.get('error')
+            })
+        
+        if emulated:
+            self.matrix_summary['emulation'] = self._emulation_comparison(cells, timings)
+        
+        final_report = self._generate_final_report()
+        final_report['execution_summary']['browser_used'] = ', '.join(self.matrix_summary['browsers'])
+        self._export_reports(final_report)
+        
+        return final_report
+    
+    def _emulation_comparison(self, cells, timings):
+        """
+        Monta a comparação da duração de cada teste entre os perfis de emulação.
+        
+        Args:
+            cells (list): Combinações da matriz
+            timings (dict): Duração por perfil, por (navegador, viewport, estratégia, teste)
+        
+        Returns:
+            dict: Perfis e uma linha por teste, com a duração em cada perfil e a
+            razão em relação à execução sem emulação
+        """
+        profiles = list(dict.fromkeys(cell.emulation for cell in cells if cell.emulation))
+        names = [BASELINE_NAME] + [profile.name for profile in profiles]
+        
+        tests = []
+        for (browser, viewport, strategy_name, test_name), durations in timings.items():
+            baseline = durations.get(BASELINE_NAME)
+            tests.append({
+                'browser': browser,
+                'viewport': viewport,
+                'strategy': strategy_name,
+                'test': test_name,
+                'seconds': {name: durations.get(name) for name in names},
+                'slowdown': {
+                    name: round(durations[name] / baseline, 2)
+                    for name in names[1:] if durations.get(name) is not None and baseline
+                }
+            })
+        
+        return {'profiles': [profile.describe() for profile in profiles], 'baseline': BASELINE_NAME, 'tests': tests}
+    
+    def _run_matrix_lane(self, lane_id, cells, plans, order):
+        """
+        Executa uma sequência de combinações do mesmo navegador em um único WebDriver.
+        
+        Args:
+            lane_id (int): Identificador da faixa (usado como worker_id das sessões)
+            cells (list): Combinações do mesmo navegador
+            plans (list): Plano de execução (um worker)
+            order (str): Ordem usada no planejamento
+            
+        Returns:
+            dict: Relatório de cada combinação, por rótulo
+        """
+        browser = cells[0].browser
+        results = {}
+        
+        try:
+            driver = WebDriverFactory.create_managed_driver(browser)
+            self._record_session(driver, lane_id)
+        except Exception as e:
+            logger.error(f"❌ Não foi possível criar o WebDriver {browser} da matriz: {str(e)}")
+            for cell in cells:
+                results[cell.label] = {'error': f"Falha ao criar WebDriver: {str(e)}"}
+            return results
+        
+        try:
+            for cell in cells:
+                logger.info(f"🧮 Combinação {cell.label}")
+                
+                # Um executor por combinação: resultados e watchdog independentes
+                cell_executor = TestExecutor(
+                    browser_type=browser,
+                    tags=self.tags,
+                    test_names=self.test_names,
+                    test_timeout=self.watchdog.test_timeout,
+                    run_timeout=self.watchdog.run_timeout or 0,
+                    fail_fast=self.fail_fast
+                )
+                
+                try:
+                    WebDriverFactory.set_viewport(driver, cell.width, cell.height)
+                    if cell.emulation or driver.emulation:
+                        WebDriverFactory.set_emulation(driver, cell.emulation)
+                    results[cell.label] = cell_executor.execute_plans(plans, order, {plans[0].worker_id: driver})
+                except Exception as e:
+                    logger.error(f"❌ Erro na combinação {cell.label}: {str(e)}")
+                    results[cell.label] = {'error': str(e)}
+                
+                self.not_run.extend(f"{name} [{cell.label}]" for name in cell_executor.not_run)
+        finally:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.error(f"❌ Erro ao fechar WebDriver {browser} da matriz: {str(e)}")
+        
+        return results
+    
+    def _run_worker_plan(self, plan, driver=None):
+        """
+        Executa o plano de um worker em um navegador dedicado.
+        
+        Args:
+            plan (WorkerPlan): Plano calculado pelo escalonador
+            driver: WebDriver já aberto a reutilizar (não é fechado ao final)
+            
+        Returns:
+            dict: Resultados individuais por chave de estratégia
+        """
+        results = {}
+        owns_driver = driver is None
+        
+        try:
+            if owns_driver:
+                driver = WebDriverFactory.create_managed_driver(self.browser_type)
+                self._record_session(driver, plan.worker_id)
+        except Exception as e:
+            logger.error(f"❌ Worker {plan.worker_id} não conseguiu criar o WebDriver: {str(e)}")
+            for unit in plan.units:
+                results.setdefault(unit.strategy_key, []).append(
+                    TestResult(unit.name, False, f'Erro crítico: {str(e)}')
+                )
+            return results
+        
+        state_manager = PageStateManager(driver)
+        strategies = {}
+        
+        try:
+            # Um span de estratégia por sequência contígua de testes da mesma estratégia
+            for strategy_key, strategy_units in groupby(plan.units, key=lambda unit: unit.strategy_key):
+                with tracer.span(strategy_key, 'strategy', driver):
+                    for unit in strategy_units:
+                        if self._stop_event.is_set():
+                            self.not_run.append(unit.qualified_name)
+                            continue
+                        
+                        strategy = strategies.get(strategy_key)
+                        if strategy is None:
+                            strategy = registry.get_strategy_class(strategy_key)(driver)
+                            strategy.watchdog = self.watchdog
+                            strategy.state_manager = state_manager
+                            strategies[strategy_key] = strategy
+                        
+                        self._run_planned_unit(strategy, unit, state_manager, driver)
+            
+            logger.info(f"✅ Worker {plan.worker_id} concluído: {state_manager.actions_performed}")
+            
+        finally:
+            if owns_driver:
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logger.error(f"❌ Erro ao fechar WebDriver do worker {plan.worker_id}: {str(e)}")
+        
+        for strategy_key, strategy in strategies.items():
+            results[strategy_key] = strategy.test_results
+        
+        return results
+    
+    def _run_planned_unit(self, strategy, unit, state_manager, driver):
+        """
+        Estabelece as precondições de uma unidade planejada e a executa.
+        
+        Args:
+            strategy (TestStrategy): Estratégia dona da unidade
+            unit (TestUnit): Unidade de teste
+            state_manager (PageStateManager): Estado da página do worker
+            driver: WebDriver do worker
+        """
+        # Unidade reproduzida do cache: a página não é tocada e seus efeitos não valem
+        if result_cache.contains(strategy, unit):
+            strategy.run_unit(unit)
+            return
+        
+        results_before = len(strategy.test_results)
+        
+        try:
+            if not self.watchdog.run_expired:
+                with tracer.span(f"{unit.name}: preparação", 'strategy', driver):
+                    strategy.run_guarded(f"{unit.qualified_name} (preparação)",
+                                         lambda: state_manager.establish(unit.requires))
+            strategy.run_unit(unit)
+        except Exception as e:
+            logger.error(f"❌ Erro crítico no teste {unit.qualified_name}: {str(e)}")
+            strategy.add_result(unit.name, False, f"Erro crítico: {str(e)}")
+        
+        new_results = strategy.test_results[results_before:]
+        if all(result.passed for result in new_results):
+            state_manager.record_effects(unit.effects)
+        else:
+            # Um teste que falhou pode ter deixado a página em estado desconhecido
+            state_manager.invalidate()
+            
+            if self.fail_fast:
+                logger.warning(f"⏹️ Fail-fast: interrompendo execução após falha em {unit.qualified_name}")
+                self._stop_event.set()
+    
+    def _record_session(self, driver, worker_id):
+        """
+        Registra a sessão de navegador usada por um worker. Sessões remotas trazem
+        a espera na fila, reportada separadamente do tempo de teste.
+        
+        Args:
+            driver: WebDriver (ou ManagedDriver) recém-criado
+            worker_id (int): Identificador do worker
+        """
+        grid_node = getattr(driver, 'grid_node', None)
+        if grid_node is None:
+            return
+        
+        self.sessions.append({
+            'worker_id': worker_id,
+            'node': grid_node,
+            'queue_wait_seconds': driver.queue_wait_seconds,
+            'session_start_seconds': driver.session_start_seconds
+        })
+    
+    @profiler.section('relatorios')
     def _generate_final_report(self):
         """
         Gera o relatório final consolidado.
@@ -166,11 +633,36 @@ class TestExecutor:
         Returns:
             dict: Relatório final
         """
-        total_tests = sum(result['total_tests'] for result in self.test_results)
-        total_passed = sum(result['passed_tests'] for result in self.test_results)
-        total_failed = sum(result['failed_tests'] for result in self.test_results)
+        total_tests, total_passed, total_failed = 0, 0, 0
+        breakdown = {
+            'by_strategy': {},
+            'failed_tests': []
+        }
         
-        overall_success = all(result['overall_success'] for result in self.test_results)
+        # Passada única: totais e breakdown saem dos contadores de cada estratégia;
+        # apenas as falhas são percorridas individualmente
+        for result in self.test_results:
+            total_tests += result.total_tests
+            total_passed += result.passed_tests
+            total_failed += result.failed_tests
+            
+            breakdown['by_strategy'][result.strategy_name] = {
+                'total': result.total_tests,
+                'passed': result.passed_tests,
+                'failed': result.failed_tests,
+                'success_rate': result.success_rate
+            }
+            
+            if result.failed_tests:
+                breakdown['failed_tests'].extend(
+                    {
+                        'strategy': result.strategy_name,
+                        'test_name': test.test_name,
+                        'message': test.message,
+                        'timestamp': test.timestamp
+                    }
+                    for test in result.results if not test.passed
+                )
         
         execution_time = None
         if self.start_time and self.end_time:
@@ -190,53 +682,46 @@ class TestExecutor:
                 'total_passed': total_passed,
                 'total_failed': total_failed,
                 'success_rate': (total_passed / total_tests * 100) if total_tests > 0 else 0,
-                'overall_success': overall_success
+                'overall_success': total_failed == 0
             },
             'strategy_results': self.test_results,
-            'detailed_breakdown': self._generate_detailed_breakdown()
+            'detailed_breakdown': breakdown
         }
         
-        return final_report
-    
-    def _generate_detailed_breakdown(self):
-        """
-        Gera um breakdown detalhado dos testes.
+        if self.schedule_summary:
+            final_report['schedule'] = self.schedule_summary
         
-        Returns:
-            dict: Breakdown detalhado
-        """
-        breakdown = {
-            'by_strategy': {},
-            'failed_tests': [],
-            'passed_tests': []
-        }
+        if self.matrix_summary:
+            final_report['matrix'] = self.matrix_summary
         
-        for result in self.test_results:
-            strategy_name = result['strategy_name']
-            
-            breakdown['by_strategy'][strategy_name] = {
-                'total': result['total_tests'],
-                'passed': result['passed_tests'],
-                'failed': result['failed_tests'],
-                'success_rate': result['success_rate']
+        if self.sessions:
+            final_report['execution_summary']['queue_wait_seconds'] = round(
+                sum(session['queue_wait_seconds'] for session in self.sessions), 3
+            )
+            final_report['remote_sessions'] = list(self.sessions)
+        
+        har_summary = har_recorder.summary()
+        if har_summary:
+            final_report['har'] = har_summary
+        
+        warmup_summary = warmup.summary()
+        if warmup_summary:
+            final_report['warmup'] = warmup_summary
+        
+        cache_summary = result_cache.summary()
+        if cache_summary:
+            final_report['result_cache'] = cache_summary
+        
+        if self.fail_fast:
+            final_report['fail_fast'] = {
+                'stopped_early': self._stop_event.is_set(),
+                'tests_not_run': len(self.not_run),
+                'not_run': list(self.not_run)
             }
-            
-            # Coletar testes falhos e bem-sucedidos
-            for test_detail in result.get('detailed_results', []):
-                test_info = {
-                    'strategy': strategy_name,
-                    'test_name': test_detail['test_name'],
-                    'message': test_detail['message'],
-                    'timestamp': test_detail['timestamp']
-                }
-                
-                if test_detail['passed']:
-                    breakdown['passed_tests'].append(test_info)
-                else:
-                    breakdown['failed_tests'].append(test_info)
         
-        return breakdown
+        return final_report
     
+    @profiler.section('relatorios')
     def _export_reports(self, final_report):
         """
         Exporta os relatórios nos formatos configurados.
@@ -250,13 +735,26 @@ class TestExecutor:
             # Exportar JSON
             if self.config.EXPORT_JSON:
                 json_path = self.config.get_report_file_path('json')
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(final_report, f, indent=2, ensure_ascii=False)
+                with tracer.span('Relatório JSON', 'export'), self.config.reserved_file(json_path):
+                    with open(json_path, 'w', encoding='utf-8') as f:
+                        # Resultados são serializados sob demanda pelo encoder (sem cópia do relatório)
+                        json.dump(final_report, f, indent=2, ensure_ascii=False, default=to_json_default)
+                json_path = artifact_store.put_file(json_path, 'report')
                 logger.info(f"📄 Relatório JSON exportado: {json_path}")
             
             # Exportar Excel
             if self.config.EXPORT_EXCEL:
-                self._export_excel_report(final_report)
+                with tracer.span('Relatório Excel', 'export'):
+                    self._export_excel_report(final_report)
+            
+            # Gravar o trace da execução, incluindo a exportação
+            tracer.save()
+            
+            # Atualizar métricas (textfile collector)
+            metrics.flush()
+            
+            # Guardar as latências dos localizadores para os tempos limite adaptativos
+            wait_history.save()
             
             # Log do resumo final
             self._log_final_summary(final_report)
@@ -274,8 +772,6 @@ class TestExecutor:
         try:
             import pandas as pd
             
-            excel_path = self.config.get_report_file_path('xlsx')
-            
             # Criar DataFrames para diferentes abas
             summary_data = {
                 'Métrica': [
@@ -304,25 +800,84 @@ class TestExecutor:
             
             summary_df = pd.DataFrame(summary_data)
             
-            # DataFrame de testes detalhados
-            detailed_tests = []
-            for result in final_report['strategy_results']:
-                for test in result.get('detailed_results', []):
-                    detailed_tests.append({
-                        'Estratégia': result['strategy_name'],
-                        'Teste': test['test_name'],
-                        'Status': 'Aprovado' if test['passed'] else 'Falhou',
-                        'Mensagem': test['message'],
-                        'Timestamp': test['timestamp']
-                    })
+            # DataFrame de testes detalhados, montado direto dos resultados
+            columns = ['Estratégia', 'Teste', 'Status', 'Mensagem', 'Timestamp']
+            emulated = 'emulation' in final_report.get('matrix', {})
+            if 'matrix' in final_report:
+                columns += ['Navegador', 'Viewport']
+            if emulated:
+                columns.append('Emulação')
+            if 'result_cache' in final_report:
+                columns.append('Cache')
             
-            detailed_df = pd.DataFrame(detailed_tests)
+            def detailed_rows():
+                for result in final_report['strategy_results']:
+                    dimensions = result.dimensions or {}
+                    for test in result.results:
+                        row = [
+                            result.strategy_name,
+                            test.test_name,
+                            'Aprovado' if test.passed else 'Falhou',
+                            test.message,
+                            test.timestamp
+                        ]
+                        if 'matrix' in final_report:
+                            row += [dimensions.get('browser'), dimensions.get('viewport')]
+                        if emulated:
+                            row.append(dimensions.get('emulation'))
+                        if 'result_cache' in final_report:
+                            row.append('Sim' if (test.details or {}).get('cached') else 'Não')
+                        yield row
+            
+            detailed_df = pd.DataFrame.from_records(detailed_rows(), columns=columns)
             
             # Escrever no Excel
-            with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
+            excel_path = self.config.get_report_file_path('xlsx')
+            with self.config.reserved_file(excel_path), pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
                 summary_df.to_excel(writer, sheet_name='Resumo', index=False)
                 detailed_df.to_excel(writer, sheet_name='Testes Detalhados', index=False)
+                
+                if 'matrix' in final_report:
+                    matrix_df = pd.DataFrame([
+                        {
+                            'Navegador': cell['browser'],
+                            'Viewport': cell['viewport'],
+                            'Emulação': cell.get('emulation'),
+                            'Total de Testes': cell['total_tests'],
+                            'Aprovados': cell['passed'],
+                            'Falharam': cell['failed'],
+                            'Taxa de Sucesso (%)': round(cell['success_rate'], 2),
+                            'Tempo de Execução (s)': cell['execution_time_seconds'],
+                            'Erro': cell['error']
+                        }
+                        for cell in final_report['matrix']['cells']
+                    ])
+                    matrix_df.to_excel(writer, sheet_name='Matriz', index=False)
+                    
+                    # Taxa de sucesso com viewports (e emulações) nas linhas e navegadores nas colunas
+                    index = ['Viewport', 'Emulação'] if emulated else 'Viewport'
+                    pivot_df = matrix_df.pivot(index=index, columns='Navegador', values='Taxa de Sucesso (%)')
+                    pivot_df.to_excel(writer, sheet_name='Matriz (Taxa)')
+                
+                if emulated:
+                    # Duração de cada teste com os perfis de emulação lado a lado
+                    comparison = final_report['matrix']['emulation']
+                    emulation_df = pd.DataFrame([
+                        dict(
+                            {
+                                'Navegador': test['browser'],
+                                'Viewport': test['viewport'],
+                                'Estratégia': test['strategy'],
+                                'Teste': test['test']
+                            },
+                            **{f"{name} (s)": seconds for name, seconds in test['seconds'].items()},
+                            **{f"{name} (×)": ratio for name, ratio in test['slowdown'].items()}
+                        )
+                        for test in comparison['tests']
+                    ])
+                    emulation_df.to_excel(writer, sheet_name='Emulação (Tempos)', index=False)
             
+            excel_path = artifact_store.put_file(excel_path, 'report')
             logger.info(f"📊 Relatório Excel exportado: {excel_path}")
             
         except ImportError:
@@ -351,4 +906,52 @@ class TestExecutor:
         if final_report['execution_summary']['execution_time_seconds']:
             logger.info(f"⏱️ Tempo de Execução: {final_report['execution_summary']['execution_time_seconds']:.1f}s")
         
+        if 'matrix' in final_report:
+            logger.info("🧮 Matriz navegador × viewport:")
+            for cell in final_report['matrix']['cells']:
+                status = "✅" if cell['overall_success'] else "❌"
+                emulation = f" {cell['emulation']:<16}" if cell.get('emulation') else ""
+                logger.info(
+                    f"   {status} {cell['browser']:<8} {cell['viewport']:>10}{emulation}: "
+                    f"{cell['passed']}/{cell['total_tests']} ({cell['success_rate']:.1f}%)"
+                )
+            
+            if 'emulation' in final_report['matrix']:
+                # Testes mais afetados pela emulação, pela maior razão sobre a execução sem emulação
+                slowest = sorted(
+                    ((ratio, name, test) for test in final_report['matrix']['emulation']['tests']
+                     for name, ratio in test['slowdown'].items()),
+                    key=lambda item: item[0], reverse=True
+                )
+                for ratio, name, test in slowest[:5]:
+                    logger.info(
+                        f"   🐢 {test['test']} ({test['viewport']}) em {name}: {test['seconds'][name]:.2f}s, "
+                        f"{ratio:.1f}× o tempo sem emulação"
+                    )
+        
+        if 'har' in final_report:
+            har = final_report['har']
+            logger.info(f"🌊 HAR: {len(har['pages'])} carga(s) de página gravada(s) em {har['directory']}")
+            for resource in har['heaviest_resources'][:3]:
+                logger.info(f"   📦 {resource['transfer_bytes'] / 1024:.0f} KB  {resource['url']}")
+            for resource in har['slowest_resources'][:3]:
+                logger.info(f"   🐢 {resource['time_ms']:.0f} ms  {resource['url']}")
+        
+        if 'warmup' in final_report:
+            warm = final_report['warmup']
+            logger.info(
+                f"🔥 Aquecimento: {warm['compile_ms'] / 1000:.1f}s de compilação sob demanda absorvidos "
+                f"antes dos testes ({warm['pages']} página(s), {warm['api_routes']} rota(s), {warm['chunks']} chunk(s))"
+            )
+        
+        if 'result_cache' in final_report:
+            cache = final_report['result_cache']
+            if cache['active']:
+                logger.info(
+                    f"💾 Cache de resultados (build {cache['build_id']}): {cache['hits']} teste(s) reproduzido(s), "
+                    f"{cache['misses']} executado(s), {cache['stored']} gravado(s)"
+                )
+            else:
+                logger.info("💾 Cache de resultados inativo nesta execução (build do site não identificado)")
+        
         logger.info("=" * 60)
\ No newline at end of file
@@ -0,0 +1,346 @@
+"""
+Armazenamento de artefatos endereçado por conteúdo.
+Screenshots, HARs, snapshots do DOM e relatórios são gravados em
+artifacts/objects/<hash[:2]>/<hash><extensão>, de modo que arquivos idênticos
+ocupam espaço uma única vez. Cada execução tem um manifesto em
+artifacts/manifests/ ligando os nomes lógicos aos hashes, e a coleta de lixo
+descarta execuções antigas (idade, quantidade e tamanho total) e remove os
+objetos que nenhum manifesto restante referencia.
+"""
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+from config.settings import Config
+from src.utils.logger import logger
+
+# Objetos mais novos que isto não são removidos: podem pertencer a uma execução
+# paralela que ainda não gravou o manifesto
+GC_GRACE_SECONDS = 300
+
+# Tamanho dos blocos lidos ao calcular o hash de arquivos grandes (HARs, relatórios)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+class ArtifactStore:
+    """Classe singleton que guarda os artefatos das execuções por hash de conteúdo."""
+    
+    _instance = None
+    _initialized = False
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ArtifactStore, cls).__new__(cls)
+        return cls._instance
+    
+    def __init__(self):
+        if not self._initialized:
+            self.enabled = False
+            self.root = Config().ARTIFACTS_DIR
+            self.run_id = None
+            self._manifest = None
+            self._lock = threading.Lock()
+            self._initialized = True
+    
+    @property
+    def objects_dir(self):
+        """Diretório dos objetos (conteúdo)."""
+        return self.root / 'objects'
+    
+    @property
+    def manifests_dir(self):
+        """Diretório dos manifestos das execuções."""
+        return self.root / 'manifests'
+    
+    def enable(self, root=None):
+        """
+        Ativa o armazenamento, aplica a retenção e inicia o manifesto da execução.
+        
+        Args:
+            root (Path): Diretório do armazenamento (padrão: ARTIFACTS_DIR)
+        """
+        self.root = root or Config().ARTIFACTS_DIR
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+        self.enabled = True
+        logger.info(f"🗄️ Armazenamento de artefatos ativado em {self.root}")
+        
+        self.collect_garbage()
+        self.begin_run()
+    
+    def begin_run(self, label=None):
+        """
+        Inicia o manifesto de uma nova execução (no daemon, um por ciclo).
+        
+        Args:
+            label (str): Descrição da execução
+        """
+        if not self.enabled:
+            return
+        
+        started = datetime.now()
+        with self._lock:
+            # pid e microssegundos: execuções paralelas nunca compartilham manifesto
+            self.run_id = f"{started.strftime('%Y%m%d_%H%M%S_%f')}_{os.getpid()}"
+            self._manifest = {
+                'run_id': self.run_id,
+                'label': label,
+                'started_at': started.timestamp(),
+                'updated_at': started.timestamp(),
+                'artifacts': []
+            }
+            self._write_manifest()
+    
+    def _object_path(self, digest, extension):
+        """Caminho do objeto de um hash."""
+        return self.objects_dir / digest[:2] / f"{digest}{extension}"
+    
+    def _write_manifest(self):
+        """Grava o manifesto da execução atual (chamado com o lock adquirido)."""
+        path = self.manifests_dir / f"{self.run_id}.json"
+        temporary = path.with_suffix('.tmp')
+        try:
+            with open(temporary, 'w', encoding='utf-8') as f:
+                json.dump(self._manifest, f, indent=2, ensure_ascii=False, default=str)
+            os.replace(temporary, path)
+        except OSError as e:
+            logger.error(f"❌ Erro ao gravar o manifesto de artefatos: {str(e)}")
+    
+    def _register(self, kind, name, digest, extension, size, metadata):
+        """Adiciona um artefato ao manifesto da execução."""
+        path = self._object_path(digest, extension)
+        entry = dict(metadata, kind=kind, name=name, sha256=digest, size=size,
+                     object=path.relative_to(self.root).as_posix(), created_at=time.time())
+        
+        with self._lock:
+            if self._manifest is None:
+                return path
+            self._manifest['artifacts'].append(entry)
+            self._manifest['updated_at'] = entry['created_at']
+            self._write_manifest()
+        return path
+    
+    def put_bytes(self, data, kind, name, extension, **metadata):
+        """
+        Guarda um conteúdo em memória (screenshot, snapshot do DOM).
+        
+        Args:
+            data (bytes | str): Conteúdo
+            kind (str): Tipo do artefato ('screenshot', 'dom', 'har', 'report')
+            name (str): Nome lógico no manifesto
+            extension (str): Extensão do objeto (ex: '.png')
+            **metadata: Campos extras registrados no manifesto
+        
+        Returns:
+            Path: Objeto gravado (ou já existente com o mesmo conteúdo)
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest, extension)
+        
+        if path.exists():
+            # Renovar o mtime protege o objeto reaproveitado da coleta de lixo em andamento
+            os.utime(path)
+        else:
+            path.parent.mkdir(exist_ok=True)
+            temporary = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            with open(temporary, 'wb') as f:
+                f.write(data)
+            os.replace(temporary, path)
+        
+        return self._register(kind, name, digest, extension, len(data), metadata)
+    
+    def put_file(self, source, kind, name=None, **metadata):
+        """
+        Move um arquivo já gravado (relatório, HAR) para o armazenamento.
+        Com o armazenamento desativado o arquivo fica onde está.
+        
+        Args:
+            source (Path): Arquivo gravado
+            kind (str): Tipo do artefato
+            name (str): Nome lógico no manifesto (padrão: nome do arquivo)
+            **metadata: Campos extras registrados no manifesto
+        
+        Returns:
+            Path: Objeto no armazenamento, ou o próprio arquivo se desativado
+        """
+        if not self.enabled:
+            return source
+        
+        digest = hashlib.sha256()
+        with open(source, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        digest = digest.hexdigest()
+        
+        size = source.stat().st_size
+        path = self._object_path(digest, source.suffix)
+        
+        if path.exists():
+            os.utime(path)
+            source.unlink()
+        else:
+            path.parent.mkdir(exist_ok=True)
+            shutil.move(str(source), str(path))
+        
+        return self._register(kind, name or source.name, digest, source.suffix, size, metadata)
+    
+    def _load_manifests(self):
+        """Lê todos os manifestos, do mais antigo para o mais recente."""
+        manifests = []
+        try:
+            entries = list(os.scandir(self.manifests_dir))
+        except OSError:
+            return manifests
+        
+        for entry in entries:
+            if not entry.name.endswith('.json'):
+                continue
+            try:
+                with open(entry.path, encoding='utf-8') as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ Manifesto de artefatos ignorado ({entry.name}): {str(e)}")
+                continue
+            manifest['_path'] = entry.path
+            manifests.append(manifest)
+        
+        manifests.sort(key=lambda manifest: manifest['started_at'])
+        return manifests
+    
+    def find(self, kind, pattern='*'):
+        """
+        Lista os objetos de um tipo registrados nos manifestos.
+        
+        Args:
+            kind (str): Tipo do artefato
+            pattern (str): Padrão do nome lógico (ex: 'relatorio_testes_*.json')
+        
+        Returns:
+            list: Caminhos existentes, do mais antigo para o mais recente
+        """
+        paths = []
+        for manifest in self._load_manifests():
+            for artifact in manifest['artifacts']:
+                if artifact['kind'] == kind and fnmatch.fnmatch(artifact['name'], pattern):
+                    path = self.root / artifact['object']
+                    if path.exists():
+                        paths.append(path)
+        return paths
+    
+    def collect_garbage(self, retention_days=None, max_runs=None, max_bytes=None):
+        """
+        Descarta as execuções fora da política de retenção e os objetos sem referência.
+        Apenas os manifestos são lidos para decidir o que remover (tamanhos vêm
+        deles); o diretório de objetos é percorrido uma única vez na varredura.
+        
+        Args:
+            retention_days (float): Idade máxima das execuções (padrão: ARTIFACT_RETENTION_DAYS)
+            max_runs (int): Execuções mantidas (padrão: ARTIFACT_MAX_RUNS)
+            max_bytes (int): Tamanho máximo dos objetos (padrão: ARTIFACT_MAX_BYTES)
+        
+        Returns:
+            dict: runs_removed, objects_removed, bytes_freed e seconds
+        """
+        config = Config()
+        retention_days = config.ARTIFACT_RETENTION_DAYS if retention_days is None else retention_days
+        max_runs = config.ARTIFACT_MAX_RUNS if max_runs is None else max_runs
+        max_bytes = config.ARTIFACT_MAX_BYTES if max_bytes is None else max_bytes
+        
+        started = time.perf_counter()
+        manifests = self._load_manifests()
+        current = [manifest for manifest in manifests if manifest['run_id'] == self.run_id]
+        candidates = [manifest for manifest in manifests if manifest['run_id'] != self.run_id]
+        
+        # Contagem de referências e tamanho por hash (objetos deduplicados contam uma vez)
+        references, sizes = {}, {}
+        for manifest in manifests:
+            for artifact in manifest['artifacts']:
+                references[artifact['object']] = references.get(artifact['object'], 0) + 1
+                sizes[artifact['object']] = artifact['size']
+        total_bytes = sum(sizes.values())
+        
+        def release(manifest):
+            nonlocal total_bytes
+            for artifact in manifest['artifacts']:
+                references[artifact['object']] -= 1
+                if not references[artifact['object']]:
+                    total_bytes -= sizes[artifact['object']]
+        
+        # Do mais antigo para o mais recente: idade, quantidade e, por fim, tamanho total
+        expired_before = time.time() - retention_days * 86400 if retention_days else None
+        kept_runs = len(candidates) + len(current)
+        removed = []
+        for manifest in candidates:
+            too_old = expired_before is not None and manifest['updated_at'] < expired_before
+            too_many = max_runs and kept_runs > max_runs
+            too_big = max_bytes and total_bytes > max_bytes
+            if not (too_old or too_many or too_big):
+                break
+            release(manifest)
+            removed.append(manifest)
+            kept_runs -= 1
+        
+        for manifest in removed:
+            try:
+                os.unlink(manifest['_path'])
+            except OSError:
+                pass
+        
+        live = {name for name, count in references.items() if count > 0}
+        objects_removed, bytes_freed = self._sweep(live)
+        
+        stats = {
+            'runs_removed': len(removed),
+            'objects_removed': objects_removed,
+            'bytes_freed': bytes_freed,
+            'seconds': round(time.perf_counter() - started, 3)
+        }
+        if removed or objects_removed:
+            logger.info(
+                f"🧹 Artefatos: {len(removed)} execução(ões) e {objects_removed} objeto(s) removidos, "
+                f"{bytes_freed / 1024 / 1024:.1f} MB liberados em {stats['seconds']}s"
+            )
+        return stats
+    
+    def _sweep(self, live):
+        """
+        Remove os objetos que nenhum manifesto referencia.
+        
+        Args:
+            live (set): Objetos referenciados (caminhos relativos à raiz)
+        
+        Returns:
+            tuple: Objetos removidos e bytes liberados
+        """
+        removed, freed = 0, 0
+        grace_limit = time.time() - GC_GRACE_SECONDS
+        
+        try:
+            buckets = [entry for entry in os.scandir(self.objects_dir) if entry.is_dir()]
+        except OSError:
+            return removed, freed
+        
+        for bucket in buckets:
+            for entry in os.scandir(bucket.path):
+                if f"objects/{bucket.name}/{entry.name}" in live:
+                    continue
+                try:
+                    stat = entry.stat()
+                    if stat.st_mtime > grace_limit:
+                        continue
+                    os.unlink(entry.path)
+                except OSError:
+                    continue
+                removed += 1
+                freed += stat.st_size
+        
+        return removed, freed
+
+# Instância global do armazenamento de artefatos
+artifact_store = ArtifactStore()
\ No newline at end of file
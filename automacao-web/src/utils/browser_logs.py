@@ -0,0 +1,143 @@
+"""
+Captura dos logs do navegador (console, exceções JavaScript e falhas de rede).
+O ChromeDriver acumula o log 'browser' habilitado por goog:loggingPrefs; cada
+navegador tem um buffer circular limitado que é esvaziado periodicamente nos
+intervalos entre testes e recortado para a janela de tempo de um teste que
+falhou. Testes aprovados não disparam nenhum comando extra além do
+esvaziamento periódico.
+"""
+import threading
+import time
+from collections import deque
+from config.settings import Config
+from src.utils.logger import logger
+
+# Níveis do log 'browser' em ordem crescente de severidade
+LOG_LEVELS = ('ALL', 'DEBUG', 'INFO', 'WARNING', 'SEVERE')
+
+# Margem antes do início do teste, para eventos disparados pela ação que o abriu
+WINDOW_MARGIN_SECONDS = 0.5
+
+def classify_entry(entry):
+    """
+    Classifica uma entrada do log 'browser'.
+    
+    Args:
+        entry (dict): Entrada retornada por driver.get_log('browser')
+    
+    Returns:
+        str: 'network', 'exception' ou 'console'
+    """
+    source = entry.get('source', '')
+    if source == 'network':
+        return 'network'
+    if source == 'javascript' or 'Uncaught' in entry.get('message', ''):
+        return 'exception'
+    return 'console'
+
+class BrowserLogBuffer:
+    """Buffer circular com as entradas relevantes do log de um navegador."""
+    
+    def __init__(self, driver, max_entries=None, drain_interval=None):
+        """
+        Inicializa o buffer.
+        
+        Args:
+            driver: WebDriver (não o ManagedDriver) dono do log
+            max_entries (int): Máximo de entradas mantidas (padrão: BROWSER_LOG_BUFFER_SIZE)
+            drain_interval (float): Intervalo mínimo entre esvaziamentos periódicos, em
+                segundos (padrão: BROWSER_LOG_DRAIN_INTERVAL)
+        """
+        config = Config()
+        self.driver = driver
+        self.entries = deque(maxlen=max_entries or config.BROWSER_LOG_BUFFER_SIZE)
+        self.drain_interval = config.BROWSER_LOG_DRAIN_INTERVAL if drain_interval is None else drain_interval
+        self.min_level = LOG_LEVELS.index(config.BROWSER_LOG_LEVEL) if config.BROWSER_LOG_LEVEL in LOG_LEVELS else 0
+        self.supported = True
+        self._last_drain = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def drain(self):
+        """
+        Transfere as entradas acumuladas pelo driver para o buffer.
+        
+        Returns:
+            int: Quantidade de entradas relevantes recebidas
+        """
+        if not self.supported:
+            return 0
+        
+        with self._lock:
+            self._last_drain = time.monotonic()
+            
+            try:
+                raw_entries = self.driver.get_log('browser')
+            except Exception as e:
+                # Firefox/geckodriver não implementa o endpoint de logs
+                self.supported = False
+                logger.debug(f"Logs do navegador indisponíveis neste driver: {str(e)}")
+                return 0
+            
+            received = 0
+            for entry in raw_entries:
+                level = entry.get('level', 'INFO')
+                if level in LOG_LEVELS and LOG_LEVELS.index(level) < self.min_level:
+                    continue
+                
+                self.entries.append({
+                    'timestamp': entry.get('timestamp', time.time() * 1000) / 1000,
+                    'level': level,
+                    'type': classify_entry(entry),
+                    'message': entry.get('message', '')
+                })
+                received += 1
+            
+            return received
+    
+    def maybe_drain(self):
+        """Esvazia o log do driver se o intervalo periódico tiver passado (mantém o driver com pouca memória)."""
+        if self.supported and time.monotonic() - self._last_drain >= self.drain_interval:
+            self.drain()
+    
+    def slice(self, started_at, ended_at=None):
+        """
+        Retorna as entradas de uma janela de tempo, esvaziando antes o log do driver.
+        
+        Args:
+            started_at (float): Início da janela (epoch, segundos)
+            ended_at (float): Fim da janela (padrão: agora)
+        
+        Returns:
+            list: Entradas da janela, da mais antiga para a mais recente
+        """
+        self.drain()
+        ended_at = ended_at or time.time()
+        started_at -= WINDOW_MARGIN_SECONDS
+        
+        with self._lock:
+            return [entry for entry in self.entries if started_at <= entry['timestamp'] <= ended_at]
+
+def get_log_buffer(driver):
+    """
+    Obtém o buffer de logs do navegador, criando-o no primeiro uso.
+    O ManagedDriver é resolvido para o WebDriver atual, então um navegador
+    substituído pelo watchdog começa com um buffer novo.
+    
+    Args:
+        driver: WebDriver ou ManagedDriver
+    
+    Returns:
+        BrowserLogBuffer: Buffer do navegador, ou None se a captura estiver desativada
+    """
+    if driver is None or not Config().BROWSER_LOGS_ENABLED:
+        return None
+    
+    driver = getattr(driver, 'wrapped_driver', driver)
+    buffer = getattr(driver, 'log_buffer', None)
+    if buffer is None:
+        buffer = BrowserLogBuffer(driver)
+        try:
+            driver.log_buffer = buffer
+        except AttributeError:
+            return None
+    return buffer
\ No newline at end of file
@@ -0,0 +1,206 @@
+"""
+Esperas dentro da página, sem polling pelo protocolo WebDriver.
+O WebDriverWait consulta o navegador a cada 500ms, somando até meio segundo
+de atraso e uma série de comandos por espera. Aqui um script observador é
+instalado uma vez por documento e cada espera é uma única chamada
+execute_async_script, que retorna assim que a condição é atendida (elemento
+visível ou clicável, texto alterado, classe alternada, imagem carregada),
+reagindo a mutações do DOM e a eventos de carga e de animação.
+"""
+import threading
+import time
+import weakref
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from config.settings import Config
+from src.utils.logger import logger
+
+# Margem do tempo limite de scripts sobre o da espera: o script sempre responde antes
+SCRIPT_TIMEOUT_MARGIN = 5
+
+# Observador instalado uma vez por documento em window.__blocoWaits
+INSTALL_SCRIPT = """
+if (!window.__blocoWaits) {
+  const find = function (by, value) {
+    switch (by) {
+      case 'css selector': return document.querySelector(value);
+      case 'id': return document.getElementById(value);
+      case 'name': return document.getElementsByName(value)[0] || null;
+      case 'class name': return document.getElementsByClassName(value)[0] || null;
+      case 'tag name': return document.getElementsByTagName(value)[0] || null;
+      case 'xpath':
+        return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+      case 'link text':
+      case 'partial link text':
+        for (const link of document.getElementsByTagName('a')) {
+          const text = link.innerText.trim();
+          if (by === 'link text' ? text === value : text.includes(value)) return link;
+        }
+        return null;
+    }
+    throw new Error('Localizador não suportado: ' + by);
+  };
+  const visible = function (element) {
+    if (!element.isConnected) return false;
+    const style = getComputedStyle(element);
+    if (style.visibility === 'hidden' || style.display === 'none' || parseFloat(style.opacity) === 0) return false;
+    const rect = element.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+  };
+  const conditions = {
+    visible: (element) => visible(element),
+    clickable: (element) => visible(element) && !element.disabled,
+    text_changed: (element, options) => element.innerText !== options.previous,
+    class_toggled: (element, options) => element.classList.contains(options.class_name) === options.present,
+    image_loaded: (element) => element.complete && element.naturalWidth > 0
+  };
+  // Eventos que alteram o estado sem mutação do DOM (imagens, transições do acordeão)
+  const events = ['load', 'transitionend', 'animationend'];
+  window.__blocoWaits = {
+    wait: function (by, value, condition, options, timeoutMs, done) {
+      const check = function () {
+        const element = find(by, value);
+        return element && conditions[condition](element, options) ? {status: 'ok', element: element} : null;
+      };
+      let result;
+      try {
+        result = check();
+      } catch (error) {
+        return done({status: 'error', message: String(error)});
+      }
+      if (result) return done(result);
+      let finished = false, observer, interval, timer;
+      const finish = function (value) {
+        if (finished) return;
+        finished = true;
+        observer.disconnect();
+        clearInterval(interval);
+        clearTimeout(timer);
+        events.forEach((name) => document.removeEventListener(name, onChange, true));
+        done(value);
+      };
+      const onChange = function () {
+        try {
+          const value = check();
+          if (value) finish(value);
+        } catch (error) {
+          finish({status: 'error', message: String(error)});
+        }
+      };
+      observer = new MutationObserver(onChange);
+      observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true, characterData: true});
+      events.forEach((name) => document.addEventListener(name, onChange, true));
+      // Mudanças de layout sem mutação nem evento (rolagem, media queries) ainda são vistas, sem sair do navegador
+      interval = setInterval(onChange, 100);
+      timer = setTimeout(() => finish({status: 'timeout'}), timeoutMs);
+    }
+  };
+}
+"""
+
+# Chamada de uma espera; sem o observador no documento (página trocada) pede a instalação
+WAIT_SCRIPT = """
+const done = arguments[arguments.length - 1];
+if (!window.__blocoWaits) return done({status: 'missing'});
+window.__blocoWaits.wait(arguments[0], arguments[1], arguments[2], arguments[3], arguments[4], done);
+"""
+
+class PushWaitEngine:
+    """Classe singleton que executa esperas dentro da página com um observador de mutações."""
+    
+    _instance = None
+    _initialized = False
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(PushWaitEngine, cls).__new__(cls)
+        return cls._instance
+    
+    def __init__(self):
+        if not self._initialized:
+            self._drivers = weakref.WeakKeyDictionary()
+            self._lock = threading.Lock()
+            self._initialized = True
+    
+    def available(self, driver):
+        """
+        Verifica se as esperas na página podem ser usadas com o driver.
+        
+        Args:
+            driver: Instância do WebDriver
+        
+        Returns:
+            bool: True se habilitadas e suportadas pelo driver
+        """
+        return Config().PUSH_WAITS and hasattr(driver, 'execute_async_script')
+    
+    def _state(self, driver):
+        """Estado do driver (documento instalado e tempo limite de scripts), zerado ao trocar o navegador."""
+        generation = getattr(driver, 'generation', 0)
+        with self._lock:
+            state = self._drivers.get(driver)
+            if state is None or state['generation'] != generation:
+                state = self._drivers[driver] = {'generation': generation, 'document': None, 'script_timeout': None}
+            return state
+    
+    def _ensure_script_timeout(self, driver, state, timeout):
+        """Ajusta o tempo limite de scripts do driver apenas quando o atual não basta."""
+        needed = timeout + SCRIPT_TIMEOUT_MARGIN
+        if state['script_timeout'] is None or state['script_timeout'] < needed:
+            driver.set_script_timeout(needed)
+            state['script_timeout'] = needed
+    
+    def wait(self, driver, locator, condition, timeout, document=None, **options):
+        """
+        Aguarda uma condição sobre um elemento dentro da página.
+        
+        Args:
+            driver: Instância do WebDriver
+            locator (tuple): Localizador do elemento
+            condition (str): 'visible', 'clickable', 'text_changed', 'class_toggled' ou 'image_loaded'
+            timeout (float): Tempo limite em segundos
+            document: Identificador do documento atual (o observador é reinstalado quando muda)
+            **options: Parâmetros da condição (previous, class_name, present)
+        
+        Returns:
+            WebElement: Elemento que atendeu à condição, ou None se a espera não pôde
+            ser feita na página (o chamador recorre ao WebDriverWait)
+        
+        Raises:
+            TimeoutException: Se a condição não for atendida no tempo limite
+        """
+        state = self._state(driver)
+        started = time.perf_counter()
+        
+        try:
+            self._ensure_script_timeout(driver, state, timeout)
+            
+            install = document is None or state['document'] != document
+            for _ in range(2):
+                remaining = max(timeout - (time.perf_counter() - started), 0)
+                script = INSTALL_SCRIPT + WAIT_SCRIPT if install else WAIT_SCRIPT
+                result = driver.execute_async_script(
+                    script, locator[0], locator[1], condition, options, int(remaining * 1000)
+                )
+                if result and result.get('status') == 'missing':
+                    # Documento trocado por fora dos Page Objects (clique em link, recarga)
+                    install = True
+                    continue
+                break
+        except WebDriverException as e:
+            # Ex: documento descarregado durante a espera; o WebDriverWait assume o restante
+            logger.debug(f"Espera na página indisponível para {locator}: {str(e).splitlines()[0] if str(e) else e}")
+            return None
+        
+        state['document'] = document
+        status = result.get('status') if result else None
+        
+        if status == 'ok':
+            return result['element']
+        if status == 'timeout':
+            raise TimeoutException(f"Condição '{condition}' não atendida em {timeout:.1f}s para {locator}")
+        
+        logger.debug(f"Espera na página indisponível para {locator}: {result.get('message') if result else status}")
+        return None
+
+# Instância global das esperas na página
+push_waits = PushWaitEngine()
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+Perfis de emulação de rede e CPU.
+Os testes rodam em rede local contra o localhost, o que esconde como o fluxo
+do QR Code e o acordeão de membros se comportam em um celular com 3G. Cada
+perfil aplica Network.emulateNetworkConditions e Emulation.setCPUThrottlingRate
+pelo CDP do Chrome; especificações como "slow-3g,cpu4x" viram combinações
+extras da matriz, executadas depois de uma combinação sem emulação.
+"""
+import re
+
+# Perfis de rede do DevTools (latência em ms, banda em kbit/s)
+NETWORK_PROFILES = {
+    'slow-3g': {'latency': 2000, 'download_kbps': 400, 'upload_kbps': 400},
+    'fast-3g': {'latency': 562.5, 'download_kbps': 1474.6, 'upload_kbps': 675},
+    'slow-4g': {'latency': 150, 'download_kbps': 1638.4, 'upload_kbps': 750}
+}
+
+# Redução da CPU: 'cpu4x' deixa o navegador 4 vezes mais lento
+CPU_PATTERN = re.compile(r'^cpu(\d+(?:\.\d+)?)x$')
+
+# Rótulo das combinações sem emulação na comparação
+BASELINE_NAME = 'sem-emulacao'
+
+class EmulationProfile:
+    """Combinação de condições de rede e redução de CPU."""
+    
+    def __init__(self, name, network=None, cpu_rate=1):
+        """
+        Inicializa o perfil.
+        
+        Args:
+            name (str): Nome do perfil, ex: 'slow-3g+cpu4x'
+            network (dict): Latência e banda da rede (None = sem limitação)
+            cpu_rate (float): Fator de redução da CPU (1 = sem redução)
+        """
+        self.name = name
+        self.network = network
+        self.cpu_rate = cpu_rate
+    
+    def describe(self):
+        """
+        Descrição das condições para o relatório.
+        
+        Returns:
+            dict: Nome, rede e CPU do perfil
+        """
+        return {'name': self.name, 'network': self.network, 'cpu_rate': self.cpu_rate}
+    
+    def __repr__(self):
+        return f"EmulationProfile({self.name!r})"
+
+def parse_emulation(spec):
+    """
+    Interpreta a especificação dos perfis de emulação.
+    
+    Args:
+        spec (str): Perfis separados por vírgula; '+' combina rede e CPU em um
+            perfil, ex: "slow-3g,cpu4x" (dois perfis) ou "slow-3g+cpu4x" (um)
+    
+    Returns:
+        list: Perfis (EmulationProfile), sem repetição
+    """
+    profiles = {}
+    
+    for item in spec.split(','):
+        parts = [part.strip().lower() for part in item.split('+') if part.strip()]
+        if not parts:
+            continue
+        
+        network, cpu_rate = None, 1
+        for part in parts:
+            cpu = CPU_PATTERN.match(part)
+            if part in NETWORK_PROFILES and network is None:
+                network = NETWORK_PROFILES[part]
+            elif cpu and cpu_rate == 1 and float(cpu.group(1)) >= 1:
+                cpu_rate = float(cpu.group(1))
+            else:
+                raise ValueError(
+                    f"Perfil de emulação inválido: '{part}' em '{item.strip()}' "
+                    f"(use {', '.join(NETWORK_PROFILES)} ou cpuNx, combinados com '+')"
+                )
+        
+        name = '+'.join(parts)
+        profiles.setdefault(name, EmulationProfile(name, network, cpu_rate))
+    
+    if not profiles:
+        raise ValueError("Informe ao menos um perfil de emulação (ex: slow-3g,cpu4x)")
+    return list(profiles.values())
+
+def network_conditions(profile):
+    """
+    Parâmetros de Network.emulateNetworkConditions para um perfil.
+    
+    Args:
+        profile (EmulationProfile): Perfil, ou None para remover a limitação
+    
+    Returns:
+        dict: Parâmetros do comando CDP (banda em bytes/s; -1 = sem limite)
+    """
+    network = profile.network if profile else None
+    if network is None:
+        return {'offline': False, 'latency': 0, 'downloadThroughput': -1, 'uploadThroughput': -1}
+    return {
+        'offline': False,
+        'latency': network['latency'],
+        'downloadThroughput': network['download_kbps'] * 1024 / 8,
+        'uploadThroughput': network['upload_kbps'] * 1024 / 8
+    }
\ No newline at end of file
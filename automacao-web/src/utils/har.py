@@ -0,0 +1,410 @@
+"""
+Gravação de HAR (HTTP Archive 1.2) das cargas de página.
+Monta um HAR por navegação a partir dos eventos Network.* e Page.* do log
+'performance' do ChromeDriver, gravando as entradas em streaming (uma por
+vez) e mantendo apenas um resumo limitado com os recursos mais pesados e
+mais lentos para o relatório.
+"""
+import heapq
+import json
+import re
+import threading
+import time
+import unicodedata
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from config.settings import Config
+from src.utils.logger import logger
+from src.utils.artifact_store import artifact_store
+
+# Espera máxima pelo fim das requisições disparadas pela navegação, em segundos
+SETTLE_TIMEOUT = 5.0
+
+# Intervalo entre leituras do log durante a espera, em segundos
+SETTLE_POLL_INTERVAL = 0.2
+
+def _iso(epoch):
+    """Formata um instante (epoch) no padrão ISO 8601 exigido pelo HAR."""
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+def _headers(headers):
+    """Converte o dicionário de cabeçalhos do CDP na lista do HAR."""
+    return [{'name': name, 'value': str(value)} for name, value in (headers or {}).items()]
+
+def _duration(start, end):
+    """Duração em ms entre dois marcos do timing do CDP (-1 se indisponível)."""
+    if start is None or end is None or start < 0 or end < 0:
+        return -1
+    return round(end - start, 3)
+
+class HarWriter:
+    """Grava um arquivo HAR em streaming: cabeçalho e página primeiro, depois uma entrada por vez."""
+    
+    def __init__(self, path, page):
+        """
+        Abre o arquivo e grava o cabeçalho.
+        
+        Args:
+            path (Path): Arquivo de destino
+            page (dict): Página do HAR (id, title, startedDateTime, pageTimings)
+        """
+        self.path = path
+        self.entries_written = 0
+        self._file = open(path, 'w', encoding='utf-8')
+        self._file.write('{"log": {"version": "1.2", ')
+        self._file.write('"creator": {"name": "automacao-bloco-praieira", "version": "1.0"}, ')
+        self._file.write(f'"pages": [{json.dumps(page, ensure_ascii=False)}], "entries": [\n')
+    
+    def write_entry(self, entry):
+        """Acrescenta uma entrada ao arquivo."""
+        if self.entries_written:
+            self._file.write(',\n')
+        self._file.write(json.dumps(entry, ensure_ascii=False))
+        self.entries_written += 1
+    
+    def close(self):
+        """Fecha a lista de entradas e o arquivo."""
+        self._file.write('\n]}}\n')
+        self._file.close()
+
+class PendingRequest:
+    """Requisição em andamento, montada a partir dos eventos Network.*."""
+    
+    def __init__(self, params):
+        request = params['request']
+        self.url = request.get('url', '')
+        self.method = request.get('method', 'GET')
+        self.request_headers = request.get('headers', {})
+        self.post_data = request.get('postData')
+        self.resource_type = params.get('type', 'Other')
+        self.wall_time = params.get('wallTime', time.time())
+        self.started = params.get('timestamp', 0.0)
+        self.response = None
+        self.ended = None
+        self.encoded_length = 0
+        self.error = None
+    
+    def to_entry(self, pageref):
+        """
+        Converte a requisição em uma entrada do HAR.
+        
+        Args:
+            pageref (str): Identificador da página
+        
+        Returns:
+            dict: Entrada do HAR
+        """
+        response = self.response or {}
+        timing = response.get('timing')
+        ended = self.ended if self.ended is not None else self.started
+        total = max(0.0, (ended - self.started) * 1000)
+        
+        if timing:
+            starts = [timing.get(key, -1) for key in ('dnsStart', 'connectStart', 'sendStart')]
+            blocked = next((value for value in starts if value >= 0), 0)
+            send = max(0.0, _duration(timing.get('sendStart'), timing.get('sendEnd')))
+            wait = max(0.0, _duration(timing.get('sendEnd'), timing.get('receiveHeadersEnd')))
+            receive = max(0.0, (ended - timing['requestTime']) * 1000 - timing.get('receiveHeadersEnd', 0))
+            timings = {
+                'blocked': round(blocked, 3),
+                'dns': _duration(timing.get('dnsStart'), timing.get('dnsEnd')),
+                'connect': _duration(timing.get('connectStart'), timing.get('connectEnd')),
+                'ssl': _duration(timing.get('sslStart'), timing.get('sslEnd')),
+                'send': round(send, 3),
+                'wait': round(wait, 3),
+                'receive': round(receive, 3)
+            }
+            total = sum(value for key, value in timings.items() if key != 'ssl' and value > 0)
+        else:
+            timings = {'blocked': 0, 'dns': -1, 'connect': -1, 'ssl': -1, 'send': 0, 'wait': round(total, 3), 'receive': 0}
+        
+        protocol = response.get('protocol', 'http/1.1')
+        entry = {
+            'pageref': pageref,
+            'startedDateTime': _iso(self.wall_time),
+            'time': round(total, 3),
+            'request': {
+                'method': self.method,
+                'url': self.url,
+                'httpVersion': protocol,
+                'headers': _headers(self.request_headers),
+                'queryString': [],
+                'cookies': [],
+                'headersSize': -1,
+                'bodySize': len(self.post_data) if self.post_data else 0
+            },
+            'response': {
+                'status': response.get('status', 0),
+                'statusText': response.get('statusText', ''),
+                'httpVersion': protocol,
+                'headers': _headers(response.get('headers')),
+                'cookies': [],
+                'content': {'size': self.encoded_length, 'mimeType': response.get('mimeType', '')},
+                'redirectURL': '',
+                'headersSize': -1,
+                'bodySize': self.encoded_length,
+                '_transferSize': self.encoded_length
+            },
+            'cache': {},
+            'timings': timings,
+            '_resourceType': self.resource_type
+        }
+        if response.get('fromDiskCache'):
+            entry['response']['_fromCache'] = 'disk'
+        if self.error:
+            entry['response']['_error'] = self.error
+        return entry
+
+class HarRecorder:
+    """Classe singleton que grava os HARs e mantém o resumo dos recursos."""
+    
+    _instance = None
+    _initialized = False
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(HarRecorder, cls).__new__(cls)
+        return cls._instance
+    
+    def __init__(self):
+        if not self._initialized:
+            self.enabled = False
+            self.output_dir = None
+            self.top = 10
+            self._lock = threading.Lock()
+            self._capturing = set()
+            self._unsupported = set()
+            self.reset()
+            self._initialized = True
+    
+    def enable(self, output_dir=None, top=None):
+        """
+        Ativa a gravação de HARs.
+        
+        Args:
+            output_dir (Path): Diretório dos arquivos (padrão: reports/har/<timestamp>)
+            top (int): Quantidade de recursos no resumo (padrão: HAR_SUMMARY_TOP)
+        """
+        config = Config()
+        self.enabled = True
+        self.output_dir = output_dir or config.get_har_dir()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.top = top or config.HAR_SUMMARY_TOP
+        logger.info(f"🌊 Gravação de HAR ativada: {self.output_dir}")
+    
+    def reset(self):
+        """Descarta o resumo acumulado (os arquivos já gravados são mantidos)."""
+        with self._lock:
+            self.pages = []
+            self._sequence = 0
+            self._heaviest = []
+            self._slowest = []
+    
+    @contextmanager
+    def capture(self, driver, title):
+        """
+        Grava em um HAR as requisições disparadas pelo bloco (navegação ou rolagem
+        que carrega uma seção). Capturas aninhadas no mesmo navegador são ignoradas.
+        
+        Args:
+            driver: WebDriver ou ManagedDriver (Chrome)
+            title (str): Título da página no HAR
+        """
+        driver = getattr(driver, 'wrapped_driver', driver)
+        key = id(driver)
+        
+        if not self.enabled or key in self._capturing or key in self._unsupported:
+            yield
+            return
+        
+        # Descarta eventos anteriores à captura
+        if self._read_events(driver) is None:
+            yield
+            return
+        
+        self._capturing.add(key)
+        started_at = time.time()
+        try:
+            yield
+        finally:
+            self._capturing.discard(key)
+            try:
+                self._record_page(driver, title, started_at)
+            except Exception as e:
+                logger.error(f"❌ Erro ao gravar HAR de '{title}': {str(e)}")
+    
+    def _read_events(self, driver):
+        """
+        Lê os eventos pendentes do log 'performance'.
+        
+        Returns:
+            list: Eventos CDP (method, params), ou None se o driver não oferece o log
+        """
+        try:
+            raw_entries = driver.get_log('performance')
+        except Exception as e:
+            self._unsupported.add(id(driver))
+            logger.warning(f"⚠️ HAR indisponível neste navegador (log 'performance' ausente): {str(e)}")
+            return None
+        
+        events = []
+        for raw in raw_entries:
+            try:
+                message = json.loads(raw['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            if message.get('method', '').startswith(('Network.', 'Page.')):
+                events.append(message)
+        return events
+    
+    def _record_page(self, driver, title, started_at):
+        """Lê os eventos até a rede ficar ociosa e grava o HAR da página."""
+        pending = {}
+        finished = []
+        page_events = {}
+        first_timestamp = None
+        deadline = time.monotonic() + SETTLE_TIMEOUT
+        
+        while True:
+            events = self._read_events(driver) or []
+            
+            for event in events:
+                method, params = event['method'], event.get('params', {})
+                request_id = params.get('requestId')
+                
+                if method == 'Network.requestWillBeSent':
+                    previous = pending.pop(request_id, None)
+                    if previous and params.get('redirectResponse'):
+                        previous.response = params['redirectResponse']
+                        previous.ended = params.get('timestamp')
+                        finished.append(previous)
+                    request = PendingRequest(params)
+                    pending[request_id] = request
+                    if first_timestamp is None or request.started < first_timestamp:
+                        first_timestamp = request.started
+                elif method == 'Network.responseReceived' and request_id in pending:
+                    pending[request_id].response = params.get('response')
+                    pending[request_id].resource_type = params.get('type', pending[request_id].resource_type)
+                elif method == 'Network.dataReceived' and request_id in pending:
+                    pending[request_id].encoded_length += params.get('encodedDataLength', 0)
+                elif method in ('Network.loadingFinished', 'Network.loadingFailed') and request_id in pending:
+                    request = pending.pop(request_id)
+                    request.ended = params.get('timestamp')
+                    if method == 'Network.loadingFinished':
+                        request.encoded_length = params.get('encodedDataLength', request.encoded_length)
+                    else:
+                        request.error = params.get('errorText') or ('canceled' if params.get('canceled') else 'failed')
+                    finished.append(request)
+                elif method in ('Page.domContentEventFired', 'Page.loadEventFired'):
+                    page_events[method] = params.get('timestamp')
+            
+            # Aguarda as requisições em andamento (ex: chunks carregados pela rolagem)
+            if (not pending and not events) or time.monotonic() >= deadline:
+                break
+            time.sleep(SETTLE_POLL_INTERVAL)
+        
+        # Requisições sem término dentro do prazo entram no HAR como incompletas
+        for request in pending.values():
+            request.error = request.error or 'incompleto'
+            finished.append(request)
+        
+        self._write_page(title, started_at, finished, page_events, first_timestamp)
+    
+    def _write_page(self, title, started_at, requests, page_events, first_timestamp):
+        """Grava o arquivo HAR da página e atualiza o resumo."""
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+        
+        page_id = f"page_{sequence}"
+        
+        def page_timing(method):
+            timestamp = page_events.get(method)
+            if timestamp is None or first_timestamp is None:
+                return -1
+            return round((timestamp - first_timestamp) * 1000, 3)
+        
+        page = {
+            'startedDateTime': _iso(started_at),
+            'id': page_id,
+            'title': title,
+            'pageTimings': {
+                'onContentLoad': page_timing('Page.domContentEventFired'),
+                'onLoad': page_timing('Page.loadEventFired')
+            }
+        }
+        
+        ascii_title = unicodedata.normalize('NFKD', title).encode('ascii', 'ignore').decode()
+        slug = re.sub(r'[^a-zA-Z0-9]+', '_', ascii_title).strip('_') or 'pagina'
+        path = self.output_dir / f"{sequence:04d}_{slug}.har"
+        
+        total_bytes, failed = 0, 0
+        writer = HarWriter(path, page)
+        try:
+            for request in sorted(requests, key=lambda item: item.started):
+                entry = request.to_entry(page_id)
+                writer.write_entry(entry)
+                
+                total_bytes += request.encoded_length
+                failed += 1 if request.error or entry['response']['status'] >= 400 else 0
+                self._rank(title, entry)
+        finally:
+            writer.close()
+        
+        path = artifact_store.put_file(path, 'har', title=title)
+        
+        page_summary = {
+            'title': title,
+            'file': str(path),
+            'requests': writer.entries_written,
+            'transfer_bytes': total_bytes,
+            'failed_requests': failed,
+            'on_content_load_ms': page['pageTimings']['onContentLoad'],
+            'on_load_ms': page['pageTimings']['onLoad']
+        }
+        with self._lock:
+            self.pages.append(page_summary)
+        
+        logger.info(
+            f"🌊 HAR gravado: {path} ({writer.entries_written} requisições, "
+            f"{total_bytes / 1024:.0f} KB, {failed} com falha)"
+        )
+    
+    def _rank(self, title, entry):
+        """Mantém apenas os N recursos mais pesados e mais lentos."""
+        resource = {
+            'page': title,
+            'url': entry['request']['url'],
+            'type': entry['_resourceType'],
+            'status': entry['response']['status'],
+            'transfer_bytes': entry['response']['_transferSize'],
+            'time_ms': entry['time']
+        }
+        
+        with self._lock:
+            for heap, key in ((self._heaviest, 'transfer_bytes'), (self._slowest, 'time_ms')):
+                item = (resource[key], id(resource), resource)
+                if len(heap) < self.top:
+                    heapq.heappush(heap, item)
+                elif item[0] > heap[0][0]:
+                    heapq.heapreplace(heap, item)
+    
+    def summary(self):
+        """
+        Resumo das páginas gravadas e dos recursos mais pesados e mais lentos.
+        
+        Returns:
+            dict: Resumo para o relatório, ou None se nenhum HAR foi gravado
+        """
+        with self._lock:
+            if not self.pages:
+                return None
+            return {
+                'directory': str(self.output_dir),
+                'pages': list(self.pages),
+                'heaviest_resources': [item[2] for item in sorted(self._heaviest, reverse=True)],
+                'slowest_resources': [item[2] for item in sorted(self._slowest, reverse=True)]
+            }
+
+# Instância global do gravador de HAR
+har_recorder = HarRecorder()
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""
+Histórico de execuções anteriores.
+Lê os relatórios JSON gerados em REPORTS_DIR para estimar, por unidade de
+teste (estratégia:teste) e contexto de execução (navegador, viewport e
+emulação), a probabilidade de falha recente e a duração típica, permitindo
+ordenar a execução para que falhas prováveis e testes baratos apareçam primeiro.
+"""
+import json
+from config.settings import Config
+from src.utils.logger import logger
+from src.utils.artifact_store import artifact_store
+from src.utils.emulation import BASELINE_NAME
+
+class TestHistory:
+    """Estatísticas de falha e duração por unidade de teste a partir de relatórios anteriores."""
+    
+    # Peso de cada relatório decai pela metade a cada execução mais antiga
+    DECAY = 0.5
+    
+    def __init__(self, browser=None):
+        """
+        Inicializa o histórico vazio.
+        
+        Args:
+            browser (str): Navegador da execução a planejar; as estatísticas desse
+                navegador, sem viewport nem emulação, têm preferência sobre as demais
+        """
+        self.stats = {}
+        self.context = (browser, None, None)
+        self.reports_loaded = 0
+    
+    @classmethod
+    def load(cls, reports_dir=None, max_reports=20, browser=None):
+        """
+        Carrega o histórico a partir dos relatórios JSON mais recentes, inclusive
+        os guardados no armazenamento de artefatos.
+        
+        Args:
+            reports_dir (Path): Diretório dos relatórios (padrão: REPORTS_DIR)
+            max_reports (int): Quantidade máxima de relatórios considerados
+            browser (str): Navegador da execução a planejar
+        
+        Returns:
+            TestHistory: Histórico carregado
+        """
+        history = cls(browser)
+        reports_dir = reports_dir or Config().REPORTS_DIR
+        
+        report_files = sorted(
+            list(reports_dir.glob('relatorio_testes_*.json')) + artifact_store.find('report', 'relatorio_testes_*.json'),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True
+        )[:max_reports]
+        
+        for age, report_file in enumerate(report_files):
+            try:
+                with open(report_file, encoding='utf-8') as f:
+                    report = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ Relatório ignorado no histórico ({report_file.name}): {str(e)}")
+                continue
+            
+            history._add_report(report, cls.DECAY ** age)
+            history.reports_loaded += 1
+        
+        units = {unit for unit, _ in history.stats}
+        logger.info(f"📚 Histórico carregado: {history.reports_loaded} relatório(s), {len(units)} teste(s)")
+        return history
+    
+    def _add_report(self, report, weight):
+        """
+        Acumula os resultados de um relatório com o peso informado.
+        
+        Cada unidade executada em um contexto conta uma vez: falha se qualquer um
+        dos seus resultados falhou, com a maior duração registrada entre eles (a
+        duração dos resultados é medida desde o início da unidade). Resultados
+        reproduzidos do cache não são execuções novas e ficam de fora; resultados
+        de timeout contam como falha, mas sem duração.
+        """
+        browser_used = report.get('execution_summary', {}).get('browser_used')
+        runs = {}
+        
+        for strategy_result in report.get('strategy_results', []):
+            emulation = strategy_result.get('emulation')
+            context = (
+                strategy_result.get('browser', browser_used),
+                strategy_result.get('viewport'),
+                None if emulation in (None, BASELINE_NAME) else emulation
+            )
+            for test in strategy_result.get('detailed_results', []):
+                # Relatórios sem a unidade de cada resultado não distinguem testes homônimos
+                if not test.get('unit') or test.get('cached'):
+                    continue
+                run = runs.setdefault((test['unit'], context), {'failed': False, 'duration': None})
+                run['failed'] |= not test.get('passed', False)
+                if test.get('duration_seconds') is not None and not test.get('timed_out'):
+                    run['duration'] = max(run['duration'] or 0.0, test['duration_seconds'])
+        
+        for key, run in runs.items():
+            stats = self.stats.setdefault(key, {
+                'weight': 0.0,
+                'failure_weight': 0.0,
+                'durations': []
+            })
+            stats['weight'] += weight
+            if run['failed']:
+                stats['failure_weight'] += weight
+            if run['duration'] is not None:
+                stats['durations'].append(run['duration'])
+    
+    def _stats_for(self, unit):
+        """
+        Estatísticas da unidade no contexto da execução ou, sem elas, somadas entre
+        os contextos em que a unidade rodou (ex: só houve execuções da matriz).
+        """
+        stats = self.stats.get((unit.qualified_name, self.context))
+        if stats:
+            return stats
+        
+        pooled = [stats for (name, _), stats in self.stats.items() if name == unit.qualified_name]
+        if not pooled:
+            return None
+        return {
+            'weight': sum(stats['weight'] for stats in pooled),
+            'failure_weight': sum(stats['failure_weight'] for stats in pooled),
+            'durations': [duration for stats in pooled for duration in stats['durations']]
+        }
+    
+    def failure_probability(self, unit):
+        """
+        Estima a probabilidade de falha recente de um teste.
+        Usa suavização de Laplace para que testes sem histórico fiquem no meio.
+        
+        Args:
+            unit (TestUnit): Unidade de teste
+        
+        Returns:
+            float: Probabilidade entre 0 e 1
+        """
+        stats = self._stats_for(unit)
+        if not stats:
+            return 0.5
+        return (stats['failure_weight'] + 1) / (stats['weight'] + 2)
+    
+    def expected_duration(self, unit):
+        """
+        Estima a duração de um teste (média histórica ou custo declarado).
+        
+        Args:
+            unit (TestUnit): Unidade de teste
+        
+        Returns:
+            float: Duração estimada em segundos
+        """
+        stats = self._stats_for(unit)
+        if stats and stats['durations']:
+            return sum(stats['durations']) / len(stats['durations'])
+        return unit.cost
+    
+    def priority_key(self, unit):
+        """
+        Chave de ordenação: maior probabilidade de falha por segundo primeiro.
+        
+        Args:
+            unit (TestUnit): Unidade de teste
+        
+        Returns:
+            float: Chave (menor executa antes)
+        """
+        return -self.failure_probability(unit) / max(self.expected_duration(unit), 0.01)
@@ -0,0 +1,239 @@
+"""
+Verificação concorrente dos links da página.
+Os endereços (href, src e srcset) são coletados do DOM renderizado em uma
+única chamada de script e verificados em paralelo por um cliente HTTP
+assíncrono com conexões reaproveitadas: HEAD primeiro e GET quando o servidor
+recusa o HEAD, com limite de requisições simultâneas por host e sem repetir
+URLs já verificadas. Usa o aiohttp quando instalado; sem ele, as mesmas
+requisições saem por uma sessão do requests em threads.
+"""
+import asyncio
+import re
+import time
+from urllib.parse import urldefrag, urlparse
+from config.settings import Config
+from src.utils.logger import logger
+
+# Todos os endereços do DOM em uma chamada, resolvidos contra o baseURI do documento
+LINK_COLLECTION_SCRIPT = """
+const links = [];
+const resolve = function (value) {
+  try {
+    return new URL(value, document.baseURI).href;
+  } catch (error) {
+    return value;
+  }
+};
+const add = function (element, attribute, value) {
+  if (!value || !value.trim()) return;
+  links.push({
+    url: resolve(value.trim()),
+    tag: element.tagName.toLowerCase(),
+    attribute: attribute,
+    text: (element.innerText || element.getAttribute('alt') || element.getAttribute('aria-label') || '').trim().slice(0, 80)
+  });
+};
+document.querySelectorAll('[href], [src], [srcset]').forEach(function (element) {
+  add(element, 'href', element.getAttribute('href'));
+  add(element, 'src', element.getAttribute('src'));
+  const srcset = element.getAttribute('srcset');
+  if (srcset) srcset.split(',').forEach((candidate) => add(element, 'srcset', candidate.trim().split(/\\s+/)[0]));
+});
+return links;
+"""
+
+# Esquemas sem requisição HTTP: contato tem a sintaxe validada; os demais (javascript:, data:) são ignorados
+CONTACT_PATTERNS = {
+    'mailto': re.compile(r'^mailto:[^@\s?]+@[^@\s?]+\.[^@\s?]+(\?.*)?$', re.IGNORECASE),
+    'tel': re.compile(r'^tel:\+?[\d\-\s().]{6,}$', re.IGNORECASE)
+}
+
+# Respostas de sites externos que bloqueiam robôs (Instagram, LinkedIn) sem indicar link quebrado
+BLOCKED_STATUSES = {401, 403, 429, 999}
+
+USER_AGENT = 'Mozilla/5.0 (compatible; BlocoPraieiraLinkCheck/1.0)'
+
+def classify_link(link, base_url):
+    """
+    Classifica um endereço coletado do DOM.
+    
+    Args:
+        link (dict): Endereço com url, tag e attribute
+        base_url (str): URL base do site
+    
+    Returns:
+        str: 'internal', 'asset', 'external', 'contact' ou 'ignored'
+    """
+    scheme = urlparse(link['url']).scheme.lower()
+    if scheme in CONTACT_PATTERNS:
+        return 'contact'
+    if scheme not in ('http', 'https'):
+        return 'ignored'
+    if urlparse(link['url']).netloc != urlparse(base_url).netloc:
+        return 'external'
+    # Imagens, scripts, folhas de estilo e ícones; âncoras para o próprio site são links internos
+    if link['attribute'] in ('src', 'srcset') or link['tag'] == 'link':
+        return 'asset'
+    return 'internal'
+
+class LinkChecker:
+    """Verifica URLs em paralelo e guarda o resultado de cada uma."""
+    
+    def __init__(self, timeout=None, workers=None, per_host=None):
+        """
+        Inicializa o verificador.
+        
+        Args:
+            timeout (float): Tempo limite por requisição em segundos (padrão: LINK_CHECK_TIMEOUT)
+            workers (int): Requisições simultâneas no total (padrão: LINK_CHECK_WORKERS)
+            per_host (int): Requisições simultâneas por host (padrão: LINK_CHECK_PER_HOST)
+        """
+        config = Config()
+        self.timeout = timeout or config.LINK_CHECK_TIMEOUT
+        self.workers = workers or config.LINK_CHECK_WORKERS
+        self.per_host = per_host or config.LINK_CHECK_PER_HOST
+        self.results = {}
+        self.requests = 0
+        self.peak_per_host = {}
+    
+    @staticmethod
+    def normalize(url):
+        """
+        Normaliza uma URL para a deduplicação (sem o fragmento).
+        
+        Args:
+            url (str): URL coletada
+        
+        Returns:
+            str: URL normalizada
+        """
+        return urldefrag(url)[0] or url
+    
+    def check(self, urls):
+        """
+        Verifica uma lista de URLs, repetindo apenas as ainda não verificadas.
+        
+        Args:
+            urls (iterable): URLs (com ou sem fragmento, possivelmente repetidas)
+        
+        Returns:
+            dict: Resultado por URL normalizada: state ('ok', 'broken', 'blocked',
+            'invalid' ou 'ignored'), status, method, ms e error
+        """
+        normalized = list(dict.fromkeys(self.normalize(url) for url in urls))
+        pending = []
+        
+        for url in normalized:
+            if url in self.results:
+                continue
+            scheme = urlparse(url).scheme.lower()
+            if scheme in CONTACT_PATTERNS:
+                valid = bool(CONTACT_PATTERNS[scheme].match(url))
+                self.results[url] = {'state': 'ok' if valid else 'invalid', 'status': None, 'method': None,
+                                     'ms': None, 'error': None if valid else f"Endereço {scheme} malformado"}
+            elif scheme not in ('http', 'https'):
+                self.results[url] = {'state': 'ignored', 'status': None, 'method': None, 'ms': None, 'error': None}
+            else:
+                pending.append(url)
+        
+        if pending:
+            started = time.perf_counter()
+            asyncio.run(self._check_all(pending))
+            logger.info(f"🔗 {len(pending)} URL(s) verificada(s) em {time.perf_counter() - started:.2f}s "
+                        f"({self.requests} requisição(ões) no total)")
+        
+        return {url: self.results[url] for url in normalized}
+    
+    async def _check_all(self, urls):
+        """Verifica as URLs em paralelo, respeitando os limites global e por host."""
+        limit = asyncio.Semaphore(self.workers)
+        hosts = {urlparse(url).netloc: asyncio.Semaphore(self.per_host) for url in urls}
+        active = dict.fromkeys(hosts, 0)
+        
+        async def check(fetch, url):
+            host = urlparse(url).netloc
+            async with limit, hosts[host]:
+                active[host] += 1
+                self.peak_per_host[host] = max(self.peak_per_host.get(host, 0), active[host])
+                try:
+                    self.results[url] = await self._check_url(fetch, url)
+                finally:
+                    active[host] -= 1
+        
+        try:
+            import aiohttp
+        except ImportError:
+            aiohttp = None
+        
+        if aiohttp is not None:
+            connector = aiohttp.TCPConnector(limit=self.workers, limit_per_host=self.per_host)
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                             headers={'User-Agent': USER_AGENT}) as session:
+                async def fetch(method, url):
+                    async with session.request(method, url, allow_redirects=True) as response:
+                        return response.status
+                
+                await asyncio.gather(*(check(fetch, url) for url in urls))
+            return
+        
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        session = requests.Session()
+        session.headers['User-Agent'] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=len(hosts), pool_maxsize=self.per_host)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        
+        def request(method, url):
+            # stream=True: no GET de fallback só o cabeçalho importa, o corpo não é baixado
+            with session.request(method, url, allow_redirects=True, timeout=self.timeout, stream=True) as response:
+                return response.status_code
+        
+        async def fetch(method, url):
+            return await asyncio.to_thread(request, method, url)
+        
+        try:
+            await asyncio.gather(*(check(fetch, url) for url in urls))
+        finally:
+            session.close()
+    
+    async def _check_url(self, fetch, url):
+        """
+        Verifica uma URL com HEAD e, se recusado, com GET.
+        
+        Args:
+            fetch (callable): Corrotina (método, url) que devolve o código HTTP
+            url (str): URL a verificar
+        
+        Returns:
+            dict: Resultado da verificação
+        """
+        started = time.perf_counter()
+        status, method, error = None, None, None
+        
+        # Muitos servidores respondem 405/501 ou 4xx ao HEAD e 200 ao GET
+        for method in ('HEAD', 'GET'):
+            self.requests += 1
+            try:
+                status, error = await fetch(method, url), None
+            except Exception as e:
+                status, error = None, str(e).splitlines()[0] if str(e) else type(e).__name__
+            if status is not None and status < 400:
+                break
+        
+        if status is not None and status < 400:
+            state = 'ok'
+        elif status in BLOCKED_STATUSES:
+            state = 'blocked'
+        else:
+            state = 'broken'
+        
+        return {
+            'state': state,
+            'status': status,
+            'method': method,
+            'ms': round((time.perf_counter() - started) * 1000, 1),
+            'error': error
+        }
\ No newline at end of file
@@ -3,7 +3,11 @@ Logger configurado para o projeto.
 Implementa padrão Singleton para garantir única instância de logging.
 """
 import logging
+import logging.handlers
 import sys
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 
@@ -21,6 +25,7 @@ class Logger:
     def __init__(self, name="AutomacaoBlocoPraieira"):
         if not self._initialized:
             self.logger = logging.getLogger(name)
+            self._capture = threading.local()
             self._setup_logger()
             self._initialized = True
     
@@ -30,6 +35,7 @@ class Logger:
         config = Config()
         
         self.logger.setLevel(config.LOG_LEVEL)
+        self.debug_buffer_size = config.DEBUG_BUFFER_SIZE
         
         # Limpar handlers existentes
         self.logger.handlers.clear()
@@ -56,6 +62,30 @@ class Logger:
             file_handler.setFormatter(formatter)
             self.logger.addHandler(file_handler)
     
+    def enable_rotation(self, max_bytes, backup_count=3):
+        """
+        Troca o arquivo de log por um arquivo rotativo de tamanho limitado.
+        Usado em execuções de longa duração (modo daemon).
+        
+        Args:
+            max_bytes (int): Tamanho máximo de cada arquivo de log
+            backup_count (int): Quantidade de arquivos antigos mantidos
+        """
+        for handler in list(self.logger.handlers):
+            if type(handler) is logging.FileHandler:
+                rotating_handler = logging.handlers.RotatingFileHandler(
+                    handler.baseFilename,
+                    maxBytes=max_bytes,
+                    backupCount=backup_count,
+                    encoding='utf-8'
+                )
+                rotating_handler.setLevel(handler.level)
+                rotating_handler.setFormatter(handler.formatter)
+                
+                self.logger.removeHandler(handler)
+                handler.close()
+                self.logger.addHandler(rotating_handler)
+    
     def info(self, message):
         """Log de informação."""
         self.logger.info(message)
@@ -69,9 +99,55 @@ class Logger:
         self.logger.error(message)
     
     def debug(self, message):
-        """Log de debug."""
+        """Log de debug (guardado no buffer do teste em andamento, se houver)."""
+        buffer = getattr(self._capture, 'buffer', None)
+        if buffer is not None:
+            buffer.append((time.time(), message))
+            return
         self.logger.debug(message)
     
+    def begin_capture(self):
+        """
+        Passa a guardar os logs de debug da thread atual em um buffer circular
+        (DEBUG_BUFFER_SIZE registros), em vez de emiti-los. Usado durante cada teste.
+        Com LOG_LEVEL=DEBUG os registros já são emitidos na hora e nada é guardado.
+        """
+        if self.debug_buffer_size > 0 and not self.logger.isEnabledFor(logging.DEBUG):
+            self._capture.buffer = deque(maxlen=self.debug_buffer_size)
+    
+    def end_capture(self):
+        """Descarta o buffer de debug da thread atual e volta a emitir os logs de debug."""
+        self._capture.buffer = None
+    
+    def flush_capture(self):
+        """
+        Emite os logs de debug guardados na thread atual, com o horário original e
+        independentemente do LOG_LEVEL, e esvazia o buffer. Chamado quando um teste falha.
+        
+        Returns:
+            list: Linhas emitidas ("HH:MM:SS.mmm mensagem"), vazia sem captura ativa
+        """
+        buffer = getattr(self._capture, 'buffer', None)
+        if not buffer:
+            return []
+        
+        records = list(buffer)
+        buffer.clear()
+        
+        self.logger.info(f"🐞 Últimos {len(records)} registro(s) de debug antes da falha:")
+        lines = []
+        for created, message in records:
+            record = self.logger.makeRecord(self.logger.name, logging.DEBUG, __file__, 0, message, None, None)
+            record.created = created
+            record.msecs = (created - int(created)) * 1000
+            
+            # Entregue direto aos handlers: o nível configurado não filtra o contexto da falha
+            for handler in self.logger.handlers:
+                handler.handle(record)
+            
+            lines.append(f"{time.strftime('%H:%M:%S', time.localtime(created))}.{int(record.msecs):03d} {message}")
+        return lines
+    
     def critical(self, message):
         """Log crítico."""
         self.logger.critical(message)
@@ -0,0 +1,143 @@
+"""
+Matriz de execução navegador × viewport (× perfil de emulação).
+Interpreta especificações como "chrome,firefox x 1920x1080,390x844" e
+agrupa as combinações por navegador para que um mesmo WebDriver percorra
+várias viewports e perfis de emulação sendo apenas reconfigurado.
+"""
+import re
+
+SUPPORTED_BROWSERS = ('chrome', 'firefox')
+
+class MatrixCell:
+    """Uma combinação de navegador, viewport e, opcionalmente, perfil de emulação."""
+    
+    def __init__(self, browser, width, height, emulation=None):
+        """
+        Inicializa a combinação.
+        
+        Args:
+            browser (str): Navegador ('chrome' ou 'firefox')
+            width (int): Largura da viewport em pixels
+            height (int): Altura da viewport em pixels
+            emulation (EmulationProfile): Perfil de rede e CPU (None = sem emulação)
+        """
+        self.browser = browser
+        self.width = width
+        self.height = height
+        self.emulation = emulation
+    
+    @property
+    def viewport(self):
+        """Viewport no formato 'LARGURAxALTURA'."""
+        return f"{self.width}x{self.height}"
+    
+    @property
+    def label(self):
+        """Identificador da combinação, ex: 'chrome@390x844' ou 'chrome@390x844~slow-3g'."""
+        label = f"{self.browser}@{self.viewport}"
+        return f"{label}~{self.emulation.name}" if self.emulation else label
+    
+    def __repr__(self):
+        return f"MatrixCell({self.label!r})"
+
+def parse_viewport(value):
+    """
+    Converte 'LARGURAxALTURA' em uma tupla de inteiros.
+    
+    Args:
+        value (str): Viewport, ex: '390x844'
+    
+    Returns:
+        tuple: (largura, altura)
+    """
+    try:
+        width, height = (int(part) for part in value.lower().split('x'))
+    except ValueError:
+        raise ValueError(f"Viewport inválida: '{value}' (use LARGURAxALTURA, ex: 390x844)")
+    
+    if width <= 0 or height <= 0:
+        raise ValueError(f"Viewport inválida: '{value}'")
+    return width, height
+
+def parse_matrix(spec, default_browser='chrome', default_viewport=None):
+    """
+    Interpreta a especificação da matriz.
+    
+    Args:
+        spec (str): Ex: "chrome,firefox x 1920x1080,390x844"; também aceita só
+            navegadores ("chrome,firefox") ou só viewports ("1920x1080,390x844")
+        default_browser (str): Navegador usado quando a especificação não informa nenhum
+        default_viewport (tuple): Viewport usada quando a especificação não informa nenhuma
+    
+    Returns:
+        list: Combinações (MatrixCell), agrupadas por navegador
+    """
+    parts = re.split(r'\s+x\s+', spec.strip(), maxsplit=1)
+    if len(parts) == 2:
+        browsers_part, viewports_part = parts
+    elif re.search(r'\d', parts[0]):
+        browsers_part, viewports_part = '', parts[0]
+    else:
+        browsers_part, viewports_part = parts[0], ''
+    
+    browsers = [browser.strip().lower() for browser in browsers_part.split(',') if browser.strip()]
+    viewports = [parse_viewport(viewport.strip()) for viewport in viewports_part.split(',') if viewport.strip()]
+    
+    browsers = browsers or [default_browser]
+    viewports = viewports or [default_viewport]
+    
+    for browser in browsers:
+        if browser not in SUPPORTED_BROWSERS:
+            raise ValueError(f"Browser não suportado na matriz: {browser}")
+    
+    if None in viewports:
+        raise ValueError("Informe ao menos uma viewport na matriz (ex: 'chrome x 390x844')")
+    
+    # Remove duplicatas preservando a ordem
+    browsers = list(dict.fromkeys(browsers))
+    viewports = list(dict.fromkeys(viewports))
+    
+    return [MatrixCell(browser, width, height) for browser in browsers for width, height in viewports]
+
+def add_emulation(cells, profiles):
+    """
+    Repete cada combinação em cada perfil de emulação, logo após a versão sem
+    emulação, que serve de referência na comparação.
+    
+    Args:
+        cells (list): Combinações da matriz
+        profiles (list): Perfis de emulação (EmulationProfile)
+    
+    Returns:
+        list: Combinações com os perfis, agrupadas por navegador
+    """
+    for cell in cells:
+        if cell.browser != 'chrome':
+            raise ValueError(f"Emulação de rede e CPU exige o Chrome (CDP); combinação inválida: {cell.label}")
+    
+    return [
+        MatrixCell(cell.browser, cell.width, cell.height, emulation)
+        for cell in cells for emulation in [None] + list(profiles)
+    ]
+
+def plan_lanes(cells, drivers_per_browser=1):
+    """
+    Distribui as combinações em faixas; cada faixa usa um único WebDriver e
+    percorre suas viewports por redimensionamento.
+    
+    Args:
+        cells (list): Combinações da matriz
+        drivers_per_browser (int): Máximo de WebDrivers simultâneos por navegador
+    
+    Returns:
+        list: Listas de combinações, uma por WebDriver
+    """
+    by_browser = {}
+    for cell in cells:
+        by_browser.setdefault(cell.browser, []).append(cell)
+    
+    lanes = []
+    for browser_cells in by_browser.values():
+        count = max(1, min(int(drivers_per_browser), len(browser_cells)))
+        lanes.extend(browser_cells[position::count] for position in range(count))
+    return lanes
@@ -0,0 +1,375 @@
+"""
+Métricas da automação no formato Prometheus/OpenMetrics.
+Mantém contadores, gauges e histogramas em memória, alimentados diretamente
+pelas estratégias, pelos Page Objects e pelo WebDriver, e os expõe por um
+endpoint HTTP local ou por um arquivo para o textfile collector.
+"""
+import math
+import os
+from abc import ABC, abstractmethod
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from src.utils.logger import logger
+
+OPENMETRICS_CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+def _format_value(value):
+    """Formata um valor numérico como no formato de exposição."""
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def _escape(value):
+    """Escapa o valor de um label (barra invertida, aspas e quebra de linha)."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(names, values, extra=()):
+    """Formata o conjunto de labels de uma amostra."""
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+class Metric(ABC):
+    """Base das métricas: nome, descrição, labels e amostras por combinação de labels."""
+    
+    TYPE = None
+    
+    def __init__(self, name, documentation, labelnames=()):
+        """
+        Inicializa a métrica.
+        
+        Args:
+            name (str): Nome da métrica (sem o sufixo _total nos contadores)
+            documentation (str): Texto do HELP
+            labelnames (iterable): Nomes dos labels
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+    
+    def _key(self, labels):
+        """Converte os labels informados na chave interna."""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Labels inválidos para {self.name}: {sorted(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+    
+    @abstractmethod
+    def render(self, openmetrics=True):
+        """
+        Gera as linhas da métrica no formato de exposição.
+        
+        Args:
+            openmetrics (bool): True para OpenMetrics, False para o formato texto do Prometheus
+        
+        Returns:
+            list: Linhas de texto
+        """
+
+class Counter(Metric):
+    """Contador monotônico."""
+    
+    TYPE = 'counter'
+    
+    def inc(self, amount=1, **labels):
+        """Incrementa o contador para a combinação de labels."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, **labels):
+        """Valor atual do contador."""
+        return self._values.get(self._key(labels), 0)
+    
+    def render(self, openmetrics=True):
+        family = self.name if openmetrics else f"{self.name}_total"
+        lines = [f"# HELP {family} {self.documentation}", f"# TYPE {family} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}_total{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+class Gauge(Metric):
+    """Valor que pode subir e descer."""
+    
+    TYPE = 'gauge'
+    
+    def set(self, value, **labels):
+        """Define o valor do gauge."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+    
+    def inc(self, amount=1, **labels):
+        """Incrementa o gauge."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def dec(self, amount=1, **labels):
+        """Decrementa o gauge."""
+        self.inc(-amount, **labels)
+    
+    def value(self, **labels):
+        """Valor atual do gauge."""
+        return self._values.get(self._key(labels), 0)
+    
+    def render(self, openmetrics=True):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        with self._lock:
+            if not self._values and not self.labelnames:
+                lines.append(f"{self.name} 0")
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+class Histogram(Metric):
+    """Histograma com buckets cumulativos, soma e contagem."""
+    
+    TYPE = 'histogram'
+    
+    def __init__(self, name, documentation, labelnames=(), buckets=(0.1, 0.5, 1, 5, 10)):
+        """
+        Inicializa o histograma.
+        
+        Args:
+            name (str): Nome da métrica
+            documentation (str): Texto do HELP
+            labelnames (iterable): Nomes dos labels
+            buckets (iterable): Limites superiores dos buckets, em ordem crescente
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+    
+    def observe(self, value, **labels):
+        """Registra uma observação."""
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * len(self.buckets), 0.0))
+            for position, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[position] += 1
+                    break
+            self._values[key] = (counts, total + value)
+    
+    @contextmanager
+    def time(self, **labels):
+        """Mede a duração do bloco e registra como observação."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+    
+    def count(self, **labels):
+        """Quantidade de observações registradas."""
+        counts, _ = self._values.get(self._key(labels), ([0], 0.0))
+        return sum(counts)
+    
+    def render(self, openmetrics=True):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    labels = _format_labels(self.labelnames, key, [('le', _format_value(bound))])
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_count{labels} {cumulative}")
+                lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        return lines
+
+class MetricsRegistry:
+    """Classe singleton que mantém as métricas e as exporta."""
+    
+    _instance = None
+    _initialized = False
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(MetricsRegistry, cls).__new__(cls)
+        return cls._instance
+    
+    def __init__(self):
+        if not self._initialized:
+            self._metrics = []
+            self._server = None
+            self.textfile_path = None
+            self._define_metrics()
+            self._initialized = True
+    
+    def _define_metrics(self):
+        """Declara as métricas da automação."""
+        self.tests = self.register(Counter(
+            'bloco_praieira_tests',
+            'Testes executados por estratégia e resultado.',
+            ('strategy', 'result')
+        ))
+        self.test_duration = self.register(Histogram(
+            'bloco_praieira_test_duration_seconds',
+            'Duração de cada teste, em segundos.',
+            ('strategy',),
+            (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+        ))
+        self.navigation_duration = self.register(Histogram(
+            'bloco_praieira_navigation_seconds',
+            'Tempo de navegação (driver.get) por caminho da URL, em segundos.',
+            ('path',),
+            (0.1, 0.25, 0.5, 1, 2, 3, 5, 10, 30)
+        ))
+        self.page_action_duration = self.register(Histogram(
+            'bloco_praieira_page_action_seconds',
+            'Duração das ações dos Page Objects, em segundos.',
+            ('action',),
+            (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+        ))
+        self.element_cache = self.register(Counter(
+            'bloco_praieira_element_cache_lookups',
+            'Consultas ao cache de elementos dos Page Objects por resultado (hit, miss, stale, not_interactable).',
+            ('result',)
+        ))
+        self.command_duration = self.register(Histogram(
+            'bloco_praieira_webdriver_command_seconds',
+            'Latência dos comandos WebDriver, em segundos.',
+            ('command',),
+            (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+        ))
+        self.session_queue_wait = self.register(Histogram(
+            'bloco_praieira_session_queue_wait_seconds',
+            'Espera na fila até a criação da sessão do navegador, em segundos.',
+            ('backend',),
+            (0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+        ))
+        self.browser_pool_size = self.register(Gauge(
+            'bloco_praieira_browser_pool_size',
+            'Navegadores abertos pela automação.'
+        ))
+        self.last_run_timestamp = self.register(Gauge(
+            'bloco_praieira_last_run_timestamp_seconds',
+            'Instante (epoch) do fim da última execução.'
+        ))
+    
+    def register(self, metric):
+        """
+        Registra uma métrica para exportação.
+        
+        Args:
+            metric (Metric): Métrica a registrar
+        
+        Returns:
+            Metric: A própria métrica
+        """
+        self._metrics.append(metric)
+        return metric
+    
+    def record_test(self, strategy, passed, duration=None):
+        """
+        Registra o resultado de um teste.
+        
+        Args:
+            strategy (str): Chave da estratégia
+            passed (bool): Se o teste passou
+            duration (float): Duração em segundos, se medida
+        """
+        self.tests.inc(strategy=strategy, result='passed' if passed else 'failed')
+        if duration is not None:
+            self.test_duration.observe(duration, strategy=strategy)
+    
+    def render(self, openmetrics=True):
+        """
+        Gera a exposição de todas as métricas.
+        
+        Args:
+            openmetrics (bool): True para OpenMetrics, False para o formato texto do Prometheus
+        
+        Returns:
+            str: Texto da exposição
+        """
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render(openmetrics))
+        if openmetrics:
+            lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+    
+    def serve(self, port, host='127.0.0.1'):
+        """
+        Inicia um endpoint HTTP local (/metrics) em uma thread em segundo plano.
+        
+        Args:
+            port (int): Porta do endpoint
+            host (str): Interface de escuta
+        """
+        if self._server:
+            return
+        
+        registry = self
+        
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                
+                openmetrics = 'application/openmetrics-text' in self.headers.get('Accept', '')
+                body = registry.render(openmetrics).encode('utf-8')
+                
+                self.send_response(200)
+                self.send_header('Content-Type', OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                logger.debug(f"Métricas: {format % args}")
+        
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="metrics", daemon=True).start()
+        logger.info(f"📈 Métricas disponíveis em http://{host}:{self._server.server_port}/metrics")
+    
+    def shutdown(self):
+        """Encerra o endpoint HTTP, se ativo."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+    
+    def flush(self):
+        """Marca o fim de uma execução e atualiza o arquivo do textfile collector, se configurado."""
+        self.last_run_timestamp.set(time.time())
+        self.write_textfile()
+    
+    def write_textfile(self, path=None):
+        """
+        Grava as métricas atomicamente para o textfile collector do node_exporter.
+        
+        Args:
+            path (str): Arquivo .prom de destino (padrão: textfile_path)
+        """
+        path = path or self.textfile_path
+        if not path:
+            return
+        
+        path = Path(path)
+        
+        try:
+            temp_path = path.with_name(f".{path.name}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(self.render(openmetrics=False))
+            os.replace(temp_path, path)
+            logger.debug(f"Métricas gravadas em {path}")
+        except OSError as e:
+            logger.error(f"❌ Erro ao gravar métricas em {path}: {str(e)}")
+
+# Instância global das métricas
+metrics = MetricsRegistry()
\ No newline at end of file
@@ -0,0 +1,185 @@
+"""
+Validação do conteúdo do QR Code PIX.
+A imagem do QR Code é lida direto da página (data URL ou canvas) e
+decodificada no próprio processo, sem screenshots. O conteúdo pode ser um
+BR Code (payload EMV do PIX, com CRC16) ou apenas a chave PIX, que é o que o
+Donations.tsx gera hoje com QRCode.toDataURL(pixKey).
+"""
+import base64
+import binascii
+
+# Identificador do arranjo PIX na informação da conta do recebedor (campo 26)
+PIX_GUI = 'br.gov.bcb.pix'
+
+# Campos EMV que contêm subcampos no formato ID + tamanho + valor
+TEMPLATE_FIELDS = {str(tag) for tag in range(26, 52)} | {'62', '80'}
+
+def crc16_ccitt(data):
+    """
+    Calcula o CRC16-CCITT (polinômio 0x1021, valor inicial 0xFFFF) usado pelo BR Code.
+    
+    Args:
+        data (str): Payload até o identificador e tamanho do CRC ('6304'), inclusive
+    
+    Returns:
+        str: CRC em 4 dígitos hexadecimais maiúsculos
+    """
+    crc = 0xFFFF
+    for byte in data.encode('utf-8'):
+        crc ^= byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else crc << 1
+            crc &= 0xFFFF
+    return f"{crc:04X}"
+
+def parse_emv(payload):
+    """
+    Decompõe um payload EMV (ID de 2 dígitos, tamanho de 2 dígitos e valor).
+    
+    Args:
+        payload (str): Payload EMV
+    
+    Returns:
+        dict: Valor por ID; campos de template viram dicionários de subcampos
+    
+    Raises:
+        ValueError: Se a estrutura estiver corrompida
+    """
+    fields = {}
+    position = 0
+    while position < len(payload):
+        tag, size = payload[position:position + 2], payload[position + 2:position + 4]
+        if len(tag) < 2 or not size.isdigit():
+            raise ValueError(f"Campo EMV inválido na posição {position}")
+        value = payload[position + 4:position + 4 + int(size)]
+        if len(value) != int(size):
+            raise ValueError(f"Campo {tag} truncado: esperado {size} caracteres")
+        fields[tag] = parse_emv(value) if tag in TEMPLATE_FIELDS else value
+        position += 4 + int(size)
+    return fields
+
+def validate_pix_payload(payload, expected_key, require_brcode=False):
+    """
+    Valida o conteúdo do QR Code PIX.
+    
+    Args:
+        payload (str): Texto decodificado do QR Code
+        expected_key (str): Chave PIX esperada (TEST_PIX_KEY)
+        require_brcode (bool): Exige um BR Code em vez da chave pura
+    
+    Returns:
+        dict: format ('brcode' ou 'chave'), valid, key, errors e, no BR Code, os campos
+    """
+    payload = payload.strip()
+    errors = []
+    
+    if not payload.startswith('000201'):
+        key = payload
+        if key != expected_key:
+            errors.append(f"Chave PIX no QR Code incorreta: esperado {expected_key}, encontrado {key}")
+        if require_brcode:
+            errors.append("QR Code contém apenas a chave PIX, não um BR Code (EMV)")
+        return {'format': 'chave', 'valid': not errors, 'key': key, 'errors': errors}
+    
+    # O CRC cobre todo o payload até '6304', inclusive
+    crc_position = payload.rfind('6304')
+    if crc_position < 0 or crc_position + 8 != len(payload):
+        errors.append("Campo 63 (CRC16) ausente ou fora do fim do payload")
+    else:
+        expected_crc = crc16_ccitt(payload[:crc_position + 4])
+        if payload[crc_position + 4:].upper() != expected_crc:
+            errors.append(f"CRC16 inválido: esperado {expected_crc}, encontrado {payload[crc_position + 4:]}")
+    
+    try:
+        fields = parse_emv(payload)
+    except ValueError as e:
+        return {'format': 'brcode', 'valid': False, 'key': None, 'errors': errors + [str(e)]}
+    
+    account = fields.get('26')
+    key = account.get('01') if isinstance(account, dict) else None
+    if not isinstance(account, dict) or account.get('00', '').lower() != PIX_GUI:
+        errors.append(f"Campo 26 sem o identificador {PIX_GUI}")
+    elif key != expected_key:
+        errors.append(f"Chave PIX no BR Code incorreta: esperado {expected_key}, encontrado {key}")
+    
+    if fields.get('53', '986') != '986':
+        errors.append(f"Moeda diferente de BRL (986): {fields['53']}")
+    if fields.get('58') != 'BR':
+        errors.append(f"País do recebedor diferente de BR: {fields.get('58')}")
+    
+    return {
+        'format': 'brcode',
+        'valid': not errors,
+        'key': key,
+        'errors': errors,
+        'merchant_name': fields.get('59'),
+        'merchant_city': fields.get('60'),
+        'amount': fields.get('54'),
+        'txid': fields['62'].get('05') if isinstance(fields.get('62'), dict) else None
+    }
+
+def image_from_data_url(data_url):
+    """
+    Extrai os bytes de uma imagem em data URL (base64).
+    
+    Args:
+        data_url (str): URL 'data:image/png;base64,...'
+    
+    Returns:
+        bytes: Conteúdo da imagem, ou None se a URL não estiver em base64
+    """
+    header, _, data = data_url.partition(',')
+    if not header.startswith('data:') or not header.endswith(';base64'):
+        return None
+    try:
+        return base64.b64decode(data)
+    except (binascii.Error, ValueError):
+        return None
+
+def decode_qr_image(image):
+    """
+    Decodifica um QR Code com o OpenCV ou, se ele não conseguir ou não estiver instalado, com o pyzbar.
+    
+    Args:
+        image (bytes): Imagem (PNG/JPEG)
+    
+    Returns:
+        str: Texto do QR Code
+    
+    Raises:
+        ValueError: Se não houver decodificador instalado, a imagem estiver corrompida
+            ou nenhum QR Code for encontrado nela
+    """
+    decoders = []
+    
+    try:
+        import cv2
+        import numpy as np
+        
+        decoders.append('opencv')
+        matrix = cv2.imdecode(np.frombuffer(image, np.uint8), cv2.IMREAD_GRAYSCALE)
+        if matrix is None:
+            raise ValueError("Imagem do QR Code corrompida ou em formato não suportado")
+        text, _, _ = cv2.QRCodeDetector().detectAndDecode(matrix)
+        if text:
+            return text
+    except ImportError:
+        pass
+    
+    try:
+        import io
+        from PIL import Image
+        from pyzbar.pyzbar import decode
+        
+        decoders.append('pyzbar')
+        symbols = decode(Image.open(io.BytesIO(image)))
+        if symbols:
+            return symbols[0].data.decode('utf-8')
+    except ImportError:
+        pass
+    except OSError as e:
+        raise ValueError(f"Imagem do QR Code corrompida ou em formato não suportado: {str(e)}")
+    
+    if not decoders:
+        raise ValueError("Nenhum decodificador de QR Code instalado (instale opencv-python-headless ou pyzbar)")
+    raise ValueError(f"Nenhum QR Code encontrado na imagem ({' e '.join(decoders)})")
\ No newline at end of file
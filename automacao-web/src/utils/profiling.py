@@ -0,0 +1,342 @@
+"""
+Perfil de desempenho do próprio executor (--profile).
+Separa o tempo gasto em Python (logs, relatórios, formatação de
+localizadores, imports) do tempo de espera pelo navegador. Há dois modos: o
+determinístico (cProfile, preciso e mais caro) e o de amostragem (uma thread
+lê as pilhas de todas as threads a cada poucos milissegundos, com custo
+baixo e suporte a vários workers). Em ambos o tempo é atribuído à seção
+ativa (a estratégia em execução ou a geração de relatórios), e o tracemalloc
+registra as alocações de memória da execução.
+"""
+import cProfile
+import io
+import linecache
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from config.settings import Config
+from src.utils.logger import logger
+from src.utils.artifact_store import artifact_store
+
+# Funções que representam espera pelo navegador (round trip do protocolo
+# WebDriver) e esperas ociosas, para separar o tempo do executor. No cProfile
+# as esperas aparecem como funções nativas; na amostragem, só as que são
+# escritas em Python ficam visíveis na pilha
+BROWSER_FUNCTIONS = {('remote_connection.py', '_request')}
+IDLE_FUNCTIONS = {('~', '<built-in method time.sleep>'), ('~', "<method 'acquire' of '_thread.lock' objects>")}
+IDLE_FRAMES = {('threading.py', 'wait'), ('queue.py', 'get'), ('thread.py', '_worker')}
+
+# Seção das amostras da thread principal fora das estratégias e relatórios
+OUTSIDE_SECTION = 'fora_das_secoes'
+
+# Profundidade máxima das pilhas no modo de amostragem
+MAX_STACK_DEPTH = 64
+
+def _frame_label(code):
+    """Rótulo de uma função: nome (arquivo:linha)."""
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+class RunProfiler:
+    """Classe singleton que mede o custo em Python de cada seção da execução."""
+    
+    _instance = None
+    _initialized = False
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(RunProfiler, cls).__new__(cls)
+        return cls._instance
+    
+    def __init__(self):
+        if not self._initialized:
+            self.mode = None
+            self.started = None
+            self._profiles = {}
+            self._samples = {}
+            self._wall = Counter()
+            self._memory = {}
+            self._active = {}
+            self._first_snapshot = None
+            self._sampler = None
+            self._stop_event = threading.Event()
+            self._warned = False
+            self._lock = threading.Lock()
+            self._initialized = True
+    
+    @property
+    def enabled(self):
+        """True se o perfil está sendo coletado."""
+        return self.mode is not None
+    
+    def enable(self, mode='cprofile'):
+        """
+        Inicia a coleta do perfil.
+        
+        Args:
+            mode (str): 'cprofile' (determinístico) ou 'sampling' (amostragem)
+        """
+        config = Config()
+        self.mode = mode
+        self.started = time.perf_counter()
+        
+        if config.PROFILE_MEMORY:
+            tracemalloc.start(config.PROFILE_MEMORY_FRAMES)
+            self._first_snapshot = tracemalloc.take_snapshot()
+        
+        if mode == 'sampling':
+            self._stop_event.clear()
+            self._sampler = threading.Thread(
+                target=self._sample_loop, args=(config.PROFILE_INTERVAL_MS / 1000,), name='profiler', daemon=True
+            )
+            self._sampler.start()
+        
+        logger.info(f"🔬 Perfil do executor ativado (modo {mode}{', com tracemalloc' if config.PROFILE_MEMORY else ''})")
+    
+    @contextmanager
+    def section(self, name):
+        """
+        Atribui ao perfil da seção o trabalho feito na thread atual.
+        Seções aninhadas na mesma thread contam para a mais externa.
+        
+        Args:
+            name (str): Nome da seção (ex: chave da estratégia)
+        """
+        thread_id = threading.get_ident()
+        if not self.enabled or thread_id in self._active:
+            yield
+            return
+        
+        self._active[thread_id] = name
+        profile = None
+        if self.mode == 'cprofile':
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError as e:
+                # Python 3.12+: um único perfil determinístico ativo por vez (use --profile sampling com workers)
+                profile = None
+                if not self._warned:
+                    self._warned = True
+                    logger.warning(f"⚠️ Perfil determinístico indisponível em seções paralelas: {str(e)}")
+        
+        memory_before = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            if profile:
+                profile.disable()
+            del self._active[thread_id]
+            
+            with self._lock:
+                self._wall[name] += elapsed
+                if profile:
+                    self._profiles.setdefault(name, []).append(profile)
+                if memory_before is not None:
+                    current, peak = tracemalloc.get_traced_memory()
+                    memory = self._memory.setdefault(name, {'allocated_bytes': 0, 'peak_bytes': 0})
+                    memory['allocated_bytes'] += current - memory_before
+                    memory['peak_bytes'] = max(memory['peak_bytes'], peak)
+    
+    def _sample_loop(self, interval):
+        """Lê as pilhas das threads em seções (e da principal) a cada intervalo."""
+        own_id = threading.get_ident()
+        main_id = threading.main_thread().ident
+        
+        while not self._stop_event.wait(interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                name = self._active.get(thread_id)
+                if name is None:
+                    if thread_id != main_id:
+                        continue
+                    name = OUTSIDE_SECTION
+                self._record_sample(name, frame)
+    
+    def _record_sample(self, name, frame):
+        """Acumula uma pilha amostrada na seção."""
+        top_frame = frame
+        stack = []
+        while frame is not None and len(stack) < MAX_STACK_DEPTH:
+            stack.append(frame.f_code)
+            frame = frame.f_back
+        
+        # Funções em C (time.sleep) não aparecem na pilha: a linha em execução revela a espera
+        functions = {(os.path.basename(code.co_filename), code.co_name) for code in stack}
+        if functions & BROWSER_FUNCTIONS:
+            category = 'browser'
+        elif functions & IDLE_FRAMES or 'sleep(' in linecache.getline(top_frame.f_code.co_filename, top_frame.f_lineno):
+            category = 'idle'
+        else:
+            category = 'python'
+        
+        labels = [_frame_label(code) for code in stack]
+        with self._lock:
+            samples = self._samples.setdefault(name, {
+                'total': 0, 'self': Counter(), 'cumulative': Counter(), 'stacks': Counter(), 'categories': Counter()
+            })
+            samples['total'] += 1
+            if category == 'python':
+                # Tempo próprio só do que é custo do executor (sem esperas e round trips)
+                samples['self'][labels[0]] += 1
+            samples['cumulative'].update(set(labels))
+            samples['stacks'][';'.join(reversed(labels))] += 1
+            samples['categories'][category] += 1
+    
+    def _summarize_cprofile(self, name, directory, top):
+        """Grava o .pstats e o texto da seção e resume as funções mais caras."""
+        stats = pstats.Stats(*self._profiles[name])
+        stats_path = directory / f"{name}.pstats"
+        stats.dump_stats(str(stats_path))
+        
+        text = io.StringIO()
+        pstats.Stats(str(stats_path), stream=text).sort_stats('cumulative').print_stats(top * 2)
+        text_path = directory / f"{name}.txt"
+        text_path.write_text(text.getvalue(), encoding='utf-8')
+        
+        browser, idle = 0.0, 0.0
+        functions = []
+        for (filename, line, function), (_, calls, own, cumulative, _) in stats.stats.items():
+            key = (os.path.basename(filename), function)
+            if key in BROWSER_FUNCTIONS:
+                browser += cumulative
+                continue
+            if key in IDLE_FUNCTIONS:
+                idle += cumulative
+                continue
+            functions.append((own, cumulative, calls, f"{function} ({os.path.basename(filename)}:{line})"))
+        
+        functions.sort(reverse=True)
+        return [stats_path, text_path], browser, idle, [
+            {'function': label, 'self_seconds': round(own, 4), 'cumulative_seconds': round(cumulative, 4), 'calls': calls}
+            for own, cumulative, calls, label in functions[:top]
+        ]
+    
+    def _summarize_samples(self, name, directory, top, interval, wall):
+        """
+        Grava as pilhas (formato folded, para flame graphs) e o texto da seção.
+        As amostras dão a proporção de cada função; os segundos saem do tempo
+        real da seção, já que a amostragem atrasa quando o executor ocupa a CPU.
+        """
+        samples = self._samples[name]
+        share = wall / samples['total']
+        folded_path = directory / f"{name}.folded"
+        with open(folded_path, 'w', encoding='utf-8') as f:
+            for stack, count in samples['stacks'].most_common():
+                f.write(f"{stack} {count}\n")
+        
+        lines = [f"{samples['total']} amostras a cada {interval * 1000:.0f}ms", "", "Tempo próprio (Python):"]
+        lines += [f"{count:>8}  {label}" for label, count in samples['self'].most_common(top * 2)]
+        lines += ["", "Tempo acumulado:"]
+        lines += [f"{count:>8}  {label}" for label, count in samples['cumulative'].most_common(top * 2)]
+        text_path = directory / f"{name}.txt"
+        text_path.write_text('\n'.join(lines), encoding='utf-8')
+        
+        return [folded_path, text_path], samples['categories']['browser'] * share, samples['categories']['idle'] * share, [
+            {'function': label, 'self_seconds': round(count * share, 4),
+             'cumulative_seconds': round(samples['cumulative'][label] * share, 4), 'samples': count}
+            for label, count in samples['self'].most_common(top)
+        ]
+    
+    def _write_memory(self, directory, top):
+        """Grava as linhas que mais alocaram memória desde o início do perfil."""
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>')
+        ))
+        differences = snapshot.compare_to(self._first_snapshot, 'lineno')
+        tracemalloc.stop()
+        
+        memory_path = directory / 'memoria.txt'
+        memory_path.write_text('\n'.join(str(difference) for difference in differences[:top * 2]), encoding='utf-8')
+        return memory_path, [
+            {'location': str(difference.traceback), 'size_diff_kb': round(difference.size_diff / 1024, 1),
+             'count_diff': difference.count_diff}
+            for difference in differences[:top]
+        ]
+    
+    def finish(self):
+        """
+        Encerra a coleta, grava os arquivos de cada seção e registra o resumo no log.
+        
+        Returns:
+            dict: Resumo por seção, ou None se o perfil não estava ativo
+        """
+        if not self.enabled:
+            return None
+        
+        config = Config()
+        top = config.PROFILE_TOP
+        interval = config.PROFILE_INTERVAL_MS / 1000
+        
+        if self._sampler:
+            self._stop_event.set()
+            self._sampler.join()
+            self._sampler = None
+        
+        directory = config.get_profile_dir()
+        files = []
+        summary = {'mode': self.mode, 'seconds': round(time.perf_counter() - self.started, 3), 'sections': {}}
+        
+        sections = self._profiles if self.mode == 'cprofile' else self._samples
+        for name in sorted(sections):
+            if self.mode == 'cprofile':
+                written, browser, idle, functions = self._summarize_cprofile(name, directory, top)
+                wall = self._wall[name]
+            else:
+                wall = self._wall[name] or self._samples[name]['total'] * interval
+                written, browser, idle, functions = self._summarize_samples(name, directory, top, interval, wall)
+            files.extend(written)
+            
+            summary['sections'][name] = {
+                'wall_seconds': round(wall, 3),
+                'browser_seconds': round(browser, 3),
+                'idle_seconds': round(idle, 3),
+                'python_seconds': round(max(wall - browser - idle, 0), 3),
+                'memory': self._memory.get(name),
+                'top_functions': functions
+            }
+        
+        if self._first_snapshot is not None:
+            memory_path, summary['memory_top'] = self._write_memory(directory, top)
+            files.append(memory_path)
+            self._first_snapshot = None
+        
+        summary['directory'] = str(directory)
+        if artifact_store.enabled:
+            for path in files:
+                artifact_store.put_file(path, 'profile', f"{directory.name}/{path.name}")
+            directory.rmdir()
+            summary['directory'] = str(artifact_store.root)
+        self.mode = None
+        self._log_summary(summary)
+        return summary
+    
+    def _log_summary(self, summary):
+        """Registra no log o tempo por seção e as funções mais caras."""
+        logger.info("=" * 60)
+        logger.info(f"🔬 PERFIL DO EXECUTOR ({summary['mode']}) - arquivos em {summary['directory']}")
+        
+        for name, section in summary['sections'].items():
+            logger.info(
+                f"   🧩 {name}: {section['wall_seconds']:.2f}s = navegador {section['browser_seconds']:.2f}s + "
+                f"espera {section['idle_seconds']:.2f}s + Python {section['python_seconds']:.2f}s"
+            )
+            if section['memory']:
+                logger.info(f"      💾 alocado {section['memory']['allocated_bytes'] / 1024:.0f} KB, "
+                            f"pico {section['memory']['peak_bytes'] / 1024 / 1024:.1f} MB")
+            for function in section['top_functions'][:Config().PROFILE_LOG_TOP]:
+                logger.info(f"      {function['self_seconds']:>8.3f}s  {function['function']}")
+        
+        for allocation in summary.get('memory_top', [])[:Config().PROFILE_LOG_TOP]:
+            logger.info(f"   💾 {allocation['size_diff_kb']:>+10.1f} KB  {allocation['location']}")
+
+# Instância global do perfil do executor
+profiler = RunProfiler()
\ No newline at end of file
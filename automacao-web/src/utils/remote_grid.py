@@ -0,0 +1,284 @@
+"""
+Backend remoto de WebDriver (Selenium Grid / standalone).
+Distribui as sessões entre uma lista de endpoints de acordo com a capacidade
+livre informada por cada um em /status, tenta outro nó quando a criação da
+sessão falha e mede o tempo de espera na fila separadamente do tempo de teste.
+"""
+import threading
+import time
+from selenium import webdriver
+from config.settings import Config
+from src.utils.logger import logger
+from src.utils.metrics import metrics
+
+class GridNode:
+    """Endpoint remoto (hub do Grid ou servidor standalone) e sua capacidade."""
+    
+    # Após uma falha, o nó só é escolhido se nenhum outro tiver capacidade
+    FAILURE_COOLDOWN = 60
+    
+    def __init__(self, url):
+        """
+        Inicializa o nó.
+        
+        Args:
+            url (str): URL do endpoint, ex: http://localhost:4444
+        """
+        self.url = url.rstrip('/')
+        self.ready = False
+        self.total_slots = 0
+        self.free_slots = 0
+        self.pending = 0
+        self.active = 0
+        self.failures = 0
+        self.last_failure = None
+    
+    def refresh(self, browser_type, timeout=5):
+        """
+        Atualiza a capacidade do nó consultando /status.
+        
+        Args:
+            browser_type (str): Navegador desejado (filtra os slots pelo browserName)
+            timeout (float): Tempo limite da consulta em segundos
+        """
+        import requests
+        
+        try:
+            response = requests.get(f"{self.url}/status", timeout=timeout)
+            status = response.json().get('value', {})
+        except Exception as e:
+            logger.debug(f"Nó {self.url} indisponível: {str(e)}")
+            self.ready = False
+            self.total_slots = self.free_slots = 0
+            return
+        
+        total, free = 0, 0
+        for node in status.get('nodes', []):
+            if node.get('availability', 'UP') != 'UP':
+                continue
+            for slot in node.get('slots', []):
+                browser_name = slot.get('stereotype', {}).get('browserName', browser_type)
+                if browser_name != browser_type:
+                    continue
+                total += 1
+                if not slot.get('session'):
+                    free += 1
+        
+        self.ready = bool(status.get('ready', total > 0))
+        self.total_slots = total
+        self.free_slots = free
+    
+    @property
+    def available_slots(self):
+        """Slots livres descontando as sessões que este processo está criando."""
+        return self.free_slots - self.pending if self.ready else 0
+    
+    @property
+    def recently_failed(self):
+        """Indica se o nó falhou ao criar uma sessão há pouco tempo."""
+        return self.last_failure is not None and time.monotonic() - self.last_failure < self.FAILURE_COOLDOWN
+    
+    def to_dict(self):
+        """
+        Serializa o estado do nó para logs e relatórios.
+        
+        Returns:
+            dict: Estado do nó
+        """
+        return {
+            'url': self.url,
+            'ready': self.ready,
+            'total_slots': self.total_slots,
+            'free_slots': self.free_slots,
+            'active_sessions': self.active,
+            'failures': self.failures
+        }
+
+class RemoteSessionPool:
+    """Classe singleton que distribui sessões remotas entre os nós configurados."""
+    
+    # Tempo limite do DELETE de encerramento forçado: o nó pode estar tão travado quanto a sessão
+    KILL_TIMEOUT = 5
+    
+    _instance = None
+    _initialized = False
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(RemoteSessionPool, cls).__new__(cls)
+        return cls._instance
+    
+    def __init__(self):
+        if not self._initialized:
+            self.nodes = {}
+            self._lock = threading.Condition()
+            self._initialized = True
+    
+    def _get_nodes(self, endpoints):
+        """Retorna os nós dos endpoints informados, criando-os na primeira vez."""
+        with self._lock:
+            for url in endpoints:
+                key = url.rstrip('/')
+                if key not in self.nodes:
+                    self.nodes[key] = GridNode(url)
+            return [self.nodes[url.rstrip('/')] for url in endpoints]
+    
+    def create_session(self, browser_type, options, endpoints=None):
+        """
+        Cria uma sessão remota no nó com mais capacidade livre, aguardando na fila
+        enquanto nenhum nó tiver slot livre e tentando outro nó em caso de falha.
+        
+        Args:
+            browser_type (str): Navegador ('chrome' ou 'firefox')
+            options: Options do Selenium para o navegador
+            endpoints (list): URLs dos nós (padrão: REMOTE_ENDPOINTS)
+        
+        Returns:
+            WebDriver: Sessão remota; driver.grid_node, driver.queue_wait_seconds e
+            driver.session_start_seconds informam o nó escolhido, a espera por um
+            slot livre (incluindo tentativas falhas) e o tempo de criação da sessão
+        """
+        config = Config()
+        nodes = self._get_nodes(endpoints or config.REMOTE_ENDPOINTS)
+        if not nodes:
+            raise ValueError("Nenhum endpoint remoto configurado (REMOTE_ENDPOINTS)")
+        
+        requested_at = time.monotonic()
+        deadline = requested_at + config.REMOTE_QUEUE_TIMEOUT
+        failed = set()
+        last_error = None
+        
+        while True:
+            node = self._reserve_node(nodes, browser_type, failed)
+            
+            if node is None:
+                if len(failed) == len(nodes):
+                    raise RuntimeError(f"Falha ao criar sessão em todos os nós remotos: {last_error}")
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Nenhum nó remoto com capacidade livre após {config.REMOTE_QUEUE_TIMEOUT}s")
+                
+                # Fila: aguarda a liberação de um slot (por este processo ou por outros clientes)
+                with self._lock:
+                    self._lock.wait(config.REMOTE_POLL_INTERVAL)
+                continue
+            
+            reserved_at = time.monotonic()
+            
+            try:
+                driver = webdriver.Remote(command_executor=node.url, options=options)
+            except Exception as e:
+                last_error = e
+                failed.add(node.url)
+                with self._lock:
+                    node.pending -= 1
+                    node.failures += 1
+                    node.last_failure = time.monotonic()
+                    self._lock.notify_all()
+                logger.warning(f"⚠️ Falha ao criar sessão em {node.url}, tentando outro nó: {str(e)}")
+                continue
+            
+            queue_wait = reserved_at - requested_at
+            session_start = time.monotonic() - reserved_at
+            with self._lock:
+                node.pending -= 1
+                node.active += 1
+                node.free_slots -= 1
+            
+            self._bind_release(driver, node)
+            driver.grid_node = node.url
+            driver.queue_wait_seconds = round(queue_wait, 3)
+            driver.session_start_seconds = round(session_start, 3)
+            metrics.session_queue_wait.observe(queue_wait, backend='remote')
+            
+            logger.info(
+                f"🛰️ Sessão remota criada em {node.url} "
+                f"(fila: {queue_wait:.1f}s, criação: {session_start:.1f}s)"
+            )
+            return driver
+    
+    def _reserve_node(self, nodes, browser_type, failed):
+        """
+        Escolhe o nó com mais slots livres e reserva um slot nele.
+        
+        Returns:
+            GridNode: Nó reservado, ou None se nenhum tiver capacidade
+        """
+        candidates = [node for node in nodes if node.url not in failed]
+        for node in candidates:
+            node.refresh(browser_type)
+        
+        with self._lock:
+            available = [node for node in candidates if node.available_slots > 0]
+            if not available:
+                return None
+            
+            node = max(available, key=lambda candidate: (
+                not candidate.recently_failed,
+                candidate.available_slots,
+                -candidate.active
+            ))
+            node.pending += 1
+            return node
+    
+    def _bind_release(self, driver, node):
+        """Faz driver.quit (ou driver.release_slot, no encerramento forçado) liberar o slot reservado no nó."""
+        quit_session = driver.quit
+        released = []
+        
+        def release():
+            with self._lock:
+                if not released:
+                    released.append(True)
+                    node.active -= 1
+                    self._lock.notify_all()
+        
+        def quit_and_release():
+            try:
+                quit_session()
+            finally:
+                release()
+        
+        driver.quit = quit_and_release
+        driver.release_slot = release
+    
+    def kill_session(self, driver):
+        """
+        Encerra à força uma sessão remota com DELETE /session/{id} em uma conexão
+        própria, sem passar pelo executor do driver (ocupado pelo comando travado),
+        e libera o slot reservado no nó.
+        
+        Args:
+            driver: Sessão criada por create_session
+        
+        Returns:
+            bool: True se o nó confirmou o encerramento da sessão
+        """
+        import requests
+        
+        url = f"{driver.grid_node}/session/{driver.session_id}"
+        try:
+            response = requests.delete(url, timeout=self.KILL_TIMEOUT)
+            killed = response.status_code < 400
+            if not killed:
+                logger.warning(f"⚠️ Nó recusou o encerramento da sessão {driver.session_id}: HTTP {response.status_code}")
+        except Exception as e:
+            logger.warning(f"⚠️ Falha ao encerrar a sessão remota {driver.session_id}: {str(e)}")
+            killed = False
+        finally:
+            # O slot é liberado mesmo sem resposta: o nó descarta a sessão pelo próprio timeout
+            driver.release_slot()
+        
+        return killed
+    
+    def status(self):
+        """
+        Estado dos nós conhecidos.
+        
+        Returns:
+            list: Estado serializado de cada nó
+        """
+        with self._lock:
+            return [node.to_dict() for node in self.nodes.values()]
+
+# Instância global do pool remoto
+remote_pool = RemoteSessionPool()
\ No newline at end of file
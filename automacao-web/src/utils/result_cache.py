@@ -0,0 +1,355 @@
+"""
+Cache de resultados de teste entre execuções.
+Cada unidade de teste aprovada é gravada sob uma chave que combina o build
+publicado do site (buildId do Next.js), o hash do código da estratégia e dos
+Page Objects que ela usa, um retrato das configurações que afetam os testes e
+o navegador/viewport. Enquanto nada disso muda, a unidade é reproduzida do
+cache sem interagir com o navegador; falhas nunca são gravadas e sempre
+executam de novo.
+"""
+import ast
+import hashlib
+import importlib.util
+import inspect
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from config.settings import Config
+from src.utils.logger import logger
+
+# Fontes do buildId no HTML: páginas do pages router, scripts do manifesto de build
+# (presentes em produção nos dois routers) e payload RSC do app router
+NEXT_DATA_PATTERN = re.compile(r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.S)
+BUILD_MANIFEST_PATTERN = re.compile(r'/_next/static/([^/"\']+)/_(?:buildManifest|ssgManifest)\.js')
+APP_ROUTER_PATTERN = re.compile(r'\\"b\\":\\"([^"\\]+)\\"')
+
+# Pacotes do projeto cujo código entra no hash das estratégias
+PROJECT_PACKAGES = ('src', 'config')
+
+# O servidor de desenvolvimento usa sempre este buildId, mesmo após recompilar
+DEVELOPMENT_BUILD_ID = 'development'
+
+# Configurações que não alteram o resultado dos testes (saídas, infraestrutura, cache)
+CONFIG_IGNORED_PREFIXES = (
+    'EXPORT_', 'LOG_', 'METRICS_', 'TRACE_', 'HAR_', 'DAEMON_', 'REMOTE_', 'RESULT_CACHE_',
+    'BROWSER_LOG', 'SCALE_', 'ARTIFACT', 'DEBUG_', 'RUN_TIMEOUT', 'PROJECT_ROOT', 'WARMUP', 'PROFILE_'
+)
+
+def extract_build_id(html):
+    """
+    Extrai o buildId do Next.js do HTML de uma página.
+    
+    Args:
+        html (str): HTML da página
+    
+    Returns:
+        str: buildId, ou None se não encontrado
+    """
+    match = NEXT_DATA_PATTERN.search(html)
+    if match:
+        try:
+            build_id = json.loads(match.group(1)).get('buildId')
+            if build_id:
+                return build_id
+        except ValueError:
+            pass
+    
+    for pattern in (BUILD_MANIFEST_PATTERN, APP_ROUTER_PATTERN):
+        match = pattern.search(html)
+        if match:
+            return match.group(1)
+    
+    return None
+
+def _project_imports(path):
+    """
+    Lista os módulos do projeto importados por um arquivo, inclusive os
+    importados dentro de funções.
+    
+    Args:
+        path (Path): Arquivo Python
+    
+    Returns:
+        set: Nomes candidatos a módulo ('from src.utils import x' gera 'src.utils' e 'src.utils.x')
+    """
+    names = set()
+    for node in ast.walk(ast.parse(path.read_bytes())):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return {name for name in names if name.split('.')[0] in PROJECT_PACKAGES}
+
+def _module_file(name):
+    """Arquivo do módulo do projeto, ou None se o nome não for um módulo (ex: uma classe)."""
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.origin or not spec.origin.endswith('.py'):
+        return None
+    return Path(spec.origin).resolve()
+
+def hash_sources(strategy_class):
+    """
+    Calcula o hash do código relevante para uma estratégia: o módulo da
+    estratégia e, transitivamente, todos os módulos do projeto (src e config)
+    que ele importa, direta ou indiretamente, incluindo importações tardias
+    dentro de funções.
+    
+    Args:
+        strategy_class (type): Classe da estratégia
+    
+    Returns:
+        str: Hash SHA-256 do código
+    """
+    pending = [Path(inspect.getsourcefile(strategy_class)).resolve()]
+    files = set()
+    
+    while pending:
+        path = pending.pop()
+        if path in files:
+            continue
+        files.add(path)
+        for name in _project_imports(path):
+            module_file = _module_file(name)
+            if module_file is not None:
+                pending.append(module_file)
+    
+    root = Path(Config().PROJECT_ROOT).resolve()
+    digest = hashlib.sha256()
+    for path in sorted(files):
+        digest.update(path.relative_to(root).as_posix().encode('utf-8'))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+def snapshot_config(config):
+    """
+    Retrata as configurações que podem alterar o resultado dos testes.
+    
+    Args:
+        config (Config): Configurações atuais
+    
+    Returns:
+        dict: Configurações relevantes, em ordem alfabética
+    """
+    return {
+        name: str(value)
+        for name, value in sorted(vars(config).items())
+        if name.isupper() and not name.endswith('_DIR') and not name.startswith(CONFIG_IGNORED_PREFIXES)
+    }
+
+class ResultCache:
+    """Classe singleton que reproduz resultados de unidades de teste já aprovadas."""
+    
+    _instance = None
+    _initialized = False
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ResultCache, cls).__new__(cls)
+        return cls._instance
+    
+    def __init__(self):
+        if not self._initialized:
+            self.enabled = False
+            self.active = False
+            self.build_id = None
+            self.directory = None
+            self.max_age = None
+            self._config_hash = None
+            self._source_hashes = {}
+            self._stats = {'hits': 0, 'misses': 0, 'stored': 0}
+            self._lock = threading.Lock()
+            self._initialized = True
+    
+    def enable(self, max_age=None):
+        """
+        Ativa o cache.
+        
+        Args:
+            max_age (float): Validade das entradas em segundos (padrão: RESULT_CACHE_MAX_AGE)
+        """
+        config = Config()
+        self.enabled = True
+        self.max_age = max_age or config.RESULT_CACHE_MAX_AGE
+        self.directory = config.get_result_cache_dir()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        logger.info(f"💾 Cache de resultados ativado em {self.directory}")
+    
+    def begin_run(self, base_url):
+        """
+        Identifica o build do site e o retrato das configurações da execução.
+        Sem um buildId de produção o cache fica inativo nesta execução.
+        
+        Args:
+            base_url (str): URL base do site
+        
+        Returns:
+            bool: True se o cache está ativo
+        """
+        self.active = False
+        if not self.enabled:
+            return False
+        
+        try:
+            import requests
+            build_id = extract_build_id(requests.get(base_url, timeout=10).text)
+        except Exception as e:
+            logger.warning(f"⚠️ Cache de resultados inativo: não foi possível ler o build do site ({str(e)})")
+            return False
+        
+        if not build_id or build_id == DEVELOPMENT_BUILD_ID:
+            logger.warning("⚠️ Cache de resultados inativo: site sem buildId de produção (servidor de desenvolvimento?)")
+            return False
+        
+        snapshot = json.dumps(snapshot_config(Config()), sort_keys=True)
+        self._config_hash = hashlib.sha256(snapshot.encode('utf-8')).hexdigest()
+        self.build_id = build_id
+        self.active = True
+        self.reset()
+        logger.info(f"💾 Cache de resultados ativo para o build {build_id}")
+        return True
+    
+    def reset(self):
+        """Zera as estatísticas da execução (entradas gravadas são mantidas)."""
+        with self._lock:
+            self._stats = {'hits': 0, 'misses': 0, 'stored': 0}
+    
+    def _source_hash(self, strategy_class):
+        """Hash do código da estratégia, calculado uma vez por execução."""
+        source_hash = self._source_hashes.get(strategy_class)
+        if source_hash is None:
+            source_hash = self._source_hashes[strategy_class] = hash_sources(strategy_class)
+        return source_hash
+    
+    def _browser_context(self, driver):
+        """Navegador, tamanho de janela e emulação atuais (a matriz muda viewport e emulação entre células)."""
+        emulation = getattr(driver, 'emulation', None)
+        driver = getattr(driver, 'wrapped_driver', driver)
+        try:
+            size = driver.get_window_size()
+            viewport = f"{size['width']}x{size['height']}"
+        except Exception:
+            viewport = ''
+        context = f"{getattr(driver, 'name', '')}@{viewport}"
+        return f"{context}~{emulation.name}" if emulation else context
+    
+    def _entry_path(self, strategy, unit):
+        """Arquivo da entrada de uma unidade de teste."""
+        key = hashlib.sha256(json.dumps([
+            self.build_id,
+            self._source_hash(type(strategy)),
+            self._config_hash,
+            self._browser_context(strategy.driver),
+            unit.qualified_name
+        ]).encode('utf-8')).hexdigest()
+        return self.directory / f"{key}.json"
+    
+    def lookup(self, strategy, unit):
+        """
+        Procura os resultados gravados de uma unidade de teste.
+        
+        Args:
+            strategy (TestStrategy): Estratégia dona da unidade
+            unit (TestUnit): Unidade de teste
+        
+        Returns:
+            dict: Entrada do cache (cached_at e results), ou None se ausente ou expirada
+        """
+        if not self.active:
+            return None
+        
+        path = self._entry_path(strategy, unit)
+        try:
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+        
+        if entry and time.time() - entry['cached_at'] > self.max_age:
+            entry = None
+        
+        with self._lock:
+            self._stats['hits' if entry else 'misses'] += 1
+        return entry
+    
+    def contains(self, strategy, unit):
+        """
+        Verifica, sem contar nas estatísticas, se uma unidade pode ser reproduzida.
+        
+        Args:
+            strategy (TestStrategy): Estratégia dona da unidade
+            unit (TestUnit): Unidade de teste
+        
+        Returns:
+            bool: True se há uma entrada válida
+        """
+        if not self.active:
+            return False
+        
+        path = self._entry_path(strategy, unit)
+        try:
+            return time.time() - path.stat().st_mtime <= self.max_age
+        except OSError:
+            return False
+    
+    def store(self, strategy, unit, results):
+        """
+        Grava os resultados de uma unidade executada, se todos foram aprovados.
+        
+        Args:
+            strategy (TestStrategy): Estratégia dona da unidade
+            unit (TestUnit): Unidade de teste
+            results (list): Resultados (TestResult) produzidos pela unidade
+        """
+        if not self.active or not results or not all(result.passed for result in results):
+            return
+        
+        entry = {
+            'cached_at': time.time(),
+            'build_id': self.build_id,
+            'unit': unit.qualified_name,
+            'results': [
+                {
+                    'test_name': result.test_name,
+                    'message': result.message,
+                    'duration_seconds': result.duration_seconds,
+                    'details': result.details
+                }
+                for result in results
+            ]
+        }
+        
+        path = self._entry_path(strategy, unit)
+        try:
+            # Grava em arquivo temporário e renomeia: workers paralelos nunca leem entradas pela metade
+            temporary = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(temporary, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False, default=str)
+            temporary.replace(path)
+        except OSError as e:
+            logger.warning(f"⚠️ Não foi possível gravar {unit.qualified_name} no cache: {str(e)}")
+            return
+        
+        with self._lock:
+            self._stats['stored'] += 1
+    
+    def summary(self):
+        """
+        Resume o uso do cache na execução.
+        
+        Returns:
+            dict: build_id, hits, misses e stored, ou None se o cache estiver desativado
+        """
+        if not self.enabled:
+            return None
+        
+        with self._lock:
+            return dict(self._stats, active=self.active, build_id=self.build_id)
+
+# Instância global do cache de resultados
+result_cache = ResultCache()
\ No newline at end of file
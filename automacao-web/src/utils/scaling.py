@@ -0,0 +1,102 @@
+"""
+Estatísticas das curvas de escala (latência e DOM em função do volume de dados).
+"""
+import math
+
+def parse_sizes(value):
+    """
+    Converte a lista de volumes da linha de comando ou do .env.
+    
+    Args:
+        value (str): Volumes separados por vírgula, ex: "100,1000,5k,10k"
+    
+    Returns:
+        list: Volumes em ordem crescente, sem repetição
+    
+    Raises:
+        ValueError: Se algum volume for inválido
+    """
+    sizes = set()
+    for item in value.split(','):
+        item = item.strip().lower()
+        if not item:
+            continue
+        multiplier = 1000 if item.endswith('k') else 1
+        try:
+            size = int(float(item.rstrip('k')) * multiplier)
+        except ValueError:
+            raise ValueError(f"Volume inválido: '{item}'")
+        if size <= 0:
+            raise ValueError(f"Volume deve ser positivo: '{item}'")
+        sizes.add(size)
+    
+    if not sizes:
+        raise ValueError("Nenhum volume informado")
+    return sorted(sizes)
+
+def percentile(values, fraction):
+    """
+    Percentil com interpolação linear.
+    
+    Args:
+        values (list): Amostras
+        fraction (float): Percentil entre 0 e 1 (ex: 0.95)
+    
+    Returns:
+        float: Percentil, ou None sem amostras
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def summarize(values, digits=2):
+    """
+    Resume amostras de latência.
+    
+    Args:
+        values (list): Amostras em milissegundos
+        digits (int): Casas decimais
+    
+    Returns:
+        dict: median, p95 e max
+    """
+    if not values:
+        return {'median': None, 'p95': None, 'max': None}
+    return {
+        'median': round(percentile(values, 0.5), digits),
+        'p95': round(percentile(values, 0.95), digits),
+        'max': round(max(values), digits)
+    }
+
+def fit_power_law(sizes, values):
+    """
+    Ajusta y = a * n^k por mínimos quadrados em escala log-log.
+    Um expoente próximo de 1 indica crescimento linear com o volume; acima de 1,
+    superlinear (ex: layout recalculado para todos os cards a cada inserção).
+    
+    Args:
+        sizes (list): Volumes (n)
+        values (list): Medidas correspondentes (y); pares sem valor positivo são ignorados
+    
+    Returns:
+        dict: exponent e coefficient, ou None com menos de dois pontos válidos
+    """
+    points = [(math.log(n), math.log(y)) for n, y in zip(sizes, values) if n and y and y > 0]
+    if len(points) < 2:
+        return None
+    
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return None
+    
+    exponent = sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+    return {
+        'exponent': round(exponent, 3),
+        'coefficient': round(math.exp(mean_y - exponent * mean_x), 6)
+    }
\ No newline at end of file
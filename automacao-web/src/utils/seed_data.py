@@ -0,0 +1,150 @@
+"""
+Geração e carga de dados sintéticos para testes de escala.
+Os registros são determinísticos (mesma semente, mesmos dados) e são criados
+pelas rotas públicas da API, em paralelo e com conexões reaproveitadas, para
+que os mesmos volumes possam ser aplicados ao site real ou ao stub local.
+"""
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from src.utils.logger import logger
+from src.utils.site_stub import INSTRUMENTS
+
+FIRST_NAMES = (
+    'Ana', 'Bruno', 'Carla', 'Diego', 'Elisa', 'Fábio', 'Gabriela', 'Heitor', 'Isabela', 'João',
+    'Karina', 'Lucas', 'Marina', 'Nicolas', 'Olívia', 'Pedro', 'Queila', 'Rafael', 'Sofia', 'Tiago'
+)
+LAST_NAMES = (
+    'Almeida', 'Barbosa', 'Cardoso', 'Dias', 'Esteves', 'Ferreira', 'Gomes', 'Holanda', 'Lima', 'Moura',
+    'Nogueira', 'Oliveira', 'Pereira', 'Queiroz', 'Ribeiro', 'Santos', 'Teixeira', 'Vasconcelos'
+)
+ROLES = ('Mestre', 'Diretor de Harmonia', 'Puxador', 'Coordenação')
+
+def generate_members(count, seed=42):
+    """
+    Gera membros sintéticos distribuídos igualmente entre os instrumentos.
+    
+    Args:
+        count (int): Quantidade de membros
+        seed (int): Semente do gerador
+    
+    Returns:
+        list: Payloads no formato aceito por POST /api/members
+    """
+    rng = random.Random(seed)
+    instruments = list(INSTRUMENTS)
+    members = []
+    
+    for index in range(count):
+        member = {
+            'name': f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {index:05d}",
+            'instrument': instruments[index % len(instruments)]
+        }
+        # Uma parte dos membros tem função, como no elenco real
+        if rng.random() < 0.1:
+            member['role'] = rng.choice(ROLES)
+        members.append(member)
+    
+    return members
+
+def generate_donations(count, seed=42):
+    """
+    Gera doações sintéticas com valores e doadores variados.
+    
+    Args:
+        count (int): Quantidade de doações
+        seed (int): Semente do gerador
+    
+    Returns:
+        list: Payloads no formato aceito por POST /api/donations
+    """
+    rng = random.Random(seed)
+    donations = []
+    
+    for index in range(count):
+        donation = {'amount': round(rng.uniform(5, 500), 2)}
+        # Parte das doações é anônima, como permite o formulário de doação
+        if rng.random() < 0.7:
+            first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            donation['donorName'] = f"{first_name} {last_name}"
+            donation['donorEmail'] = f"doador{index:05d}@exemplo.com"
+        donations.append(donation)
+    
+    return donations
+
+def seed_records(base_url, route, records, workers=8, timeout=10):
+    """
+    Cria registros via POST em uma rota da API, com requisições simultâneas.
+    
+    Args:
+        base_url (str): URL base do site ou do stub
+        route (str): Rota da API, ex: '/api/members'
+        records (list): Payloads a enviar
+        workers (int): Requisições simultâneas
+        timeout (float): Tempo limite de cada requisição em segundos
+    
+    Returns:
+        dict: created, failed e seconds
+    """
+    endpoint = f"{base_url.rstrip('/')}{route}"
+    # Uma sessão por worker: o pool de conexões do requests não é compartilhável entre threads
+    local = threading.local()
+    sessions = []
+    
+    def post(record):
+        session = getattr(local, 'session', None)
+        if session is None:
+            session = local.session = requests.Session()
+            sessions.append(session)
+        try:
+            return session.post(endpoint, json=record, timeout=timeout).status_code == 201
+        except requests.RequestException as e:
+            logger.debug(f"Falha ao criar registro em {route}: {str(e)}")
+            return False
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="seed") as pool:
+        created = sum(pool.map(post, records))
+    elapsed = time.perf_counter() - started
+    
+    for session in sessions:
+        session.close()
+    
+    failed = len(records) - created
+    if failed:
+        logger.warning(f"⚠️ {failed} de {len(records)} registros não foram criados em {route}")
+    logger.info(f"🌱 {created} registros criados em {route} em {elapsed:.1f}s ({created / elapsed if elapsed else 0:.0f}/s)")
+    
+    return {'created': created, 'failed': failed, 'seconds': round(elapsed, 3)}
+
+def seed_members(base_url, members, workers=8, timeout=10):
+    """
+    Cria os membros via POST /api/members.
+    
+    Args:
+        base_url (str): URL base do site ou do stub
+        members (list): Payloads a enviar
+        workers (int): Requisições simultâneas
+        timeout (float): Tempo limite de cada requisição em segundos
+    
+    Returns:
+        dict: created, failed e seconds
+    """
+    return seed_records(base_url, '/api/members', members, workers, timeout)
+
+def seed_donations(base_url, donations, workers=8, timeout=10):
+    """
+    Cria as doações via POST /api/donations (todas com status PENDING, como na rota real).
+    
+    Args:
+        base_url (str): URL base do site ou do stub
+        donations (list): Payloads a enviar
+        workers (int): Requisições simultâneas
+        timeout (float): Tempo limite de cada requisição em segundos
+    
+    Returns:
+        dict: created, failed e seconds
+    """
+    return seed_records(base_url, '/api/donations', donations, workers, timeout)
\ No newline at end of file
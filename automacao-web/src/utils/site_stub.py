@@ -0,0 +1,468 @@
+"""
+Servidor local que substitui o backend do site em testes de escala.
+Implementa o mesmo contrato das rotas de API do Next.js (/api/members e
+/api/donations) sobre dados em memória e serve páginas que reproduzem a
+marcação e a renderização condicional dos componentes, alimentadas por essas
+rotas: a seção de membros (o Members.tsx usa uma lista fixa e não consulta a
+API) e o painel administrativo (permite criar volumes grandes sem gravar no
+banco do site).
+"""
+import json
+import threading
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.utils.logger import logger
+
+# Enum Instrument do schema Prisma, na ordem em que as seções aparecem no site
+INSTRUMENTS = {
+    'MESTRES': ('Mestres', 'Liderança musical e coordenação do bloco'),
+    'HARMONIA': ('Harmonia', 'Base melódica do bloco'),
+    'CAIXA': ('Caixa', 'Percussão de base e marcação'),
+    'REPINIQUE': ('Repinique', 'Percussão de chamada e condução'),
+    'SURDO': ('Surdo', 'Percussão grave e base rítmica'),
+    'XEQUERE_GANZA': ('Xequerê & Ganzá', 'Percussão complementar e texturas'),
+    'TAMBORIM': ('Tamborim', 'Percussão aguda e detalhes rítmicos')
+}
+
+# Página de membros: mesma estrutura de classes do Members.tsx (os localizadores
+# do MembersPage funcionam sem alteração), com o elenco vindo de GET /api/members
+MEMBERS_PAGE = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="utf-8">
+<title>Bloco Praieira - Membros (stub de escala)</title>
+<style>
+  body { background: #000; color: #fff; font-family: sans-serif; margin: 0; }
+  .max-w-4xl { max-width: 56rem; margin: 0 auto; padding: 2rem 1rem; }
+  .glassmorphism { background: rgba(255, 255, 255, .05); border: 1px solid rgba(255, 255, 255, .1); border-radius: 12px; margin-bottom: 1rem; }
+  .glassmorphism > button { width: 100%; padding: 1.5rem; text-align: left; display: flex; justify-content: space-between; background: none; border: 0; color: inherit; cursor: pointer; }
+  .grid { display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin-top: 1rem; }
+  .bg-black\\/30 { background: rgba(0, 0, 0, .3); padding: 1rem; border-radius: 8px; border: 1px solid rgba(255, 255, 255, .1); }
+  .px-6 { padding: 0 1.5rem 1.5rem; }
+</style>
+</head>
+<body>
+<section class="py-20 px-4">
+  <div class="max-w-4xl mx-auto">
+    <div class="text-center mb-12">
+      <h2 class="text-4xl md:text-5xl font-bold mb-4"><span class="gradient-text">Nossos Membros</span></h2>
+      <p class="text-xl text-gray-300">Conheça os integrantes que fazem a magia do carnaval acontecer</p>
+    </div>
+    <div id="sections" class="space-y-4"></div>
+    <div class="mt-12 text-center glassmorphism p-6">
+      <h3 class="text-2xl font-semibold mb-4 text-neon-blue neon-text">Quer fazer parte do Bloco Praieira?</h3>
+      <a href="mailto:blocopraieira@gmail.com">Entrar em Contato</a>
+    </div>
+  </div>
+</section>
+<script>
+const SECTIONS = __SECTIONS__;
+
+function memberCard(member) {
+  const card = document.createElement('div');
+  card.className = 'bg-black/30 p-4 rounded-lg border border-white/10 hover:border-white/20 transition-colors';
+  const name = document.createElement('h4');
+  name.className = 'font-semibold text-white';
+  name.textContent = member.name;
+  card.appendChild(name);
+  if (member.role) {
+    const role = document.createElement('p');
+    role.className = 'text-sm mt-1';
+    role.textContent = member.role;
+    card.appendChild(role);
+  }
+  return card;
+}
+
+// Como no React, o conteúdo da seção é criado ao abrir e removido ao fechar
+function toggle(section, members) {
+  const details = section.querySelector(':scope > .border-t');
+  if (details) {
+    details.remove();
+    return;
+  }
+  const content = document.createElement('div');
+  content.className = 'px-6 pb-6 border-t border-white/10';
+  const grid = document.createElement('div');
+  grid.className = 'grid grid-cols-1 md:grid-cols-2 gap-4 mt-4';
+  members.forEach(member => grid.appendChild(memberCard(member)));
+  content.appendChild(grid);
+  const total = document.createElement('div');
+  total.className = 'mt-4 text-center';
+  total.innerHTML = '<p class="text-gray-400 text-sm">Total de membros: <span class="text-white font-semibold"></span></p>';
+  total.querySelector('span').textContent = members.length;
+  content.appendChild(total);
+  section.appendChild(content);
+}
+
+function render(grouped) {
+  const container = document.getElementById('sections');
+  SECTIONS.forEach(([key, title, description]) => {
+    const members = grouped[key] || [];
+    const section = document.createElement('div');
+    section.className = 'glassmorphism overflow-hidden';
+    const button = document.createElement('button');
+    button.className = 'w-full p-6 text-left flex items-center justify-between hover:bg-white/5 transition-colors';
+    button.innerHTML = '<div><h3 class="text-2xl font-semibold neon-text"></h3><p class="text-gray-400 mt-1"></p></div><div class="transform transition-transform duration-300">&#9662;</div>';
+    button.querySelector('h3').textContent = title;
+    button.querySelector('p').textContent = description;
+    button.addEventListener('click', () => toggle(section, members));
+    section.appendChild(button);
+    container.appendChild(section);
+  });
+  document.body.dataset.ready = 'true';
+}
+
+fetch('/api/members').then(response => response.json()).then(render);
+</script>
+</body>
+</html>
+"""
+
+# Painel administrativo: mesma estrutura do AdminDashboard.tsx (tela de carregamento,
+# abas com contadores, formulário de novo membro e tabelas), com os mesmos fetches
+ADMIN_PAGE = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="utf-8">
+<title>Bloco Praieira - Admin (stub de escala)</title>
+<style>
+  body { background: #000; color: #fff; font-family: sans-serif; margin: 0; }
+  .max-w-6xl { max-width: 72rem; margin: 0 auto; padding: 1.5rem; }
+  .glassmorphism { background: rgba(255, 255, 255, .05); border: 1px solid rgba(255, 255, 255, .1); border-radius: 12px; padding: 1.5rem; margin-bottom: 1.5rem; }
+  table { width: 100%; border-collapse: collapse; }
+  td, th { text-align: left; padding: .75rem 1rem; border-bottom: 1px solid #333; }
+  button { padding: .75rem 1.5rem; border-radius: 8px; border: 0; margin-right: 1rem; cursor: pointer; }
+</style>
+</head>
+<body>
+<div id="root"></div>
+<script>
+const INSTRUMENTS = ['MESTRES', 'HARMONIA', 'CAIXA', 'REPINIQUE', 'SURDO', 'XEQUERE_GANZA', 'TAMBORIM'];
+const state = {activeTab: 'members', members: [], donations: [], totalDonations: 0, loading: true};
+const root = document.getElementById('root');
+
+function el(tag, className, text) {
+  const node = document.createElement(tag);
+  if (className) node.className = className;
+  if (text !== undefined) node.textContent = text;
+  return node;
+}
+
+function table(headers, rows) {
+  const wrapper = el('div', 'overflow-x-auto');
+  const element = el('table', 'w-full');
+  const head = el('tr', 'border-b border-gray-700');
+  headers.forEach(header => head.appendChild(el('th', 'text-left py-3 px-4', header)));
+  element.appendChild(el('thead')).appendChild(head);
+  const body = el('tbody');
+  rows.forEach(cells => {
+    const row = el('tr', 'border-b border-gray-800');
+    cells.forEach(cell => row.appendChild(cell));
+    body.appendChild(row);
+  });
+  element.appendChild(body);
+  wrapper.appendChild(element);
+  return wrapper;
+}
+
+function date(value) {
+  return new Date(value).toLocaleDateString('pt-BR');
+}
+
+function membersTab() {
+  const container = el('div', 'space-y-6');
+  const form = el('div', 'glassmorphism p-6');
+  form.appendChild(el('h2', 'text-2xl font-semibold mb-4 text-neon-green', 'Adicionar Novo Membro'));
+  const grid = el('div', 'grid md:grid-cols-4 gap-4');
+  const name = el('input', 'bg-gray-800 border border-gray-600 rounded-lg px-4 py-2 text-white');
+  name.placeholder = 'Nome';
+  const role = el('input', 'bg-gray-800 border border-gray-600 rounded-lg px-4 py-2 text-white');
+  role.placeholder = 'Função (opcional)';
+  const instrument = el('select', 'bg-gray-800 border border-gray-600 rounded-lg px-4 py-2 text-white');
+  INSTRUMENTS.forEach(value => {
+    const option = el('option', '', value.replace('_', ' & '));
+    option.value = value;
+    instrument.appendChild(option);
+  });
+  const add = el('button', 'bg-neon-green text-black font-semibold py-2 px-4 rounded-lg', 'Adicionar');
+  add.disabled = true;
+  name.addEventListener('input', () => { add.disabled = !name.value; });
+  add.addEventListener('click', () => addMember({name: name.value, role: role.value, instrument: instrument.value}));
+  [name, role, instrument, add].forEach(node => grid.appendChild(node));
+  form.appendChild(grid);
+  container.appendChild(form);
+  
+  const list = el('div', 'glassmorphism p-6');
+  list.appendChild(el('h2', 'text-2xl font-semibold mb-4 text-neon-green', 'Lista de Membros'));
+  list.appendChild(table(['Nome', 'Função', 'Instrumento', 'Data de Entrada'], state.members.map(member => [
+    el('td', 'py-3 px-4 font-semibold', member.name),
+    el('td', 'py-3 px-4 text-gray-300', member.role || '-'),
+    el('td', 'py-3 px-4 text-neon-blue', member.instrument.replace('_', ' & ')),
+    el('td', 'py-3 px-4 text-gray-400', date(member.joinedAt))
+  ])));
+  container.appendChild(list);
+  return container;
+}
+
+function donationsTab() {
+  const container = el('div', 'space-y-6');
+  const summary = el('div', 'grid md:grid-cols-3 gap-6');
+  const average = state.donations.length ? (state.totalDonations / state.donations.length).toFixed(2) : '0.00';
+  [['Total Arrecadado', 'R$ ' + state.totalDonations.toFixed(2)], ['Total de Doações', String(state.donations.length)],
+   ['Média por Doação', 'R$ ' + average]].forEach(([title, value]) => {
+    const card = el('div', 'glassmorphism p-6 text-center');
+    card.appendChild(el('h3', 'text-lg font-semibold mb-2', title));
+    card.appendChild(el('p', 'text-3xl font-bold text-white', value));
+    summary.appendChild(card);
+  });
+  container.appendChild(summary);
+  
+  const list = el('div', 'glassmorphism p-6');
+  list.appendChild(el('h2', 'text-2xl font-semibold mb-4 text-neon-pink', 'Histórico de Doações'));
+  list.appendChild(table(['Valor', 'Doador', 'Status', 'Data'], state.donations.map(donation => {
+    const status = el('td', 'py-3 px-4');
+    status.appendChild(el('span', 'px-2 py-1 rounded text-xs font-semibold', donation.status));
+    return [
+      el('td', 'py-3 px-4 font-semibold text-neon-green', 'R$ ' + donation.amount.toFixed(2)),
+      el('td', 'py-3 px-4', donation.donorName || 'Anônimo'),
+      status,
+      el('td', 'py-3 px-4 text-gray-400', date(donation.createdAt))
+    ];
+  })));
+  container.appendChild(list);
+  return container;
+}
+
+// Como no React, cada mudança de estado renderiza a árvore novamente
+function render() {
+  root.replaceChildren();
+  if (state.loading) {
+    const loading = el('div', 'min-h-screen bg-black flex items-center justify-center');
+    loading.appendChild(el('p', 'text-white', 'Carregando...'));
+    root.appendChild(loading);
+    return;
+  }
+  const page = el('div', 'min-h-screen bg-black text-white');
+  const header = el('header', 'bg-gray-900 p-6 border-b border-gray-800');
+  header.appendChild(el('h1', 'text-3xl font-bold gradient-text', 'Admin - Bloco Praieira'));
+  header.appendChild(el('p', 'text-gray-400 mt-2', 'Painel administrativo'));
+  page.appendChild(header);
+  const content = el('div', 'max-w-6xl mx-auto p-6');
+  const tabs = el('div', 'flex space-x-4 mb-8');
+  [['members', 'Membros (' + state.members.length + ')'],
+   ['donations', 'Doações (R$ ' + state.totalDonations.toFixed(2) + ')']].forEach(([tab, label]) => {
+    const button = el('button', 'px-6 py-3 rounded-lg font-semibold transition-colors', label);
+    button.addEventListener('click', () => { state.activeTab = tab; render(); });
+    tabs.appendChild(button);
+  });
+  content.appendChild(tabs);
+  content.appendChild(state.activeTab === 'members' ? membersTab() : donationsTab());
+  page.appendChild(content);
+  root.appendChild(page);
+}
+
+async function fetchData() {
+  state.loading = true;
+  render();
+  const membersRes = await fetch('/api/members');
+  if (membersRes.ok) state.members = Object.values(await membersRes.json()).flat();
+  const donationsRes = await fetch('/api/donations');
+  if (donationsRes.ok) {
+    const data = await donationsRes.json();
+    state.donations = data.donations;
+    state.totalDonations = data.totalAmount;
+  }
+  state.loading = false;
+  render();
+}
+
+async function addMember(member) {
+  const res = await fetch('/api/members', {
+    method: 'POST', headers: {'Content-Type': 'application/json'}, body: JSON.stringify(member)
+  });
+  if (res.ok) fetchData();
+}
+
+fetchData();
+</script>
+</body>
+</html>
+"""
+
+def _now():
+    """Instante atual no formato ISO usado pelo Prisma na serialização JSON."""
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+class SiteStub:
+    """Servidor HTTP local com as rotas de API do site sobre dados em memória."""
+    
+    def __init__(self, host='127.0.0.1', port=0):
+        """
+        Inicializa o servidor (sem iniciá-lo).
+        
+        Args:
+            host (str): Interface de escuta
+            port (int): Porta (0 = escolhida pelo sistema)
+        """
+        self.host = host
+        self.port = port
+        self.members = []
+        self.donations = []
+        self.pages = {'/': self._members_page, '/admin': lambda: ADMIN_PAGE}
+        self._lock = threading.Lock()
+        self._server = None
+    
+    @property
+    def base_url(self):
+        """URL base do servidor em execução."""
+        return f"http://{self.host}:{self._server.server_port}"
+    
+    def start(self):
+        """
+        Inicia o servidor em uma thread em segundo plano.
+        
+        Returns:
+            str: URL base do servidor
+        """
+        stub = self
+        
+        class StubHandler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Cabeçalho e corpo saem em escritas separadas; sem isso o Nagle somado ao
+            # ACK atrasado limita cada conexão keep-alive a ~25 requisições/s
+            disable_nagle_algorithm = True
+            
+            def do_GET(self):
+                stub._dispatch(self, 'GET')
+            
+            def do_POST(self):
+                stub._dispatch(self, 'POST')
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self._server = ThreadingHTTPServer((self.host, self.port), StubHandler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="site-stub", daemon=True).start()
+        logger.info(f"🧪 Stub do site disponível em {self.base_url}")
+        return self.base_url
+    
+    def stop(self):
+        """Encerra o servidor."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+    
+    def _dispatch(self, handler, method):
+        """Encaminha a requisição para a rota correspondente."""
+        path = handler.path.split('?')[0].rstrip('/') or '/'
+        
+        if method == 'GET' and path in self.pages:
+            self._send(handler, 200, self.pages[path](), 'text/html; charset=utf-8')
+            return
+        
+        route = getattr(self, f"_{method.lower()}_{path.strip('/').replace('/', '_')}", None)
+        if route is None:
+            self._send(handler, 404, {'error': 'Not found'})
+            return
+        
+        body = None
+        if method == 'POST':
+            length = int(handler.headers.get('Content-Length', 0))
+            try:
+                body = json.loads(handler.rfile.read(length) or b'{}')
+            except ValueError:
+                self._send(handler, 400, {'error': 'Invalid JSON'})
+                return
+        
+        status, payload = route(body) if body is not None else route()
+        self._send(handler, status, payload)
+    
+    def _send(self, handler, status, payload, content_type='application/json'):
+        """Envia a resposta."""
+        data = payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False)
+        data = data.encode('utf-8')
+        handler.send_response(status)
+        handler.send_header('Content-Type', content_type)
+        handler.send_header('Content-Length', str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+    
+    def _members_page(self):
+        """HTML da página de membros."""
+        sections = [[key, title, description] for key, (title, description) in INSTRUMENTS.items()]
+        return MEMBERS_PAGE.replace('__SECTIONS__', json.dumps(sections, ensure_ascii=False))
+    
+    # Rotas com o mesmo contrato de src/app/api/members/route.ts
+    
+    def _get_api_members(self):
+        """Membros ativos agrupados por instrumento, ordenados por instrumento e nome."""
+        with self._lock:
+            active = sorted(
+                (member for member in self.members if member['isActive']),
+                key=lambda member: (member['instrument'], member['name'])
+            )
+        
+        grouped = {}
+        for member in active:
+            grouped.setdefault(member['instrument'], []).append(member)
+        return 200, grouped
+    
+    def _post_api_members(self, body):
+        """Cria um membro (nome e instrumento obrigatórios)."""
+        name, instrument = body.get('name'), body.get('instrument')
+        if not name or not instrument:
+            return 400, {'error': 'Name and instrument are required'}
+        if instrument not in INSTRUMENTS:
+            return 500, {'error': 'Failed to create member'}
+        
+        now = _now()
+        member = {
+            'id': uuid.uuid4().hex,
+            'name': name,
+            'role': body.get('role') or None,
+            'instrument': instrument,
+            'isActive': True,
+            'joinedAt': now,
+            'createdAt': now,
+            'updatedAt': now
+        }
+        with self._lock:
+            self.members.append(member)
+        return 201, member
+    
+    # Rotas com o mesmo contrato de src/app/api/donations/route.ts
+    
+    def _get_api_donations(self):
+        """Últimas 50 doações e soma das concluídas."""
+        with self._lock:
+            latest = sorted(self.donations, key=lambda donation: donation['createdAt'], reverse=True)[:50]
+            total = sum(donation['amount'] for donation in self.donations if donation['status'] == 'COMPLETED')
+        return 200, {'donations': latest, 'totalAmount': total}
+    
+    def _post_api_donations(self, body):
+        """Cria uma doação pendente (valor positivo obrigatório)."""
+        try:
+            amount = float(body.get('amount') or 0)
+        except (TypeError, ValueError):
+            amount = 0
+        if amount <= 0:
+            return 400, {'error': 'Valid amount is required'}
+        
+        now = _now()
+        donation = {
+            'id': uuid.uuid4().hex,
+            'amount': amount,
+            'donorName': body.get('donorName') or None,
+            'donorEmail': body.get('donorEmail') or None,
+            'pixKey': body.get('pixKey') or 'blocopraieira@gmail.com',
+            'status': 'PENDING',
+            'createdAt': now,
+            'updatedAt': now
+        }
+        with self._lock:
+            self.donations.append(donation)
+        return 201, donation
\ No newline at end of file
@@ -0,0 +1,184 @@
+"""
+Rastreamento da execução no formato Trace Event do Chrome.
+Registra spans de estratégias, testes, ações dos Page Objects, comandos
+WebDriver, screenshots e exportação de relatórios, com uma trilha por
+navegador, em um JSON que abre no Perfetto (ui.perfetto.dev) ou em
+chrome://tracing. Intervalos sem comandos dentro de um teste revelam esperas
+fixas (time.sleep) e trilhas ociosas revelam gargalos seriais.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from src.utils.logger import logger
+
+# Trilha dos eventos sem navegador associado (ex: exportação dos relatórios)
+EXECUTOR_TRACK = 0
+
+class TraceRecorder:
+    """Classe singleton que acumula os eventos de trace da execução."""
+    
+    _instance = None
+    _initialized = False
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(TraceRecorder, cls).__new__(cls)
+        return cls._instance
+    
+    def __init__(self):
+        if not self._initialized:
+            self.enabled = False
+            self.path = None
+            self._events = deque()
+            self._tracks = {}
+            self._track_names = {}
+            self._lock = threading.Lock()
+            self._origin = time.perf_counter()
+            self._initialized = True
+    
+    def enable(self, path=None, max_events=None):
+        """
+        Ativa o rastreamento.
+        
+        Args:
+            path (str): Arquivo de destino (padrão: um arquivo por execução em REPORTS_DIR)
+            max_events (int): Máximo de eventos mantidos em memória; os mais antigos são descartados
+        """
+        self.enabled = True
+        self.path = path
+        self._events = deque(self._events, maxlen=max_events or None)
+        logger.info("🧵 Rastreamento da execução ativado (Trace Event / Perfetto)")
+    
+    def _timestamp(self, started):
+        """Converte um instante de perf_counter em microssegundos desde a origem do trace."""
+        return round((started - self._origin) * 1_000_000, 3)
+    
+    def _track(self, driver):
+        """
+        Retorna a trilha do navegador, criando-a no primeiro uso.
+        O ManagedDriver é resolvido para o WebDriver em uso, então um navegador
+        substituído pelo watchdog ganha uma trilha nova.
+        """
+        if driver is None:
+            return EXECUTOR_TRACK
+        
+        driver = getattr(driver, 'wrapped_driver', driver)
+        key = id(driver)
+        
+        with self._lock:
+            entry = self._tracks.get(key)
+            if entry is not None and entry[0] is driver:
+                return entry[1]
+            
+            track = len(self._track_names) + 1
+            browser = getattr(driver, 'name', None) or 'navegador'
+            self._tracks[key] = (driver, track)
+            self._track_names[track] = f"{browser} #{track} ({threading.current_thread().name})"
+            return track
+    
+    def complete(self, name, category, started, elapsed, driver=None, **args):
+        """
+        Registra um span já concluído.
+        
+        Args:
+            name (str): Nome do span
+            category (str): Categoria ('strategy', 'test', 'page', 'command', 'screenshot', 'export')
+            started (float): Início, em time.perf_counter()
+            elapsed (float): Duração em segundos
+            driver: Navegador dono da trilha (None = trilha do executor)
+            **args: Dados extras exibidos no Perfetto
+        """
+        if not self.enabled:
+            return
+        
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': self._timestamp(started),
+            'dur': round(elapsed * 1_000_000, 3),
+            'pid': os.getpid(),
+            'tid': self._track(driver)
+        }
+        if args:
+            event['args'] = args
+        
+        self._events.append(event)
+    
+    @contextmanager
+    def span(self, name, category, driver=None, **args):
+        """
+        Mede o bloco como um span. O dicionário retornado pode receber dados
+        extras até o fim do bloco (ex: resultado do teste).
+        
+        Args:
+            name (str): Nome do span
+            category (str): Categoria do span
+            driver: Navegador dono da trilha (None = trilha do executor)
+            **args: Dados extras exibidos no Perfetto
+        """
+        if not self.enabled:
+            yield args
+            return
+        
+        # A trilha é resolvida no início, antes de uma eventual troca do navegador
+        track_driver = getattr(driver, 'wrapped_driver', driver)
+        started = time.perf_counter()
+        try:
+            yield args
+        finally:
+            self.complete(name, category, started, time.perf_counter() - started, track_driver, **args)
+    
+    def save(self, path=None):
+        """
+        Grava os eventos acumulados e esvazia o buffer.
+        
+        Args:
+            path (str): Arquivo de destino (padrão: path informado em enable ou um novo arquivo em REPORTS_DIR)
+        
+        Returns:
+            Path: Arquivo gravado, ou None se o rastreamento estiver desativado
+        """
+        if not self.enabled:
+            return None
+        
+        from config.settings import Config
+        path = path or self.path or Config().get_trace_file_path()
+        
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+            track_names = dict(self._track_names)
+        
+        pid = os.getpid()
+        metadata = [
+            {'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': EXECUTOR_TRACK,
+             'args': {'name': 'Automação Bloco Praieira'}},
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': EXECUTOR_TRACK,
+             'args': {'name': 'executor'}}
+        ]
+        for track, track_name in track_names.items():
+            metadata.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': track, 'args': {'name': track_name}})
+            metadata.append({'name': 'thread_sort_index', 'ph': 'M', 'pid': pid, 'tid': track, 'args': {'sort_index': track}})
+        
+        try:
+            with Config().reserved_file(path), open(path, 'w', encoding='utf-8') as f:
+                f.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+                # Um evento por linha, sem montar o documento inteiro em memória
+                for position, event in enumerate(metadata + events):
+                    if position:
+                        f.write(',\n')
+                    f.write(json.dumps(event, ensure_ascii=False))
+                f.write('\n]}\n')
+            logger.info(f"🧵 Trace exportado: {path} ({len(events)} eventos; abra em https://ui.perfetto.dev)")
+        except OSError as e:
+            logger.error(f"❌ Erro ao gravar trace em {path}: {str(e)}")
+            return None
+        
+        return path
+
+# Instância global do rastreamento
+tracer = TraceRecorder()
\ No newline at end of file
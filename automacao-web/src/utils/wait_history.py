@@ -0,0 +1,157 @@
+"""
+Histórico de latência de aparecimento dos elementos.
+Cada espera bem-sucedida dos Page Objects registra quanto o elemento levou
+para aparecer, por site, navegador (local ou remoto), viewport, perfil de
+emulação, página e localizador. Com amostras suficientes, a espera seguinte
+usa um tempo limite derivado do histórico (p99 × fator, entre um mínimo e
+MAX_WAIT_ELEMENTS): elementos ausentes falham em segundos, e os lentos mas
+saudáveis continuam com folga. Uma espera adaptativa que se esgota entra no
+histórico com o tempo esperado (amostra censurada), elevando o limite seguinte.
+"""
+import json
+import os
+import threading
+from urllib.parse import urlparse
+from config.settings import Config
+from src.utils.logger import logger
+from src.utils.scaling import percentile
+
+class LocatorLatencyHistory:
+    """Classe singleton que guarda as latências por localizador e deriva tempos limite."""
+    
+    _instance = None
+    _initialized = False
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(LocatorLatencyHistory, cls).__new__(cls)
+        return cls._instance
+    
+    def __init__(self):
+        if not self._initialized:
+            self.path = None
+            self._samples = None
+            self._dirty = False
+            self._lock = threading.Lock()
+            self._initialized = True
+    
+    def _load(self):
+        """Carrega o histórico salvo (chamado com o lock adquirido)."""
+        config = Config()
+        self.path = config.get_locator_latency_path()
+        self._samples = {}
+        
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                self._samples = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Histórico de latência dos localizadores ignorado: {str(e)}")
+    
+    def context(self, driver):
+        """
+        Contexto de execução do documento carregado no navegador.
+        
+        Args:
+            driver: Instância do WebDriver (ou ManagedDriver)
+        
+        Returns:
+            str: Contexto 'site|navegador|viewport|emulação', ou None se o documento
+            não for do BASE_URL (ex: stub local dos testes de escala)
+        """
+        try:
+            host = urlparse(driver.current_url).netloc
+        except Exception:
+            return None
+        if host != urlparse(Config().BASE_URL).netloc:
+            return None
+        
+        emulation = getattr(driver, 'emulation', None)
+        viewport = getattr(driver, 'viewport', None)
+        wrapped = getattr(driver, 'wrapped_driver', driver)
+        # Sessões remotas (Selenium Grid) não têm o serviço local do driver
+        browser = getattr(wrapped, 'name', '') + ('' if hasattr(wrapped, 'service') else '@remoto')
+        return '|'.join([
+            host,
+            browser,
+            'x'.join(map(str, viewport)) if viewport else '',
+            emulation.name if emulation else ''
+        ])
+    
+    def key(self, context, page, locator):
+        """
+        Monta a chave de um localizador.
+        
+        Args:
+            context (str): Contexto de execução (ver context)
+            page (str): Nome do Page Object
+            locator (tuple): Localizador (By, valor)
+        
+        Returns:
+            str: Chave 'contexto|página|by=valor', ou None sem contexto
+        """
+        if context is None:
+            return None
+        return f"{context}|{page}|{locator[0]}={locator[1]}"
+    
+    def record(self, key, seconds):
+        """
+        Registra quanto um elemento levou para aparecer.
+        
+        Args:
+            key (str): Chave do localizador
+            seconds (float): Latência observada
+        """
+        limit = Config().ADAPTIVE_TIMEOUT_SAMPLES
+        with self._lock:
+            if self._samples is None:
+                self._load()
+            samples = self._samples.setdefault(key, [])
+            samples.append(round(seconds * 1000))
+            del samples[:-limit]
+            self._dirty = True
+    
+    def timeout_for(self, key):
+        """
+        Deriva o tempo limite de um localizador a partir do histórico.
+        
+        Args:
+            key (str): Chave do localizador
+        
+        Returns:
+            tuple: Tempo limite em segundos e p99 observado em ms (None sem histórico suficiente)
+        """
+        config = Config()
+        if not config.ADAPTIVE_TIMEOUTS:
+            return config.MAX_WAIT_ELEMENTS, None
+        
+        with self._lock:
+            if self._samples is None:
+                self._load()
+            samples = self._samples.get(key)
+            if not samples or len(samples) < config.ADAPTIVE_TIMEOUT_MIN_SAMPLES:
+                return config.MAX_WAIT_ELEMENTS, None
+            p99 = percentile(samples, 0.99)
+        
+        timeout = p99 / 1000 * config.ADAPTIVE_TIMEOUT_FACTOR
+        return min(max(timeout, config.ADAPTIVE_TIMEOUT_MIN), config.MAX_WAIT_ELEMENTS), p99
+    
+    def save(self):
+        """Grava o histórico, se houve novas amostras."""
+        with self._lock:
+            if not self._dirty:
+                return
+            samples = json.dumps(self._samples, ensure_ascii=False)
+            self._dirty = False
+        
+        temporary = self.path.with_suffix('.tmp')
+        try:
+            with open(temporary, 'w', encoding='utf-8') as f:
+                f.write(samples)
+            os.replace(temporary, self.path)
+        except OSError as e:
+            logger.error(f"❌ Erro ao gravar o histórico de latência dos localizadores: {str(e)}")
+
+# Instância global do histórico de latência dos localizadores
+wait_history = LocatorLatencyHistory()
\ No newline at end of file
@@ -0,0 +1,221 @@
+"""
+Aquecimento do servidor de desenvolvimento antes dos testes.
+Com 'npm run dev' o Next.js compila cada página, rota de API e chunk na
+primeira requisição, e o primeiro teste que os visita absorve essa
+compilação (às vezes estourando PAGE_LOAD_TIMEOUT). O aquecimento requisita
+em paralelo todas as páginas, rotas de API e chunks referenciados pelo HTML,
+repetindo até as respostas estabilizarem, e registra a latência fria e a
+quente de cada uma para separar o custo de compilação do desempenho do site.
+"""
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse
+from config.settings import Config
+from src.utils.logger import logger
+from src.utils.result_cache import DEVELOPMENT_BUILD_ID, extract_build_id
+
+# Páginas (src/app/**/page.tsx) e rotas GET de API (src/app/api/**/route.ts) do site
+PAGE_PATHS = ('/', '/admin')
+API_PATHS = ('/api/members', '/api/donations')
+
+# Chunks e folhas de estilo referenciados pelo HTML das páginas
+CHUNK_PATTERN = re.compile(r'(?:src|href)="(/_next/static/[^"?#]+\.(?:js|css))"')
+
+# Uma resposta está quente quando fica abaixo deste limite ou varia menos que
+# esta fração em relação à rodada anterior
+WARM_LATENCY_MS = 150
+WARM_STABLE_RATIO = 0.25
+
+class DevServerWarmup:
+    """Classe singleton que aquece as rotas do site e guarda as latências fria e quente."""
+    
+    _instance = None
+    _initialized = False
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(DevServerWarmup, cls).__new__(cls)
+        return cls._instance
+    
+    def __init__(self):
+        if not self._initialized:
+            self.targets = {}
+            self.build_id = None
+            self.seconds = None
+            self._session = None
+            self._lock = threading.Lock()
+            self._initialized = True
+    
+    def _fetch(self, url, timeout):
+        """
+        Requisita uma URL e mede a latência até o fim do corpo.
+        
+        Args:
+            url (str): URL a requisitar
+            timeout (float): Tempo limite em segundos
+        
+        Returns:
+            tuple: Latência em ms, código HTTP (None em erro de conexão) e corpo (apenas HTML)
+        """
+        started = time.perf_counter()
+        try:
+            response = self._session.get(url, timeout=timeout)
+            body = response.text if 'text/html' in response.headers.get('Content-Type', '') else None
+            status = response.status_code
+        except Exception as e:
+            logger.debug(f"Aquecimento de {url} falhou: {str(e)}")
+            body, status = None, None
+        return (time.perf_counter() - started) * 1000, status, body
+    
+    def _add_target(self, url, kind):
+        """Inclui uma URL no aquecimento (chamado com o lock adquirido)."""
+        if url not in self.targets:
+            self.targets[url] = {'kind': kind, 'samples': [], 'status': None, 'warm': False}
+    
+    def _discover_chunks(self, base_url, html):
+        """Inclui os chunks referenciados por uma página."""
+        with self._lock:
+            for path in CHUNK_PATTERN.findall(html):
+                self._add_target(urljoin(base_url, path), 'chunk')
+    
+    def _visit(self, base_url, url, timeout):
+        """Requisita uma URL e atualiza o seu estado de aquecimento."""
+        latency, status, body = self._fetch(url, timeout)
+        
+        with self._lock:
+            target = self.targets[url]
+            previous = target['samples'][-1] if target['samples'] else None
+            target['samples'].append(round(latency, 1))
+            target['status'] = status
+            
+            # Erros 5xx e de conexão costumam ser compilações em andamento: tenta na próxima rodada
+            if status is not None and status < 500:
+                target['warm'] = latency <= WARM_LATENCY_MS or (
+                    previous is not None and abs(latency - previous) <= previous * WARM_STABLE_RATIO
+                )
+        
+        if body and target['kind'] == 'page':
+            if self.build_id is None:
+                self.build_id = extract_build_id(body)
+            self._discover_chunks(base_url, body)
+    
+    def run(self, base_url=None, force=False):
+        """
+        Aquece o site: todas as páginas e rotas na primeira rodada, depois os
+        chunks descobertos, repetindo apenas o que ainda não estabilizou.
+        
+        Args:
+            base_url (str): URL base do site (padrão: BASE_URL)
+            force (bool): Aquece mesmo se o site for um build de produção
+        
+        Returns:
+            dict: Resumo do aquecimento, ou None se ignorado
+        """
+        config = Config()
+        base_url = (base_url or config.BASE_URL).rstrip('/')
+        started = time.perf_counter()
+        
+        try:
+            import requests
+            from requests.adapters import HTTPAdapter
+        except ImportError:
+            logger.warning("⚠️ Biblioteca 'requests' não disponível. Pulando aquecimento do servidor.")
+            return None
+        
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config.WARMUP_WORKERS)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        
+        self.targets = {}
+        self.build_id = None
+        with self._lock:
+            for path in PAGE_PATHS:
+                self._add_target(base_url + path, 'page')
+            for path in API_PATHS:
+                self._add_target(base_url + path, 'api')
+        
+        logger.info(f"🔥 Aquecendo {base_url}: {len(PAGE_PATHS)} página(s) e {len(API_PATHS)} rota(s) de API")
+        
+        try:
+            with ThreadPoolExecutor(max_workers=config.WARMUP_WORKERS, thread_name_prefix='warmup') as pool:
+                for round_number in range(1, config.WARMUP_MAX_ROUNDS + 1):
+                    with self._lock:
+                        pending = [url for url, target in self.targets.items() if not target['warm']]
+                    if not pending:
+                        break
+                    
+                    list(pool.map(lambda url: self._visit(base_url, url, config.WARMUP_TIMEOUT), pending))
+                    
+                    # Build de produção não compila sob demanda: a primeira rodada basta
+                    if round_number == 1 and not force and self.build_id and self.build_id != DEVELOPMENT_BUILD_ID:
+                        logger.info(f"🔥 Build de produção ({self.build_id}): aquecimento dispensado")
+                        self.targets = {}
+                        return None
+        finally:
+            self._session.close()
+        
+        self.seconds = time.perf_counter() - started
+        summary = self.summary()
+        self._log_summary(summary)
+        return summary
+    
+    def summary(self):
+        """
+        Latência fria e quente de cada URL aquecida.
+        
+        Returns:
+            dict: Resumo para o relatório, ou None se não houve aquecimento
+        """
+        with self._lock:
+            if not self.targets:
+                return None
+            
+            entries = []
+            for url, target in self.targets.items():
+                samples = target['samples']
+                entries.append({
+                    'url': urlparse(url).path or '/',
+                    'kind': target['kind'],
+                    'status': target['status'],
+                    'cold_ms': samples[0] if samples else None,
+                    'warm_ms': samples[-1] if len(samples) > 1 else None,
+                    'requests': len(samples),
+                    'warm': target['warm']
+                })
+        
+        # Custo de compilação: quanto a primeira requisição levou além da latência quente
+        compile_ms = sum(
+            entry['cold_ms'] - entry['warm_ms'] for entry in entries
+            if entry['warm_ms'] is not None and entry['cold_ms'] > entry['warm_ms']
+        )
+        entries.sort(key=lambda entry: entry['cold_ms'] or 0, reverse=True)
+        
+        return {
+            'build_id': self.build_id,
+            'seconds': round(self.seconds, 3) if self.seconds is not None else None,
+            'compile_ms': round(compile_ms, 1),
+            'pages': sum(1 for entry in entries if entry['kind'] == 'page'),
+            'api_routes': sum(1 for entry in entries if entry['kind'] == 'api'),
+            'chunks': sum(1 for entry in entries if entry['kind'] == 'chunk'),
+            'not_warm': [entry['url'] for entry in entries if not entry['warm']],
+            'targets': entries
+        }
+    
+    def _log_summary(self, summary):
+        """Registra no log o resultado do aquecimento."""
+        logger.info(
+            f"🔥 Aquecimento concluído em {summary['seconds']}s: {summary['pages']} página(s), "
+            f"{summary['api_routes']} rota(s) de API e {summary['chunks']} chunk(s); "
+            f"compilação sob demanda estimada em {summary['compile_ms'] / 1000:.1f}s"
+        )
+        for entry in summary['targets']:
+            if entry['kind'] != 'chunk' and entry['warm_ms'] is not None:
+                logger.info(f"   🌡️ {entry['url']}: fria {entry['cold_ms']:.0f}ms → quente {entry['warm_ms']:.0f}ms")
+        if summary['not_warm']:
+            logger.warning(f"⚠️ Sem estabilizar após o aquecimento: {', '.join(summary['not_warm'][:5])}")
+
+# Instância global do aquecimento do servidor
+warmup = DevServerWarmup()
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""
+Watchdog de execução.
+Thread supervisora que impõe orçamentos de tempo por teste e para a execução
+completa, acionando um callback (normalmente matar o navegador travado) quando
+um comando do WebDriver não retorna dentro do prazo.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from src.utils.logger import logger
+
+class WatchdogGuard:
+    """Prazo ativo de uma operação supervisionada."""
+    
+    def __init__(self, label, deadline, on_timeout):
+        """
+        Inicializa o prazo.
+        
+        Args:
+            label (str): Descrição da operação supervisionada
+            deadline (float): Instante limite (time.monotonic)
+            on_timeout (callable): Chamado uma única vez se o prazo estourar
+        """
+        self.label = label
+        self.deadline = deadline
+        self.on_timeout = on_timeout
+        self.fired = False
+        self.reason = None
+
+class Watchdog:
+    """Supervisiona operações com prazo e o tempo total da execução."""
+    
+    def __init__(self, test_timeout, run_timeout=None):
+        """
+        Inicializa o watchdog.
+        
+        Args:
+            test_timeout (float): Tempo máximo por teste, em segundos
+            run_timeout (float): Tempo máximo da execução completa (None/0 = ilimitado)
+        """
+        self.test_timeout = test_timeout
+        self.run_timeout = run_timeout or None
+        self.run_expired = False
+        self._guards = set()
+        self._run_deadline = None
+        self._running = False
+        self._condition = threading.Condition()
+        self._thread = None
+    
+    def start(self):
+        """Inicia a thread supervisora e o relógio da execução."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self.run_expired = False
+            if self.run_timeout:
+                self._run_deadline = time.monotonic() + self.run_timeout
+        
+        self._thread = threading.Thread(target=self._loop, name="watchdog", daemon=True)
+        self._thread.start()
+        logger.debug(f"Watchdog iniciado (teste: {self.test_timeout}s, execução: {self.run_timeout}s)")
+    
+    def stop(self):
+        """Encerra a thread supervisora."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+    
+    @contextmanager
+    def guard(self, label, on_timeout, timeout=None):
+        """
+        Supervisiona um bloco de código com prazo.
+        
+        Args:
+            label (str): Descrição da operação
+            on_timeout (callable): Ação para destravar a operação (ex: matar o navegador)
+            timeout (float): Prazo em segundos (padrão: test_timeout)
+        
+        Yields:
+            WatchdogGuard: Estado do prazo; guard.fired indica estouro
+        """
+        timeout = timeout or self.test_timeout
+        guard = WatchdogGuard(label, time.monotonic() + timeout, on_timeout)
+        
+        with self._condition:
+            if self.run_expired:
+                guard.fired = True
+                guard.reason = 'run'
+            else:
+                self._guards.add(guard)
+                self._condition.notify_all()
+        
+        try:
+            yield guard
+        finally:
+            with self._condition:
+                self._guards.discard(guard)
+    
+    def _loop(self):
+        """Laço da thread supervisora."""
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+                
+                now = time.monotonic()
+                expired = []
+                
+                if self._run_deadline and now >= self._run_deadline and not self.run_expired:
+                    self.run_expired = True
+                    logger.error(f"⏰ Tempo total da execução esgotado ({self.run_timeout}s)")
+                    expired += [(guard, 'run') for guard in self._guards if not guard.fired]
+                else:
+                    expired += [(guard, 'test') for guard in self._guards if not guard.fired and now >= guard.deadline]
+                
+                # Marcados sob o lock: guard() e stop() não esperam pelos callbacks
+                for guard, reason in expired:
+                    guard.fired = True
+                    guard.reason = reason
+                
+                if not expired:
+                    deadlines = [guard.deadline for guard in self._guards if not guard.fired]
+                    if self._run_deadline and not self.run_expired:
+                        deadlines.append(self._run_deadline)
+                    
+                    wait_time = max(0.0, min(deadlines) - now) if deadlines else None
+                    self._condition.wait(wait_time)
+                    continue
+            
+            # Os callbacks (matar o navegador, DELETE da sessão remota) rodam fora do lock
+            for guard, reason in expired:
+                self._fire(guard, reason)
+    
+    def _fire(self, guard, reason):
+        """Dispara o callback de um prazo estourado (já marcado em guard.fired)."""
+        logger.error(f"⏰ Watchdog: '{guard.label}' excedeu o tempo limite ({reason})")
+        
+        try:
+            guard.on_timeout()
+        except Exception as e:
+            logger.error(f"❌ Erro no callback do watchdog: {str(e)}")
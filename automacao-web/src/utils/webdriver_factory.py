@@ -11,10 +11,56 @@ from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 from config.settings import Config
 from src.utils.logger import logger
+from src.utils.metrics import metrics
+from src.utils.tracing import tracer
+from src.utils.emulation import network_conditions
+import time
 
 class WebDriverFactory:
     """Factory para criação de WebDrivers com diferentes configurações."""
     
+    # Funções chamadas após cada comando WebDriver: listener(driver, command, started, elapsed)
+    _command_listeners = []
+    
+    @staticmethod
+    def add_command_listener(listener):
+        """
+        Registra uma função chamada após cada comando enviado ao WebDriver.
+        
+        Args:
+            listener (callable): Recebe (driver, comando, início em perf_counter, duração em segundos)
+        """
+        WebDriverFactory._command_listeners.append(listener)
+    
+    @staticmethod
+    def instrument_driver(driver):
+        """
+        Intercepta driver.execute para medir a latência de cada comando WebDriver.
+        Comandos disparados por WebElements também passam por driver.execute.
+        
+        Args:
+            driver: Instância do WebDriver
+            
+        Returns:
+            WebDriver: O próprio driver instrumentado
+        """
+        execute = driver.execute
+        
+        def timed_execute(driver_command, params=None):
+            started = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                elapsed = time.perf_counter() - started
+                for listener in WebDriverFactory._command_listeners:
+                    try:
+                        listener(driver, driver_command, started, elapsed)
+                    except Exception as e:
+                        logger.debug(f"Erro em listener de comando WebDriver: {str(e)}")
+        
+        driver.execute = timed_execute
+        return driver
+    
     @staticmethod
     def create_driver(browser_type="chrome"):
         """
@@ -30,16 +76,40 @@ class WebDriverFactory:
         
         logger.info(f"🌐 Criando WebDriver: {browser_type}")
         
-        if browser_type.lower() == "chrome":
-            return WebDriverFactory._create_chrome_driver(config)
-        elif browser_type.lower() == "firefox":
-            return WebDriverFactory._create_firefox_driver(config)
-        else:
+        if browser_type.lower() not in ("chrome", "firefox"):
             raise ValueError(f"Browser não suportado: {browser_type}")
+        
+        if config.REMOTE_ENDPOINTS:
+            driver = WebDriverFactory._create_remote_driver(config, browser_type.lower())
+        elif browser_type.lower() == "chrome":
+            driver = WebDriverFactory._create_chrome_driver(config)
+        else:
+            driver = WebDriverFactory._create_firefox_driver(config)
+        
+        return WebDriverFactory.instrument_driver(driver)
     
     @staticmethod
-    def _create_chrome_driver(config):
-        """Cria um driver Chrome com configurações específicas."""
+    def _create_remote_driver(config, browser_type):
+        """Cria uma sessão em um dos nós remotos configurados (REMOTE_ENDPOINTS)."""
+        from src.utils.remote_grid import remote_pool
+        
+        if browser_type == "chrome":
+            options = WebDriverFactory._chrome_options(config)
+        else:
+            options = WebDriverFactory._firefox_options(config)
+        
+        driver = remote_pool.create_session(browser_type, options)
+        
+        # Configurações do driver
+        driver.implicitly_wait(config.IMPLICIT_WAIT)
+        driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
+        
+        logger.info(f"✅ WebDriver remoto criado com sucesso em {driver.grid_node}")
+        return driver
+    
+    @staticmethod
+    def _chrome_options(config):
+        """Monta as opções do Chrome (locais e remotas)."""
         options = Options()
         
         # Configurações básicas
@@ -59,6 +129,24 @@ class WebDriverFactory:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         
+        # Logs acumulados pelo ChromeDriver: 'browser' (console, exceções JS e falhas
+        # de rede) e 'performance' (eventos CDP de rede e página, usados no HAR)
+        logging_prefs = {}
+        if config.BROWSER_LOGS_ENABLED:
+            logging_prefs['browser'] = config.BROWSER_LOG_LEVEL
+        if config.HAR_ENABLED:
+            logging_prefs['performance'] = 'ALL'
+            options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': True})
+        if logging_prefs:
+            options.set_capability('goog:loggingPrefs', logging_prefs)
+        
+        return options
+    
+    @staticmethod
+    def _create_chrome_driver(config):
+        """Cria um driver Chrome com configurações específicas."""
+        options = WebDriverFactory._chrome_options(config)
+        
         # Service
         service = Service(ChromeDriverManager().install())
         
@@ -73,8 +161,8 @@ class WebDriverFactory:
         return driver
     
     @staticmethod
-    def _create_firefox_driver(config):
-        """Cria um driver Firefox com configurações específicas."""
+    def _firefox_options(config):
+        """Monta as opções do Firefox (locais e remotas)."""
         options = FirefoxOptions()
         
         # Configurações básicas
@@ -85,6 +173,13 @@ class WebDriverFactory:
         options.add_argument(f"--width={config.BROWSER_WIDTH}")
         options.add_argument(f"--height={config.BROWSER_HEIGHT}")
         
+        return options
+    
+    @staticmethod
+    def _create_firefox_driver(config):
+        """Cria um driver Firefox com configurações específicas."""
+        options = WebDriverFactory._firefox_options(config)
+        
         # Service
         service = FirefoxService(GeckoDriverManager().install())
         
@@ -96,4 +191,191 @@ class WebDriverFactory:
         driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
         
         logger.info(f"✅ Firefox WebDriver criado com sucesso")
-        return driver
\ No newline at end of file
+        return driver
+    
+    @staticmethod
+    def set_viewport(driver, width, height):
+        """
+        Ajusta a área visível da página sem reiniciar o navegador.
+        No Chrome usa Emulation.setDeviceMetricsOverride (permite larguras abaixo do
+        mínimo da janela e ativa o modo mobile); nos demais redimensiona a janela
+        compensando bordas e barras do navegador.
+        
+        Args:
+            driver: Instância do WebDriver (ou ManagedDriver)
+            width (int): Largura da viewport em pixels
+            height (int): Altura da viewport em pixels
+        """
+        # Guardado no driver para ser reaplicado se o navegador for substituído
+        driver.viewport = (width, height)
+        
+        if hasattr(driver, 'execute_cdp_cmd'):
+            driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
+                'width': width,
+                'height': height,
+                'deviceScaleFactor': 0,
+                'mobile': width < 768
+            })
+        else:
+            driver.set_window_size(width, height)
+            inner_width, inner_height = driver.execute_script("return [window.innerWidth, window.innerHeight];")
+            if (inner_width, inner_height) != (width, height):
+                driver.set_window_size(2 * width - inner_width, 2 * height - inner_height)
+        
+        logger.info(f"📐 Viewport ajustada para {width}x{height}")
+    
+    @staticmethod
+    def set_emulation(driver, profile):
+        """
+        Aplica (ou remove) a emulação de rede e CPU pelo CDP, sem reiniciar o navegador.
+        O cache HTTP é limpo para que a rede emulada transfira de novo os recursos.
+        
+        Args:
+            driver: Instância do WebDriver (ou ManagedDriver)
+            profile (EmulationProfile): Perfil a aplicar, ou None para remover a emulação
+        
+        Raises:
+            RuntimeError: Se o navegador não expõe o CDP (Firefox, sessões remotas)
+        """
+        if not hasattr(driver, 'execute_cdp_cmd'):
+            if profile is None:
+                return
+            raise RuntimeError(f"Emulação '{profile.name}' exige o Chrome local (CDP)")
+        
+        # Guardado no driver para ser reaplicado se o navegador for substituído
+        driver.emulation = profile
+        
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        driver.execute_cdp_cmd('Network.emulateNetworkConditions', network_conditions(profile))
+        driver.execute_cdp_cmd('Emulation.setCPUThrottlingRate', {'rate': profile.cpu_rate if profile else 1})
+        
+        if profile:
+            logger.info(f"🐢 Emulação '{profile.name}' aplicada")
+    
+    @staticmethod
+    def create_managed_driver(browser_type="chrome"):
+        """
+        Cria um WebDriver substituível, usado pelo watchdog para recuperar sessões travadas.
+        
+        Args:
+            browser_type (str): Tipo do navegador ('chrome' ou 'firefox')
+            
+        Returns:
+            ManagedDriver: Proxy para o WebDriver atual
+        """
+        return ManagedDriver(lambda: WebDriverFactory.create_driver(browser_type))
+    
+    @staticmethod
+    def kill_driver(driver):
+        """
+        Mata à força o processo do driver e do navegador, sem passar pelo protocolo WebDriver.
+        Sessões remotas são encerradas no nó (DELETE /session/{id}) e liberam o slot do pool.
+        Qualquer comando pendente no driver falha imediatamente.
+        
+        Args:
+            driver: Instância do WebDriver
+            
+        Returns:
+            bool: True se havia um processo local ou uma sessão remota para encerrar
+        """
+        if getattr(driver, 'grid_node', None):
+            from src.utils.remote_grid import remote_pool
+            
+            killed = remote_pool.kill_session(driver)
+            if killed:
+                logger.warning(f"🔪 Sessão remota encerrada à força em {driver.grid_node}")
+            return killed
+        
+        service = getattr(driver, 'service', None)
+        process = getattr(service, 'process', None)
+        
+        if process is None:
+            logger.warning("⚠️ Processo do driver não disponível para encerramento forçado")
+            return False
+        
+        # Encerrar primeiro os processos do navegador (filhos do driver)
+        try:
+            import psutil
+            for child in psutil.Process(process.pid).children(recursive=True):
+                try:
+                    child.kill()
+                except psutil.Error:
+                    pass
+        except ImportError:
+            logger.debug("psutil não disponível; encerrando apenas o processo do driver")
+        except Exception as e:
+            logger.debug(f"Não foi possível listar processos do navegador: {str(e)}")
+        
+        try:
+            process.kill()
+        except Exception as e:
+            logger.error(f"❌ Erro ao encerrar processo do driver: {str(e)}")
+        
+        logger.warning("🔪 Processo do WebDriver encerrado à força")
+        return True
+
+class ManagedDriver:
+    """Proxy para um WebDriver que pode ser encerrado e substituído em tempo de execução."""
+    
+    def __init__(self, driver_factory):
+        """
+        Inicializa o proxy criando o primeiro WebDriver.
+        
+        Args:
+            driver_factory (callable): Função que cria um novo WebDriver
+        """
+        self._driver_factory = driver_factory
+        self._driver = driver_factory()
+        self.generation = 0
+        self.viewport = None
+        self.emulation = None
+        self._closed = False
+        metrics.browser_pool_size.inc()
+    
+    @property
+    def wrapped_driver(self):
+        """WebDriver atualmente em uso."""
+        return self._driver
+    
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+    
+    def quit(self):
+        """Fecha o navegador atual e o remove do pool."""
+        if not self._closed:
+            self._closed = True
+            metrics.browser_pool_size.dec()
+        self._driver.quit()
+    
+    def kill(self):
+        """Encerra à força o navegador atual."""
+        WebDriverFactory.kill_driver(self._driver)
+    
+    def replace(self):
+        """Descarta o navegador atual e inicia um novo."""
+        old_driver = self._driver
+        
+        try:
+            old_driver.quit()
+        except Exception:
+            pass
+        
+        self._driver = self._driver_factory()
+        self.generation += 1
+        logger.info(f"♻️ WebDriver substituído (geração {self.generation})")
+        
+        if self.viewport:
+            WebDriverFactory.set_viewport(self, *self.viewport)
+        if self.emulation:
+            WebDriverFactory.set_emulation(self, self.emulation)
+
+# Latência dos comandos WebDriver exportada como métrica
+WebDriverFactory.add_command_listener(
+    lambda driver, command, started, elapsed: metrics.command_duration.observe(elapsed, command=command)
+)
+
+# Comandos WebDriver como spans na trilha do navegador
+WebDriverFactory.add_command_listener(
+    lambda driver, command, started, elapsed: tracer.complete(command, 'command', started, elapsed, driver)
+)
\ No newline at end of file
@@ -0,0 +1,7 @@
+"""
+Configuração do pytest: permite importar os pacotes src e config do projeto.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
\ No newline at end of file
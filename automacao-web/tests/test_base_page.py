@@ -0,0 +1,114 @@
+"""
+Testes do cache de elementos dos Page Objects com um driver simulado, sem navegador.
+"""
+import pytest
+from selenium.common.exceptions import ElementClickInterceptedException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from src.pages.base_page import BasePage
+from src.utils.metrics import metrics
+
+TITLE = (By.ID, 'title')
+BUTTON = (By.ID, 'support')
+
+class FakeElement:
+    """Elemento que pode ficar obsoleto ou ser coberto depois de localizado."""
+    
+    def __init__(self, text):
+        self._text = text
+        self.stale = False
+        self.covered = False
+        self.clicks = 0
+    
+    @property
+    def text(self):
+        if self.stale:
+            raise StaleElementReferenceException("elemento removido do DOM")
+        return self._text
+    
+    def is_displayed(self):
+        if self.stale:
+            raise StaleElementReferenceException("elemento removido do DOM")
+        return True
+    
+    def is_enabled(self):
+        return True
+    
+    def click(self):
+        if self.covered:
+            raise ElementClickInterceptedException("outro elemento receberia o clique")
+        self.clicks += 1
+
+class FakeDriver:
+    """Driver sem execute_async_script: as esperas usam o WebDriverWait."""
+    
+    def __init__(self):
+        self.current_url = 'about:blank'
+        self.title = 'Bloco Praieira'
+        self.generation = 0
+        self.finds = 0
+        self.elements = {}
+    
+    def get(self, url):
+        self.current_url = url
+    
+    def find_element(self, by, value):
+        self.finds += 1
+        element = self.elements.get(value)
+        if element is None or element.stale:
+            element = self.elements[value] = FakeElement(value.upper())
+        return element
+
+@pytest.fixture
+def page():
+    return BasePage(FakeDriver())
+
+@pytest.fixture
+def lookups():
+    before = {result: metrics.element_cache.value(result=result)
+              for result in ('hit', 'miss', 'stale', 'not_interactable')}
+    return lambda: {result: metrics.element_cache.value(result=result) - count for result, count in before.items()}
+
+def test_repeated_interaction_reuses_the_element(page, lookups):
+    assert page.get_text(TITLE) == page.get_text(TITLE) == 'TITLE'
+    
+    assert page.driver.finds == 1
+    assert lookups() == {'hit': 1, 'miss': 1, 'stale': 0, 'not_interactable': 0}
+
+def test_navigation_invalidates_elements_of_every_page_object(page, lookups):
+    other = BasePage(page.driver)
+    page.get_text(TITLE)
+    
+    other.navigate_to('http://localhost:3000/')
+    page.get_text(TITLE)
+    
+    assert page.driver.finds == 2
+    assert lookups()['miss'] == 2
+
+def test_replaced_browser_invalidates_elements(page, lookups):
+    page.get_text(TITLE)
+    
+    page.driver.generation += 1
+    page.get_text(TITLE)
+    
+    assert page.driver.finds == 2
+    assert lookups()['hit'] == 0
+
+def test_stale_element_is_found_again_transparently(page, lookups):
+    page.get_text(TITLE)
+    page.driver.elements['title'].stale = True
+    
+    assert page.get_text(TITLE) == 'TITLE'
+    assert page.driver.finds == 2
+    assert lookups() == {'hit': 0, 'miss': 1, 'stale': 1, 'not_interactable': 0}
+
+def test_covered_element_is_not_counted_as_stale(page, lookups):
+    page.click_element(BUTTON)
+    button = page.driver.elements['support']
+    button.covered = True
+    
+    # Coberto no clique guardado; a espera por clicável localiza o mesmo elemento, ainda coberto
+    with pytest.raises(ElementClickInterceptedException):
+        page.click_element(BUTTON)
+    
+    assert button.clicks == 1
+    assert lookups() == {'hit': 0, 'miss': 1, 'stale': 0, 'not_interactable': 1}
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+Testes das esperas na página (observador de mutações) com um driver simulado:
+resultado da espera, reinstalação do observador e recurso ao WebDriverWait
+quando o script assíncrono falha.
+"""
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+from config.settings import Config
+from src.pages.base_page import BasePage
+from src.utils.dom_waits import INSTALL_SCRIPT, SCRIPT_TIMEOUT_MARGIN, push_waits
+
+TITLE = (By.ID, 'title')
+
+class FakeElement:
+    def is_displayed(self):
+        return True
+
+class ScriptDriver:
+    """Driver cujas esperas assíncronas devolvem as respostas programadas, em ordem."""
+    
+    def __init__(self, *responses):
+        self.current_url = 'about:blank'
+        self.responses = list(responses)
+        self.scripts = []
+        self.script_timeouts = []
+        self.finds = 0
+        self.element = FakeElement()
+    
+    def set_script_timeout(self, seconds):
+        self.script_timeouts.append(seconds)
+    
+    def execute_async_script(self, script, *args):
+        self.scripts.append(script)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+    
+    def find_element(self, by, value):
+        self.finds += 1
+        return self.element
+
+@pytest.fixture(autouse=True)
+def enabled(monkeypatch):
+    monkeypatch.setattr(Config(), 'PUSH_WAITS', True)
+
+def installs(driver):
+    return [script.startswith(INSTALL_SCRIPT) for script in driver.scripts]
+
+def test_observer_is_installed_once_per_document():
+    element = FakeElement()
+    driver = ScriptDriver({'status': 'ok', 'element': element}, {'status': 'ok', 'element': element})
+    
+    assert push_waits.wait(driver, TITLE, 'visible', 5, document=1) is element
+    assert push_waits.wait(driver, TITLE, 'visible', 5, document=1) is element
+    
+    assert installs(driver) == [True, False]
+    assert driver.script_timeouts == [5 + SCRIPT_TIMEOUT_MARGIN]
+
+def test_observer_is_reinstalled_when_the_page_was_replaced():
+    element = FakeElement()
+    driver = ScriptDriver({'status': 'ok', 'element': element}, {'status': 'missing'},
+                          {'status': 'ok', 'element': element})
+    push_waits.wait(driver, TITLE, 'visible', 5, document=1)
+    
+    # Mesmo documento para os Page Objects, mas a página foi recarregada por fora
+    assert push_waits.wait(driver, TITLE, 'visible', 5, document=1) is element
+    assert installs(driver) == [True, False, True]
+
+def test_timeout_in_the_page_raises():
+    driver = ScriptDriver({'status': 'timeout'})
+    
+    with pytest.raises(TimeoutException):
+        push_waits.wait(driver, TITLE, 'visible', 1)
+
+def test_script_error_falls_back_to_webdriver_wait():
+    driver = ScriptDriver(JavascriptException("document unloaded"))
+    
+    assert push_waits.wait(driver, TITLE, 'visible', 5) is None
+    
+    driver.responses.append(JavascriptException("document unloaded"))
+    assert BasePage(driver).wait_for_element(TITLE) is driver.element
+    assert len(driver.scripts) == 2 and driver.finds == 1
+
+def test_disabled_push_waits_use_webdriver_wait(monkeypatch):
+    monkeypatch.setattr(Config(), 'PUSH_WAITS', False)
+    driver = ScriptDriver()
+    
+    assert BasePage(driver).wait_for_element(TITLE) is driver.element
+    assert driver.scripts == [] and driver.finds == 1
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+Testes do histórico de execuções usado pela ordem 'history' do agendador.
+"""
+import json
+import os
+import pytest
+from src.strategies.registry import TestUnit as Unit
+from src.utils import history as history_module
+from src.utils.history import TestHistory as History
+
+def unit(strategy, name, cost=1.0):
+    return Unit(name, '_test', cost=cost).bind(strategy)
+
+def result(unit_name, test_name, passed=True, duration=1.0, **details):
+    return dict({'unit': unit_name, 'test_name': test_name, 'passed': passed,
+                 'duration_seconds': duration}, **details)
+
+def write_reports(directory, *reports):
+    """Grava relatórios do mais antigo para o mais recente."""
+    for age, strategy_results in enumerate(reports):
+        path = directory / f"relatorio_testes_{age:02d}.json"
+        path.write_text(json.dumps({
+            'execution_summary': {'browser_used': 'chrome'},
+            'strategy_results': strategy_results
+        }))
+        os.utime(path, (1000 + age, 1000 + age))
+
+@pytest.fixture(autouse=True)
+def no_artifacts(monkeypatch):
+    monkeypatch.setattr(history_module.artifact_store, 'find', lambda kind, pattern='*': [])
+
+def test_same_name_in_different_strategies_does_not_collide(tmp_path):
+    write_reports(tmp_path, [
+        {'detailed_results': [result('home:Title', 'Title', passed=False, duration=8.0)]},
+        {'detailed_results': [result('admin:Title', 'Title', passed=True, duration=2.0)]}
+    ])
+    history = History.load(tmp_path, browser='chrome')
+    
+    assert history.expected_duration(unit('home', 'Title')) == 8.0
+    assert history.expected_duration(unit('admin', 'Title')) == 2.0
+    assert history.failure_probability(unit('home', 'Title')) > history.failure_probability(unit('admin', 'Title'))
+
+def test_results_under_other_names_count_for_their_unit(tmp_path):
+    # Um resultado por volume de dados: uma execução da unidade, falha se qualquer volume falhou
+    write_reports(tmp_path, [{'detailed_results': [
+        result('admin:Scale', 'Scale - 100', duration=3.0),
+        result('admin:Scale', 'Scale - 1000', passed=False, duration=9.0),
+        result('admin:Scale', 'Scale', duration=9.5)
+    ]}])
+    history = History.load(tmp_path, browser='chrome')
+    
+    assert history.expected_duration(unit('admin', 'Scale')) == 9.5
+    assert history.failure_probability(unit('admin', 'Scale')) == pytest.approx(2 / 3)
+
+def test_cached_and_timed_out_results_are_not_durations(tmp_path):
+    write_reports(tmp_path, [{'detailed_results': [
+        result('home:Cached', 'Cached', duration=0.0, cached=True),
+        result('home:Hung', 'Hung', passed=False, duration=60.0, timed_out=True)
+    ]}])
+    history = History.load(tmp_path, browser='chrome')
+    
+    assert history.failure_probability(unit('home', 'Cached')) == 0.5
+    assert history.expected_duration(unit('home', 'Cached', cost=4.0)) == 4.0
+    assert history.expected_duration(unit('home', 'Hung', cost=5.0)) == 5.0
+    assert history.failure_probability(unit('home', 'Hung')) == pytest.approx(2 / 3)
+
+def test_plain_run_context_is_preferred_over_matrix_cells(tmp_path):
+    write_reports(tmp_path, [
+        {'browser': 'chrome', 'viewport': '390x844', 'emulation': 'slow-3g',
+         'detailed_results': [result('home:Hero', 'Hero', duration=30.0)]},
+        {'detailed_results': [result('home:Hero', 'Hero', duration=2.0)]}
+    ])
+    
+    assert History.load(tmp_path, browser='chrome').expected_duration(unit('home', 'Hero')) == 2.0
+    # Sem histórico no navegador da execução, as demais combinações são usadas
+    assert History.load(tmp_path, browser='firefox').expected_duration(unit('home', 'Hero')) == 16.0
+
+def test_reports_without_unit_are_ignored(tmp_path):
+    write_reports(tmp_path, [{'detailed_results': [{'test_name': 'Title', 'passed': False, 'duration_seconds': 7.0}]}])
+    history = History.load(tmp_path, browser='chrome')
+    
+    assert history.failure_probability(unit('home', 'Title')) == 0.5
\ No newline at end of file
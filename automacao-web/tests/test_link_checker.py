@@ -0,0 +1,83 @@
+"""
+Testes do verificador de links contra o stub local do site, sem navegador nem rede.
+"""
+import pytest
+from src.utils.link_checker import LinkChecker, classify_link
+from src.utils.site_stub import SiteStub
+
+PER_HOST = 2
+
+@pytest.fixture
+def stub():
+    stub = SiteStub()
+    stub.start()
+    yield stub
+    stub.stop()
+
+@pytest.fixture
+def checker():
+    return LinkChecker(timeout=5, workers=8, per_host=PER_HOST)
+
+def test_head_refused_falls_back_to_get(stub, checker):
+    # O stub não implementa HEAD (501): a página só passa pelo GET
+    results = checker.check([stub.base_url + '/', stub.base_url + '/api/members'])
+    
+    for result in results.values():
+        assert (result['state'], result['status'], result['method']) == ('ok', 200, 'GET')
+    assert checker.requests == 4
+
+def test_missing_page_is_broken(stub, checker):
+    result = checker.check([stub.base_url + '/pagina-inexistente'])[stub.base_url + '/pagina-inexistente']
+    
+    assert (result['state'], result['status'], result['method']) == ('broken', 404, 'GET')
+
+def test_connection_error_is_broken(checker):
+    # Porta 9 (discard) sem servidor: conexão recusada
+    result = checker.check(['http://127.0.0.1:9/'])['http://127.0.0.1:9/']
+    
+    assert result['state'] == 'broken'
+    assert result['status'] is None and result['error']
+
+def test_fragments_and_repeats_are_checked_once(stub, checker):
+    urls = [stub.base_url + '/api/members', stub.base_url + '/api/members#topo', stub.base_url + '/api/members']
+    
+    results = checker.check(urls)
+    assert list(results) == [stub.base_url + '/api/members']
+    assert checker.requests == 2
+    
+    # Uma nova chamada reaproveita o resultado já obtido
+    checker.check(urls + [stub.base_url + '/#doacoes'])
+    assert checker.requests == 4
+
+def test_per_host_concurrency_limit(stub, checker):
+    urls = [f"{stub.base_url}/api/donations?pagina={page}" for page in range(12)]
+    
+    results = checker.check(urls)
+    
+    assert all(result['state'] == 'ok' for result in results.values())
+    assert 1 <= checker.peak_per_host[stub.base_url.split('://')[1]] <= PER_HOST
+
+def test_non_http_schemes_are_not_requested(checker):
+    results = checker.check([
+        'mailto:blocopraieira@gmail.com',
+        'mailto:blocopraieira',
+        'tel:+55 81 99999-0000',
+        'javascript:void(0)'
+    ])
+    
+    assert results['mailto:blocopraieira@gmail.com']['state'] == 'ok'
+    assert results['mailto:blocopraieira']['state'] == 'invalid'
+    assert results['tel:+55 81 99999-0000']['state'] == 'ok'
+    assert results['javascript:void(0)']['state'] == 'ignored'
+    assert checker.requests == 0
+
+@pytest.mark.parametrize('link, category', [
+    ({'url': 'http://localhost:3000/admin', 'tag': 'a', 'attribute': 'href'}, 'internal'),
+    ({'url': 'http://localhost:3000/_next/static/app.js', 'tag': 'script', 'attribute': 'src'}, 'asset'),
+    ({'url': 'http://localhost:3000/favicon.ico', 'tag': 'link', 'attribute': 'href'}, 'asset'),
+    ({'url': 'https://instagram.com/blocopraieira', 'tag': 'a', 'attribute': 'href'}, 'external'),
+    ({'url': 'mailto:blocopraieira@gmail.com', 'tag': 'a', 'attribute': 'href'}, 'contact'),
+    ({'url': 'javascript:void(0)', 'tag': 'a', 'attribute': 'href'}, 'ignored')
+])
+def test_classify_link(link, category):
+    assert classify_link(link, 'http://localhost:3000') == category
\ No newline at end of file
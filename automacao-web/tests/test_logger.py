@@ -0,0 +1,76 @@
+"""
+Testes do buffer de debug por teste: os registros só são emitidos quando o teste
+falha, e nada é guardado quando o LOG_LEVEL já é DEBUG.
+"""
+import logging
+import pytest
+from src.strategies.base_strategy import TestStrategy as Strategy
+from src.utils.logger import logger
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.messages = []
+    
+    def emit(self, record):
+        self.messages.append((record.levelno, record.getMessage()))
+
+class SyntheticStrategy(Strategy):
+    def execute(self, units=None):
+        pass
+
+@pytest.fixture
+def emitted():
+    level = logger.logger.level
+    handler = RecordingHandler()
+    logger.logger.setLevel(logging.INFO)
+    logger.logger.addHandler(handler)
+    yield handler.messages
+    logger.end_capture()
+    logger.logger.removeHandler(handler)
+    logger.logger.setLevel(level)
+
+def debug_messages(messages):
+    return [message for level, message in messages if level == logging.DEBUG]
+
+def test_captured_debug_is_emitted_only_on_failure(emitted):
+    strategy = SyntheticStrategy(None)
+    
+    logger.begin_capture()
+    logger.debug("clicando no botão")
+    strategy.add_result("Passa", True)
+    assert debug_messages(emitted) == [] and not strategy.test_results[0].details
+    
+    logger.debug("esperando o modal")
+    strategy.add_result("Falha", False, "modal não abriu")
+    logger.end_capture()
+    
+    # O buffer é do teste inteiro: a falha traz também o que veio antes do resultado que passou
+    assert debug_messages(emitted) == ["clicando no botão", "esperando o modal"]
+    lines = strategy.test_results[1].details['debug_log']
+    assert [line.split(' ', 1)[1] for line in lines] == ["clicando no botão", "esperando o modal"]
+
+def test_flush_empties_the_buffer(emitted):
+    logger.begin_capture()
+    logger.debug("primeiro")
+    
+    assert len(logger.flush_capture()) == 1
+    assert logger.flush_capture() == []
+
+def test_debug_level_emits_immediately_without_buffer(emitted):
+    logger.logger.setLevel(logging.DEBUG)
+    strategy = SyntheticStrategy(None)
+    
+    logger.begin_capture()
+    logger.debug("clicando no botão")
+    strategy.add_result("Falha", False)
+    
+    assert debug_messages(emitted) == ["clicando no botão"]
+    assert not strategy.test_results[0].details
+
+def test_debug_after_end_capture_follows_the_log_level(emitted):
+    logger.begin_capture()
+    logger.end_capture()
+    logger.debug("fora do teste")
+    
+    assert logger.flush_capture() == [] and debug_messages(emitted) == []
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+Testes do formato de exposição das métricas (Prometheus e OpenMetrics), do
+arquivo para o textfile collector e de uma coleta real no endpoint HTTP local.
+"""
+import urllib.error
+import urllib.request
+import pytest
+from src.utils.metrics import (
+    Counter, Gauge, Histogram, OPENMETRICS_CONTENT_TYPE, PROMETHEUS_CONTENT_TYPE, metrics
+)
+
+def test_counter_family_name_depends_on_the_format():
+    counter = Counter('demo_tests', 'Testes executados.', ('result',))
+    counter.inc(result='passed')
+    counter.inc(2, result='passed')
+    counter.inc(0.5, result='failed')
+    
+    assert counter.render(openmetrics=True) == [
+        '# HELP demo_tests Testes executados.',
+        '# TYPE demo_tests counter',
+        'demo_tests_total{result="failed"} 0.5',
+        'demo_tests_total{result="passed"} 3'
+    ]
+    assert counter.render(openmetrics=False)[:2] == [
+        '# HELP demo_tests_total Testes executados.',
+        '# TYPE demo_tests_total counter'
+    ]
+
+def test_label_values_are_escaped():
+    counter = Counter('demo_errors', 'Erros.', ('message',))
+    counter.inc(message='campo "nome"\nem C:\\dados')
+    
+    assert counter.render()[-1] == r'demo_errors_total{message="campo \"nome\"\nem C:\\dados"} 1'
+
+def test_counter_rejects_unknown_labels():
+    counter = Counter('demo_tests', 'Testes executados.', ('result',))
+    
+    with pytest.raises(ValueError):
+        counter.inc(status='passed')
+
+def test_gauge_without_labels_is_exposed_before_the_first_set():
+    gauge = Gauge('demo_pool_size', 'Navegadores abertos.')
+    assert gauge.render()[-1] == 'demo_pool_size 0'
+    
+    gauge.inc(3)
+    gauge.dec()
+    assert gauge.render() == ['# HELP demo_pool_size Navegadores abertos.', '# TYPE demo_pool_size gauge',
+                              'demo_pool_size 2']
+
+def test_histogram_buckets_are_cumulative_with_sum_and_count():
+    histogram = Histogram('demo_duration_seconds', 'Duração.', ('strategy',), buckets=(1, 0.5))
+    for value in (0.2, 0.5, 0.75, 3):
+        histogram.observe(value, strategy='home')
+    
+    assert histogram.count(strategy='home') == 4
+    assert histogram.render()[2:] == [
+        'demo_duration_seconds_bucket{strategy="home",le="0.5"} 2',
+        'demo_duration_seconds_bucket{strategy="home",le="1"} 3',
+        'demo_duration_seconds_bucket{strategy="home",le="+Inf"} 4',
+        'demo_duration_seconds_count{strategy="home"} 4',
+        'demo_duration_seconds_sum{strategy="home"} 4.45'
+    ]
+
+def test_openmetrics_exposition_ends_with_eof():
+    openmetrics = metrics.render(openmetrics=True)
+    prometheus = metrics.render(openmetrics=False)
+    
+    assert openmetrics.endswith('\n# EOF\n')
+    assert '# EOF' not in prometheus
+    assert '# TYPE bloco_praieira_tests counter' in openmetrics
+    assert '# TYPE bloco_praieira_tests_total counter' in prometheus
+
+def test_textfile_uses_the_prometheus_format(tmp_path):
+    path = tmp_path / 'bloco_praieira.prom'
+    
+    metrics.write_textfile(path)
+    
+    assert path.read_text(encoding='utf-8') == metrics.render(openmetrics=False)
+    assert list(tmp_path.iterdir()) == [path]
+
+@pytest.fixture
+def endpoint():
+    metrics.serve(0)
+    yield f"http://127.0.0.1:{metrics._server.server_port}"
+    metrics.shutdown()
+
+def scrape(url, accept=None):
+    request = urllib.request.Request(url, headers={'Accept': accept} if accept else {})
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return response.headers['Content-Type'], response.read().decode('utf-8')
+
+def test_endpoint_negotiates_the_format_from_accept(endpoint):
+    metrics.record_test('home', passed=True, duration=0.3)
+    
+    content_type, body = scrape(f"{endpoint}/metrics")
+    assert content_type == PROMETHEUS_CONTENT_TYPE
+    assert 'bloco_praieira_tests_total{strategy="home",result="passed"}' in body
+    assert not body.endswith('# EOF\n')
+    
+    content_type, body = scrape(f"{endpoint}/metrics", accept='application/openmetrics-text; version=1.0.0')
+    assert content_type == OPENMETRICS_CONTENT_TYPE
+    assert body.endswith('# EOF\n')
+
+def test_endpoint_answers_404_outside_metrics(endpoint):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        scrape(f"{endpoint}/outro")
+    
+    assert error.value.code == 404
\ No newline at end of file
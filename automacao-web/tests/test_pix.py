@@ -0,0 +1,52 @@
+"""
+Testes da validação do conteúdo do QR Code PIX.
+"""
+import base64
+import pytest
+from src.utils.pix import crc16_ccitt, decode_qr_image, image_from_data_url, validate_pix_payload
+
+KEY = 'blocopraieira@gmail.com'
+
+def brcode(key=KEY):
+    """Monta um BR Code estático com o CRC correto."""
+    account = f"0014br.gov.bcb.pix01{len(key):02d}{key}"
+    body = (f"000201" f"26{len(account):02d}{account}" "52040000" "5303986" "5802BR"
+            "5914BLOCO PRAIEIRA" "6006RECIFE" "62070503***" "6304")
+    return body + crc16_ccitt(body)
+
+def test_crc16_check_value():
+    assert crc16_ccitt('123456789') == '29B1'
+
+def test_valid_brcode():
+    result = validate_pix_payload(brcode(), KEY)
+    
+    assert result['valid'], result['errors']
+    assert (result['format'], result['key'], result['merchant_city']) == ('brcode', KEY, 'RECIFE')
+
+def test_brcode_with_wrong_crc():
+    payload = brcode()
+    payload = payload[:-1] + ('0' if payload[-1] != '0' else '1')
+    
+    result = validate_pix_payload(payload, KEY)
+    assert not result['valid']
+    assert any('CRC16' in error for error in result['errors'])
+
+def test_brcode_with_other_key():
+    result = validate_pix_payload(brcode('outra@chave.com'), KEY)
+    
+    assert not result['valid']
+    assert result['key'] == 'outra@chave.com'
+
+def test_raw_key():
+    assert validate_pix_payload(KEY, KEY)['valid']
+    assert not validate_pix_payload(KEY, KEY, require_brcode=True)['valid']
+    assert not validate_pix_payload('outra@chave.com', KEY)['valid']
+
+def test_image_from_data_url():
+    assert image_from_data_url('data:image/png;base64,' + base64.b64encode(b'png').decode()) == b'png'
+    assert image_from_data_url('https://example.com/qr.png') is None
+
+def test_undecodable_image_raises():
+    # Sem decodificador instalado, ou com a imagem corrompida, a leitura falha com o motivo
+    with pytest.raises(ValueError):
+        decode_qr_image(b'not an image')
\ No newline at end of file
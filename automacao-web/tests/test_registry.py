@@ -0,0 +1,86 @@
+"""
+Testes do registro declarativo de unidades de teste e da seleção por tags e nomes.
+"""
+import pytest
+from src.strategies.base_strategy import TestStrategy as Strategy
+from src.strategies.registry import OPT_IN_TAGS, TestUnit as Unit, registry, test_unit as declare_unit
+
+def unit(name, tags=(), strategy='home'):
+    return Unit(name, '_test', tags=tags).bind(strategy)
+
+@pytest.mark.parametrize('tags, names, expected', [
+    (None, None, True),
+    ({'smoke'}, None, True),
+    ({'smoke', 'admin'}, None, True),
+    ({'admin'}, None, False),
+    (None, ['Title'], True),
+    (None, ['home:Title'], True),
+    (None, ['admin:Title'], False),
+    ({'smoke'}, ['Other'], False)
+])
+def test_matches_tags_and_simple_or_qualified_names(tags, names, expected):
+    assert unit('Title', tags={'home', 'smoke'}).matches(tags=tags, names=names) is expected
+
+@pytest.mark.parametrize('tags, names, expected', [
+    (None, None, False),
+    ({'links'}, None, False),
+    ({'external'}, None, True),
+    ({'links', 'external'}, None, True),
+    (None, ['External Links'], True),
+    (None, ['links:External Links'], True),
+    ({'links'}, ['External Links'], True)
+])
+def test_opt_in_units_run_only_when_selected(tags, names, expected):
+    assert 'external' in OPT_IN_TAGS
+    external = unit('External Links', tags={'links', 'external'}, strategy='links')
+    
+    assert external.matches(tags=tags, names=names) is expected
+
+@pytest.fixture
+def strategy_classes():
+    class BaseSynthetic(Strategy):
+        STRATEGY_KEY = 'synthetic'
+        
+        def execute(self, units=None):
+            pass
+        
+        @declare_unit("Second", tags={'smoke'}, cost=2.0, after=("First",))
+        def _test_second(self):
+            pass
+        
+        @declare_unit("First", requires={'page': 'home'})
+        def _test_first(self):
+            pass
+    
+    class ChildSynthetic(BaseSynthetic):
+        STRATEGY_KEY = 'synthetic_child'
+        
+        @declare_unit("First (child)", requires={'page': 'admin'})
+        def _test_first(self):
+            pass
+    
+    yield BaseSynthetic, ChildSynthetic
+    for key in ('synthetic', 'synthetic_child'):
+        registry._strategies.pop(key, None)
+
+def test_decorated_methods_become_bound_units_in_declaration_order(strategy_classes):
+    base, _ = strategy_classes
+    
+    assert [unit.qualified_name for unit in base.TEST_UNITS] == ['synthetic:Second', 'synthetic:First']
+    second = base.TEST_UNITS[0]
+    assert (second.cost, second.after, second.tags) == (2.0, ("First",), frozenset({'smoke'}))
+    assert registry.get_strategy_class('synthetic') is base
+
+def test_subclass_overrides_inherited_unit_by_method_name(strategy_classes):
+    _, child = strategy_classes
+    
+    assert [unit.qualified_name for unit in child.TEST_UNITS] == ['synthetic_child:Second', 'synthetic_child:First (child)']
+    assert child.TEST_UNITS[1].requires == {'page': 'admin'}
+
+def test_registry_filters_units_by_strategy_tags_and_names(strategy_classes):
+    assert [unit.name for unit in registry.get_units('synthetic', tags={'smoke'})] == ['Second']
+    assert [unit.qualified_name for unit in registry.get_units('synthetic_child', names=['Second'])] == [
+        'synthetic_child:Second'
+    ]
+    with pytest.raises(ValueError):
+        registry.get_units('inexistente')
\ No newline at end of file
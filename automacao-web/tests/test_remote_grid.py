@@ -0,0 +1,200 @@
+"""
+Testes do backend remoto: distribuição das sessões pela capacidade dos nós, nova
+tentativa em outro nó, fila de espera e encerramento forçado de uma sessão travada.
+Rodam contra nós simulados; com SELENIUM_STANDALONE_URL (ex: http://localhost:4444)
+apontando para um servidor standalone local, repetem o encerramento contra ele.
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException
+from selenium.webdriver.chrome.options import Options
+from src.utils.remote_grid import remote_pool
+from src.utils.webdriver_factory import WebDriverFactory
+
+class GridNodeStub:
+    """Nó standalone simulado: /status, criação de sessão, um comando que trava e DELETE."""
+    
+    def __init__(self, capacity=1, fail=False):
+        self.capacity = capacity
+        self.fail = fail
+        self.sessions = {}
+        self.deleted = []
+        stub = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, status, value):
+                body = json.dumps({'value': value}).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def do_GET(self):
+                slots = [{'stereotype': {'browserName': 'chrome'}, 'session': {'sessionId': session_id}}
+                         for session_id in stub.sessions]
+                slots += [{'stereotype': {'browserName': 'chrome'}, 'session': None}] * (stub.capacity - len(slots))
+                self._send(200, {'ready': True, 'nodes': [{'availability': 'UP', 'slots': slots}]})
+            
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                if self.path == '/session':
+                    if stub.fail:
+                        return self._send(500, {'error': 'session not created', 'message': 'Navegador não iniciou',
+                                                'stacktrace': ''})
+                    session_id = uuid.uuid4().hex
+                    stub.sessions[session_id] = threading.Event()
+                    return self._send(200, {'sessionId': session_id, 'capabilities': {'browserName': 'chrome'}})
+                
+                # Navegação travada: só responde quando a sessão é encerrada
+                session_id = self.path.split('/')[2]
+                stub.sessions[session_id].wait(30)
+                self._send(404, {'error': 'invalid session id', 'message': 'Sessão encerrada', 'stacktrace': ''})
+            
+            def do_DELETE(self):
+                session_id = self.path.split('/')[2]
+                if session_id not in stub.sessions:
+                    return self._send(404, {'error': 'invalid session id', 'message': 'Sessão inexistente', 'stacktrace': ''})
+                stub.deleted.append(session_id)
+                stub.sessions.pop(session_id).set()
+                self._send(200, None)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+    
+    def stop(self):
+        for event in self.sessions.values():
+            event.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def node():
+    node = GridNodeStub()
+    yield node
+    node.stop()
+
+@pytest.fixture
+def make_node():
+    nodes = []
+    
+    def make(capacity=1, fail=False):
+        nodes.append(GridNodeStub(capacity, fail))
+        return nodes[-1]
+    
+    yield make
+    for node in nodes:
+        node.stop()
+
+def test_sessions_go_to_the_node_with_more_free_slots(make_node):
+    small, large = make_node(capacity=1), make_node(capacity=3)
+    endpoints = [small.url, large.url]
+    
+    drivers = [remote_pool.create_session('chrome', Options(), endpoints=endpoints) for _ in range(3)]
+    
+    # 1 x 3 livres, depois 1 x 2; no empate (1 x 1), o nó com menos sessões ativas
+    assert [driver.grid_node for driver in drivers] == [large.url, large.url, small.url]
+    assert (remote_pool.nodes[small.url].active, remote_pool.nodes[large.url].active) == (1, 2)
+    for driver in drivers:
+        driver.quit()
+
+def test_failed_session_creation_retries_on_another_node(make_node):
+    broken, healthy = make_node(capacity=5, fail=True), make_node(capacity=1)
+    
+    driver = remote_pool.create_session('chrome', Options(), endpoints=[broken.url, healthy.url])
+    
+    assert driver.grid_node == healthy.url
+    broken_node = remote_pool.nodes[broken.url]
+    assert broken_node.failures == 1 and broken_node.recently_failed
+    assert broken_node.pending == 0 and broken_node.active == 0
+    driver.quit()
+
+def test_session_waits_in_queue_while_every_node_is_full(make_node):
+    node = make_node(capacity=1)
+    first = remote_pool.create_session('chrome', Options(), endpoints=[node.url])
+    assert first.queue_wait_seconds < 0.5
+    
+    # A liberação do slot acorda a fila sem esperar o intervalo de consulta
+    release = threading.Timer(0.5, first.quit)
+    release.start()
+    second = remote_pool.create_session('chrome', Options(), endpoints=[node.url])
+    release.join()
+    
+    assert 0.4 <= second.queue_wait_seconds < 5
+    assert second.session_start_seconds < second.queue_wait_seconds
+    second.quit()
+
+def start_hung_command(command):
+    """Executa um comando que trava em outra thread e devolve a thread e o erro recebido."""
+    errors = []
+    
+    def run():
+        try:
+            command()
+        except Exception as e:
+            errors.append(e)
+    
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    time.sleep(0.5)
+    return thread, errors
+
+def test_kill_remote_session_deletes_it_and_releases_the_slot(node):
+    driver = remote_pool.create_session('chrome', Options(), endpoints=[node.url])
+    grid_node = remote_pool.nodes[node.url]
+    assert grid_node.active == 1
+    
+    thread, errors = start_hung_command(lambda: driver.get('http://localhost:3000'))
+    
+    started = time.monotonic()
+    assert WebDriverFactory.kill_driver(driver) is True
+    thread.join(5)
+    
+    assert not thread.is_alive() and errors
+    assert time.monotonic() - started < remote_pool.KILL_TIMEOUT
+    assert node.deleted == [driver.session_id]
+    assert grid_node.active == 0
+    
+    # O quit após o encerramento não libera o slot uma segunda vez
+    with pytest.raises(InvalidSessionIdException):
+        driver.quit()
+    assert grid_node.active == 0
+
+def test_slot_is_released_when_the_node_does_not_answer(node):
+    driver = remote_pool.create_session('chrome', Options(), endpoints=[node.url])
+    node.stop()
+    
+    assert WebDriverFactory.kill_driver(driver) is False
+    assert remote_pool.nodes[node.url].active == 0
+
+@pytest.mark.skipif(not os.getenv('SELENIUM_STANDALONE_URL'),
+                    reason="defina SELENIUM_STANDALONE_URL com um servidor standalone local")
+def test_kill_session_on_standalone_server():
+    url = os.environ['SELENIUM_STANDALONE_URL'].rstrip('/')
+    options = Options()
+    options.add_argument('--headless=new')
+    
+    driver = remote_pool.create_session('chrome', options, endpoints=[url])
+    grid_node = remote_pool.nodes[url]
+    free_slots = grid_node.free_slots
+    
+    # Script assíncrono que nunca retorna: simula o comando travado
+    driver.set_script_timeout(60)
+    thread, errors = start_hung_command(lambda: driver.execute_async_script('return;'))
+    
+    assert WebDriverFactory.kill_driver(driver) is True
+    thread.join(10)
+    
+    assert not thread.is_alive() and errors
+    assert grid_node.active == 0
+    grid_node.refresh('chrome')
+    assert grid_node.free_slots == free_slots + 1
\ No newline at end of file
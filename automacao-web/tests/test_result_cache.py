@@ -0,0 +1,19 @@
+"""
+Testes do hash de código usado nas chaves do cache de resultados.
+"""
+from pathlib import Path
+from src.strategies.link_check_strategy import LinkCheckTestStrategy
+from src.utils.result_cache import hash_sources
+
+def test_hash_follows_indirect_and_late_imports(monkeypatch):
+    # dom_waits só é importado pelo base_page, e remote_grid só dentro de uma função da fábrica de drivers
+    original = hash_sources(LinkCheckTestStrategy)
+    
+    for module in ('dom_waits.py', 'remote_grid.py'):
+        read_bytes = Path.read_bytes
+        monkeypatch.setattr(Path, 'read_bytes', lambda path, module=module, read_bytes=read_bytes:
+                            read_bytes(path) + (b'\n# alterado' if path.name == module else b''))
+        assert hash_sources(LinkCheckTestStrategy) != original
+        monkeypatch.undo()
+    
+    assert hash_sources(LinkCheckTestStrategy) == original
\ No newline at end of file
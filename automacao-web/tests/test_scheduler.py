@@ -0,0 +1,119 @@
+"""
+Testes do escalonador com unidades sintéticas: ordem por dependências, componentes
+conexos, distribuição gulosa entre workers e ordenação que minimiza preparações.
+"""
+import pytest
+from src.strategies.registry import TestUnit as Unit
+from src.strategies.scheduler import TestScheduler as Scheduler
+
+def unit(name, strategy='home', **options):
+    return Unit(name, '_test', **options).bind(strategy)
+
+def names(units):
+    return [unit.name for unit in units]
+
+def test_dependencies_run_first_even_when_declared_later():
+    units = [unit('Details', after=('Listing',)), unit('Listing'), unit('Summary', after=('home:Details',))]
+    
+    plan, = Scheduler(units).plan()
+    
+    assert names(plan.units) == ['Listing', 'Details', 'Summary']
+
+def test_dependencies_outside_the_selection_are_ignored():
+    units = [unit('Details', after=('Listing', 'admin:Login')), unit('Other', strategy='admin', after=('Details',))]
+    scheduler = Scheduler(units)
+    
+    # Nome sem prefixo resolve só dentro da própria estratégia
+    assert scheduler._dependencies == {'home:Details': set(), 'admin:Other': set()}
+
+def test_dependency_cycle_is_rejected():
+    units = [unit('A', after=('C',)), unit('B', after=('A',)), unit('C', after=('B',))]
+    
+    with pytest.raises(ValueError, match='Ciclo de dependências'):
+        Scheduler(units)
+
+def test_components_group_units_linked_by_dependencies():
+    units = [unit('A'), unit('B', after=('A',)), unit('C'), unit('D', after=('B',)), unit('E', after=('C',)), unit('F')]
+    
+    components = Scheduler(units)._components()
+    
+    assert sorted(names(group) for group in components) == [['A', 'B', 'D'], ['C', 'E'], ['F']]
+
+def test_workers_receive_whole_components_balanced_by_cost():
+    units = [unit('A', cost=1.0), unit('B', cost=1.0, after=('A',)), unit('C', cost=3.0), unit('D', cost=1.0)]
+    
+    assignments = Scheduler(units, workers=2).assign_workers()
+    
+    # Maior componente primeiro: C (3) -> worker 0, A+B (2) -> worker 1, D (1) -> menor carga
+    assert [names(group) for group in assignments] == [['C'], ['A', 'B', 'D']]
+
+def test_empty_workers_are_left_out_of_the_plan():
+    units = [unit('A'), unit('B', after=('A',))]
+    
+    plans = Scheduler(units, workers=3).plan()
+    
+    assert [plan.to_dict() for plan in plans] == [{
+        'worker_id': 0, 'estimated_cost_seconds': 2.0, 'navigations': 0, 'scrolls': 0,
+        'tests': ['home:A', 'home:B']
+    }]
+
+def test_ordering_groups_units_by_page_and_section():
+    units = [
+        unit('Donations', requires={'page': 'home', 'section': 'donations'}),
+        unit('Dashboard', requires={'page': 'admin'}),
+        unit('Hero', requires={'page': 'home', 'section': 'top'}),
+        unit('Pix', requires={'page': 'home', 'section': 'donations'})
+    ]
+    
+    plan = Scheduler(units).order_units(units)
+    
+    # Na ordem declarada seriam 3 navegações e 2 rolagens
+    assert plan.steps == [
+        ('setup', ('navigate', 'admin')), ('test', units[1]),
+        ('setup', ('navigate', 'home')), ('test', units[2]),
+        ('setup', ('scroll', 'donations')), ('test', units[0]), ('test', units[3])
+    ]
+    assert (plan.count_actions('navigate'), plan.count_actions('scroll')) == (2, 1)
+    assert plan.estimated_cost == pytest.approx(2 * 3.0 + 0.5 + 4 * 1.0)
+
+def test_units_that_break_shared_state_run_last():
+    units = [
+        unit('Expand', requires={'page': 'home'}, effects={'accordion': 'expanded'}),
+        unit('Collapsed', requires={'page': 'home', 'accordion': 'collapsed'})
+    ]
+    
+    plan = Scheduler(units).order_units(units)
+    
+    assert names(plan.units) == ['Collapsed', 'Expand']
+    assert plan.count_actions('navigate') == 1
+
+@pytest.mark.parametrize('effects, requires, expected', [
+    ({'accordion': 'expanded'}, {'accordion': 'collapsed'}, True),
+    ({'accordion': 'expanded'}, {'accordion': 'expanded'}, False),
+    ({'accordion': 'expanded'}, {'page': 'home'}, False),
+    ({}, {'accordion': 'collapsed'}, False)
+])
+def test_invalidates_compares_effects_with_required_state(effects, requires, expected):
+    assert Scheduler._invalidates(effects, requires) is expected
+
+def test_priority_overrides_setup_cost():
+    units = [
+        unit('Hero', requires={'page': 'home'}),
+        unit('Donations', requires={'page': 'home', 'section': 'donations'}),
+        unit('Dashboard', requires={'page': 'admin'})
+    ]
+    priority = {'Dashboard': 0, 'Hero': 1, 'Donations': 1}
+    
+    plan = Scheduler(units, priority=lambda unit: priority[unit.name]).order_units(units)
+    
+    assert names(Scheduler(units).order_units(units).units) == ['Hero', 'Donations', 'Dashboard']
+    assert names(plan.units) == ['Dashboard', 'Hero', 'Donations']
+
+def test_priority_does_not_skip_dependencies():
+    units = [unit('Cheap'), unit('Login'), unit('Urgent', after=('Login',))]
+    priority = {'Urgent': 0, 'Login': 1, 'Cheap': 1}
+    
+    plan = Scheduler(units, priority=lambda unit: priority[unit.name]).order_units(units)
+    
+    # A prioridade só vale entre unidades prontas; não é herdada pelas dependências
+    assert names(plan.units) == ['Cheap', 'Login', 'Urgent']
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""
+Testes da reserva de caminhos únicos para relatórios e screenshots.
+"""
+import datetime as datetime_module
+import pytest
+from config.settings import Config
+
+class FixedDatetime(datetime_module.datetime):
+    """Relógio parado: todas as reservas caem no mesmo segundo."""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 2, 14, 10, 30, 0)
+
+def test_same_second_paths_get_suffixes(tmp_path, monkeypatch):
+    monkeypatch.setattr(datetime_module, 'datetime', FixedDatetime)
+    config = Config()
+    
+    paths = [config._unique_path(tmp_path, 'relatorio', '.json') for _ in range(3)]
+    
+    assert [path.name for path in paths] == [
+        'relatorio_20260214_103000.json', 'relatorio_20260214_103000_2.json', 'relatorio_20260214_103000_3.json'
+    ]
+
+def test_failed_write_removes_reserved_file(tmp_path):
+    config = Config()
+    path = config._unique_path(tmp_path, 'screenshot', '.png')
+    
+    with pytest.raises(RuntimeError):
+        with config.reserved_file(path):
+            raise RuntimeError("navegador fechado")
+    
+    assert list(tmp_path.iterdir()) == []
+
+def test_write_without_content_removes_reserved_file(tmp_path):
+    config = Config()
+    empty = config._unique_path(tmp_path, 'screenshot', '.png')
+    written = config._unique_path(tmp_path, 'relatorio', '.json')
+    
+    with config.reserved_file(empty):
+        pass
+    with config.reserved_file(written):
+        written.write_text('{}')
+    
+    assert list(tmp_path.iterdir()) == [written]
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""
+Testes dos tempos limite adaptativos por localizador: p99 × fator, limites mínimo
+e máximo, quantidade mínima de amostras e amostras censuradas de esperas esgotadas.
+"""
+import json
+import time
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+from config.settings import Config
+from src.pages.base_page import BasePage
+from src.utils.wait_history import wait_history
+
+KEY = 'localhost:3000|chrome|1920x1080||HomePage|id=title'
+
+@pytest.fixture
+def history(monkeypatch, tmp_path):
+    config = Config()
+    for name, value in {'ADAPTIVE_TIMEOUTS': True, 'ADAPTIVE_TIMEOUT_FACTOR': 3.0, 'ADAPTIVE_TIMEOUT_MIN': 2.0,
+                        'ADAPTIVE_TIMEOUT_MIN_SAMPLES': 5, 'ADAPTIVE_TIMEOUT_SAMPLES': 200,
+                        'MAX_WAIT_ELEMENTS': 10}.items():
+        monkeypatch.setattr(config, name, value)
+    monkeypatch.setattr(wait_history, '_samples', {})
+    monkeypatch.setattr(wait_history, '_dirty', False)
+    monkeypatch.setattr(wait_history, 'path', tmp_path / 'locator_latency.json')
+    return wait_history
+
+def record_ms(history, *samples):
+    for sample in samples:
+        history.record(KEY, sample / 1000)
+
+def test_few_samples_keep_the_configured_maximum(history):
+    record_ms(history, 100, 100, 100, 100)
+    
+    assert history.timeout_for(KEY) == (10, None)
+    assert history.timeout_for('outro') == (10, None)
+
+def test_timeout_is_p99_times_factor(history):
+    record_ms(history, 1000, 1000, 1000, 1000, 2000)
+    
+    timeout, p99 = history.timeout_for(KEY)
+    
+    # p99 interpolado entre 1000 e 2000 ms
+    assert p99 == pytest.approx(1960)
+    assert timeout == pytest.approx(1.96 * 3)
+
+@pytest.mark.parametrize('latency_ms, expected', [(50, 2.0), (8000, 10)])
+def test_timeout_is_clamped_between_minimum_and_maximum(history, latency_ms, expected):
+    record_ms(history, *[latency_ms] * 5)
+    
+    assert history.timeout_for(KEY)[0] == expected
+
+def test_disabled_adaptive_timeouts_use_the_maximum(history, monkeypatch):
+    monkeypatch.setattr(Config(), 'ADAPTIVE_TIMEOUTS', False)
+    record_ms(history, *[50] * 5)
+    
+    assert history.timeout_for(KEY) == (10, None)
+
+def test_only_the_latest_samples_are_kept_and_saved(history, monkeypatch):
+    monkeypatch.setattr(Config(), 'ADAPTIVE_TIMEOUT_SAMPLES', 3)
+    record_ms(history, 10, 20, 30, 40)
+    
+    history.save()
+    
+    assert json.loads(history.path.read_text(encoding='utf-8')) == {KEY: [20, 30, 40]}
+
+class MissingElementDriver:
+    """Driver no BASE_URL em que o elemento nunca aparece."""
+    
+    name = 'chrome'
+    
+    def __init__(self):
+        self.current_url = Config().BASE_URL + '/'
+    
+    def find_element(self, by, value):
+        raise NoSuchElementException(value)
+
+def test_exhausted_adaptive_wait_is_recorded_and_raises_the_next_limit(history, monkeypatch):
+    monkeypatch.setattr(Config(), 'ADAPTIVE_TIMEOUT_MIN', 0.1)
+    page = BasePage(MissingElementDriver())
+    locator = (By.ID, 'title')
+    key = page._history_key(locator)
+    for _ in range(5):
+        history.record(key, 0.1)
+    assert history.timeout_for(key)[0] == pytest.approx(0.3)
+    
+    started = time.perf_counter()
+    with pytest.raises(TimeoutException):
+        page.wait_for_element(locator)
+    assert time.perf_counter() - started < 2
+    
+    # Amostra censurada: pelo menos o tempo esperado, não a latência real (desconhecida)
+    assert history._samples[key][-1] >= 300
+    assert history.timeout_for(key)[0] > 0.3
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+Testes do watchdog de execução: prazos por teste, orçamento total e callbacks fora do lock.
+"""
+import threading
+import time
+import pytest
+from src.utils.watchdog import Watchdog
+
+@pytest.fixture
+def watchdog():
+    watchdog = Watchdog(test_timeout=0.2)
+    watchdog.start()
+    yield watchdog
+    watchdog.stop()
+
+def test_expired_guard_fires_once_with_reason(watchdog):
+    calls = []
+    
+    with watchdog.guard('lento', on_timeout=lambda: calls.append('kill')) as guard:
+        time.sleep(0.5)
+    
+    assert calls == ['kill']
+    assert (guard.fired, guard.reason) == (True, 'test')
+
+def test_slow_callback_does_not_block_other_guards(watchdog):
+    # O callback simula o DELETE de uma sessão remota que demora a responder
+    in_callback, release = threading.Event(), threading.Event()
+    
+    def slow_kill():
+        in_callback.set()
+        release.wait(5)
+    
+    def hung():
+        with watchdog.guard('travado', on_timeout=slow_kill):
+            release.wait(5)
+    
+    thread = threading.Thread(target=hung, daemon=True)
+    thread.start()
+    assert in_callback.wait(2)
+    
+    started = time.monotonic()
+    with watchdog.guard('outro worker', on_timeout=lambda: None) as guard:
+        pass
+    assert time.monotonic() - started < 0.1 and not guard.fired
+    
+    release.set()
+    thread.join(2)
+
+def test_run_budget_fires_active_guards_and_prefires_new_ones():
+    watchdog = Watchdog(test_timeout=10, run_timeout=0.2)
+    watchdog.start()
+    calls = []
+    
+    try:
+        with watchdog.guard('em andamento', on_timeout=lambda: calls.append('kill')) as guard:
+            time.sleep(0.5)
+        assert watchdog.run_expired and (guard.reason, calls) == ('run', ['kill'])
+        
+        # Depois do orçamento esgotado, o prazo já nasce disparado e nada é chamado
+        with watchdog.guard('seguinte', on_timeout=lambda: calls.append('late')) as late:
+            pass
+        assert (late.fired, late.reason, calls) == (True, 'run', ['kill'])
+    finally:
+        watchdog.stop()
\ No newline at end of file